@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.engine.bead_ledger import BeadLedger
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the sovereign bead normalization sweep.")
+    parser.add_argument("--project-root", default=str(PROJECT_ROOT), help="Corvus Star workspace root")
+    parser.add_argument(
+        "--pending-only",
+        action="store_true",
+        help="Only normalize beads written by older code or touched since their last pass.",
+    )
+    args = parser.parse_args()
+
+    ledger = BeadLedger(Path(args.project_root))
+    rewritten = ledger.normalize_pending_beads() if args.pending_only else ledger.normalize_existing_beads()
+    examined = ledger.normalization_stats["rows_examined"]
+    ledger.sync_tasks_projection()
+
+    print(
+        json.dumps(
+            {"mode": "pending" if args.pending_only else "full", "rows_examined": examined, "rows_rewritten": rewritten},
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,297 @@
+"""
+[SPOKE] Analysis Cache
+Lore: "What the well has once answered, it does not forget."
+Purpose: Persistent per-file analysis results keyed by content hash and rule-set version.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+BUSY_TIMEOUT_MS = 5000
+
+
+def analysis_cache_path(project_root: Path | str) -> Path:
+    return Path(project_root) / ".agents" / "analysis_cache.db"
+
+
+def content_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def current_rule_versions() -> dict[str, str]:
+    """Namespace -> rule-set version of every analysis that writes to the cache."""
+    from src.core.engine.gungnir.universal import UniversalGungnir
+    from src.core.engine.intent_store import INTENT_NAMESPACE, INTENT_RULES_VERSION
+    from src.core.engine.wardens.mimir import MimirWarden
+    from src.core.engine.wardens.valkyrie import ValkyrieWarden
+
+    return {
+        MimirWarden.CACHE_NAMESPACE: MimirWarden.RULES_VERSION,
+        ValkyrieWarden.CACHE_NAMESPACE: ValkyrieWarden.RULES_VERSION,
+        UniversalGungnir.AUDIT_NAMESPACE: UniversalGungnir.RULES_VERSION,
+        UniversalGungnir.MATRIX_NAMESPACE: UniversalGungnir.RULES_VERSION,
+        INTENT_NAMESPACE: INTENT_RULES_VERSION,
+    }
+
+
+class AnalysisCache:
+    """
+    SQLite store of JSON analysis results keyed by (namespace, rule version, key).
+    Keys are content hashes, optionally salted with analysis parameters, so renamed or copied files still hit.
+    Writes inside `batch()` are committed in one transaction; each process opens its own connection.
+    Hit/miss counters stay in memory and are persisted with the next write, flush() or close(), never by a read.
+    """
+
+    _instances: dict[str, AnalysisCache] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path: Path | str) -> None:
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._batch_depth = 0
+        self._pending: dict[tuple[str, str, str], str] = {}
+        self._pending_counters: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        self.stats: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0, "writes": 0})
+
+    @classmethod
+    def for_root(cls, project_root: Path | str) -> AnalysisCache | None:
+        """Shared cache for a project, or None when disabled with CSTAR_ANALYSIS_CACHE=0."""
+        if os.getenv("CSTAR_ANALYSIS_CACHE", "1").lower() in ("0", "false", "off"):
+            return None
+        path = str(analysis_cache_path(project_root).resolve())
+        with cls._instances_lock:
+            cache = cls._instances.get(path)
+            if cache is None:
+                cache = cls._instances[path] = cls(path)
+            return cache
+
+    @staticmethod
+    def key(digest: str, *params: Any) -> str:
+        """Cache key for a content digest under the given analysis parameters."""
+        if not params:
+            return digest
+        salt = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(f"{digest}\x00{salt}".encode()).hexdigest()
+
+    # --- Reads and writes -----------------------------------------------------
+
+    def get(self, namespace: str, rule_version: str, key: str) -> Any | None:
+        """Returns a fresh copy of the cached payload, or None on a miss."""
+        with self._lock:
+            raw = self._pending.get((namespace, rule_version, key))
+            if raw is None:
+                try:
+                    row = self._connection().execute(
+                        "SELECT payload FROM analysis_results WHERE namespace = ? AND rule_version = ? AND key = ?",
+                        (namespace, rule_version, key),
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                raw = row[0] if row else None
+            counters = self._pending_counters[namespace]
+            if raw is None:
+                self.stats[namespace]["misses"] += 1
+                counters[1] += 1
+            else:
+                self.stats[namespace]["hits"] += 1
+                counters[0] += 1
+            return json.loads(raw) if raw is not None else None
+
+    def put(self, namespace: str, rule_version: str, key: str, payload: Any) -> None:
+        with self._lock:
+            self._pending[(namespace, rule_version, key)] = json.dumps(payload)
+            self.stats[namespace]["writes"] += 1
+            if not self._batch_depth:
+                self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[AnalysisCache]:
+        """Defers writes and hit counters until the outermost block exits, then commits them together."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._pending and not self._pending_counters:
+                return
+            rows = [(*key, payload) for key, payload in self._pending.items()]
+            counters = [(namespace, hits, misses) for namespace, (hits, misses) in self._pending_counters.items()]
+            self._pending.clear()
+            self._pending_counters.clear()
+            try:
+                conn = self._connection()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO analysis_results (namespace, rule_version, key, payload) VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+                    conn.executemany(
+                        """
+                        INSERT INTO analysis_counters (namespace, hits, misses) VALUES (?, ?, ?)
+                        ON CONFLICT(namespace) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses
+                        """,
+                        counters,
+                    )
+            except sqlite3.Error:
+                # The cache is an accelerator; a locked or unwritable store must never fail a sweep.
+                pass
+
+    # --- Maintenance ----------------------------------------------------------
+
+    def invalidate(self, namespace: str | None = None, rule_version: str | None = None) -> int:
+        """Deletes cached results matching the filters (all of them when both are None). Returns rows removed."""
+        clauses, params = [], []
+        if namespace is not None:
+            clauses.append("namespace = ?")
+            params.append(namespace)
+        if rule_version is not None:
+            clauses.append("rule_version = ?")
+            params.append(rule_version)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            self._pending = {
+                key: payload for key, payload in self._pending.items()
+                if not ((namespace is None or key[0] == namespace) and (rule_version is None or key[1] == rule_version))
+            }
+            conn = self._connection()
+            with conn:
+                return conn.execute(f"DELETE FROM analysis_results{where}", params).rowcount
+
+    def prune_stale(self, current: dict[str, str] | None = None) -> int:
+        """Deletes results written under any rule version other than the current one for their namespace."""
+        current = current if current is not None else current_rule_versions()
+        with self._lock:
+            self.flush()
+            conn = self._connection()
+            with conn:
+                return sum(
+                    conn.execute(
+                        "DELETE FROM analysis_results WHERE namespace = ? AND rule_version != ?", (namespace, version)
+                    ).rowcount
+                    for namespace, version in current.items()
+                )
+
+    def describe(self) -> dict[str, Any]:
+        """Stored entries per namespace/version, with this process's and the lifetime hit rates."""
+        with self._lock:
+            self.flush()
+            conn = self._connection()
+            entries = conn.execute(
+                "SELECT namespace, rule_version, COUNT(*) FROM analysis_results GROUP BY namespace, rule_version ORDER BY 1, 2"
+            ).fetchall()
+            lifetime = conn.execute("SELECT namespace, hits, misses FROM analysis_counters ORDER BY 1").fetchall()
+            return {
+                "path": str(self.db_path),
+                "entries": [{"namespace": ns, "rule_version": version, "count": count} for ns, version, count in entries],
+                "session": {ns: {**counts, "hit_rate": _hit_rate(counts["hits"], counts["misses"])} for ns, counts in self.stats.items()},
+                "lifetime": {ns: {"hits": hits, "misses": misses, "hit_rate": _hit_rate(hits, misses)} for ns, hits, misses in lifetime},
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection inherited across fork() must never be used by the child.
+        if self._conn is None or self._pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS analysis_results (
+                        namespace TEXT NOT NULL,
+                        rule_version TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (namespace, rule_version, key)
+                    ) WITHOUT ROWID
+                    """
+                )
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS analysis_counters (
+                        namespace TEXT PRIMARY KEY,
+                        hits INTEGER NOT NULL DEFAULT 0,
+                        misses INTEGER NOT NULL DEFAULT 0
+                    )
+                    """
+                )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+
+@atexit.register
+def _flush_shared_caches() -> None:
+    """Persists the counters of shared caches nobody closed; reads alone never write them."""
+    with AnalysisCache._instances_lock:
+        caches = list(AnalysisCache._instances.values())
+    for cache in caches:
+        cache.flush()
+
+
+def _hit_rate(hits: int, misses: int) -> float:
+    total = hits + misses
+    return round(hits / total, 4) if total else 0.0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point: inspect or invalidate the analysis cache."""
+    parser = argparse.ArgumentParser(description="Inspect or invalidate the Mimir/Valkyrie/Gungnir/intent analysis cache.")
+    parser.add_argument("--root", default=os.getenv("CSTAR_ROOT", "."), help="Project root (default: CSTAR_ROOT or cwd)")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--stats", action="store_true", help="Show stored entries and hit rates (default)")
+    action.add_argument("--invalidate", action="store_true", help="Delete entries matching --namespace/--rule-version")
+    action.add_argument("--prune-stale", action="store_true", help="Delete entries from superseded rule versions")
+    parser.add_argument("--namespace", help="Restrict --invalidate to one namespace (e.g. mimir, valkyrie, gungnir.audit, intent)")
+    parser.add_argument("--rule-version", help="Restrict --invalidate to one rule-set version")
+    parser.add_argument("--all", action="store_true", help="Allow --invalidate without filters to clear everything")
+    args = parser.parse_args(argv)
+
+    cache = AnalysisCache(analysis_cache_path(args.root))
+    try:
+        if args.invalidate:
+            if args.namespace is None and args.rule_version is None and not args.all:
+                parser.error("--invalidate needs --namespace, --rule-version or --all")
+            removed = cache.invalidate(args.namespace, args.rule_version)
+            print(json.dumps({"removed": removed}))
+        elif args.prune_stale:
+            print(json.dumps({"removed": cache.prune_stale(), "current": current_rule_versions()}))
+        else:
+            print(json.dumps(cache.describe(), indent=2))
+    finally:
+        cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
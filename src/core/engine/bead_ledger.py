@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -10,6 +11,12 @@ from pathlib import Path
 from typing import Any, Sequence
 
 from src.core.engine.hall_schema import HallBeadRecord, HallOfRecords, normalize_hall_path
+from src.core.engine.tasks_projection import (
+    DeferredProjectionWriter,
+    resolve_projection_mode,
+    resolve_projection_staleness_ms,
+    write_projection_atomically,
+)
 
 PROJECTION_STATUS_ORDER = ("OPEN", "SET-PENDING", "SET", "IN_PROGRESS", "READY_FOR_REVIEW", "NEEDS_TRIAGE", "BLOCKED", "RESOLVED", "ARCHIVED", "SUPERSEDED")
 PROJECTION_MARKERS = {
@@ -158,20 +165,46 @@ class SovereignBead:
 class BeadLedger:
     """Canonical Hall-backed sovereign bead system with a `tasks.qmd` projection."""
 
-    CLAIM_RETRY_LIMIT = 4
+    # Bump when `_normalize_materialized_bead` or `_apply_legacy_supersession` change so older rows re-normalize.
+    NORMALIZATION_VERSION = 1
 
-    def __init__(self, project_root: Path | str):
+    def __init__(
+        self,
+        project_root: Path | str,
+        *,
+        projection_mode: str | None = None,
+        projection_staleness_ms: int | None = None,
+    ):
         self.project_root = Path(project_root)
         self.hall = HallOfRecords(self.project_root)
         self.repository = self.hall.bootstrap_repository()
         self.tasks_file = self.project_root / "tasks.qmd"
+        self.normalization_stats = {"passes": 0, "rows_examined": 0, "rows_rewritten": 0, "last_rows_rewritten": 0}
+        # `sync` rewrites tasks.qmd after every mutation; `deferred` coalesces writes within the staleness window.
+        self.projection_mode = resolve_projection_mode(projection_mode)
+        self._projection_writer = (
+            DeferredProjectionWriter(
+                self._write_tasks_projection,
+                resolve_projection_staleness_ms(projection_staleness_ms),
+            )
+            if self.projection_mode == "deferred"
+            else None
+        )
+        # status -> (section signature, rendered section lines)
+        self._projection_sections: dict[str, tuple[tuple[Any, ...], list[str]]] = {}
+        self._projection_lock = threading.Lock()
+        self._last_active_count = 0
+        self.projection_stats = {"renders": 0, "sections_rendered": 0}
 
     def connect(self):
         return self.hall.connect()
 
+    def read(self):
+        return self.hall.read()
+
     def list_beads(self, statuses: Sequence[str] | None = None) -> list[SovereignBead]:
-        self.normalize_existing_beads()
-        with self.connect() as conn:
+        self.normalize_pending_beads()
+        with self.read() as conn:
             rows = conn.execute(
                 "SELECT * FROM hall_beads WHERE repo_id = ?",
                 (self.repository.repo_id,),
@@ -183,16 +216,36 @@ class BeadLedger:
         return sorted(beads, key=self._sort_key)
 
     def peek_next_bead(self) -> dict[str, Any] | None:
-        actionable_beads = self._list_actionable_beads(statuses=("SET", "OPEN"))
-        if not actionable_beads:
-            return None
-        return sorted(actionable_beads, key=self._claim_sort_key)[0].to_public_dict()
+        self.normalize_pending_beads()
+        with self.read() as conn:
+            bead = self._select_next_claimable_bead(conn)
+        return bead.to_public_dict() if bead else None
+
+    def peek_claimable_beads(self, limit: int) -> list[dict[str, Any]]:
+        """
+        Up to `limit` claimable beads in claim order (SET before OPEN), without claiming any.
+        Lets a caller skip beads it cannot take and claim the rest one by one with `claim_bead`.
+        """
+        self.normalize_pending_beads()
+        beads: list[SovereignBead] = []
+        with self.read() as conn:
+            for status in ("SET", "OPEN"):
+                remaining = limit - len(beads)
+                if remaining <= 0:
+                    break
+                rows = conn.execute(
+                    "SELECT * FROM hall_beads WHERE repo_id = ? AND claimable = 1 AND status = ?"
+                    " ORDER BY claim_priority, created_at, bead_id LIMIT ?",
+                    (self.repository.repo_id, status, remaining),
+                ).fetchall()
+                beads.extend(self._row_to_bead(row) for row in rows)
+        return [bead.to_public_dict() for bead in beads]
 
     def claim_next_bead(self, agent_id: str) -> dict[str, Any] | None:
-        self.normalize_existing_beads()
-        claimed = self._claim_selected_bead(agent_id, self._select_next_claimable_bead)
+        self.normalize_pending_beads()
+        claimed = self._claim_next_indexed_bead(agent_id)
 
-        self.sync_tasks_projection()
+        self._project_tasks()
         return claimed.to_public_dict() if claimed else None
 
     def claim_next_p1_scan_bead(self, agent_id: str) -> dict[str, Any] | None:
@@ -201,23 +254,37 @@ class BeadLedger:
         Restricts to beads that belong to a P1_SCAN scan record.
         Returns None if no claimable P1_SCAN beads remain.
         """
-        self.normalize_existing_beads()
-        claimed = self._claim_selected_bead(agent_id, self._select_next_p1_scan_bead)
+        self.normalize_pending_beads()
+        claimed = self._claim_next_indexed_bead(agent_id, p1_scan_only=True)
 
-        self.sync_tasks_projection()
+        self._project_tasks()
         return claimed.to_public_dict() if claimed else None
 
     def claim_bead(self, bead_id: str | int, agent_id: str) -> SovereignBead | None:
-        self.normalize_existing_beads()
+        self.normalize_pending_beads()
         with self.connect() as conn:
             bead = self._get_bead_for_update(conn, bead_id)
             if bead is None or bead.status not in {"OPEN", "SET"} or not self._is_claimable(bead):
                 return None
             claimed = self._claim_bead_in_transaction(conn, bead, agent_id)
 
-        self.sync_tasks_projection()
+        self._project_tasks()
         return claimed
 
+    def release_bead(self, bead_id: str | int, agent_id: str, *, status: str = "OPEN") -> SovereignBead | None:
+        """Hands a bead claimed by `agent_id` back to the queue as `status` (OPEN or SET), undoing claim_bead."""
+        with self.connect() as conn:
+            bead = self._get_bead_for_update(conn, bead_id)
+            if bead is None or bead.status != "IN_PROGRESS" or bead.assigned_agent != agent_id:
+                return None
+            bead.status = status
+            bead.assigned_agent = None
+            bead.updated_at = self._now()
+            self._upsert_record(conn, bead.to_record())
+
+        self._project_tasks()
+        return bead
+
     def mark_ready_for_review(self, bead_id: str | int, resolution_note: str | None = None) -> SovereignBead | None:
         bead = self.get_bead(bead_id)
         if bead is None:
@@ -232,7 +299,7 @@ class BeadLedger:
         with self.connect() as conn:
             self._upsert_record(conn, bead.to_record())
 
-        self.sync_tasks_projection()
+        self._project_tasks()
         return bead
 
     def block_bead(
@@ -257,7 +324,7 @@ class BeadLedger:
         with self.connect() as conn:
             self._upsert_record(conn, bead.to_record())
 
-        self.sync_tasks_projection()
+        self._project_tasks()
         return bead
 
     def resolve_bead(
@@ -283,11 +350,11 @@ class BeadLedger:
             bead.resolved_validation_id = resolved_validation_id
             self._upsert_record(conn, bead.to_record())
 
-        self.sync_tasks_projection()
+        self._project_tasks()
         return bead
 
     def get_bead(self, bead_id: str | int) -> SovereignBead | None:
-        with self.connect() as conn:
+        with self.read() as conn:
             if isinstance(bead_id, int):
                 row = conn.execute(
                     "SELECT * FROM hall_beads WHERE repo_id = ? AND legacy_id = ?",
@@ -384,52 +451,196 @@ class BeadLedger:
                 superseded_by=superseded_by,
             )
             materialized = self._normalize_materialized_bead(conn, self._materialize_bead(conn, bead))
-            self._upsert_record(conn, materialized.to_record())
+            # Legacy imports still need the ledger-wide supersession pass before they count as normalized.
+            self._upsert_record(conn, materialized.to_record(), normalized=materialized.source_kind != "LEGACY_IMPORT")
 
-        self.sync_tasks_projection()
+        self._project_tasks()
         return materialized
 
     def normalize_existing_beads(self) -> int:
+        """
+        Full maintenance sweep: re-normalizes every bead regardless of its normalization stamp.
+        Returns the number of rows rewritten.
+        """
+        return self._normalize_beads(pending_only=False)
+
+    def normalize_pending_beads(self) -> int:
+        """
+        Normalizes only beads stamped by an older normalization version or touched since their last pass.
+        Returns the number of rows rewritten.
+        """
+        return self._normalize_beads(pending_only=True)
+
+    def _normalize_beads(self, *, pending_only: bool) -> int:
+        if pending_only and not self._has_pending_normalization():
+            self.normalization_stats["passes"] += 1
+            self.normalization_stats["last_rows_rewritten"] = 0
+            return 0
+
         with self.connect() as conn:
-            rows = conn.execute(
-                "SELECT * FROM hall_beads WHERE repo_id = ?",
-                (self.repository.repo_id,),
-            ).fetchall()
+            if pending_only:
+                # Two index probes: rows stamped by older code, and rows touched since their last stamp.
+                rows = conn.execute(
+                    """
+                    SELECT * FROM hall_beads WHERE repo_id = ? AND normalized_version < ?
+                    UNION
+                    SELECT * FROM hall_beads WHERE repo_id = ? AND normalized_at IS NOT updated_at
+                    """,
+                    (self.repository.repo_id, self.NORMALIZATION_VERSION, self.repository.repo_id),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM hall_beads WHERE repo_id = ?",
+                    (self.repository.repo_id,),
+                ).fetchall()
 
-            updates: list[SovereignBead] = []
-            normalized_beads: list[tuple[SovereignBead, SovereignBead]] = []
+            originals: dict[str, SovereignBead] = {}
+            normalized_beads: list[SovereignBead] = []
             for row in rows:
                 original = self._row_to_bead(row)
+                originals[original.id] = original
                 materialized = self._materialize_bead(conn, original)
-                normalized = self._normalize_materialized_bead(conn, materialized)
-                normalized_beads.append((original, normalized))
-
-            superseded = self._apply_legacy_supersession([bead for _, bead in normalized_beads])
-            for original, normalized in zip((original for original, _ in normalized_beads), superseded, strict=False):
-                if (
-                    normalized.scan_id != original.scan_id
-                    or normalized.target_kind != original.target_kind
-                    or normalized.target_ref != original.target_ref
-                    or normalized.target_path != original.target_path
-                    or normalized.baseline_scores != original.baseline_scores
-                    or normalized.acceptance_criteria != original.acceptance_criteria
-                    or normalized.status != original.status
-                    or normalized.source_kind != original.source_kind
-                    or normalized.triage_reason != original.triage_reason
-                    or normalized.resolution_note != original.resolution_note
-                    or normalized.resolved_validation_id != original.resolved_validation_id
-                    or normalized.superseded_by != original.superseded_by
-                ):
+                normalized_beads.append(self._normalize_materialized_bead(conn, materialized))
+            pending_ids = set(originals)
+
+            if pending_only and any(bead.source_kind == "LEGACY_IMPORT" for bead in normalized_beads):
+                # Supersession compares legacy beads across the whole ledger, so clean candidates join the pass.
+                for row in conn.execute(
+                    """
+                    SELECT * FROM hall_beads
+                    WHERE repo_id = ? AND source_kind = 'LEGACY_IMPORT' AND status IN ('NEEDS_TRIAGE', 'ARCHIVED', 'SUPERSEDED')
+                    """,
+                    (self.repository.repo_id,),
+                ).fetchall():
+                    bead = self._row_to_bead(row)
+                    if bead.id not in originals:
+                        originals[bead.id] = bead
+                        normalized_beads.append(bead)
+
+            updates: list[SovereignBead] = []
+            stamped: list[tuple[int, str, int]] = []
+            for normalized in self._apply_legacy_supersession(normalized_beads):
+                original = originals[normalized.id]
+                if self._normalization_changed(original, normalized):
                     updates.append(normalized)
+                elif normalized.id in pending_ids:
+                    stamped.append((self.NORMALIZATION_VERSION, normalized.id, original.updated_at))
 
             for bead in updates:
-                self._upsert_record(conn, bead.to_record())
+                self._upsert_record(conn, bead.to_record(), normalized=True)
+            conn.executemany(
+                """
+                UPDATE hall_beads
+                SET normalized_version = ?, normalized_at = updated_at
+                WHERE bead_id = ? AND updated_at = ?
+                """,
+                stamped,
+            )
 
+        if updates:
+            # Normalization keeps `updated_at`, so cached projection sections cannot see these rewrites.
+            self._invalidate_projection_sections()
+        self.normalization_stats["passes"] += 1
+        self.normalization_stats["rows_examined"] += len(pending_ids)
+        self.normalization_stats["rows_rewritten"] += len(updates)
+        self.normalization_stats["last_rows_rewritten"] = len(updates)
         return len(updates)
 
+    def _has_pending_normalization(self) -> bool:
+        # Probe on the pooled reader so read-mostly callers never queue behind the writer.
+        with self.read() as conn:
+            row = conn.execute(
+                """
+                SELECT 1 FROM hall_beads WHERE repo_id = ? AND normalized_version < ?
+                UNION ALL
+                SELECT 1 FROM hall_beads WHERE repo_id = ? AND normalized_at IS NOT updated_at
+                LIMIT 1
+                """,
+                (self.repository.repo_id, self.NORMALIZATION_VERSION, self.repository.repo_id),
+            ).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _normalization_changed(original: SovereignBead, normalized: SovereignBead) -> bool:
+        return (
+            normalized.scan_id != original.scan_id
+            or normalized.target_kind != original.target_kind
+            or normalized.target_ref != original.target_ref
+            or normalized.target_path != original.target_path
+            or normalized.contract_refs != original.contract_refs
+            or normalized.baseline_scores != original.baseline_scores
+            or normalized.acceptance_criteria != original.acceptance_criteria
+            or normalized.status != original.status
+            or normalized.source_kind != original.source_kind
+            or normalized.triage_reason != original.triage_reason
+            or normalized.resolution_note != original.resolution_note
+            or normalized.resolved_validation_id != original.resolved_validation_id
+            or normalized.superseded_by != original.superseded_by
+        )
+
     def render_tasks_projection(self) -> str:
-        beads = self.list_beads()
-        projection_timestamp = max((bead.updated_at for bead in beads), default=self.repository.updated_at)
+        return self._render_tasks_projection(full=True)[0]
+
+    def _render_tasks_projection(self, *, full: bool = False) -> tuple[str, dict[str, int]]:
+        """
+        Renders tasks.qmd from per-status section caches.
+        Incremental renders only re-query and re-format sections whose Hall signature moved since the last render.
+        """
+        self.normalize_pending_beads()
+        with self._projection_lock:
+            signatures = self._refresh_projection_sections(full=full)
+            return self._assemble_tasks_projection(signatures)
+
+    def _refresh_projection_sections(self, *, full: bool) -> dict[str, tuple[Any, ...]]:
+        # Every Hall writer bumps `updated_at`, so count/updated_at/rowid totals move whenever a section's rows do.
+        with self.read() as conn:
+            signatures = {
+                str(row["status"]): (
+                    int(row["bead_count"]),
+                    row["last_updated"],
+                    row["updated_total"],
+                    row["rowid_total"],
+                )
+                for row in conn.execute(
+                    """
+                    SELECT status, COUNT(*) AS bead_count, MAX(updated_at) AS last_updated,
+                           TOTAL(updated_at) AS updated_total, TOTAL(rowid) AS rowid_total
+                    FROM hall_beads WHERE repo_id = ? GROUP BY status
+                    """,
+                    (self.repository.repo_id,),
+                ).fetchall()
+            }
+            stale = [
+                status
+                for status in PROJECTION_STATUS_ORDER
+                if full
+                or status not in self._projection_sections
+                or self._projection_sections[status][0] != signatures.get(status, ())
+            ]
+            section_beads: dict[str, list[SovereignBead]] = {status: [] for status in stale}
+            if stale:
+                placeholders = ", ".join("?" for _ in stale)
+                for row in conn.execute(
+                    f"SELECT * FROM hall_beads WHERE repo_id = ? AND status IN ({placeholders})",
+                    (self.repository.repo_id, *stale),
+                ).fetchall():
+                    bead = self._row_to_bead(row)
+                    section_beads[bead.status].append(bead)
+
+        for status in stale:
+            beads = sorted(section_beads[status], key=self._sort_key)
+            section = [self._format_projection_line(bead) for bead in beads] or ["- None"]
+            self._projection_sections[status] = (signatures.get(status, ()), section)
+        self.projection_stats["renders"] += 1
+        self.projection_stats["sections_rendered"] += len(stale)
+        return signatures
+
+    def _assemble_tasks_projection(self, signatures: dict[str, tuple[Any, ...]]) -> tuple[str, dict[str, int]]:
+        counts = {status: signature[0] for status, signature in signatures.items()}
+        projection_timestamp = max(
+            (signature[1] for signature in signatures.values()),
+            default=self.repository.updated_at,
+        )
         generated_at = (
             time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(projection_timestamp / 1000))
             if projection_timestamp
@@ -447,35 +658,62 @@ class BeadLedger:
             "`tasks.qmd` is a projection of the Hall of Records. Do not edit bead state here.",
             "",
             f"- Repository: `{self.repository.repo_id}`",
-            f"- Open Beads: `{sum(1 for bead in beads if bead.status == 'OPEN')}`",
-            f"- Set Pending: `{sum(1 for bead in beads if bead.status == 'SET-PENDING')}`",
-            f"- Set Beads: `{sum(1 for bead in beads if bead.status == 'SET')}`",
-            f"- In Progress: `{sum(1 for bead in beads if bead.status == 'IN_PROGRESS')}`",
-            f"- Ready For Review: `{sum(1 for bead in beads if bead.status == 'READY_FOR_REVIEW')}`",
-            f"- Needs Triage: `{sum(1 for bead in beads if bead.status == 'NEEDS_TRIAGE')}`",
-            f"- Blocked: `{sum(1 for bead in beads if bead.status == 'BLOCKED')}`",
-            f"- Resolved: `{sum(1 for bead in beads if bead.status == 'RESOLVED')}`",
-            f"- Archived: `{sum(1 for bead in beads if bead.status == 'ARCHIVED')}`",
-            f"- Superseded: `{sum(1 for bead in beads if bead.status == 'SUPERSEDED')}`",
+            f"- Open Beads: `{counts.get('OPEN', 0)}`",
+            f"- Set Pending: `{counts.get('SET-PENDING', 0)}`",
+            f"- Set Beads: `{counts.get('SET', 0)}`",
+            f"- In Progress: `{counts.get('IN_PROGRESS', 0)}`",
+            f"- Ready For Review: `{counts.get('READY_FOR_REVIEW', 0)}`",
+            f"- Needs Triage: `{counts.get('NEEDS_TRIAGE', 0)}`",
+            f"- Blocked: `{counts.get('BLOCKED', 0)}`",
+            f"- Resolved: `{counts.get('RESOLVED', 0)}`",
+            f"- Archived: `{counts.get('ARCHIVED', 0)}`",
+            f"- Superseded: `{counts.get('SUPERSEDED', 0)}`",
             "",
         ]
 
         for status in PROJECTION_STATUS_ORDER:
-            section_beads = [bead for bead in beads if bead.status == status]
             lines.append(f"## {self._section_title(status)}")
-            if section_beads:
-                for bead in section_beads:
-                    lines.append(self._format_projection_line(bead))
-            else:
-                lines.append("- None")
+            lines.extend(self._projection_sections[status][1])
             lines.append("")
 
-        return "\n".join(lines).rstrip() + "\n"
+        return "\n".join(lines).rstrip() + "\n", counts
 
     def sync_tasks_projection(self) -> int:
-        content = self.render_tasks_projection()
-        self.tasks_file.write_text(content, encoding="utf-8")
-        return len(self.list_beads(statuses=("OPEN", "IN_PROGRESS", "READY_FOR_REVIEW")))
+        """Rebuilds tasks.qmd in full right now, absorbing any pending deferred write."""
+        self._invalidate_projection_sections()
+        if self._projection_writer is not None:
+            self._projection_writer.mark_dirty()
+            self._projection_writer.flush()
+            return self._last_active_count
+        return self._write_tasks_projection()
+
+    def flush_tasks_projection(self) -> bool:
+        """Flushes a pending deferred projection write. Returns True when tasks.qmd was rewritten."""
+        if self._projection_writer is None:
+            return False
+        return self._projection_writer.flush()
+
+    def close(self) -> None:
+        """Flushes any pending deferred projection write; later mutations project synchronously."""
+        if self._projection_writer is not None:
+            writer, self._projection_writer = self._projection_writer, None
+            writer.close()
+
+    def _invalidate_projection_sections(self) -> None:
+        with self._projection_lock:
+            self._projection_sections.clear()
+
+    def _project_tasks(self) -> None:
+        if self._projection_writer is not None:
+            self._projection_writer.mark_dirty()
+        else:
+            self._write_tasks_projection()
+
+    def _write_tasks_projection(self) -> int:
+        content, counts = self._render_tasks_projection()
+        write_projection_atomically(self.tasks_file, content)
+        self._last_active_count = sum(counts.get(status, 0) for status in ("OPEN", "IN_PROGRESS", "READY_FOR_REVIEW"))
+        return self._last_active_count
 
     def projection_matches(self) -> bool:
         expected = self.render_tasks_projection()
@@ -524,53 +762,55 @@ class BeadLedger:
             superseded_by=bead.superseded_by,
         )
 
-    def _list_actionable_beads(self, statuses: Sequence[str] | None = None) -> list[SovereignBead]:
-        beads = self.list_beads(statuses=statuses)
-        return [bead for bead in beads if self._is_claimable(bead)]
-
-    def _select_next_claimable_bead(self, conn) -> SovereignBead | None:
-        rows = conn.execute(
-            """
-            SELECT * FROM hall_beads
-            WHERE repo_id = ? AND status IN ('SET', 'OPEN')
-            """,
-            (self.repository.repo_id,),
-        ).fetchall()
-        beads = sorted(
-            (self._row_to_bead(row) for row in rows if self._is_claimable(self._row_to_bead(row))),
-            key=self._claim_sort_key,
+    def _claim_candidate_sql(self, *, p1_scan_only: bool = False) -> str:
+        """
+        Returns a single-row lookup against `idx_hall_beads_claim` for one claim status.
+        The persisted `claimable`/`claim_priority` columns mirror `_is_claimable` and `_claim_sort_key`.
+        """
+        scope = (
+            " AND scan_id IN (SELECT scan_id FROM hall_scans WHERE scan_kind = 'P1_SCAN')"
+            if p1_scan_only
+            else ""
+        )
+        return (
+            "SELECT bead_id FROM hall_beads"
+            f" WHERE repo_id = ? AND claimable = 1 AND status = ?{scope}"
+            " ORDER BY claim_priority, created_at, bead_id LIMIT 1"
         )
-        return beads[0] if beads else None
+
+    def _select_next_claimable_bead(self, conn, *, p1_scan_only: bool = False) -> SovereignBead | None:
+        candidate = self._claim_candidate_sql(p1_scan_only=p1_scan_only)
+        row = conn.execute(
+            f"SELECT * FROM hall_beads WHERE bead_id = COALESCE(({candidate}), ({candidate}))",
+            (self.repository.repo_id, "SET", self.repository.repo_id, "OPEN"),
+        ).fetchone()
+        return self._row_to_bead(row) if row else None
 
     def _select_next_p1_scan_bead(self, conn) -> SovereignBead | None:
         """
         Selects the next claimable P1_SCAN bead, ordered by claim priority.
         Filters to beads whose scan_id belongs to a scan with scan_kind = 'P1_SCAN'.
         """
-        rows = conn.execute(
-            """
-            SELECT b.* FROM hall_beads b
-            JOIN hall_scans s ON s.scan_id = b.scan_id
-            WHERE b.repo_id = ? AND b.status IN ('SET', 'OPEN') AND s.scan_kind = 'P1_SCAN'
-            """,
-            (self.repository.repo_id,),
-        ).fetchall()
-        beads = sorted(
-            (self._row_to_bead(row) for row in rows if self._is_claimable(self._row_to_bead(row))),
-            key=self._claim_sort_key,
-        )
-        return beads[0] if beads else None
-
-    def _claim_selected_bead(self, agent_id: str, selector) -> SovereignBead | None:
-        for _ in range(self.CLAIM_RETRY_LIMIT):
-            with self.connect() as conn:
-                bead = selector(conn)
-                if bead is None:
-                    return None
-                claimed = self._claim_bead_in_transaction(conn, bead, agent_id)
-                if claimed is not None:
-                    return claimed
-        return None
+        return self._select_next_claimable_bead(conn, p1_scan_only=True)
+
+    def _claim_next_indexed_bead(self, agent_id: str, *, p1_scan_only: bool = False) -> SovereignBead | None:
+        """
+        Selects and flips the next claimable bead to IN_PROGRESS in one `UPDATE ... RETURNING` statement.
+        SET beads are probed before OPEN beads, each through an index seek rather than a table sort.
+        """
+        candidate = self._claim_candidate_sql(p1_scan_only=p1_scan_only)
+        with self.connect() as conn:
+            row = conn.execute(
+                f"""
+                UPDATE hall_beads
+                SET status = 'IN_PROGRESS', assigned_agent = ?, updated_at = ?
+                WHERE bead_id = COALESCE(({candidate}), ({candidate}))
+                  AND status IN ('SET', 'OPEN')
+                RETURNING *
+                """,
+                (agent_id, self._now(), self.repository.repo_id, "SET", self.repository.repo_id, "OPEN"),
+            ).fetchone()
+        return self._row_to_bead(row) if row else None
 
     def _get_bead_for_update(self, conn, bead_id: str | int) -> SovereignBead | None:
         if isinstance(bead_id, int):
@@ -792,14 +1032,15 @@ class BeadLedger:
             return row
         return None
 
-    def _upsert_record(self, conn, record: HallBeadRecord) -> None:
+    def _upsert_record(self, conn, record: HallBeadRecord, *, normalized: bool = False) -> None:
+        """Writes a bead row; `normalized=True` stamps it so lazy normalization skips it until it is touched again."""
         conn.execute(
             """
             INSERT INTO hall_beads (
                 bead_id, repo_id, scan_id, legacy_id, target_kind, target_ref, target_path, rationale, contract_refs_json,
                 baseline_scores_json, acceptance_criteria, checker_shell, status, assigned_agent, source_kind, triage_reason,
-                resolution_note, resolved_validation_id, superseded_by, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                resolution_note, resolved_validation_id, superseded_by, created_at, updated_at, normalized_version, normalized_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(bead_id) DO UPDATE SET
                 scan_id = excluded.scan_id,
                 legacy_id = excluded.legacy_id,
@@ -818,7 +1059,9 @@ class BeadLedger:
                 resolution_note = excluded.resolution_note,
                 resolved_validation_id = excluded.resolved_validation_id,
                 superseded_by = excluded.superseded_by,
-                updated_at = excluded.updated_at
+                updated_at = excluded.updated_at,
+                normalized_version = excluded.normalized_version,
+                normalized_at = excluded.normalized_at
             """,
             (
                 record.bead_id,
@@ -842,6 +1085,8 @@ class BeadLedger:
                 record.superseded_by,
                 record.created_at,
                 record.updated_at,
+                self.NORMALIZATION_VERSION if normalized else 0,
+                record.updated_at if normalized else None,
             ),
         )
 
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any
+
+_MISSING = object()
+
+
+def shallow_sizeof(key: Any, value: Any) -> int:
+    """Approximate footprint of one entry: the key, the value, and one level of its contents."""
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(sys.getsizeof(item) for item in value.values())
+    return size
+
+
+class BoundedCache:
+    """
+    Thread-safe LRU mapping bounded by entry count and, optionally, approximate bytes.
+    Entries are stamped with the cache generation on write; `invalidate()` bumps the generation in O(1)
+    and older entries are dropped the next time they are looked up or reach the LRU tail.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        *,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any, Any], int] = shallow_sizeof,
+        name: str = "cache",
+    ):
+        self.name = name
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict[Hashable, tuple[int, int, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.stats["misses"] += 1
+                return default
+            self.stats["hits"] += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(key, value) if self.max_bytes is not None else 0
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (self._generation, size, value)
+            self._bytes += size
+            self._enforce_bounds()
+
+    def invalidate(self) -> int:
+        """Marks every current entry stale. Returns the new generation."""
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def describe(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "generation": self._generation,
+                **self.stats,
+            }
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            if not self._drop(key):
+                raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] == self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] != self._generation:
+            self._drop(key)
+            self.stats["invalidations"] += 1
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def _drop(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def _enforce_bounds(self) -> None:
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1
+        ):
+            _, (generation, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            if generation == self._generation:
+                self.stats["evictions"] += 1
+            else:
+                self.stats["invalidations"] += 1
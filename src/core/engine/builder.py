@@ -8,6 +8,9 @@ from pathlib import Path
 from src.core.engine.instruction_loader import InstructionLoader
 from src.core.engine.memory_db import MemoryDB
 from src.core.engine.vector import SovereignVector
+from src.core.engine.vector_ingest import VectorIngest
+from src.core.engine.vector_snapshot import VectorSnapshot
+from src.core.sovereign_hud import SovereignHUD
 
 class SovereignBuilder:
     """
@@ -20,23 +23,55 @@ class SovereignBuilder:
         self.thresholds = thresholds
 
     def build_vector_engine(self, skills_db_path: Path) -> SovereignVector:
-        """Initializes and builds the semantic search index."""
-        thesaurus = self.project_root / "src" / "data" / "thesaurus.qmd"
-        corrections = self.base_path / "corrections.json"
-        stopwords = self.project_root / "src" / "data" / "stopwords.json"
+        """
+        Initializes and builds the semantic search index.
+        Warm-starts from the vector snapshot when none of its inputs changed, and refreshes it otherwise.
+        """
+        thesaurus, corrections, stopwords = self._asset_paths()
 
-        memory_db = MemoryDB(str(self.base_path))
+        memory_db = MemoryDB(str(self.project_root))
         instruction_loader = InstructionLoader(str(self.project_root))
 
         if skills_db_path.exists():
             instruction_loader.add_source(str(skills_db_path))
 
-        vector = SovereignVector(str(thesaurus), str(corrections), str(stopwords))
-        vector.memory_db = memory_db
+        snapshot, key, state = None, b"", None
+        if VectorSnapshot.enabled():
+            snapshot = VectorSnapshot(self.base_path / VectorSnapshot.FILENAME)
+            key = self.input_fingerprint()
+            state = snapshot.load(key)
+
+        vector = SovereignVector(
+            str(thesaurus), str(corrections), str(stopwords),
+            memory_db=memory_db, instruction_loader=instruction_loader, state=state,
+        )
         vector.loader = instruction_loader
 
         vector.load_core_skills()
-        vector.load_skills_from_dir(str(self.project_root / "src" / "skills" / "local"))
+        vector.load_skills_from_dir(str(self._local_skills_dir()))
         vector.build_index()
 
+        if snapshot is not None and state is None:
+            try:
+                snapshot.save(key, vector.export_state())
+            except (OSError, ValueError) as e:
+                SovereignHUD.persona_log("WARN", f"Vector snapshot write failed: {e}")
+
         return vector
+
+    def input_fingerprint(self) -> bytes:
+        """Digest of every file the vector engine is built from; changes whenever a rebuild is due."""
+        skill_files = [
+            f for directory in (SovereignVector.PROJECT_ROOT / ".agents" / "workflows", self._local_skills_dir())
+            for f in VectorIngest.skill_files(directory)
+        ]
+        return VectorSnapshot.fingerprint(list(self._asset_paths()), skill_files)
+
+    def _asset_paths(self) -> tuple[Path, Path, Path]:
+        thesaurus = self.project_root / "src" / "data" / "thesaurus.qmd"
+        corrections = self.base_path / "corrections.json"
+        stopwords = self.project_root / "src" / "data" / "stopwords.json"
+        return thesaurus, corrections, stopwords
+
+    def _local_skills_dir(self) -> Path:
+        return self.project_root / "src" / "skills" / "local"
@@ -56,7 +56,7 @@ def _claim_specific_bead(ledger: BeadLedger, bead: SovereignBead, agent_id: str)
 
 
 def _preview_bead(ledger: BeadLedger, bead_id: str | None) -> SovereignBead | None:
-    ledger.normalize_existing_beads()
+    ledger.normalize_pending_beads()
     if bead_id:
         return ledger.get_bead(bead_id)
     for bead in ledger.list_beads(statuses=("OPEN",)):
@@ -150,7 +150,7 @@ def execute_evolve(
     hall_repo = hall.bootstrap_repository()
     agent_id = "skill:evolve"
     focus_axes = list(focus_axes or [])
-    ledger.normalize_existing_beads()
+    ledger.normalize_pending_beads()
 
     if dry_run:
         bead = _preview_bead(ledger, bead_id)
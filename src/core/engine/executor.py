@@ -15,6 +15,14 @@ class SovereignExecutor:
     def __init__(self, project_root: Path, base_path: Path):
         self.project_root = project_root
         self.base_path = base_path
+        self._cortex: Cortex | None = None
+
+    @property
+    def cortex(self) -> Cortex:
+        """The Knowledge Graph, built on first use and kept warm; Cortex.query re-ingests changed docs."""
+        if self._cortex is None:
+            self._cortex = Cortex(str(self.project_root), str(self.base_path))
+        return self._cortex
 
     def handle_proactive(self, payload) -> None:
         """Executes automated tasks based on payload triggers."""
@@ -48,8 +56,7 @@ class SovereignExecutor:
 
     def handle_cortex_query(self, query: str) -> None:
         """Direct search against the Knowledge Graph."""
-        cortex = Cortex(str(self.project_root), str(self.base_path))
-        results = cortex.search(query)
+        results = self.cortex.search(query)
 
         SovereignHUD.box_top("CORTEX KNOWLEDGE")
         if not results:
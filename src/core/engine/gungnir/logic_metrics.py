@@ -0,0 +1,146 @@
+import ast
+from dataclasses import dataclass, field
+
+# Scope of a node while walking, mirroring which radon ComplexityVisitor would see it.
+_MODULE, _CLASS, _FUNCTION, _DETACHED = range(4)
+
+_FUNCTION_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
+_SETUP_STATEMENTS = (ast.Assign, ast.AnnAssign, ast.AugAssign)
+_EXECUTION_STATEMENTS = (ast.Return, ast.Expr, ast.Raise, ast.Yield, ast.YieldFrom)
+_DOC_PREFIXES = ('#', '"""', "'''")
+
+
+class _Block:
+    """Complexity accumulator for one radon block (function, method or class)."""
+
+    __slots__ = ("complexity", "methods")
+
+    def __init__(self) -> None:
+        self.complexity = 1
+        self.methods: list[_Block] = []
+
+    @property
+    def total(self) -> int:
+        # radon reports a class by the average over its methods of (own decisions + method complexities).
+        if not self.methods:
+            return self.complexity
+        real = self.complexity + sum(method.complexity for method in self.methods)
+        return int(real / len(self.methods)) + (len(self.methods) > 1)
+
+
+@dataclass(slots=True)
+class LogicMetrics:
+    """Everything the Gungnir logic rules need from one Python source, gathered in a single pass."""
+
+    block_complexities: list[int] = field(default_factory=list)
+    import_count: int = 0
+    # (setup statements, execution statements) per function, in `ast.walk` order.
+    function_balance: list[tuple[int, int]] = field(default_factory=list)
+    total_lines: int = 0
+    doc_lines: int = 0
+    # 1-based line that first exceeds `claustrophobia_limit` consecutive logic lines, else None.
+    claustrophobic_line: int | None = None
+
+    @property
+    def average_complexity(self) -> float:
+        blocks = self.block_complexities
+        return sum(blocks) / len(blocks) if blocks else 1
+
+
+def measure_logic(code: str, claustrophobia_limit: int = 12) -> LogicMetrics:
+    """
+    Parses `code` once and measures it in one tree walk plus one line scan.
+    Block complexities equal radon's `cc_visit` (functions, classes, and methods of top-level classes).
+    Raises SyntaxError/ValueError exactly as `ast.parse` does.
+    """
+    tree = ast.parse(code)
+    metrics = LogicMetrics()
+    blocks: list[_Block] = []
+    functions: list[tuple[int, int, int, int]] = []
+
+    # Preorder walk; (depth, preorder index) sorts nodes the way ast.walk's breadth-first queue does.
+    stack: list[tuple[ast.AST, int, _Block | None, int]] = [(tree, _MODULE, None, 0)]
+    order = 0
+    while stack:
+        node, scope, block, depth = stack.pop()
+        order += 1
+        child_scope, child_block = scope, block
+        body_scope, body_block = scope, block
+        body: list[ast.AST] = []
+
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            metrics.import_count += 1
+        elif isinstance(node, _FUNCTION_DEFS):
+            functions.append((
+                depth, order,
+                sum(isinstance(stmt, _SETUP_STATEMENTS) for stmt in node.body),
+                sum(isinstance(stmt, _EXECUTION_STATEMENTS) for stmt in node.body),
+            ))
+            # radon only visits a function's body; closures and nested classes are not blocks.
+            child_scope, child_block = _DETACHED, None
+            body_scope, body_block = _DETACHED, None
+            body = node.body
+            if scope in (_MODULE, _CLASS):
+                function = _Block()
+                blocks.append(function)
+                if scope == _CLASS:
+                    block.methods.append(function)
+                body_scope, body_block = _FUNCTION, function
+        elif isinstance(node, ast.ClassDef):
+            child_scope, child_block = _DETACHED, None
+            body_scope, body_block = _DETACHED, None
+            body = node.body
+            if scope == _MODULE:
+                cls = _Block()
+                blocks.append(cls)
+                body_scope, body_block = _CLASS, cls
+        elif block is not None:
+            block.complexity += _decision_points(node)
+            if isinstance(node, ast.Assert):
+                # radon counts an assert once and never looks inside it.
+                child_scope, child_block = _DETACHED, None
+
+        children = list(ast.iter_child_nodes(node))
+        body_ids = {id(stmt) for stmt in body}
+        for child in reversed(children):
+            if id(child) in body_ids:
+                stack.append((child, body_scope, body_block, depth + 1))
+            else:
+                stack.append((child, child_scope, child_block, depth + 1))
+
+    metrics.block_complexities = [block.total for block in blocks]
+    metrics.function_balance = [(setup, execution) for _, _, setup, execution in sorted(functions)]
+
+    consecutive = 0
+    for line_idx, line in enumerate(code.split('\n')):
+        metrics.total_lines += 1
+        stripped = line.strip()
+        if stripped.startswith(_DOC_PREFIXES):
+            metrics.doc_lines += 1
+        if metrics.claustrophobic_line is None:
+            if stripped and not stripped.startswith('#'):
+                consecutive += 1
+                if consecutive > claustrophobia_limit:
+                    metrics.claustrophobic_line = line_idx + 1
+            else:
+                consecutive = 0
+    return metrics
+
+
+def _decision_points(node: ast.AST) -> int:
+    """Decision points radon's ComplexityVisitor adds for `node` itself (children are counted separately)."""
+    name = type(node).__name__
+    if name in ('Try', 'TryExcept'):
+        return len(node.handlers) + bool(node.orelse)
+    if name == 'BoolOp':
+        return len(node.values) - 1
+    if name in ('If', 'IfExp', 'Assert'):
+        return 1
+    if name == 'Match':
+        wildcard = any(getattr(case.pattern, "pattern", False) is None for case in node.cases)
+        return max(0, len(node.cases) - wildcard)
+    if name in ('For', 'While', 'AsyncFor'):
+        return bool(node.orelse) + 1
+    if name == 'comprehension':
+        return len(node.ifs) + 1
+    return 0
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Mapping
 
 GUNGNIR_SCHEMA_VERSION = "1.0"
@@ -72,6 +72,10 @@ class GungnirMatrix:
     aesthetic: float = 0.0
 
 
+# Every matrix field is a flat scalar, so a shallow field copy matches `asdict` without its deep-copy cost.
+_MATRIX_FIELDS = tuple(matrix_field.name for matrix_field in fields(GungnirMatrix))
+
+
 def build_gungnir_matrix(
     payload: Mapping[str, Any] | GungnirMatrix | None = None,
     **overrides: Any,
@@ -128,7 +132,7 @@ def matrix_to_dict(payload: Mapping[str, Any] | GungnirMatrix | None = None) ->
     if payload is None:
         return {}
     if isinstance(payload, GungnirMatrix):
-        return asdict(payload)
+        return {name: getattr(payload, name) for name in _MATRIX_FIELDS}
     return dict(payload)
 
 
@@ -1,7 +1,8 @@
-import ast
 import re
 from typing import Any
 
+from src.core.engine.analysis_cache import AnalysisCache, content_hash
+from src.core.engine.gungnir.logic_metrics import measure_logic
 from src.core.engine.gungnir.schema import GungnirMatrix, build_gungnir_matrix, matrix_to_dict
 
 
@@ -10,8 +11,17 @@ class UniversalGungnir:
     Universal Aesthetic Calculus Engine.
     Implements Birkhoff's Measure (M = O / C) across C* domains.
     V5: Returns structured audit reports for Forge integration.
+    V6: Optionally persists audits and matrices in an AnalysisCache keyed by content hash.
     """
 
+    AUDIT_NAMESPACE = "gungnir.audit"
+    MATRIX_NAMESPACE = "gungnir.matrix"
+    # Bump whenever an audit rule or the matrix weighting changes so cached results stop matching.
+    RULES_VERSION = "gungnir-1"
+
+    def __init__(self, cache: AnalysisCache | None = None) -> None:
+        self.cache = cache
+
     def audit(self, code_string: str, file_ext: str) -> list[str]:
         """Audits code and returns a list of aesthetic breach messages (strings)."""
         report = self.audit_logic(code_string, file_ext)
@@ -19,8 +29,20 @@ class UniversalGungnir:
 
     def audit_logic(self, code: str, ext: str) -> list[dict[str, Any]]:
         """Structured audit for logic files (PY/TS/JS)."""
-        breaches = []
         ext = ext.lower()
+        key = AnalysisCache.key(content_hash(code), ext) if self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(self.AUDIT_NAMESPACE, self.RULES_VERSION, key)
+            if cached is not None:
+                return cached
+
+        breaches = self._audit(code, ext)
+        if key is not None:
+            self.cache.put(self.AUDIT_NAMESPACE, self.RULES_VERSION, key, breaches)
+        return breaches
+
+    def _audit(self, code: str, ext: str) -> list[dict[str, Any]]:
+        breaches = []
 
         if ext in ('.py', '.ts', '.js', '.tsx', '.jsx'):
             breaches.extend(self._audit_logic_rules(code, ext))
@@ -34,6 +56,18 @@ class UniversalGungnir:
         return breaches
 
     def score_matrix(self, code: str, ext: str) -> dict[str, Any]:
+        key = AnalysisCache.key(content_hash(code), ext.lower()) if self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(self.MATRIX_NAMESPACE, self.RULES_VERSION, key)
+            if cached is not None:
+                return cached
+
+        matrix = self._score_matrix(code, ext)
+        if key is not None:
+            self.cache.put(self.MATRIX_NAMESPACE, self.RULES_VERSION, key, matrix)
+        return matrix
+
+    def _score_matrix(self, code: str, ext: str) -> dict[str, Any]:
         breaches = self.audit_logic(code, ext)
         logic = 10.0
         style = 10.0
@@ -80,51 +114,38 @@ class UniversalGungnir:
 
         if ext == '.py':
             try:
-                tree = ast.parse(code)
-                
-                # 1. Logic [L] & Stability [T]: Complexity analysis
-                import radon.complexity as cc
-                results = cc.cc_visit(code)
-                avg_cc = sum(r.complexity for r in results) / len(results) if results else 1
-                if avg_cc > 15:
-                    breaches.append({"severity": "HIGH", "action": f"GUNGNIR_LOGIC_BREACH: High Complexity ({avg_cc:.1f}). Refactor God Methods."})
-                
-                # 2. Coupling [C]: Import counting
-                imports = [node for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))]
-                if len(imports) > 10:
-                    breaches.append({"severity": "MEDIUM", "action": f"GUNGNIR_COUPLING_BREACH: Over-entangled ({len(imports)} imports). Isolate dependencies."})
-
-                # 3. Intel [I]: Docstring/Comment ratio
-                lines = code.split('\n')
-                total_lines = len(lines)
-                doc_lines = sum(1 for line in lines if line.strip().startswith(('#', '\"\"\"', '\'\'\'')))
-                if total_lines > 20 and (doc_lines / total_lines) < 0.15:
-                    breaches.append({"severity": "MEDIUM", "action": f"GUNGNIR_INTEL_BREACH: Low documentation ratio ({doc_lines/total_lines:.2f}). Add intents/docstrings."})
-
-                # 4. Balance [B]: Detect top-heavy setup versus execution
-                for node in [n for n in ast.walk(tree) if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]:
-                    setup_steps = sum(isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)) for stmt in node.body)
-                    execution_steps = sum(isinstance(stmt, (ast.Return, ast.Expr, ast.Raise, ast.Yield, ast.YieldFrom)) for stmt in node.body)
-                    if execution_steps and setup_steps / execution_steps > 1.7:
-                        breaches.append({
-                            "severity": "MEDIUM",
-                            "action": f"GUNGNIR_LOGIC_BREACH: top-heavy setup detected ({setup_steps/execution_steps:.1f}). Reduce preamble before execution."
-                        })
-                        break
-
-                # 5. Style [S]: Claustrophobia check
-                consecutive = 0
-                for line in lines:
-                    if line.strip() and not line.strip().startswith('#'):
-                        consecutive += 1
-                        if consecutive > 12:
-                            breaches.append({"severity": "LOW", "action": "GUNGNIR_STYLE_BREACH: Claustrophobic code block (>12 lines)."})
-                            break
-                    else:
-                        consecutive = 0
-
+                # One parse, one tree walk and one line scan feed every rule below.
+                metrics = measure_logic(code)
             except Exception as e:
                 breaches.append({"severity": "CRITICAL", "action": f"GUNGNIR_PARSE_ERROR: {e}"})
+                return breaches
+
+            # 1. Logic [L] & Stability [T]: Complexity analysis (radon cc_visit equivalent)
+            avg_cc = metrics.average_complexity
+            if avg_cc > 15:
+                breaches.append({"severity": "HIGH", "action": f"GUNGNIR_LOGIC_BREACH: High Complexity ({avg_cc:.1f}). Refactor God Methods."})
+
+            # 2. Coupling [C]: Import counting
+            if metrics.import_count > 10:
+                breaches.append({"severity": "MEDIUM", "action": f"GUNGNIR_COUPLING_BREACH: Over-entangled ({metrics.import_count} imports). Isolate dependencies."})
+
+            # 3. Intel [I]: Docstring/Comment ratio
+            total_lines, doc_lines = metrics.total_lines, metrics.doc_lines
+            if total_lines > 20 and (doc_lines / total_lines) < 0.15:
+                breaches.append({"severity": "MEDIUM", "action": f"GUNGNIR_INTEL_BREACH: Low documentation ratio ({doc_lines/total_lines:.2f}). Add intents/docstrings."})
+
+            # 4. Balance [B]: Detect top-heavy setup versus execution
+            for setup_steps, execution_steps in metrics.function_balance:
+                if execution_steps and setup_steps / execution_steps > 1.7:
+                    breaches.append({
+                        "severity": "MEDIUM",
+                        "action": f"GUNGNIR_LOGIC_BREACH: top-heavy setup detected ({setup_steps/execution_steps:.1f}). Reduce preamble before execution."
+                    })
+                    break
+
+            # 5. Style [S]: Claustrophobia check
+            if metrics.claustrophobic_line is not None:
+                breaches.append({"severity": "LOW", "action": "GUNGNIR_STYLE_BREACH: Claustrophobic code block (>12 lines)."})
 
         elif ext in ('.tsx', '.jsx', '.ts', '.js'):
             elements = len(re.findall(r'<[a-zA-Z0-9]+', code))
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+BUSY_TIMEOUT_MS = 5000
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_CACHE_SIZE = -32_000  # Negative values are KiB, per SQLite's `cache_size` convention.
+DEFAULT_STATEMENT_CACHE = 256
+# Managers for the most recently used databases stay open even when no Hall object references them.
+RETAINED_DATABASES = 8
+
+
+def hall_db_path(project_root: Path | str) -> Path:
+    return Path(project_root) / ".stats" / "pennyone.db"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+class _WriterSession:
+    """Context manager that holds the serialized writer for the duration of a `with` block."""
+
+    __slots__ = ("_manager",)
+
+    def __init__(self, manager: HallConnectionManager):
+        self._manager = manager
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._manager._enter_writer()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._manager._exit_writer(exc_type is None)
+        return False
+
+
+class HallConnectionManager:
+    """
+    Per-process connection pool for one Hall database.
+    Each thread gets a long-lived read-only connection; writes share one connection serialized by a lock.
+    PRAGMAs are applied once per connection rather than once per operation.
+    """
+
+    _registry: weakref.WeakValueDictionary[tuple[int, str], HallConnectionManager] = weakref.WeakValueDictionary()
+    _retained: OrderedDict[tuple[int, str], HallConnectionManager] = OrderedDict()
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        busy_timeout_ms: int = BUSY_TIMEOUT_MS,
+        mmap_size: int | None = None,
+        cache_size: int | None = None,
+        statement_cache: int | None = None,
+    ):
+        self.db_path = Path(db_path)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.mmap_size = mmap_size if mmap_size is not None else _env_int("CSTAR_HALL_MMAP_SIZE", DEFAULT_MMAP_SIZE)
+        self.cache_size = cache_size if cache_size is not None else _env_int("CSTAR_HALL_CACHE_SIZE", DEFAULT_CACHE_SIZE)
+        self.statement_cache = (
+            statement_cache
+            if statement_cache is not None
+            else _env_int("CSTAR_HALL_STATEMENT_CACHE", DEFAULT_STATEMENT_CACHE)
+        )
+        self.stats = {"writer_opens": 0, "reader_opens": 0, "resets": 0}
+        self.schema_ready = False
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.RLock()
+        self._writer_depth = 0
+        self._readers = threading.local()
+        self._generation = 0
+        self._identity: tuple[int, int] | None = None
+        self._identity_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, db_path: Path | str) -> HallConnectionManager:
+        """Returns the shared manager for `db_path` in this process, creating it on first use."""
+        key = (os.getpid(), os.path.abspath(db_path))
+        with cls._registry_lock:
+            manager = cls._registry.get(key)
+            if manager is None:
+                manager = cls(db_path)
+                cls._registry[key] = manager
+            cls._retained[key] = manager
+            cls._retained.move_to_end(key)
+            while len(cls._retained) > RETAINED_DATABASES:
+                cls._retained.popitem(last=False)
+            return manager
+
+    def writer(self) -> _WriterSession:
+        """`with manager.writer() as conn:` commits on success and rolls back on error at the outermost block."""
+        return _WriterSession(self)
+
+    def reader(self) -> sqlite3.Connection:
+        """Returns this thread's read-only connection."""
+        self._check_identity()
+        conn = getattr(self._readers, "conn", None)
+        if conn is None or self._readers.generation != self._generation:
+            if conn is not None:
+                conn.close()
+            conn = self._open(read_only=True)
+            self._readers.conn = conn
+            self._readers.generation = self._generation
+        return conn
+
+    def is_schema_ready(self) -> bool:
+        self._check_identity()
+        return self.schema_ready
+
+    def close(self) -> None:
+        """Closes the writer and this thread's reader; other threads reopen lazily on their next call."""
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._generation += 1
+            self.schema_ready = False
+        conn = getattr(self._readers, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._readers.conn = None
+
+    def _enter_writer(self) -> sqlite3.Connection:
+        self._writer_lock.acquire()
+        try:
+            if self._writer_depth == 0:
+                self._check_identity()
+            if self._writer is None:
+                self._writer = self._open(read_only=False)
+        except BaseException:
+            self._writer_lock.release()
+            raise
+        self._writer_depth += 1
+        return self._writer
+
+    def _exit_writer(self, succeeded: bool) -> None:
+        try:
+            self._writer_depth -= 1
+            if self._writer_depth == 0 and self._writer is not None:
+                if succeeded:
+                    try:
+                        self._writer.commit()
+                    except sqlite3.Error:
+                        self._writer.rollback()
+                        raise
+                else:
+                    self._writer.rollback()
+        finally:
+            self._writer_lock.release()
+
+    def _open(self, *, read_only: bool) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=self.statement_cache,
+        )
+        conn.row_factory = sqlite3.Row
+        # Configure SQLite for concurrent read/write workloads on the Hall DB.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        conn.execute(f"PRAGMA cache_size={self.cache_size}")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+            self.stats["reader_opens"] += 1
+        else:
+            self.stats["writer_opens"] += 1
+        self._record_identity()
+        return conn
+
+    def _file_identity(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def _record_identity(self) -> None:
+        with self._identity_lock:
+            if self._identity is None:
+                self._identity = self._file_identity()
+
+    def _check_identity(self) -> None:
+        """Drops pooled connections when the database file was deleted or replaced underneath them."""
+        if self._identity is None:
+            return
+        current = self._file_identity()
+        if current == self._identity:
+            return
+        with self._writer_lock:
+            with self._identity_lock:
+                if self._identity is None or self._file_identity() == self._identity:
+                    return
+                self._identity = None
+            if self._writer is not None and self._writer_depth == 0:
+                self._writer.close()
+                self._writer = None
+            self._generation += 1
+            self.schema_ready = False
+            self.stats["resets"] += 1
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "db_path": str(self.db_path),
+            "mmap_size": self.mmap_size,
+            "cache_size": self.cache_size,
+            "statement_cache": self.statement_cache,
+            **self.stats,
+        }
+
+
+def get_hall_connections(project_root: Path | str) -> HallConnectionManager:
+    """Returns the shared connection manager for a workspace's `.stats/pennyone.db`."""
+    return HallConnectionManager.for_path(hall_db_path(project_root))
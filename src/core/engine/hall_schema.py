@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import json
 import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
 from src.core.engine.gungnir.schema import GungnirMatrix, build_gungnir_matrix, get_gungnir_overall, matrix_to_dict
+from src.core.engine.hall_connections import BUSY_TIMEOUT_MS, HallConnectionManager
 
 HallRepositoryStatus = Literal["DORMANT", "AWAKE", "AGENT_LOOP"]
 HallScanStatus = Literal["PENDING", "COMPLETED", "FAILED"]
@@ -31,6 +34,95 @@ HallPlanningSessionStatus = Literal[
 ]
 
 
+# Claim-index expressions mirror `BeadLedger._is_claimable` and `BeadLedger._overall_score`.
+# They are evaluated by triggers so every writer (Python or PennyOne) keeps the index current.
+BEAD_CLAIMABLE_SQL = """
+    CASE
+        WHEN status IN ('SET', 'OPEN')
+         AND (COALESCE(target_path, '') <> '' OR COALESCE(target_ref, '') <> '')
+         AND COALESCE(acceptance_criteria, '') <> ''
+         AND EXISTS (
+            SELECT 1
+            FROM json_each(CASE WHEN json_valid(contract_refs_json) THEN contract_refs_json ELSE '[]' END) AS ref
+            WHERE TRIM(CAST(ref.value AS TEXT)) <> ''
+              AND LOWER(TRIM(CAST(ref.value AS TEXT))) NOT LIKE 'lore:%'
+              AND LOWER(TRIM(CAST(ref.value AS TEXT))) NOT LIKE 'workflow:%'
+              AND LOWER(TRIM(CAST(ref.value AS TEXT))) NOT LIKE 'registry:%'
+         )
+        THEN 1
+        ELSE 0
+    END
+"""
+BEAD_CLAIM_PRIORITY_SQL = """
+    CASE
+        WHEN NOT json_valid(baseline_scores_json) THEN 0.0
+        WHEN json_type(baseline_scores_json, '$.overall') IS NOT NULL
+            THEN COALESCE(CAST(json_extract(baseline_scores_json, '$.overall') AS REAL), 0.0)
+        WHEN json_type(baseline_scores_json, '$.scan_baseline') IS NOT NULL
+            THEN COALESCE(CAST(json_extract(baseline_scores_json, '$.scan_baseline') AS REAL), 0.0)
+        WHEN json_type(baseline_scores_json, '$.repository_baseline') IS NOT NULL
+            THEN COALESCE(CAST(json_extract(baseline_scores_json, '$.repository_baseline') AS REAL), 0.0)
+        ELSE 0.0
+    END
+"""
+BEAD_CLAIM_COLUMNS_SQL = f"claimable = {BEAD_CLAIMABLE_SQL}, claim_priority = {BEAD_CLAIM_PRIORITY_SQL}"
+
+
+HALL_FILE_UPSERT_SQL = """
+    INSERT INTO hall_files (
+        repo_id, scan_id, path, content_hash, language, gungnir_score,
+        matrix_json, imports_json, exports_json, intent_summary, interaction_summary, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(scan_id, path) DO UPDATE SET
+        content_hash = excluded.content_hash,
+        language = excluded.language,
+        gungnir_score = excluded.gungnir_score,
+        matrix_json = excluded.matrix_json,
+        imports_json = excluded.imports_json,
+        exports_json = excluded.exports_json,
+        intent_summary = excluded.intent_summary,
+        interaction_summary = excluded.interaction_summary
+"""
+
+HALL_VALIDATION_RUN_UPSERT_SQL = """
+    INSERT INTO hall_validation_runs (
+        validation_id, repo_id, scan_id, bead_id, target_path, verdict, sprt_verdict,
+        pre_scores_json, post_scores_json, benchmark_json, notes, created_at, legacy_trace_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(validation_id) DO UPDATE SET
+        verdict = excluded.verdict,
+        sprt_verdict = excluded.sprt_verdict,
+        pre_scores_json = excluded.pre_scores_json,
+        post_scores_json = excluded.post_scores_json,
+        benchmark_json = excluded.benchmark_json,
+        notes = excluded.notes
+"""
+
+HALL_SKILL_OBSERVATION_UPSERT_SQL = """
+    INSERT INTO hall_skill_observations (
+        observation_id, repo_id, skill_id, outcome, observation, created_at, metadata_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(observation_id) DO UPDATE SET
+        outcome = excluded.outcome,
+        observation = excluded.observation,
+        metadata_json = excluded.metadata_json
+"""
+
+HALL_FILE_COLUMNS = (
+    "repo_id", "scan_id", "path", "content_hash", "language", "gungnir_score",
+    "matrix_json", "imports_json", "exports_json", "intent_summary", "interaction_summary", "created_at",
+)
+HALL_EPISODIC_MEMORY_COLUMNS = (
+    "memory_id", "bead_id", "repo_id", "tactical_summary", "files_touched_json",
+    "successes_json", "metadata_json", "created_at", "updated_at",
+)
+HALL_SKILL_PROPOSAL_COLUMNS = (
+    "proposal_id", "repo_id", "skill_id", "bead_id", "validation_id", "target_path", "contract_path",
+    "proposal_path", "status", "summary", "promotion_note", "promoted_at", "promoted_by",
+    "created_at", "updated_at", "metadata_json",
+)
+
+
 def _require_non_empty_str(field_name: str, value: Any) -> None:
     if not isinstance(value, str) or not value.strip():
         raise ValueError(f"{field_name} must be a non-empty string")
@@ -251,25 +343,28 @@ def build_repo_id(root_path: str | Path) -> str:
 class HallOfRecords:
     """Canonical SQLite-backed Hall schema for repository scans and outcomes."""
 
-    BUSY_TIMEOUT_MS = 5000
+    BUSY_TIMEOUT_MS = BUSY_TIMEOUT_MS
+    BULK_WRITE_CHUNK_SIZE = 1000
+    STREAM_PAGE_SIZE = 500
 
     def __init__(self, project_root: Path | str):
         self.project_root = Path(project_root)
         self.db_path = self.project_root / ".stats" / "pennyone.db"
         self.state_path = self.project_root / ".agents" / "sovereign_state.json"
+        self.connections = HallConnectionManager.for_path(self.db_path)
+
+    def connect(self):
+        """Serialized write session on the process-wide Hall writer: `with hall.connect() as conn:`."""
+        return self.connections.writer()
 
-    def connect(self) -> sqlite3.Connection:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT_MS / 1000)
-        conn.row_factory = sqlite3.Row
-        # Configure SQLite for concurrent read/write workloads on the Hall DB.
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        return conn
+    def read(self) -> sqlite3.Connection:
+        """This thread's pooled read-only Hall connection."""
+        return self.connections.reader()
 
     def ensure_schema(self) -> None:
+        # Schema setup runs once per process and database file; the manager resets it if the file is replaced.
+        if self.connections.is_schema_ready():
+            return
         with self.connect() as conn:
             conn.executescript(
                 """
@@ -320,6 +415,8 @@ class HallOfRecords:
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_hall_files_repo_path ON hall_files(repo_id, path);
+                CREATE INDEX IF NOT EXISTS idx_hall_files_repo_path_scan ON hall_files(repo_id, path, scan_id);
+                CREATE INDEX IF NOT EXISTS idx_hall_files_repo_scan_path ON hall_files(repo_id, scan_id, path);
 
                 CREATE TABLE IF NOT EXISTS hall_episodic_memory (
                     memory_id TEXT PRIMARY KEY,
@@ -341,6 +438,12 @@ class HallOfRecords:
                 CREATE INDEX IF NOT EXISTS idx_hall_episodic_memory_bead
                 ON hall_episodic_memory(bead_id, created_at);
 
+                CREATE INDEX IF NOT EXISTS idx_hall_episodic_memory_repo_keyset
+                ON hall_episodic_memory(repo_id, created_at, memory_id);
+
+                CREATE INDEX IF NOT EXISTS idx_hall_episodic_memory_bead_keyset
+                ON hall_episodic_memory(repo_id, bead_id, created_at, memory_id);
+
                 CREATE TABLE IF NOT EXISTS hall_beads (
                     bead_id TEXT PRIMARY KEY,
                     repo_id TEXT NOT NULL,
@@ -428,6 +531,12 @@ class HallOfRecords:
                 CREATE INDEX IF NOT EXISTS idx_hall_skill_proposals_repo
                 ON hall_skill_proposals(repo_id, created_at);
 
+                CREATE INDEX IF NOT EXISTS idx_hall_skill_proposals_repo_keyset
+                ON hall_skill_proposals(repo_id, created_at, proposal_id);
+
+                CREATE INDEX IF NOT EXISTS idx_hall_skill_proposals_skill_keyset
+                ON hall_skill_proposals(repo_id, skill_id, created_at, proposal_id);
+
                 CREATE TABLE IF NOT EXISTS hall_planning_sessions (
                     session_id TEXT PRIMARY KEY,
                     repo_id TEXT NOT NULL,
@@ -449,7 +558,7 @@ class HallOfRecords:
                 ON hall_planning_sessions(repo_id, updated_at);
 
                 DROP VIEW IF EXISTS hall_repository_projection;
-                CREATE VIEW hall_repository_projection AS
+                CREATE VIEW IF NOT EXISTS hall_repository_projection AS
                 SELECT
                     r.repo_id,
                     r.root_path,
@@ -506,6 +615,18 @@ class HallOfRecords:
             self._ensure_column(conn, "hall_beads", "resolved_validation_id", "TEXT")
             self._ensure_column(conn, "hall_beads", "checker_shell", "TEXT")
             self._ensure_column(conn, "hall_beads", "superseded_by", "TEXT")
+            self._ensure_column(conn, "hall_beads", "normalized_version", "INTEGER NOT NULL DEFAULT 0")
+            self._ensure_column(conn, "hall_beads", "normalized_at", "INTEGER")
+            conn.executescript(
+                """
+                CREATE INDEX IF NOT EXISTS idx_hall_beads_normalized_version
+                ON hall_beads(repo_id, normalized_version);
+
+                CREATE INDEX IF NOT EXISTS idx_hall_beads_normalize_pending
+                ON hall_beads(repo_id) WHERE normalized_at IS NOT updated_at;
+                """
+            )
+            self._ensure_bead_claim_index(conn)
             self._ensure_column(conn, "hall_files", "imports_json", "TEXT")
             self._ensure_column(conn, "hall_files", "exports_json", "TEXT")
             self._ensure_column(conn, "hall_skill_proposals", "summary", "TEXT")
@@ -521,7 +642,7 @@ class HallOfRecords:
             conn.executescript(
                 """
                 DROP VIEW IF EXISTS hall_repository_projection;
-                CREATE VIEW hall_repository_projection AS
+                CREATE VIEW IF NOT EXISTS hall_repository_projection AS
                 SELECT
                     r.repo_id,
                     r.root_path,
@@ -570,6 +691,7 @@ class HallOfRecords:
                 FROM hall_repositories r;
                 """
             )
+        self.connections.schema_ready = True
 
     def bootstrap_repository(self) -> HallRepositoryRecord:
         self.ensure_schema()
@@ -666,45 +788,37 @@ class HallOfRecords:
 
     def record_file(self, record: HallFileRecord) -> None:
         self.ensure_schema()
-        materialized_matrix = build_gungnir_matrix(record.matrix)
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO hall_files (
-                    repo_id, scan_id, path, content_hash, language, gungnir_score,
-                    matrix_json, imports_json, exports_json, intent_summary, interaction_summary, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(scan_id, path) DO UPDATE SET
-                    content_hash = excluded.content_hash,
-                    language = excluded.language,
-                    gungnir_score = excluded.gungnir_score,
-                    matrix_json = excluded.matrix_json,
-                    imports_json = excluded.imports_json,
-                    exports_json = excluded.exports_json,
-                    intent_summary = excluded.intent_summary,
-                    interaction_summary = excluded.interaction_summary
-                """,
-                (
-                    record.repo_id,
-                    record.scan_id,
-                    normalize_hall_path(record.path),
-                    record.content_hash,
-                    record.language,
-                    record.gungnir_score or get_gungnir_overall(materialized_matrix),
-                    json.dumps(matrix_to_dict(materialized_matrix)),
-                    json.dumps(record.imports),
-                    json.dumps(record.exports),
-                    record.intent_summary,
-                    record.interaction_summary,
-                    record.created_at,
-                ),
-            )
+            conn.execute(HALL_FILE_UPSERT_SQL, self._hall_file_params(record))
+
+    def record_files_bulk(
+        self,
+        scan_id: str,
+        records: Iterable[HallFileRecord],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Streams file records for one scan into the Hall in chunked `executemany` batches.
+        All chunks share one transaction, so a record that fails validation rolls back the whole batch.
+        Returns the number of records written.
+        """
+        _require_non_empty_str("scan_id", scan_id)
+
+        def params(record: HallFileRecord) -> tuple[Any, ...]:
+            if not isinstance(record, HallFileRecord):
+                raise TypeError(f"record_files_bulk expects HallFileRecord items, got {type(record).__name__}.")
+            if record.scan_id != scan_id:
+                raise ValueError(f"File record '{record.path}' belongs to scan '{record.scan_id}', not '{scan_id}'.")
+            return self._hall_file_params(record)
+
+        return self._write_bulk(HALL_FILE_UPSERT_SQL, records, params, chunk_size)
 
     def get_file(self, file_path: str, scan_id: str | None = None) -> HallFileRecord | None:
         self.ensure_schema()
         repo_id = build_repo_id(self.project_root)
         normalized_path = normalize_hall_path(file_path)
-        with self.connect() as conn:
+        with self.read() as conn:
             row = (
                 conn.execute(
                     """
@@ -732,33 +846,44 @@ class HallOfRecords:
         return self._hall_file_from_row(row)
 
     def list_files(self, scan_id: str | None = None) -> list[HallFileRecord]:
+        return list(self.iter_files(scan_id))
+
+    def iter_files(
+        self,
+        scan_id: str | None = None,
+        *,
+        after: HallFileRecord | tuple[str, str] | None = None,
+        limit: int | None = None,
+        columns: Sequence[str] | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[HallFileRecord] | Iterator[dict[str, Any]]:
+        """
+        Streams file records ordered by `(path, scan_id)`, one keyset page at a time.
+        `after` resumes behind a record or `(path, scan_id)` cursor; `columns` yields dicts of just those columns.
+        """
         self.ensure_schema()
-        repo_id = build_repo_id(self.project_root)
-        with self.connect() as conn:
-            rows = (
-                conn.execute(
-                    """
-                    SELECT repo_id, scan_id, path, content_hash, language, gungnir_score,
-                           matrix_json, imports_json, exports_json, intent_summary, interaction_summary, created_at
-                    FROM hall_files
-                    WHERE repo_id = ? AND scan_id = ?
-                    ORDER BY path ASC
-                    """,
-                    (repo_id, scan_id),
-                ).fetchall()
-                if scan_id is not None
-                else conn.execute(
-                    """
-                    SELECT repo_id, scan_id, path, content_hash, language, gungnir_score,
-                           matrix_json, imports_json, exports_json, intent_summary, interaction_summary, created_at
-                    FROM hall_files
-                    WHERE repo_id = ?
-                    ORDER BY path ASC
-                    """,
-                    (repo_id,),
-                ).fetchall()
-            )
-        return [record for row in rows if (record := self._hall_file_from_row(row)) is not None]
+        clauses = ["repo_id = ?"]
+        params: list[Any] = [build_repo_id(self.project_root)]
+        if scan_id is not None:
+            clauses.append("scan_id = ?")
+            params.append(scan_id)
+        if isinstance(after, HallFileRecord):
+            after = (normalize_hall_path(after.path), after.scan_id)
+        rows = self._iter_keyset(
+            "hall_files",
+            HALL_FILE_COLUMNS,
+            columns,
+            clauses,
+            params,
+            keyset=("path", "scan_id"),
+            descending=False,
+            after=after,
+            limit=limit,
+            page_size=page_size,
+        )
+        if columns is not None:
+            return rows
+        return (record for row in rows if (record := self._hall_file_from_row(row)) is not None)
 
     def save_episodic_memory(self, record: HallEpisodicMemoryRecord) -> None:
         self.ensure_schema()
@@ -792,7 +917,7 @@ class HallOfRecords:
     def get_episodic_memory(self, memory_id: str) -> HallEpisodicMemoryRecord | None:
         self.ensure_schema()
         repo_id = build_repo_id(self.project_root)
-        with self.connect() as conn:
+        with self.read() as conn:
             row = conn.execute(
                 """
                 SELECT memory_id, bead_id, repo_id, tactical_summary, files_touched_json,
@@ -806,33 +931,44 @@ class HallOfRecords:
         return self._hall_episodic_memory_from_row(row)
 
     def list_episodic_memory(self, bead_id: str | None = None) -> list[HallEpisodicMemoryRecord]:
+        return list(self.iter_episodic_memory(bead_id))
+
+    def iter_episodic_memory(
+        self,
+        bead_id: str | None = None,
+        *,
+        after: HallEpisodicMemoryRecord | tuple[int, str] | None = None,
+        limit: int | None = None,
+        columns: Sequence[str] | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[HallEpisodicMemoryRecord] | Iterator[dict[str, Any]]:
+        """
+        Streams episodic memory oldest first, ordered by `(created_at, memory_id)`, one keyset page at a time.
+        `after` resumes behind a record or `(created_at, memory_id)` cursor; `columns` yields dicts.
+        """
         self.ensure_schema()
-        repo_id = build_repo_id(self.project_root)
-        with self.connect() as conn:
-            rows = (
-                conn.execute(
-                    """
-                    SELECT memory_id, bead_id, repo_id, tactical_summary, files_touched_json,
-                           successes_json, metadata_json, created_at, updated_at
-                    FROM hall_episodic_memory
-                    WHERE repo_id = ? AND bead_id = ?
-                    ORDER BY created_at ASC
-                    """,
-                    (repo_id, bead_id),
-                ).fetchall()
-                if bead_id is not None
-                else conn.execute(
-                    """
-                    SELECT memory_id, bead_id, repo_id, tactical_summary, files_touched_json,
-                           successes_json, metadata_json, created_at, updated_at
-                    FROM hall_episodic_memory
-                    WHERE repo_id = ?
-                    ORDER BY created_at ASC
-                    """,
-                    (repo_id,),
-                ).fetchall()
-            )
-        return [record for row in rows if (record := self._hall_episodic_memory_from_row(row)) is not None]
+        clauses = ["repo_id = ?"]
+        params: list[Any] = [build_repo_id(self.project_root)]
+        if bead_id is not None:
+            clauses.append("bead_id = ?")
+            params.append(bead_id)
+        if isinstance(after, HallEpisodicMemoryRecord):
+            after = (after.created_at, after.memory_id)
+        rows = self._iter_keyset(
+            "hall_episodic_memory",
+            HALL_EPISODIC_MEMORY_COLUMNS,
+            columns,
+            clauses,
+            params,
+            keyset=("created_at", "memory_id"),
+            descending=False,
+            after=after,
+            limit=limit,
+            page_size=page_size,
+        )
+        if columns is not None:
+            return rows
+        return (record for row in rows if (record := self._hall_episodic_memory_from_row(row)) is not None)
 
     def upsert_bead(self, record: HallBeadRecord) -> None:
         self.ensure_schema()
@@ -892,60 +1028,57 @@ class HallOfRecords:
     def save_validation_run(self, record: HallValidationRun) -> None:
         self.ensure_schema()
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO hall_validation_runs (
-                    validation_id, repo_id, scan_id, bead_id, target_path, verdict, sprt_verdict,
-                    pre_scores_json, post_scores_json, benchmark_json, notes, created_at, legacy_trace_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(validation_id) DO UPDATE SET
-                    verdict = excluded.verdict,
-                    sprt_verdict = excluded.sprt_verdict,
-                    pre_scores_json = excluded.pre_scores_json,
-                    post_scores_json = excluded.post_scores_json,
-                    benchmark_json = excluded.benchmark_json,
-                    notes = excluded.notes
-                """,
-                (
-                    record.validation_id,
-                    record.repo_id,
-                    record.scan_id,
-                    record.bead_id,
-                    normalize_hall_path(record.target_path) if record.target_path else None,
-                    record.verdict,
-                    record.sprt_verdict,
-                    json.dumps(record.pre_scores),
-                    json.dumps(record.post_scores),
-                    json.dumps(record.benchmark),
-                    record.notes,
-                    record.created_at,
-                    record.legacy_trace_id,
-                ),
-            )
+            conn.execute(HALL_VALIDATION_RUN_UPSERT_SQL, self._validation_run_params(record))
+
+    def save_validation_runs_bulk(
+        self,
+        records: Iterable[HallValidationRun],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        """Bulk equivalent of `save_validation_run`: one transaction, chunked `executemany` batches."""
+
+        def params(record: HallValidationRun) -> tuple[Any, ...]:
+            if not isinstance(record, HallValidationRun):
+                raise TypeError(f"save_validation_runs_bulk expects HallValidationRun items, got {type(record).__name__}.")
+            _require_non_empty_str("validation_id", record.validation_id)
+            _require_non_empty_str("repo_id", record.repo_id)
+            _require_non_empty_str("verdict", record.verdict)
+            _require_non_negative_int("created_at", record.created_at)
+            _require_dict("pre_scores", record.pre_scores)
+            _require_dict("post_scores", record.post_scores)
+            _require_dict("benchmark", record.benchmark)
+            return self._validation_run_params(record)
+
+        return self._write_bulk(HALL_VALIDATION_RUN_UPSERT_SQL, records, params, chunk_size)
 
     def save_skill_observation(self, record: HallSkillObservation) -> None:
         self.ensure_schema()
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO hall_skill_observations (
-                    observation_id, repo_id, skill_id, outcome, observation, created_at, metadata_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(observation_id) DO UPDATE SET
-                    outcome = excluded.outcome,
-                    observation = excluded.observation,
-                    metadata_json = excluded.metadata_json
-                """,
-                (
-                    record.observation_id,
-                    record.repo_id,
-                    record.skill_id,
-                    record.outcome,
-                    record.observation,
-                    record.created_at,
-                    json.dumps(record.metadata),
-                ),
-            )
+            conn.execute(HALL_SKILL_OBSERVATION_UPSERT_SQL, self._skill_observation_params(record))
+
+    def save_skill_observations_bulk(
+        self,
+        records: Iterable[HallSkillObservation],
+        *,
+        chunk_size: int | None = None,
+    ) -> int:
+        """Bulk equivalent of `save_skill_observation`: one transaction, chunked `executemany` batches."""
+
+        def params(record: HallSkillObservation) -> tuple[Any, ...]:
+            if not isinstance(record, HallSkillObservation):
+                raise TypeError(
+                    f"save_skill_observations_bulk expects HallSkillObservation items, got {type(record).__name__}."
+                )
+            _require_non_empty_str("observation_id", record.observation_id)
+            _require_non_empty_str("repo_id", record.repo_id)
+            _require_non_empty_str("skill_id", record.skill_id)
+            _require_non_empty_str("outcome", record.outcome)
+            _require_non_negative_int("created_at", record.created_at)
+            _require_dict("metadata", record.metadata)
+            return self._skill_observation_params(record)
+
+        return self._write_bulk(HALL_SKILL_OBSERVATION_UPSERT_SQL, records, params, chunk_size)
 
     def save_skill_proposal(self, record: HallSkillProposalRecord) -> None:
         self.ensure_schema()
@@ -994,7 +1127,7 @@ class HallOfRecords:
 
     def get_skill_proposal(self, proposal_id: str) -> HallSkillProposalRecord | None:
         self.ensure_schema()
-        with self.connect() as conn:
+        with self.read() as conn:
             row = conn.execute(
                 """
                 SELECT proposal_id, repo_id, skill_id, bead_id, validation_id, target_path, contract_path,
@@ -1008,24 +1141,7 @@ class HallOfRecords:
             ).fetchone()
         if row is None:
             return None
-        return HallSkillProposalRecord(
-            proposal_id=str(row["proposal_id"]),
-            repo_id=str(row["repo_id"]),
-            skill_id=str(row["skill_id"]),
-            status=row["status"],
-            created_at=int(row["created_at"] or 0),
-            updated_at=int(row["updated_at"] or 0),
-            bead_id=str(row["bead_id"]) if row["bead_id"] is not None else None,
-            validation_id=str(row["validation_id"]) if row["validation_id"] is not None else None,
-            target_path=str(row["target_path"]) if row["target_path"] is not None else None,
-            contract_path=str(row["contract_path"]) if row["contract_path"] is not None else None,
-            proposal_path=str(row["proposal_path"]) if row["proposal_path"] is not None else None,
-            summary=str(row["summary"]) if row["summary"] is not None else None,
-            promotion_note=str(row["promotion_note"]) if row["promotion_note"] is not None else None,
-            promoted_at=int(row["promoted_at"]) if row["promoted_at"] is not None else None,
-            promoted_by=str(row["promoted_by"]) if row["promoted_by"] is not None else None,
-            metadata=json.loads(row["metadata_json"] or "{}"),
-        )
+        return self._hall_skill_proposal_from_row(row)
 
     def list_skill_proposals(
         self,
@@ -1034,6 +1150,23 @@ class HallOfRecords:
         skill_id: str | None = None,
         statuses: tuple[HallSkillProposalStatus, ...] | None = None,
     ) -> list[HallSkillProposalRecord]:
+        return list(self.iter_skill_proposals(repo_id=repo_id, skill_id=skill_id, statuses=statuses))
+
+    def iter_skill_proposals(
+        self,
+        *,
+        repo_id: str | None = None,
+        skill_id: str | None = None,
+        statuses: tuple[HallSkillProposalStatus, ...] | None = None,
+        after: HallSkillProposalRecord | tuple[int, str] | None = None,
+        limit: int | None = None,
+        columns: Sequence[str] | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[HallSkillProposalRecord] | Iterator[dict[str, Any]]:
+        """
+        Streams skill proposals newest first, ordered by `(created_at, proposal_id)` descending.
+        `after` resumes behind a record or `(created_at, proposal_id)` cursor; `columns` yields dicts.
+        """
         self.ensure_schema()
         clauses = ["repo_id = ?"]
         params: list[Any] = [repo_id or build_repo_id(self.project_root)]
@@ -1044,42 +1177,28 @@ class HallOfRecords:
         if statuses:
             clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
             params.extend(statuses)
-
-        sql = f"""
-            SELECT proposal_id, repo_id, skill_id, bead_id, validation_id, target_path, contract_path,
-                   proposal_path, status, summary, promotion_note, promoted_at, promoted_by,
-                   created_at, updated_at, metadata_json
-            FROM hall_skill_proposals
-            WHERE {' AND '.join(clauses)}
-            ORDER BY created_at DESC
-        """
-        with self.connect() as conn:
-            rows = conn.execute(sql, params).fetchall()
-        return [
-            HallSkillProposalRecord(
-                proposal_id=str(row["proposal_id"]),
-                repo_id=str(row["repo_id"]),
-                skill_id=str(row["skill_id"]),
-                status=row["status"],
-                created_at=int(row["created_at"] or 0),
-                updated_at=int(row["updated_at"] or 0),
-                bead_id=str(row["bead_id"]) if row["bead_id"] is not None else None,
-                validation_id=str(row["validation_id"]) if row["validation_id"] is not None else None,
-                target_path=str(row["target_path"]) if row["target_path"] is not None else None,
-                contract_path=str(row["contract_path"]) if row["contract_path"] is not None else None,
-                proposal_path=str(row["proposal_path"]) if row["proposal_path"] is not None else None,
-                summary=str(row["summary"]) if row["summary"] is not None else None,
-                promotion_note=str(row["promotion_note"]) if row["promotion_note"] is not None else None,
-                promoted_at=int(row["promoted_at"]) if row["promoted_at"] is not None else None,
-                promoted_by=str(row["promoted_by"]) if row["promoted_by"] is not None else None,
-                metadata=json.loads(row["metadata_json"] or "{}"),
-            )
-            for row in rows
-        ]
+        if isinstance(after, HallSkillProposalRecord):
+            after = (after.created_at, after.proposal_id)
+
+        rows = self._iter_keyset(
+            "hall_skill_proposals",
+            HALL_SKILL_PROPOSAL_COLUMNS,
+            columns,
+            clauses,
+            params,
+            keyset=("created_at", "proposal_id"),
+            descending=True,
+            after=after,
+            limit=limit,
+            page_size=page_size,
+        )
+        if columns is not None:
+            return rows
+        return (self._hall_skill_proposal_from_row(row) for row in rows)
 
     def get_validation_run(self, validation_id: str) -> HallValidationRun | None:
         self.ensure_schema()
-        with self.connect() as conn:
+        with self.read() as conn:
             row = conn.execute(
                 """
                 SELECT validation_id, repo_id, scan_id, bead_id, target_path, verdict, sprt_verdict,
@@ -1111,7 +1230,7 @@ class HallOfRecords:
     def get_repository_record(self, root_path: str | Path | None = None) -> HallRepositoryRecord | None:
         self.ensure_schema()
         repo_path = normalize_hall_path(root_path or self.project_root)
-        with self.connect() as conn:
+        with self.read() as conn:
             row = conn.execute(
                 """
                 SELECT repo_id, root_path, name, status, active_persona, baseline_gungnir_score,
@@ -1139,7 +1258,7 @@ class HallOfRecords:
     def get_repository_summary(self, root_path: str | Path | None = None) -> dict[str, Any] | None:
         self.ensure_schema()
         repo_path = normalize_hall_path(root_path or self.project_root)
-        with self.connect() as conn:
+        with self.read() as conn:
             row = conn.execute(
                 "SELECT * FROM hall_repository_projection WHERE root_path = ?",
                 (repo_path,),
@@ -1250,6 +1369,155 @@ class HallOfRecords:
             return
         conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_sql}")
 
+    @staticmethod
+    def _ensure_bead_claim_index(conn: sqlite3.Connection) -> None:
+        """Maintains the persisted claim priority and claimability flag used by indexed bead claims."""
+        columns = HallOfRecords._table_columns(conn, "hall_beads")
+        needs_backfill = "claimable" not in columns or "claim_priority" not in columns
+        HallOfRecords._ensure_column(conn, "hall_beads", "claimable", "INTEGER NOT NULL DEFAULT 0")
+        HallOfRecords._ensure_column(conn, "hall_beads", "claim_priority", "REAL NOT NULL DEFAULT 0")
+        conn.executescript(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_hall_beads_claim
+            ON hall_beads(repo_id, status, claim_priority, created_at, bead_id)
+            WHERE claimable = 1;
+
+            CREATE TRIGGER IF NOT EXISTS trg_hall_beads_claim_insert
+            AFTER INSERT ON hall_beads
+            BEGIN
+                UPDATE hall_beads SET {BEAD_CLAIM_COLUMNS_SQL} WHERE bead_id = NEW.bead_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_hall_beads_claim_update
+            AFTER UPDATE OF status, target_path, target_ref, acceptance_criteria, contract_refs_json, baseline_scores_json
+            ON hall_beads
+            BEGIN
+                UPDATE hall_beads SET {BEAD_CLAIM_COLUMNS_SQL} WHERE bead_id = NEW.bead_id;
+            END;
+            """
+        )
+        if needs_backfill:
+            conn.execute(f"UPDATE hall_beads SET {BEAD_CLAIM_COLUMNS_SQL}")
+
+    def _write_bulk(
+        self,
+        sql: str,
+        records: Iterable[Any],
+        to_params: Callable[[Any], tuple[Any, ...]],
+        chunk_size: int | None,
+    ) -> int:
+        self.ensure_schema()
+        size = chunk_size or self.BULK_WRITE_CHUNK_SIZE
+        iterator = iter(records)
+        written = 0
+        with self.connect() as conn:
+            while chunk := [to_params(record) for record in itertools.islice(iterator, size)]:
+                conn.executemany(sql, chunk)
+                written += len(chunk)
+        return written
+
+    @staticmethod
+    def _hall_file_params(record: HallFileRecord) -> tuple[Any, ...]:
+        materialized_matrix = build_gungnir_matrix(record.matrix)
+        return (
+            record.repo_id,
+            record.scan_id,
+            normalize_hall_path(record.path),
+            record.content_hash,
+            record.language,
+            record.gungnir_score or get_gungnir_overall(materialized_matrix),
+            json.dumps(matrix_to_dict(materialized_matrix)),
+            json.dumps(record.imports),
+            json.dumps(record.exports),
+            record.intent_summary,
+            record.interaction_summary,
+            record.created_at,
+        )
+
+    @staticmethod
+    def _validation_run_params(record: HallValidationRun) -> tuple[Any, ...]:
+        return (
+            record.validation_id,
+            record.repo_id,
+            record.scan_id,
+            record.bead_id,
+            normalize_hall_path(record.target_path) if record.target_path else None,
+            record.verdict,
+            record.sprt_verdict,
+            json.dumps(record.pre_scores),
+            json.dumps(record.post_scores),
+            json.dumps(record.benchmark),
+            record.notes,
+            record.created_at,
+            record.legacy_trace_id,
+        )
+
+    @staticmethod
+    def _skill_observation_params(record: HallSkillObservation) -> tuple[Any, ...]:
+        return (
+            record.observation_id,
+            record.repo_id,
+            record.skill_id,
+            record.outcome,
+            record.observation,
+            record.created_at,
+            json.dumps(record.metadata),
+        )
+
+    def _iter_keyset(
+        self,
+        table: str,
+        all_columns: tuple[str, ...],
+        columns: Sequence[str] | None,
+        clauses: list[str],
+        params: list[Any],
+        *,
+        keyset: tuple[str, str],
+        descending: bool,
+        after: tuple[Any, Any] | None,
+        limit: int | None,
+        page_size: int | None,
+    ) -> Iterator[Any]:
+        """
+        Pages through `table` by a two-column keyset so each page is an index seek, not an OFFSET scan.
+        Every page is a fresh query on the pooled reader, so no read snapshot stays open between pages.
+        """
+        if columns is not None:
+            unknown = [column for column in columns if column not in all_columns]
+            if unknown:
+                raise ValueError(f"Unknown {table} columns: {', '.join(unknown)}.")
+        projected = tuple(columns) if columns is not None else all_columns
+        selected = projected + tuple(column for column in keyset if column not in projected)
+        direction = "DESC" if descending else "ASC"
+        comparator = "<" if descending else ">"
+        size = page_size or self.STREAM_PAGE_SIZE
+        remaining = limit
+        cursor = tuple(after) if after is not None else None
+
+        while remaining is None or remaining > 0:
+            page_limit = size if remaining is None else min(size, remaining)
+            page_clauses = list(clauses)
+            page_params = list(params)
+            if cursor is not None:
+                page_clauses.append(f"({keyset[0]}, {keyset[1]}) {comparator} (?, ?)")
+                page_params.extend(cursor)
+            sql = f"""
+                SELECT {', '.join(selected)}
+                FROM {table}
+                WHERE {' AND '.join(page_clauses)}
+                ORDER BY {keyset[0]} {direction}, {keyset[1]} {direction}
+                LIMIT ?
+            """
+            with self.read() as conn:
+                rows = conn.execute(sql, (*page_params, page_limit)).fetchall()
+            for row in rows:
+                yield row if columns is None else {column: row[column] for column in projected}
+            if len(rows) < page_limit:
+                return
+            cursor = (rows[-1][keyset[0]], rows[-1][keyset[1]])
+            if remaining is not None:
+                remaining -= len(rows)
+
     @staticmethod
     def _hall_file_from_row(row: sqlite3.Row | None) -> HallFileRecord | None:
         if row is None:
@@ -1285,6 +1553,27 @@ class HallOfRecords:
             metadata=json.loads(row["metadata_json"] or "{}"),
         )
 
+    @staticmethod
+    def _hall_skill_proposal_from_row(row: sqlite3.Row) -> HallSkillProposalRecord:
+        return HallSkillProposalRecord(
+            proposal_id=str(row["proposal_id"]),
+            repo_id=str(row["repo_id"]),
+            skill_id=str(row["skill_id"]),
+            status=row["status"],
+            created_at=int(row["created_at"] or 0),
+            updated_at=int(row["updated_at"] or 0),
+            bead_id=str(row["bead_id"]) if row["bead_id"] is not None else None,
+            validation_id=str(row["validation_id"]) if row["validation_id"] is not None else None,
+            target_path=str(row["target_path"]) if row["target_path"] is not None else None,
+            contract_path=str(row["contract_path"]) if row["contract_path"] is not None else None,
+            proposal_path=str(row["proposal_path"]) if row["proposal_path"] is not None else None,
+            summary=str(row["summary"]) if row["summary"] is not None else None,
+            promotion_note=str(row["promotion_note"]) if row["promotion_note"] is not None else None,
+            promoted_at=int(row["promoted_at"]) if row["promoted_at"] is not None else None,
+            promoted_by=str(row["promoted_by"]) if row["promoted_by"] is not None else None,
+            metadata=json.loads(row["metadata_json"] or "{}"),
+        )
+
     @staticmethod
     def _now() -> int:
         return int(__import__("time").time() * 1000)
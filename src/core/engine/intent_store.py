@@ -0,0 +1,155 @@
+"""
+[SPOKE] Intent Store
+Lore: "Every rune is read once, and remembered by its shape."
+Purpose: Extract skill intents from bounded file prefixes, in parallel, cached by content hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.core.engine.analysis_cache import AnalysisCache
+from src.core.engine.bounded_cache import BoundedCache
+
+INTENT_NAMESPACE = "intent"
+INTENT_RULES_VERSION = "1"
+
+# Intents live in the first lines of a file; nothing past this prefix is ever read.
+PREFIX_BYTES = 16 * 1024
+READ_CHUNK = 4096
+
+_EXPLICIT = re.compile(r'^# Intent:\s*(.*)', re.MULTILINE | re.IGNORECASE)
+_DESCRIPTION = re.compile(r'^description:\s*(.*)', re.MULTILINE)
+_DOCSTRING = re.compile(r'(?:#|""").*?Intent:\s*(.*?)(?:\n|""")', re.IGNORECASE | re.DOTALL)
+_HEADER = re.compile(r'^#\s*(.*)', re.MULTILINE)
+# Linear precheck: without the keyword the DOTALL scan fails only after trying every start position.
+_KEYWORD = re.compile(r'Intent:', re.IGNORECASE)
+
+
+def extract_intent(content: str, markdown: bool) -> str | None:
+    """The intent declared in `content`, or None when the file declares none."""
+    # [Ω] PRIMARY SIGNAL: Explicit Intent marker
+    # Matches: # Intent: My intent text
+    # Matches: # Intent:
+    #          My multi-line intent
+    match = _EXPLICIT.search(content)
+    if match:
+        intent = match.group(1).strip()
+        if not intent: # Look on next line
+            lines = content.split('\n')
+            for i, line in enumerate(lines):
+                if "# Intent:" in line and i + 1 < len(lines):
+                    return lines[i+1].strip().lstrip('#').strip()
+        return intent
+
+    # [Ω] SECONDARY SIGNAL: YAML description
+    match = _DESCRIPTION.search(content)
+    if match:
+        return match.group(1).strip()
+
+    # [Ω] TERTIARY SIGNAL: JSDoc/Docstring Intent
+    match = _DOCSTRING.search(content) if _KEYWORD.search(content) else None
+    if match:
+        return match.group(1).strip()
+
+    # Fallback to first # Header in QMD or MD
+    if markdown:
+        match = _HEADER.search(content)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def read_prefix(file_path: Path, limit: int = PREFIX_BYTES) -> bytes:
+    """Streams at most `limit` bytes, cut back to the last complete line when the file is longer."""
+    chunks, size = [], 0
+    with open(file_path, "rb") as f:
+        while size < limit:
+            chunk = f.read(min(READ_CHUNK, limit - size))
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+            size += len(chunk)
+        truncated = bool(f.read(1))
+    data = b"".join(chunks)
+    if truncated:
+        cut = data.rfind(b"\n")
+        if cut != -1:
+            data = data[:cut + 1]
+    return data
+
+
+class IntentStore:
+    """
+    Skill intents keyed by the hash of the prefix they were extracted from.
+    Every SovereignVector of a project shares one store, so the engine, the Cortex brain and the
+    SkillForge (through its Cortex) never extract the same file twice; the AnalysisCache carries
+    extractions across processes.
+    """
+
+    MEMORY_ENTRIES = 4096
+    PARALLEL_THRESHOLD = 8
+    MAX_WORKERS = 16
+
+    _instances: dict[str, IntentStore] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, cache: AnalysisCache | None = None) -> None:
+        self.cache = cache
+        self._memory = BoundedCache(self.MEMORY_ENTRIES, name="intents")
+
+    @classmethod
+    def for_root(cls, project_root: Path | str) -> IntentStore:
+        """Shared store for a project; persistent unless CSTAR_ANALYSIS_CACHE=0."""
+        path = str(Path(project_root).resolve())
+        with cls._instances_lock:
+            store = cls._instances.get(path)
+            if store is None:
+                store = cls._instances[path] = cls(AnalysisCache.for_root(path))
+            return store
+
+    def read(self, file_path: Path) -> tuple[str, str]:
+        """(prefix digest, intent) for one file. Unreadable files get an empty digest and the fallback intent."""
+        try:
+            data = read_prefix(file_path)
+        except Exception:
+            return "", f"Intent for {file_path.name}"
+        digest = hashlib.sha256(data).hexdigest()
+        markdown = file_path.suffix in (".qmd", ".md")
+        key = AnalysisCache.key(digest, markdown)
+
+        found = self._memory.get(key, self)
+        if found is self and self.cache is not None:
+            cached = self.cache.get(INTENT_NAMESPACE, INTENT_RULES_VERSION, key)
+            if cached is not None:
+                found = cached["intent"]
+                self._memory.set(key, found)
+        if found is self:
+            try:
+                # Universal newlines, as read_text would give
+                found = extract_intent(data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n"), markdown)
+            except UnicodeDecodeError:
+                found = None
+            self._memory.set(key, found)
+            if self.cache is not None:
+                self.cache.put(INTENT_NAMESPACE, INTENT_RULES_VERSION, key, {"intent": found})
+        return digest, found if found is not None else f"Intent for {file_path.name}"
+
+    def read_many(self, paths: Iterable[Path]) -> list[tuple[str, str]]:
+        """read() for every path, in order; file I/O overlaps across a thread pool for larger batches."""
+        paths = list(paths)
+        if self.cache is not None:
+            with self.cache.batch():
+                return self._map(paths)
+        return self._map(paths)
+
+    def _map(self, paths: list[Path]) -> list[tuple[str, str]]:
+        if len(paths) < self.PARALLEL_THRESHOLD:
+            return [self.read(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(paths)), thread_name_prefix="intent") as pool:
+            return list(pool.map(self.read, paths))
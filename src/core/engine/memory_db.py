@@ -3,11 +3,12 @@ try:
 except ImportError:
     chromadb = None
 
-import re
 from pathlib import Path
 from typing import Any
 
+from src.core.engine.bounded_cache import BoundedCache
 from src.core.engine.hall_schema import HallOfRecords
+from src.core.engine.memory_index import SimulatedSkillIndex
 
 
 class MemoryDB:
@@ -15,13 +16,18 @@ class MemoryDB:
     [O.D.I.N.] The Semantic Brain of Corvus Star.
     Wraps ChromaDB with strict Multi-Tenant partitioning.
     """
+    SIM_CACHE_MAXSIZE = 1024
+    SIM_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
     def __init__(self, project_root: str):
         self.root = Path(project_root)
         self.db_path = self.root / ".agents" / "chroma_db"
         self.hall = HallOfRecords(self.root)
         self.simulated = chromadb is None
-        self._mock_records = [] # [ALFRED] Always initialize
-        self._sim_cache: dict[str, list[dict]] = {} # [Ω] Partitioned cache
+        self._sim_index = SimulatedSkillIndex() # [ALFRED] Always initialize
+        # [Ω] Partitioned cache; bounded LRU, invalidated whenever the corpus changes
+        self._sim_cache = BoundedCache(self.SIM_CACHE_MAXSIZE, max_bytes=self.SIM_CACHE_MAX_BYTES, name="memory_search")
+        self.corpus_generation = 0
 
         if not self.simulated:
             try:
@@ -38,12 +44,44 @@ class MemoryDB:
         else:
             self.collection = None
             # Pre-load baseline
-            self._mock_records.append({
+            self._sim_index.upsert({
                 "id": "system::/workflow_deployment",
                 "doc": "Deploy the system to live production environment",
                 "metadata": {"app_id": "system"}
             })
 
+    @property
+    def _mock_records(self) -> list[dict[str, Any]]:
+        """Simulated records in upsert order. Assigning a list rebuilds the inverted index."""
+        return self._sim_index.records()
+
+    @_mock_records.setter
+    def _mock_records(self, records: list[dict[str, Any]]) -> None:
+        self._sim_index.replace(records)
+        self._bump_corpus_generation()
+
+    def _bump_corpus_generation(self) -> None:
+        """Search results cached before a corpus change are never served after it."""
+        self.corpus_generation += 1
+        self._sim_cache.invalidate()
+
+    def get_simulated_index_path(self) -> Path:
+        """Returns the warm-start snapshot path for the simulated search index."""
+        return self.root / ".agents" / "memory_sim_index.json"
+
+    def save_simulated_index(self, path: Path | None = None) -> Path:
+        """Persists the simulated index, tokens included, for the next process to load."""
+        target = Path(path) if path else self.get_simulated_index_path()
+        self._sim_index.save(target)
+        return target
+
+    def load_simulated_index(self, path: Path | None = None) -> bool:
+        """Replaces the simulated index with a persisted snapshot. Returns False if none was usable."""
+        loaded = self._sim_index.load(Path(path) if path else self.get_simulated_index_path())
+        if loaded:
+            self._bump_corpus_generation()
+        return loaded
+
     def batch_upsert_skills(self, app_id: str, skills: list[dict[str, Any]]) -> None:
         """[Ω] Optimized batch loading for massive skill deployments."""
         if not skills: return
@@ -71,12 +109,12 @@ class MemoryDB:
         else:
             # Update mock
             for i in range(len(ids)):
-                self._mock_records = [r for r in self._mock_records if r["id"] != ids[i]]
-                self._mock_records.append({
+                self._sim_index.upsert({
                     "id": ids[i],
                     "doc": docs[i],
                     "metadata": metadatas[i]
                 })
+        self._bump_corpus_generation()
 
     def upsert_skill(self, app_id: str, intent_id: str, description: str, metadata: dict[str, Any] | None = None) -> None:
         """
@@ -95,12 +133,29 @@ class MemoryDB:
             )
         else:
             # Update mock
-            self._mock_records = [r for r in self._mock_records if r["id"] != composite_id]
-            self._mock_records.append({
+            self._sim_index.upsert({
                 "id": composite_id,
                 "doc": description,
                 "metadata": safe_metadata
             })
+        self._bump_corpus_generation()
+
+    def delete_skills(self, app_id: str, intent_ids: list[str]) -> None:
+        """Removes skills by intent id from one tenant."""
+        if not intent_ids: return
+        ids = [f"{app_id}::{intent_id}" for intent_id in intent_ids]
+
+        if not self.simulated and self.collection:
+            self.collection.delete(ids=ids)
+        else:
+            for composite_id in ids:
+                self._sim_index.remove(composite_id)
+        self._bump_corpus_generation()
+
+    @staticmethod
+    def _search_cache_key(app_id: str, query: str, n_results: int, domain: str | None) -> str:
+        # A short result list must never answer a request for a longer one.
+        return f"{app_id}::{domain or 'ALL'}::{n_results}::{query.lower()}"
 
     def search_intent(self, app_id: str, query: str, n_results: int = 1, domain: str | None = None) -> list[dict[str, Any]]:
         """
@@ -108,9 +163,10 @@ class MemoryDB:
         Filters by app_id in metadata and optionally by domain.
         """
         # [Ω] SIMULATION CACHE: Avoid O(N) scans for identical queries
-        cache_key = f"{app_id}::{domain or 'ALL'}::{query.lower()}"
-        if cache_key in self._sim_cache:
-            return self._sim_cache[cache_key]
+        cache_key = self._search_cache_key(app_id, query, n_results, domain)
+        cached = self._sim_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         if not self.simulated and self.collection:
             try:
@@ -131,80 +187,15 @@ class MemoryDB:
                         return self.search_intent(app_id, query, n_results, domain=None)
                     return []
 
-                formatted_results = []
-                for i in range(len(results['ids'][0])):
-                    composite_id = results['ids'][0][i]
-                    intent_id = composite_id.replace(f"{app_id}::", "", 1)
-
-                    distance = results['distances'][0][i]
-                    confidence = max(0.0, 1.0 - float(distance))
-
-                    metadata = results['metadatas'][0][i]
-                    formatted_results.append({
-                        "trigger": intent_id,
-                        "score": confidence,
-                        "metadata": metadata,
-                        "description": results['documents'][0][i],
-                        "domain": metadata.get("domain", "GENERAL")
-                    })
-                return formatted_results
+                return self._format_query_results(app_id, results, 0)
             except Exception:
                 pass
 
         # Simulated Sandbox
-        query = query.lower()
-        processed = []
-        
-        # [Ω] STRICT FILTERING: Only consider records for this app_id
-        # In simulation, we must be absolutely strict to avoid GLOBAL pollution
-        sandbox = [r for r in self._mock_records if r["metadata"].get("app_id") == app_id]
-        
-        # If we are looking for a specific domain, filter by it
-        domain_sandbox = sandbox
-        if domain:
-            domain_sandbox = [r for r in sandbox if r["metadata"].get("domain") == domain]
-
-        for r in domain_sandbox:
-            intent_id = r["id"].replace(f"{app_id}::", "", 1)
-            doc = r["doc"].lower()
-            q_words = set(query.split())
-            d_words = set(doc.split())
-            
-            # [Ω] EXACT NAME MATCH: Absolute priority
-            trigger_name = intent_id.lower().lstrip("/")
-            if query == trigger_name or query == intent_id.lower():
-                score = 1.0
-            elif query in trigger_name or trigger_name in query:
-                score = 0.95
-            else:
-                # [Ω] FUZZY MATCH: Word overlap
-                overlap_words = q_words & d_words
-                trigger_tokens = set(re.findall(r'\w+', trigger_name))
-                trigger_overlap = q_words & trigger_tokens
-                
-                if trigger_overlap:
-                    score = 0.8 # Very high if name contains query word
-                elif overlap_words:
-                    # Semantic overlap
-                    weighted_overlap = sum(len(w) for w in overlap_words)
-                    weighted_total = sum(len(w) for w in q_words)
-                    score = (weighted_overlap / weighted_total) if weighted_total else 0.0
-                    score = max(score, 0.4) # Floor for any match
-                else:
-                    score = 0.0
-
-            if score > 0:
-                metadata = r["metadata"]
-                processed.append({
-                    "trigger": intent_id,
-                    "score": score,
-                    "metadata": metadata,
-                    "description": r["doc"],
-                    "domain": metadata.get("domain", "GENERAL")
-                })
-
-        processed.sort(key=lambda x: x["score"], reverse=True)
-        final_results = processed[:n_results]
+        # [Ω] STRICT FILTERING: The index is partitioned by app_id, so other tenants are never scored.
+        # Scores match the historical linear scan: exact name 1.0, substring 0.95, name token 0.8,
+        # weighted description overlap floored at 0.4.
+        final_results = self._sim_index.search(app_id, query, domain=domain, limit=n_results)[:n_results]
         
         # [Ω] CONFIDENCE FALLBACK: If top result is low confidence, try broader search
         if domain and (not final_results or final_results[0]["score"] < 0.5):
@@ -215,16 +206,94 @@ class MemoryDB:
         self._sim_cache[cache_key] = final_results
         return final_results
 
+    def search_intent_many(
+        self, app_id: str, requests: list[tuple[str, str | None]], n_results: int = 1
+    ) -> list[list[dict[str, Any]]]:
+        """
+        [Ω] Batched search_intent over (query, domain) pairs, returning one result list per pair.
+        ChromaDB receives one `query_texts` call per distinct domain instead of one call per query.
+        """
+        if self.simulated or not self.collection:
+            return [self.search_intent(app_id, query, n_results, domain=domain) for query, domain in requests]
+
+        output: list[list[dict[str, Any]] | None] = [None] * len(requests)
+        by_domain: dict[str | None, list[int]] = {}
+        for index, (query, domain) in enumerate(requests):
+            cached = self._sim_cache.get(self._search_cache_key(app_id, query, n_results, domain))
+            if cached is not None:
+                output[index] = cached
+            else:
+                by_domain.setdefault(domain, []).append(index)
+
+        fallbacks: list[int] = []
+        for domain, indices in by_domain.items():
+            query_filter = {"app_id": app_id}
+            if domain:
+                query_filter["domain"] = domain
+            try:
+                results = self.collection.query(
+                    query_texts=[requests[index][0] for index in indices],
+                    n_results=n_results,
+                    where=query_filter # Strict partitioning
+                )
+            except Exception:
+                # Let the single-query path apply its own simulated fallback.
+                for index in indices:
+                    output[index] = self.search_intent(app_id, requests[index][0], n_results, domain=domain)
+                continue
+            for row, index in enumerate(indices):
+                if results['ids'] and row < len(results['ids']) and results['ids'][row]:
+                    output[index] = self._format_query_results(app_id, results, row)
+                elif domain and domain != "GENERAL":
+                    fallbacks.append(index)
+                else:
+                    output[index] = []
+
+        if fallbacks:
+            # Fallback if domain was too strict
+            broad = self.search_intent_many(app_id, [(requests[index][0], None) for index in fallbacks], n_results)
+            for index, results in zip(fallbacks, broad, strict=True):
+                output[index] = results
+        return [results if results is not None else [] for results in output]
+
+    @staticmethod
+    def _format_query_results(app_id: str, results: dict[str, Any], row: int) -> list[dict[str, Any]]:
+        formatted_results = []
+        for i in range(len(results['ids'][row])):
+            composite_id = results['ids'][row][i]
+            intent_id = composite_id.replace(f"{app_id}::", "", 1)
+
+            distance = results['distances'][row][i]
+            confidence = max(0.0, 1.0 - float(distance))
+
+            metadata = results['metadatas'][row][i]
+            formatted_results.append({
+                "trigger": intent_id,
+                "score": confidence,
+                "metadata": metadata,
+                "description": results['documents'][row][i],
+                "domain": metadata.get("domain", "GENERAL")
+            })
+        return formatted_results
+
     def get_total_skills(self) -> int:
         """Returns the total number of skills across all tenants."""
         if not self.simulated and self.collection:
             return self.collection.count()
-        return len(self._mock_records)
+        return len(self._sim_index)
 
     def clear_active_ram(self) -> None:
         """Purges volatile caches."""
         self._sim_cache.clear()
 
+    def cache_stats(self) -> dict[str, Any]:
+        """Hit/miss/eviction counters for the search cache, for monitoring."""
+        return {"corpus_generation": self.corpus_generation, "search": self._sim_cache.describe()}
+
+    def get_skill_manifest_path(self) -> Path:
+        """Returns the ingestion manifest path; it lives inside the store so both are discarded together."""
+        return self.db_path / "skill_manifest.json"
+
     def get_hall_of_records(self) -> HallOfRecords:
         """Returns the canonical Hall authority bound to this workspace."""
         return self.hall
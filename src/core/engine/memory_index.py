@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import json
+import os
+import re
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+SIM_INDEX_VERSION = 1
+_TRIGGER_SEPARATOR = "\x00"
+
+
+@dataclass(slots=True)
+class _IndexedRecord:
+    key: Any
+    record: dict[str, Any]
+    seq: int
+    intent_id: str
+    trigger_name: str
+    trigger_tokens: frozenset[str]
+    doc_tokens: frozenset[str]
+
+
+class _AppPartition:
+    """Postings for one app_id; every record in a partition shares the same sandbox."""
+
+    def __init__(self) -> None:
+        self.entries: dict[Any, _IndexedRecord] = {}
+        self.by_trigger: dict[str, set[Any]] = defaultdict(set)
+        self.by_intent: dict[str, set[Any]] = defaultdict(set)
+        self.by_trigger_length: dict[int, dict[str, set[Any]]] = defaultdict(lambda: defaultdict(set))
+        self.trigger_postings: dict[str, set[Any]] = defaultdict(set)
+        self.doc_postings: dict[str, set[Any]] = defaultdict(set)
+        self._joined: str | None = None
+        self._joined_starts: list[int] = []
+        self._joined_keys: list[Any] = []
+
+    def add(self, entry: _IndexedRecord) -> None:
+        self.entries[entry.key] = entry
+        self.by_trigger[entry.trigger_name].add(entry.key)
+        self.by_intent[entry.intent_id.lower()].add(entry.key)
+        self.by_trigger_length[len(entry.trigger_name)][entry.trigger_name].add(entry.key)
+        for token in entry.trigger_tokens:
+            self.trigger_postings[token].add(entry.key)
+        for token in entry.doc_tokens:
+            self.doc_postings[token].add(entry.key)
+        self._joined = None
+
+    def remove(self, key: Any) -> None:
+        entry = self.entries.pop(key)
+        _discard(self.by_trigger, entry.trigger_name, key)
+        _discard(self.by_intent, entry.intent_id.lower(), key)
+        _discard(self.by_trigger_length[len(entry.trigger_name)], entry.trigger_name, key)
+        if not self.by_trigger_length[len(entry.trigger_name)]:
+            del self.by_trigger_length[len(entry.trigger_name)]
+        for token in entry.trigger_tokens:
+            _discard(self.trigger_postings, token, key)
+        for token in entry.doc_tokens:
+            _discard(self.doc_postings, token, key)
+        self._joined = None
+
+    def triggers_containing(self, query: str) -> set[Any]:
+        """Keys whose trigger name contains `query`, found with C-level `str.find` over all names at once."""
+        if not query:
+            return set(self.entries)
+        if _TRIGGER_SEPARATOR in query:
+            return {key for key, entry in self.entries.items() if query in entry.trigger_name}
+        if self._joined is None:
+            self._joined_starts = []
+            self._joined_keys = []
+            offset = 0
+            names = []
+            for key, entry in self.entries.items():
+                self._joined_starts.append(offset)
+                self._joined_keys.append(key)
+                names.append(entry.trigger_name)
+                offset += len(entry.trigger_name) + 1
+            self._joined = _TRIGGER_SEPARATOR.join(names)
+        matches: set[Any] = set()
+        position = self._joined.find(query)
+        while position != -1:
+            index = bisect.bisect_right(self._joined_starts, position) - 1
+            matches.add(self._joined_keys[index])
+            # Skip to the next name; further hits in this one add nothing.
+            next_index = index + 1
+            if next_index >= len(self._joined_starts):
+                break
+            position = self._joined.find(query, self._joined_starts[next_index])
+        return matches
+
+    def triggers_within(self, query: str) -> set[Any]:
+        """Keys whose trigger name is a substring of `query`, via hashed lookups of the query's substrings."""
+        matches: set[Any] = set()
+        for length, names in self.by_trigger_length.items():
+            if length > len(query):
+                continue
+            substrings = {query[start:start + length] for start in range(len(query) - length + 1)}
+            for name in substrings & names.keys():
+                matches |= names[name]
+        return matches
+
+
+def _discard(postings: dict[str, set[Any]], token: str, key: Any) -> None:
+    keys = postings.get(token)
+    if keys is None:
+        return
+    keys.discard(key)
+    if not keys:
+        del postings[token]
+
+
+class SimulatedSkillIndex:
+    """
+    Inverted index behind MemoryDB's simulated search mode.
+    Scores match the historical linear scan exactly; ties keep upsert order, as the old record list did.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Any, _IndexedRecord] = {}
+        self._partitions: dict[Any, _AppPartition] = defaultdict(_AppPartition)
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def records(self) -> list[dict[str, Any]]:
+        return [entry.record for entry in sorted(self._entries.values(), key=lambda entry: entry.seq)]
+
+    def replace(self, records: Iterable[dict[str, Any]]) -> None:
+        self._entries.clear()
+        self._partitions.clear()
+        for record in records:
+            self.upsert(record)
+
+    def upsert(self, record: dict[str, Any], *, tokens: tuple[Iterable[str], Iterable[str]] | None = None) -> None:
+        # Records without an id still count toward the total but can never match a search.
+        key = record["id"] if "id" in record else object()
+        self.remove(key)
+        self._seq += 1
+        metadata = record.get("metadata") or {}
+        app_id = metadata.get("app_id")
+        intent_id = str(key).replace(f"{app_id}::", "", 1) if "id" in record else ""
+        trigger_name = intent_id.lower().lstrip("/")
+        if tokens is not None:
+            trigger_tokens, doc_tokens = frozenset(tokens[0]), frozenset(tokens[1])
+        else:
+            trigger_tokens = frozenset(re.findall(r"\w+", trigger_name))
+            doc_tokens = frozenset(str(record.get("doc", "")).lower().split())
+        entry = _IndexedRecord(
+            key=key,
+            record=record,
+            seq=self._seq,
+            intent_id=intent_id,
+            trigger_name=trigger_name,
+            trigger_tokens=trigger_tokens,
+            doc_tokens=doc_tokens,
+        )
+        self._entries[key] = entry
+        if "id" in record and "doc" in record:
+            self._partitions[app_id].add(entry)
+
+    def remove(self, key: Any) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        app_id = (entry.record.get("metadata") or {}).get("app_id")
+        partition = self._partitions.get(app_id)
+        if partition is not None and key in partition.entries:
+            partition.remove(key)
+
+    def search(
+        self, app_id: str, query: str, domain: str | None = None, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Returns positively scored records for `app_id`, best first, in the legacy result shape."""
+        partition = self._partitions.get(app_id)
+        if partition is None or not partition.entries:
+            return []
+        query = query.lower()
+        q_words = set(query.split())
+
+        scores: dict[Any, float] = {}
+        for key in partition.by_trigger.get(query, set()) | partition.by_intent.get(query, set()):
+            scores[key] = 1.0
+        for key in partition.triggers_containing(query) | partition.triggers_within(query):
+            scores.setdefault(key, 0.95)
+        for word in q_words:
+            for key in partition.trigger_postings.get(word, ()):
+                scores.setdefault(key, 0.8)
+
+        weighted_total = sum(len(word) for word in q_words)
+        overlaps: dict[Any, int] = defaultdict(int)
+        for word in q_words:
+            for key in partition.doc_postings.get(word, ()):
+                if key not in scores:
+                    overlaps[key] += len(word)
+        for key, weighted_overlap in overlaps.items():
+            score = (weighted_overlap / weighted_total) if weighted_total else 0.0
+            scores[key] = max(score, 0.4)
+
+        ranked = []
+        for key, score in scores.items():
+            entry = partition.entries[key]
+            metadata = entry.record["metadata"]
+            if domain and metadata.get("domain") != domain:
+                continue
+            ranked.append((-score, entry.seq, entry, score))
+        # (score, seq) is unique per record, so the entry itself is never compared.
+        if limit is not None and 0 <= limit < len(ranked):
+            ranked = heapq.nsmallest(limit, ranked, key=lambda item: (item[0], item[1]))
+        else:
+            ranked.sort(key=lambda item: (item[0], item[1]))
+        return [
+            {
+                "trigger": entry.intent_id,
+                "score": score,
+                "metadata": entry.record["metadata"],
+                "description": entry.record["doc"],
+                "domain": entry.record["metadata"].get("domain", "GENERAL"),
+            }
+            for _, _, entry, score in ranked
+        ]
+
+    def save(self, path: Path | str) -> None:
+        """Persists records with their precomputed token sets so a warm start skips re-tokenizing."""
+        path = Path(path)
+        payload = {
+            "version": SIM_INDEX_VERSION,
+            "records": [
+                {
+                    "id": entry.record["id"],
+                    "doc": entry.record.get("doc", ""),
+                    "metadata": entry.record.get("metadata") or {},
+                    "trigger_tokens": sorted(entry.trigger_tokens),
+                    "doc_tokens": sorted(entry.doc_tokens),
+                }
+                for entry in sorted(self._entries.values(), key=lambda entry: entry.seq)
+                if "id" in entry.record
+            ],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A private temp file per save, so concurrent savers never swap in each other's partial output.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def load(self, path: Path | str) -> bool:
+        """Replaces the index with a persisted snapshot. Returns False when the snapshot is missing or stale."""
+        path = Path(path)
+        if not path.exists():
+            return False
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return False
+        if payload.get("version") != SIM_INDEX_VERSION:
+            return False
+        self._entries.clear()
+        self._partitions.clear()
+        for item in payload.get("records", []):
+            self.upsert(
+                {"id": item["id"], "doc": item["doc"], "metadata": item["metadata"]},
+                tokens=(item["trigger_tokens"], item["doc_tokens"]),
+            )
+        return True
@@ -4,6 +4,7 @@ Lore: "The Weaver of Intent."
 Purpose: Orchestration of the Search -> Discovery -> Fallback flow.
 """
 
+import asyncio
 import json
 from pathlib import Path
 from typing import Any
@@ -37,6 +38,8 @@ class SovereignOrchestrator:
 
         # 1. Search Local Engine
         results = engine.search(query)
+        if asyncio.iscoroutine(results):
+            results = asyncio.run(results)
         top = results[0] if results else None
 
         # 2. Sovereign Discovery (Local skills insufficient)
@@ -0,0 +1,176 @@
+"""
+[SPOKE] Query Server
+Lore: "The All-Father never sleeps; he only listens."
+Purpose: Resident sv_engine mode serving intent queries over a Unix socket (JSON lines).
+"""
+
+# Intent: Keep the Sovereign Engine, Cortex and caches warm between queries and hot-reload skills when their files change.
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from src.core.utils import sanitize_query
+
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+class SovereignQueryServer:
+    """
+    Long-lived host for a SovereignEngine.
+    Each request line is a JSON object with the sv_engine.py flags
+    (`query`, `json`, `record`, `cortex`, `benchmark`) or an `op` of `ping`, `stats` or `shutdown`;
+    each response line carries the captured CLI output.
+    Connections are served concurrently; engine work runs one request at a time on a dedicated
+    worker thread, because the spokes and the captured stdout are shared.
+    """
+
+    RELOAD_INTERVAL = 2.0
+
+    def __init__(self, engine: Any, socket_path: Path | str, reload_interval: float | None = None) -> None:
+        self.engine = engine
+        self.socket_path = Path(socket_path)
+        if reload_interval is None:
+            reload_interval = float(os.getenv("CSTAR_ENGINE_RELOAD_INTERVAL", self.RELOAD_INTERVAL))
+        self.reload_interval = reload_interval
+        self.stats: dict[str, Any] = {"requests": 0, "errors": 0, "reloads": 0, "started_at": time.time()}
+        self._lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+        self._fingerprint: bytes | None = None
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sv-engine")
+
+    async def serve_forever(self) -> None:
+        """Listens until a `shutdown` request arrives or the task is cancelled, then tears the engine down."""
+        self._claim_socket()
+        server = await asyncio.start_unix_server(self._handle_connection, path=str(self.socket_path), limit=MAX_REQUEST_BYTES)
+        os.chmod(self.socket_path, 0o600)
+        self._fingerprint = await self._on_worker(self.engine.input_fingerprint)
+        watcher = asyncio.create_task(self._watch_inputs())
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
+            self.socket_path.unlink(missing_ok=True)
+            async with self._lock:
+                await self._on_worker(self.engine.teardown)
+            self._worker.shutdown(wait=False)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Executes one request and returns its response object."""
+        op = request.get("op", "query")
+        if op == "ping":
+            return {"ok": True, "op": "ping"}
+        if op == "stats":
+            return {"ok": True, "op": "stats", "stats": {**self.stats, "uptime_s": round(time.time() - self.stats["started_at"], 3)}}
+        if op == "shutdown":
+            self.stop()
+            return {"ok": True, "op": "shutdown"}
+        if op != "query":
+            return {"ok": False, "error": f"Unknown op: {op}"}
+
+        self.stats["requests"] += 1
+        start = time.perf_counter()
+        async with self._lock:
+            try:
+                output = await self._on_worker(self._execute, request)
+            except (Exception, SystemExit) as e:
+                self.stats["errors"] += 1
+                return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "output": output, "elapsed_ms": round((time.perf_counter() - start) * 1000, 3)}
+
+    async def reload_if_changed(self) -> bool:
+        """Rebuilds the vector engine when any skill or lexicon file changed since the last build."""
+        fingerprint = await self._on_worker(self.engine.input_fingerprint)
+        if fingerprint == self._fingerprint:
+            return False
+        async with self._lock:
+            await self._on_worker(self.engine.reload)
+        self._fingerprint = fingerprint
+        self.stats["reloads"] += 1
+        return True
+
+    async def _on_worker(self, func: Any, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._worker, func, *args)
+
+    def _execute(self, request: dict[str, Any]) -> str:
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            if request.get("benchmark"):
+                self.engine.render_diagnostic()
+            else:
+                self.engine.run(
+                    query=sanitize_query(str(request.get("query", ""))),
+                    json_mode=bool(request.get("json")),
+                    record=bool(request.get("record")),
+                    use_cortex=bool(request.get("cortex")),
+                )
+        return buffer.getvalue()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while not reader.at_eof():
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(_encode({"ok": False, "error": "Request too large"}))
+                    break
+                if not line.strip():
+                    continue
+                request: Any = None
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as e:
+                    response = {"ok": False, "error": f"Malformed request: {e}"}
+                else:
+                    response = await self.handle_request(request)
+                if isinstance(request, dict) and "id" in request:
+                    response["id"] = request["id"]
+                writer.write(_encode(response))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _watch_inputs(self) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.reload_if_changed()
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.stats["last_reload_error"] = f"{type(e).__name__}: {e}"
+
+    def _claim_socket(self) -> None:
+        """Removes a stale socket left by a crashed server; refuses to start next to a live one."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                self.socket_path.unlink(missing_ok=True)
+                return
+        raise RuntimeError(f"A resident engine is already listening on {self.socket_path}")
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    return (json.dumps(payload) + "\n").encode("utf-8")
@@ -1,7 +1,10 @@
+import contextlib
 import json
 from pathlib import Path
 from typing import Any
 
+from src.core.engine.hall_schema import normalize_hall_path
+from src.core.lease_manager import LeaseManager
 from src.core.norn_coordinator import NornCoordinator
 from src.core.sovereign_hud import SovereignHUD
 
@@ -11,9 +14,21 @@ class MissionCoordinator:
     [ALFRED] Coordinates the Hunt and Selection phases of the Ravens Protocol.
     Integrates with PennyOne Tech Debt Ledger and Matrix Graph.
     """
+    # Beads inspected per mission slot when conflicting targets have to be skipped.
+    CANDIDATE_FACTOR = 4
+    # Leases must outlive forge, validation and promotion of a whole batch.
+    LEASE_DURATION_MS = 30 * 60 * 1000
+
     def __init__(self, root: Path):
         self.root = root
         self.norn = NornCoordinator(root)
+        self._leases: LeaseManager | None = None
+
+    @property
+    def leases(self) -> LeaseManager:
+        if self._leases is None:
+            self._leases = LeaseManager(self.root)
+        return self._leases
 
     def select_mission(
         self,
@@ -35,6 +50,76 @@ class MissionCoordinator:
 
         return self._select_legacy_projected_mission()
 
+    def select_missions(
+        self,
+        limit: int,
+        *,
+        claim_agent: str,
+        lease_agent: str | None = None,
+        allow_legacy_fallback: bool = True,
+    ) -> list[dict]:
+        """
+        Claims up to `limit` bead missions on distinct target paths, each held under a task lease.
+        Beads whose target is already taken, in this batch or by another agent's lease, stay unclaimed.
+        Release the leases with `release_missions` once the missions are done.
+        """
+        lease_agent = lease_agent or claim_agent
+        missions: list[dict] = []
+        taken: set[str] = set()
+        # (bead id, status before the claim) for every bead this call claimed
+        claims: list[tuple[str, str]] = []
+        try:
+            for bead in self.norn.peek_claimable_beads(limit * self.CANDIDATE_FACTOR):
+                if len(missions) >= limit:
+                    break
+                lease_path = self._lease_path(bead.get("target_path") or bead.get("target_ref"))
+                if lease_path is None or lease_path in taken:
+                    continue
+                if not self.leases.acquire_lease(lease_path, lease_agent, self.LEASE_DURATION_MS):
+                    continue
+                try:
+                    claimed = self.norn.claim_bead(bead["id"], claim_agent)
+                    if claimed is not None:
+                        claims.append((claimed["id"], bead.get("status") or "OPEN"))
+                        mission = self._bead_to_mission(claimed, claimed=True)
+                except BaseException:
+                    self.leases.release_lease(lease_path, lease_agent)
+                    raise
+                if claimed is None:
+                    self.leases.release_lease(lease_path, lease_agent)
+                    continue
+                taken.add(lease_path)
+                mission["lease"] = {"target_path": lease_path, "agent_id": lease_agent}
+                missions.append(mission)
+
+            if not missions and allow_legacy_fallback:
+                mission = self._select_legacy_projected_mission()
+                lease_path = self._lease_path(mission.get("file")) if mission else None
+                if lease_path and self.leases.acquire_lease(lease_path, lease_agent, self.LEASE_DURATION_MS):
+                    mission["lease"] = {"target_path": lease_path, "agent_id": lease_agent}
+                    missions.append(mission)
+        except BaseException:
+            # The caller never sees a partial batch, so its leases and claims are handed back here.
+            self.release_missions(missions)
+            for bead_id, status in claims:
+                with contextlib.suppress(Exception):
+                    self.norn.release_bead(bead_id, claim_agent, status=status)
+            raise
+        return missions
+
+    def release_missions(self, missions: list[dict]) -> None:
+        """Releases the task leases taken by `select_missions`."""
+        for mission in missions:
+            lease = mission.get("lease")
+            if lease:
+                self.leases.release_lease(lease["target_path"], lease["agent_id"])
+
+    @staticmethod
+    def _lease_path(target: str | None) -> str | None:
+        if not target or target == "unscoped":
+            return None
+        return normalize_hall_path(target)
+
     def _bead_to_mission(self, bead: dict[str, Any], *, claimed: bool) -> dict[str, Any]:
         metrics = dict(bead.get("baseline_scores") or {})
         initial_score = self._initial_score_from_metrics("OVERALL", metrics)
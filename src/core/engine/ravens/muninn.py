@@ -48,11 +48,16 @@ class Muninn:
         """Returns the structured Phase 3 cycle contract while boolean callers remain supported."""
         return await self.heart.execute_cycle_contract()
 
+    def close(self) -> None:
+        """Shuts the Heart spoke down, releasing its warm pytest workers."""
+        self.heart.close()
+
 if __name__ == "__main__":
     # Force unbuffered output for real-time monitoring
     sys.stdout.reconfigure(line_buffering=True)
     
     print("[PULSE] Muninn process started.")
+    m = None
     try:
         m = Muninn()
         print("[PULSE] Muninn starting run_cycle...")
@@ -61,3 +66,6 @@ if __name__ == "__main__":
         print(f"[PULSE] Muninn FATAL ERROR: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if m is not None:
+            m.close()
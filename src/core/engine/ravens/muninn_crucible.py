@@ -4,15 +4,21 @@ Lore: "The Anvil of Odin."
 Purpose: Forging reproduction tests, generating fixes, and verifying candidates in the Crucible.
 """
 
+import asyncio
+import os
 import shutil
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass
+import uuid
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Callable
 
 from src.core.engine.forge_candidate import ForgeValidationRequest, GeneratedTestArtifact
+from src.core.engine.ravens.pytest_pool import PytestWorkerPool
+from src.core.engine.ravens.validation_workspace import ValidationWorkspace
 from src.core.engine.ravens_stage import RavensHallReferenceSet, RavensStageResult, RavensTargetIdentity
 from src.core.engine.validation_result import (
     ValidationCheck,
@@ -36,10 +42,29 @@ class PreparedCandidate:
 
 
 class MuninnCrucible:
-    def __init__(self, root: Path, uplink: Any):
+    # Candidates validated at once, each in its own workspace; MUNINN_CRUCIBLE_CONCURRENCY overrides.
+    MAX_CONCURRENT_VALIDATIONS = 2
+    VERIFY_TIMEOUT_SECONDS = 120
+
+    def __init__(
+        self,
+        root: Path,
+        uplink: Any,
+        *,
+        max_concurrency: int | None = None,
+        warm_workers: bool = False,
+    ):
         self.root = root
         self.uplink = uplink
         self.gate = BifrostGate(root)
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("MUNINN_CRUCIBLE_CONCURRENCY", str(self.MAX_CONCURRENT_VALIDATIONS)))
+        self.max_concurrency = max(1, max_concurrency)
+        # Long-lived crucibles keep one warm pytest worker per validation slot; one-shot callers stay cold.
+        self.worker_pool = PytestWorkerPool(root, size=self.max_concurrency) if warm_workers else None
+        self._slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+        # Serializes the compare-and-apply of accepted candidates onto the live tree.
+        self._apply_lock = threading.Lock()
 
     @staticmethod
     def _target_identity(target: dict[str, Any]) -> RavensTargetIdentity:
@@ -153,7 +178,8 @@ class MuninnCrucible:
         raw_code = res["data"].get("code") or res["data"].get("raw", "")
         clean_test = self.gate.sanitize_test(raw_code, target["file"])
         
-        test_file = self.root / "tests" / "gauntlet" / f"test_{int(time.time())}.py"
+        # Concurrent missions forge gauntlets in the same second; the uuid keeps their files apart.
+        test_file = self.root / "tests" / "gauntlet" / f"test_{int(time.time())}_{uuid.uuid4().hex[:12]}.py"
         test_file.parent.mkdir(parents=True, exist_ok=True)
         test_file.write_text(clean_test, encoding="utf-8")
         
@@ -259,11 +285,8 @@ class MuninnCrucible:
                 },
             )
 
-        self.apply_fix(prepared.file_path, prepared.fix_content)
-        validation = self.verify_fix_result(
-            prepared.test_path,
-            metadata={"target_path": prepared.target.target_path, "mission_id": target.get("mission_id")},
-        )
+        async with self._validation_slot():
+            validation, applied_to_tree = await asyncio.to_thread(self._validate_in_workspace, prepared, target)
         saved_validation = save_validation_result(
             str(self.root),
             validation,
@@ -301,6 +324,7 @@ class MuninnCrucible:
             ),
             metadata={
                 "candidate_applied": True,
+                "applied_to_tree": applied_to_tree,
                 "mission_id": target.get("mission_id"),
                 "scan_id": target.get("scan_id"),
                 "validation_verdict": validation.verdict,
@@ -322,6 +346,70 @@ class MuninnCrucible:
             },
         )
 
+    async def validate_candidates(
+        self,
+        repo_id: str,
+        targets: list[dict[str, Any]],
+        record_observation: Callable[[str, str, str, dict[str, Any] | None], str],
+    ) -> list[RavensStageResult]:
+        """Validates several candidates concurrently, at most `max_concurrency` workspaces at a time."""
+        return list(
+            await asyncio.gather(
+                *(self.execute_validation_stage(repo_id, target, record_observation) for target in targets)
+            )
+        )
+
+    def _validation_slot(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots[0] is not loop:
+            self._slots = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._slots[1]
+
+    def _validate_in_workspace(self, prepared: PreparedCandidate, target: dict[str, Any]) -> tuple[ValidationResult, bool]:
+        """
+        Applies and tests the candidate in a private workspace; the live tree only receives it once accepted.
+        Returns the validation and whether the candidate now sits in the live tree (with its `.bak`).
+        """
+        baseline = self._read_bytes(prepared.file_path)
+        with ValidationWorkspace(self.root, label=prepared.target.bead_id or prepared.file_path.stem) as workspace:
+            workspace.write_text(prepared.file_path, prepared.fix_content)
+            validation = self.verify_fix_result(
+                workspace.resolve(prepared.test_path),
+                cwd=workspace.path,
+                metadata={
+                    "target_path": prepared.target.target_path,
+                    "mission_id": target.get("mission_id"),
+                    "test_path": str(prepared.test_path),
+                },
+            )
+        if validation.verdict != "ACCEPTED":
+            return validation, False
+
+        with self._apply_lock:
+            if self._read_bytes(prepared.file_path) != baseline:
+                # Another candidate for the same file was promoted while this one was under test.
+                check = ValidationCheck(
+                    name="live_tree",
+                    status="FAIL",
+                    details=f"{prepared.target.target_path} changed while the candidate was under validation.",
+                )
+                return replace(
+                    validation,
+                    verdict="REJECTED",
+                    summary="Crucible rejected the candidate: its target changed during validation.",
+                    checks=[*validation.checks, check],
+                    blocking_reasons=[*validation.blocking_reasons, f"Validation check '{check.name}' failed."],
+                ), False
+            self.apply_fix(prepared.file_path, prepared.fix_content)
+        return validation, True
+
+    @staticmethod
+    def _read_bytes(file_path: Path) -> bytes | None:
+        try:
+            return file_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
     def verify_fix_result(
         self,
         test_path: Path,
@@ -329,33 +417,32 @@ class MuninnCrucible:
         before_scores: dict[str, Any] | None = None,
         after_scores: dict[str, Any] | None = None,
         metadata: dict[str, Any] | None = None,
+        cwd: Path | None = None,
     ) -> ValidationResult:
         """Executes the gauntlet tests and returns the canonical validation envelope."""
         SovereignHUD.persona_log("INFO", f"Entering the Crucible for verification: {test_path.name}")
-        cmd = [sys.executable, "-m", "pytest", str(test_path), "-v"]
         started = time.perf_counter()
 
         try:
-            # 120s timeout for unit verification to prevent hangs
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=120)
+            returncode, stdout, stderr, runner = self._run_pytest(test_path, cwd)
             elapsed_ms = (time.perf_counter() - started) * 1000
             benchmark = create_benchmark_result(
-                status="PASS" if result.returncode == 0 else "FAIL",
-                summary="Crucible verification completed." if result.returncode == 0 else "Crucible verification failed.",
+                status="PASS" if returncode == 0 else "FAIL",
+                summary="Crucible verification completed." if returncode == 0 else "Crucible verification failed.",
                 trials=1,
                 avg_latency_ms=elapsed_ms,
                 min_latency_ms=elapsed_ms,
                 max_latency_ms=elapsed_ms,
                 stddev_latency_ms=0.0,
-                metadata={"test_path": str(test_path)},
+                metadata={"test_path": str(test_path), **runner},
             )
             check = ValidationCheck(
                 name="crucible",
-                status="PASS" if result.returncode == 0 else "FAIL",
-                details=(result.stdout or result.stderr or "").strip()[:500] or None,
+                status="PASS" if returncode == 0 else "FAIL",
+                details=(stdout or stderr or "").strip()[:500] or None,
             )
 
-            if result.returncode == 0:
+            if returncode == 0:
                 SovereignHUD.persona_log("SUCCESS", "The Crucible is satisfied. Fix verified.")
                 return create_validation_result(
                     before=before_scores,
@@ -366,7 +453,7 @@ class MuninnCrucible:
                     metadata={"test_path": str(test_path), **(metadata or {})},
                 )
 
-            SovereignHUD.persona_log("ERROR", f"Crucible Failure:\n{result.stdout}\n{result.stderr}")
+            SovereignHUD.persona_log("ERROR", f"Crucible Failure:\n{stdout}\n{stderr}")
             return create_validation_result(
                 before=before_scores,
                 after=after_scores or before_scores,
@@ -386,7 +473,7 @@ class MuninnCrucible:
                 min_latency_ms=elapsed_ms,
                 max_latency_ms=elapsed_ms,
                 stddev_latency_ms=0.0,
-                metadata={"test_path": str(test_path), "timeout_seconds": 120},
+                metadata={"test_path": str(test_path), "timeout_seconds": self.VERIFY_TIMEOUT_SECONDS},
             )
             return create_validation_result(
                 before=before_scores,
@@ -397,6 +484,31 @@ class MuninnCrucible:
                 metadata={"test_path": str(test_path), **(metadata or {})},
             )
 
+    def _run_pytest(self, test_path: Path, cwd: Path | None) -> tuple[int, str, str, dict[str, Any]]:
+        """(returncode, stdout, stderr, runner metadata) from a warm worker, or from a cold subprocess."""
+        if self.worker_pool is not None:
+            run = self.worker_pool.run(test_path, cwd=cwd, timeout=self.VERIFY_TIMEOUT_SECONDS)
+            if run is not None:
+                return run.exit_code, run.output, "", {
+                    "runner": "warm",
+                    "passed": run.passed,
+                    "failed": run.failed,
+                    "errors": run.errors,
+                    "skipped": run.skipped,
+                    "pytest_ms": run.duration_ms,
+                }
+        cmd = [sys.executable, "-m", "pytest", str(test_path), "-v"]
+        # Timeout for unit verification to prevent hangs
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, check=False, timeout=self.VERIFY_TIMEOUT_SECONDS, cwd=cwd
+        )
+        return result.returncode, result.stdout, result.stderr, {"runner": "cold"}
+
+    def close(self) -> None:
+        """Stops the warm pytest workers, if any."""
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+
     def verify_fix(self, test_path: Path) -> bool:
         """Compatibility wrapper for legacy call sites awaiting a boolean verdict."""
         return self.verify_fix_result(test_path).verdict == "ACCEPTED"
@@ -7,7 +7,6 @@ Purpose: Lifecycle management, process synchronization, and autonomous loop exec
 
 import asyncio
 import os
-import subprocess
 import time
 from pathlib import Path
 from typing import Any
@@ -16,6 +15,7 @@ from src.core.sovereign_hud import SovereignHUD
 from src.core.engine.ravens.muninn_crucible import MuninnCrucible
 from src.core.engine.ravens.muninn_memory import MuninnMemory
 from src.core.engine.ravens.muninn_promotion import MuninnPromotion
+from src.core.engine.ravens.quiescence import QuiescenceDetector
 from src.core.engine.ravens.stability import TheWatcher
 from src.core.engine.ravens.coordinator import MissionCoordinator
 
@@ -34,6 +34,10 @@ class MuninnHeart:
     Orchestrates the Hunt -> Forge -> Empire cycle with endurance hardening.
     Mandate: One Mind. No 'Too Much Mind'.
     """
+    # Batch cycles: missions claimed per cycle (MUNINN_CYCLE_MISSIONS) and validated at once
+    # (MUNINN_CYCLE_CONCURRENCY, defaulting to the Crucible's workspace limit).
+    MAX_MISSIONS_PER_CYCLE = 4
+
     def __init__(self, root: Path, uplink: Any):
         self.root = root
         self.uplink = uplink
@@ -43,13 +47,22 @@ class MuninnHeart:
         self.coordinator = MissionCoordinator(self.root)
         self.memory = MuninnMemory(self.root)
         self.promotion = MuninnPromotion(self.root)
-        self.crucible = MuninnCrucible(self.root, self.uplink)
+        # Warm pytest workers outlive a single cycle; MUNINN_CRUCIBLE_WARM_POOL=0 keeps verification cold.
+        self.crucible = MuninnCrucible(
+            self.root,
+            self.uplink,
+            warm_workers=os.getenv("MUNINN_CRUCIBLE_WARM_POOL", "1") != "0",
+        )
         self.watcher = TheWatcher(self.root)
         
         self.start_time = time.time()
         self.cycle_count = 0
         self.total_errors = 0
 
+    def close(self) -> None:
+        """Shuts the heart down, stopping the Crucible's warm pytest workers."""
+        self.crucible.close()
+
     async def _run_behavioral_pulse(self) -> bool:
         """Compatibility pulse wrapper over the structured cycle contract."""
         cycle = await self.execute_cycle_contract()
@@ -156,7 +169,7 @@ class MuninnHeart:
                 metadata={"cycle_count": self.cycle_count, "total_errors": self.total_errors},
             )
 
-        self._wait_for_silence()
+        await self._wait_for_silence()
         SovereignHUD.persona_log("INFO", "Ravens taking flight...")
 
         stages: list[RavensStageResult] = []
@@ -238,6 +251,211 @@ class MuninnHeart:
             self.memory.log_cycle_completion(self.cycle_count, self.total_errors)
             SovereignHUD.persona_log("INFO", f"Cycle {self.cycle_count} completed with {self.total_errors} errors.")
 
+    def _hunt_batch_stage(self, limit: int) -> tuple[RavensStageResult, list[dict[str, Any]]]:
+        missions = self.coordinator.select_missions(
+            limit,
+            claim_agent=self.agent_id,
+            lease_agent=f"{self.agent_id}:{os.getpid()}",
+        )
+        targets = [mission.get("file") for mission in missions]
+        status = "SUCCESS" if missions else "NO_ACTION"
+        summary = (
+            f"{len(missions)} mission(s) selected: {', '.join(str(target) for target in targets)}."
+            if missions
+            else "No mission was available for Muninn."
+        )
+        observation_id = self.memory.record_stage_observation(
+            "hunt",
+            status,
+            summary,
+            {
+                "claim_agent": self.agent_id,
+                "mission_ids": [mission.get("mission_id") for mission in missions],
+                "target_paths": targets,
+            },
+        )
+        return RavensStageResult(
+            stage="hunt",
+            status=status,
+            summary=summary,
+            hall=RavensHallReferenceSet(repo_id=self._repo_id(), observation_id=observation_id),
+            metadata={"claim_agent": self.agent_id, "missions": [dict(mission) for mission in missions]},
+        ), missions
+
+    async def _validate_mission(
+        self,
+        repo_id: str,
+        mission: dict[str, Any],
+        slots: asyncio.Semaphore,
+    ) -> tuple[RavensStageResult, float]:
+        async with slots:
+            started = time.perf_counter()
+            try:
+                stage = await self.crucible.execute_validation_stage(
+                    repo_id,
+                    mission,
+                    self.memory.record_stage_observation,
+                )
+            except Exception as e:
+                # One broken forge must not sink its siblings; promotion blocks the bead.
+                self.total_errors += 1
+                summary = f"Validation failed: {e}"
+                observation_id = self.memory.record_stage_observation(
+                    "validate",
+                    "FAILURE",
+                    summary,
+                    {"mission_id": mission.get("mission_id"), "target_path": mission.get("file")},
+                )
+                stage = RavensStageResult(
+                    stage="validate",
+                    status="FAILURE",
+                    summary=summary,
+                    target=self._target_from_mission(mission),
+                    hall=RavensHallReferenceSet(
+                        repo_id=repo_id,
+                        observation_id=observation_id,
+                        bead_id=mission.get("bead_id"),
+                    ),
+                    metadata={"candidate_applied": False, "mission_id": mission.get("mission_id")},
+                )
+            return stage, (time.perf_counter() - started) * 1000
+
+    async def execute_batch_cycle_contract(
+        self,
+        max_missions: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> RavensCycleResult:
+        """
+        One cycle over up to `max_missions` missions on distinct targets.
+        Forge and validation run concurrently, at most `max_concurrency` at a time; promotions then run
+        one by one in claim order, so the live tree and the bead ledger see them serially.
+        """
+        if max_missions is None:
+            max_missions = int(os.getenv("MUNINN_CYCLE_MISSIONS", str(self.MAX_MISSIONS_PER_CYCLE)))
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv("MUNINN_CYCLE_CONCURRENCY", str(self.crucible.max_concurrency)))
+        max_missions = max(1, max_missions)
+        max_concurrency = max(1, max_concurrency)
+
+        self.cycle_count += 1
+        cycle_start = time.time()
+        repo_id = self._repo_id()
+        mission_id = f"mission:muninn:batch:{self.cycle_count}"
+
+        if os.getenv("MUNINN_FORCE_FLIGHT") != "true" and (cycle_start - self.start_time) > 21600:
+            summary = "Endurance limit reached. Returning to the High Seat."
+            SovereignHUD.persona_log("INFO", summary)
+            return RavensCycleResult(
+                status="NO_ACTION",
+                summary=summary,
+                mission_id="mission:muninn:endurance-limit",
+                hall=RavensHallReferenceSet(repo_id=repo_id),
+                metadata={"cycle_count": self.cycle_count, "total_errors": self.total_errors},
+            )
+
+        await self._wait_for_silence()
+        SovereignHUD.persona_log("INFO", f"Ravens taking flight (up to {max_missions} missions)...")
+
+        stages: list[RavensStageResult] = []
+        missions: list[dict[str, Any]] = []
+        latency: dict[str, Any] = {"memory": 0.0, "hunt": 0.0, "validate": [], "promote": []}
+        try:
+            started = time.perf_counter()
+            stages.append(self._memory_stage())
+            latency["memory"] = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            hunt_stage, missions = self._hunt_batch_stage(max_missions)
+            latency["hunt"] = (time.perf_counter() - started) * 1000
+            stages.append(hunt_stage)
+            if not missions:
+                return RavensCycleResult(
+                    status="NO_ACTION",
+                    summary=hunt_stage.summary,
+                    mission_id=mission_id,
+                    stages=stages,
+                    hall=hunt_stage.hall,
+                    metadata={
+                        "cycle_count": self.cycle_count,
+                        "total_errors": self.total_errors,
+                        "stage_latency_ms": latency,
+                    },
+                )
+
+            validate_started = time.perf_counter()
+            slots = asyncio.Semaphore(max_concurrency)
+            validated = await asyncio.gather(
+                *(self._validate_mission(repo_id, dict(mission), slots) for mission in missions)
+            )
+            validate_wall_ms = (time.perf_counter() - validate_started) * 1000
+
+            promoted = 0
+            last_hall = hunt_stage.hall
+            for validate_stage, validate_ms in validated:
+                validate_stage.metadata["latency_ms"] = round(validate_ms, 3)
+                latency["validate"].append(round(validate_ms, 3))
+                stages.append(validate_stage)
+
+                started = time.perf_counter()
+                promote_stage = self.promotion.execute_promotion_stage(
+                    repo_id,
+                    validate_stage,
+                    self.memory.record_stage_observation,
+                    self.memory.record_trace,
+                )
+                promote_ms = (time.perf_counter() - started) * 1000
+                promote_stage.metadata["latency_ms"] = round(promote_ms, 3)
+                latency["promote"].append(round(promote_ms, 3))
+                stages.append(promote_stage)
+                if promote_stage.status == "SUCCESS":
+                    promoted += 1
+                last_hall = promote_stage.hall or validate_stage.hall or last_hall
+
+            elapsed = time.time() - cycle_start
+            summary = f"{promoted}/{len(missions)} mission(s) promoted."
+            return RavensCycleResult(
+                status="SUCCESS" if promoted == len(missions) else "FAILURE",
+                summary=summary,
+                mission_id=mission_id,
+                target=validated[0][0].target if len(missions) == 1 else None,
+                stages=stages,
+                hall=last_hall,
+                metadata={
+                    "cycle_count": self.cycle_count,
+                    "total_errors": self.total_errors,
+                    "elapsed_seconds": round(elapsed, 4),
+                    "mission_ids": [mission.get("mission_id") for mission in missions],
+                    "missions_attempted": len(missions),
+                    "missions_promoted": promoted,
+                    "max_concurrency": max_concurrency,
+                    "validate_wall_ms": round(validate_wall_ms, 3),
+                    "stage_latency_ms": latency,
+                    "missions_per_minute": round(len(missions) / elapsed * 60, 3) if elapsed > 0 else None,
+                },
+            )
+        except Exception as e:
+            self.total_errors += 1
+            summary = f"Ravens cycle failed: {e}"
+            SovereignHUD.persona_log("ERROR", summary)
+            observation_id = self.memory.record_stage_observation(
+                "memory",
+                "FAILURE",
+                summary,
+                {"cycle_count": self.cycle_count},
+            )
+            return RavensCycleResult(
+                status="FAILURE",
+                summary=summary,
+                mission_id=mission_id,
+                stages=stages,
+                hall=RavensHallReferenceSet(repo_id=repo_id, observation_id=observation_id),
+                metadata={"cycle_count": self.cycle_count, "total_errors": self.total_errors},
+            )
+        finally:
+            self.coordinator.release_missions(missions)
+            self.memory.log_cycle_completion(self.cycle_count, self.total_errors)
+            SovereignHUD.persona_log("INFO", f"Cycle {self.cycle_count} completed with {self.total_errors} errors.")
+
     async def execute_cycle(self) -> bool:
         """
         Executes one autonomous repair cycle.
@@ -246,33 +464,19 @@ class MuninnHeart:
         cycle = await self.execute_cycle_contract()
         return cycle.status == "SUCCESS"
 
-    def _wait_for_silence(self):
-        """Waits for repository silence before taking flight."""
+    async def _wait_for_silence(self) -> None:
+        """
+        Waits, without blocking the loop, for the repository to go quiet before taking flight.
+        Silence means no write for MUNINN_SILENCE_INTERVAL seconds; the tree gets
+        MUNINN_SILENCE_ATTEMPTS + 1 such windows to settle.
+        """
         if os.getenv("MUNINN_FORCE_FLIGHT") == "true":
             return
 
-        interval = float(os.getenv("MUNINN_SILENCE_INTERVAL", "1"))
+        window = float(os.getenv("MUNINN_SILENCE_INTERVAL", "1"))
         max_attempts = int(os.getenv("MUNINN_SILENCE_ATTEMPTS", "3"))
-        previous = self._repository_activity_snapshot()
-        for _ in range(max_attempts):
-            time.sleep(interval)
-            current = self._repository_activity_snapshot()
-            if current == previous:
-                return
-            previous = current
-
-        raise RuntimeError("Repository activity did not settle before Ravens flight.")
-
-    def _repository_activity_snapshot(self) -> str:
+        detector = QuiescenceDetector(self.root, window)
         try:
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=self.root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=False,
-            )
-        except (OSError, subprocess.TimeoutExpired) as exc:
-            return f"git-status-unavailable:{type(exc).__name__}"
-        return result.stdout
+            await detector.wait(timeout=window * (max_attempts + 1))
+        except asyncio.TimeoutError as exc:
+            raise RuntimeError("Repository activity did not settle before Ravens flight.") from exc
@@ -0,0 +1,305 @@
+"""
+[SPOKE] Pytest Worker Pool
+Lore: "The forge is kept hot between blades."
+Purpose: Pre-warmed pytest workers that verify Crucible candidates without paying interpreter and plugin startup.
+
+Each worker imports pytest, its entry-point plugins and any configured heavy modules once, then forks a
+fresh child per request. The child drops every module loaded from the project tree, so candidates are
+always imported from disk, and exits after one run; nothing a test does survives into the next one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import select
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+OUTPUT_LIMIT = 64 * 1024
+
+
+@dataclass(slots=True)
+class PytestRun:
+    exit_code: int
+    passed: int = 0
+    failed: int = 0
+    errors: int = 0
+    skipped: int = 0
+    duration_ms: float = 0.0
+    output: str = ""
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class _Worker:
+    """One warm worker process, spoken to in JSON lines over its stdin/stdout."""
+
+    def __init__(self, root: Path, preload: tuple[str, ...]):
+        self.root = root
+        self.preload = preload
+        self.proc: subprocess.Popen | None = None
+        self._buffer = b""
+
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def start(self) -> None:
+        env = dict(os.environ)
+        env["MUNINN_PYTEST_PRELOAD"] = ",".join(self.preload)
+        self.proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--worker", str(self.root)],
+            cwd=self.root,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # Own process group, so a timed-out run can be killed together with its forked child.
+            start_new_session=True,
+        )
+        self._buffer = b""
+
+    def request(self, payload: dict, timeout: float) -> dict:
+        if not self.alive():
+            self.start()
+        assert self.proc is not None and self.proc.stdin is not None and self.proc.stdout is not None
+        self.proc.stdin.write(json.dumps(payload).encode("utf-8") + b"\n")
+        self.proc.stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        fd = self.proc.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(payload.get("test_path", "pytest"), timeout)
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if ready:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    raise EOFError("pytest worker exited")
+                self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def kill(self) -> None:
+        if self.proc is None:
+            return
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (self.proc.stdin, self.proc.stdout):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+        self.proc = None
+
+
+class PytestWorkerPool:
+    """
+    A fixed number of warm pytest workers, started on first use.
+    `run` returns None whenever the warm path cannot answer (no fork on this platform, a worker died or
+    spoke nonsense); callers then fall back to a cold `python -m pytest` subprocess.
+    """
+
+    PRELOAD_MODULES = ("pytest",)
+
+    def __init__(self, root: Path, size: int = 1, preload: tuple[str, ...] | None = None):
+        self.root = Path(root).resolve()
+        self.size = max(1, size)
+        if preload is None:
+            extra = os.getenv("MUNINN_CRUCIBLE_PRELOAD", "")
+            preload = self.PRELOAD_MODULES + tuple(name.strip() for name in extra.split(",") if name.strip())
+        self.preload = preload
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        for _ in range(self.size):
+            self._idle.put(_Worker(self.root, self.preload))
+
+    @staticmethod
+    def supported() -> bool:
+        return hasattr(os, "fork")
+
+    def run(self, test_path: Path, cwd: Path | None = None, timeout: float = 120.0) -> PytestRun | None:
+        """Runs one test file in a forked warm child. Raises subprocess.TimeoutExpired like the cold path."""
+        if not self.supported():
+            return None
+        worker = self._idle.get()
+        try:
+            try:
+                reply = worker.request({"test_path": str(test_path), "cwd": str(cwd or self.root)}, timeout)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+                raise
+            except (OSError, EOFError, ValueError):
+                worker.kill()
+                return None
+            if reply.get("crashed"):
+                return None
+            return PytestRun(**{key: reply[key] for key in PytestRun.__slots__ if key in reply})
+        finally:
+            self._idle.put(worker)
+
+    def warm(self) -> None:
+        """Starts every worker now instead of on first use."""
+        workers = [self._idle.get() for _ in range(self.size)]
+        try:
+            for worker in workers:
+                if self.supported() and not worker.alive():
+                    worker.start()
+        finally:
+            for worker in workers:
+                self._idle.put(worker)
+
+    def close(self) -> None:
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            worker.kill()
+
+    def __enter__(self) -> PytestWorkerPool:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# --- Worker side ---------------------------------------------------------------------------------------
+
+
+class _Collector:
+    """pytest plugin tallying outcomes the way the `-v` summary line does."""
+
+    def __init__(self) -> None:
+        self.counts = {"passed": 0, "failed": 0, "errors": 0, "skipped": 0}
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when == "call":
+            if report.passed:
+                self.counts["passed"] += 1
+            elif report.failed:
+                self.counts["failed"] += 1
+        if report.skipped:
+            self.counts["skipped"] += 1
+        elif report.failed and report.when != "call":
+            self.counts["errors"] += 1
+
+    def pytest_collectreport(self, report) -> None:
+        if report.failed:
+            self.counts["errors"] += 1
+
+
+def _under(path: str | None, roots: tuple[str, ...]) -> bool:
+    if not path:
+        return False
+    path = os.path.realpath(path)
+    return any(path == root or path.startswith(root + os.sep) for root in roots)
+
+
+def _forget_project_modules(roots: tuple[str, ...]) -> None:
+    for name, module in list(sys.modules.items()):
+        if name == "__main__":
+            continue
+        origin = getattr(module, "__file__", None)
+        locations = list(getattr(module, "__path__", None) or [])
+        if _under(origin, roots) or any(_under(location, roots) for location in locations):
+            del sys.modules[name]
+
+
+def _child(request: dict, root: str, result_fd: int) -> None:
+    import tempfile
+
+    import pytest
+
+    cwd = request["cwd"]
+    capture = tempfile.TemporaryFile()
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(capture.fileno(), 1)
+    os.dup2(capture.fileno(), 2)
+    os.chdir(cwd)
+    # As `python -m pytest` run from cwd would see it.
+    sys.path[0] = cwd
+    _forget_project_modules((os.path.realpath(root), os.path.realpath(cwd)))
+
+    collector = _Collector()
+    started = time.perf_counter()
+    try:
+        exit_code = int(pytest.main([request["test_path"], "-v"], plugins=[collector]))
+    except BaseException as exc:
+        # A broken run is still a verdict.
+        exit_code = 3
+        print(f"pytest worker error: {exc!r}")
+    duration_ms = (time.perf_counter() - started) * 1000
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    capture.seek(0)
+    output = capture.read(OUTPUT_LIMIT).decode("utf-8", "replace")
+    payload = {"exit_code": exit_code, "duration_ms": duration_ms, "output": output, **collector.counts}
+    os.write(result_fd, json.dumps(payload).encode("utf-8"))
+
+
+def _serve(root: str) -> None:
+    # The protocol owns the original stdout; anything else printed goes to stderr.
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.path[0] = root
+
+    import importlib
+    import importlib.metadata
+
+    import pytest  # noqa: F401
+
+    for entry in importlib.metadata.entry_points(group="pytest11"):
+        try:
+            entry.load()
+        except Exception:
+            pass
+    for name in filter(None, os.getenv("MUNINN_PYTEST_PRELOAD", "").split(",")):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                _child(request, root, write_fd)
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        chunks = []
+        while chunk := os.read(read_fd, 65536):
+            chunks.append(chunk)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        try:
+            reply = json.loads(b"".join(chunks))
+        except ValueError:
+            reply = {"crashed": True}
+        protocol.write(json.dumps(reply) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__" and sys.argv[1:2] == ["--worker"]:
+    _serve(sys.argv[2])
@@ -0,0 +1,204 @@
+"""
+[SPOKE] Quiescence Detector
+Lore: "The ravens wait for the hall to fall silent."
+Purpose: Await the moment a repository has gone without writes for a window, driven by inotify events
+where the kernel offers them and by an mtime scan everywhere else.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+
+# inotify(7) event bits
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Recursive inotify watch over every non-excluded directory of a tree."""
+
+    def __init__(self, libc: ctypes.CDLL, fd: int, excluded) -> None:
+        self._libc = libc
+        self.fd = fd
+        self._excluded = excluded
+        self._paths: dict[int, str] = {}
+
+    @classmethod
+    def open(cls, root: Path, excluded) -> _Inotify | None:
+        """A watcher over `root`, or None when inotify is unavailable or the watch limit is too low."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        watcher = cls(libc, fd, excluded)
+        try:
+            watcher.watch_tree(str(root))
+        except OSError:
+            watcher.close()
+            return None
+        return watcher
+
+    def watch_tree(self, top: str) -> None:
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [name for name in dirnames if not self._excluded(os.path.join(dirpath, name))]
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOENT:
+                    continue  # vanished while walking
+                raise OSError(err, os.strerror(err), dirpath)
+            self._paths[wd] = dirpath
+
+    def drain(self) -> bool:
+        """Consumes pending events; True when any of them was activity in the tree."""
+        active = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return active
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length].rstrip(b"\0")
+                offset += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    active = True
+                    continue
+                if mask & _IN_IGNORED:
+                    self._paths.pop(wd, None)
+                    continue
+                parent = self._paths.get(wd)
+                if parent is None:
+                    continue
+                path = os.path.join(parent, os.fsdecode(name)) if name else parent
+                if self._excluded(path):
+                    continue
+                active = True
+                if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    try:
+                        self.watch_tree(path)
+                    except OSError:
+                        pass
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class QuiescenceDetector:
+    """
+    Resolves once nothing under `root` has been written for `window` seconds.
+    Version-control internals, caches, dependency trees and the Ravens' own runtime state are ignored,
+    so neither `git status` nor the Heart's bookkeeping count as activity.
+    """
+
+    EXCLUDED_DIRS = frozenset({
+        ".git", "node_modules", "__pycache__", ".venv", "venv",
+        ".pytest_cache", ".mypy_cache", ".ruff_cache", ".tox", ".nox",
+    })
+    # Relative to the root: runtime state the Ravens write themselves.
+    EXCLUDED_PATHS = (".agents", ".stats")
+
+    def __init__(self, root: Path, window: float, *, use_inotify: bool = True):
+        self.root = Path(root)
+        self.window = max(0.0, window)
+        self.use_inotify = use_inotify
+        # The mtime scan re-walks the tree this often while waiting.
+        self.poll_interval = min(max(self.window / 4, 0.05), 1.0)
+        self.backend: str | None = None
+        root_str = os.path.abspath(self.root)
+        self._excluded_prefixes = tuple(os.path.join(root_str, rel) for rel in self.EXCLUDED_PATHS)
+
+    def _excluded(self, path: str) -> bool:
+        if os.path.basename(path) in self.EXCLUDED_DIRS:
+            return True
+        return any(path == prefix or path.startswith(prefix + os.sep) for prefix in self._excluded_prefixes)
+
+    def last_write(self) -> float:
+        """Wall-clock time of the newest file or directory change in the tree (0.0 for an empty tree)."""
+        newest = 0
+        for dirpath, dirnames, filenames in os.walk(os.path.abspath(self.root)):
+            dirnames[:] = [name for name in dirnames if not self._excluded(os.path.join(dirpath, name))]
+            for name in (".", *filenames):
+                try:
+                    newest = max(newest, os.lstat(os.path.join(dirpath, name)).st_mtime_ns)
+                except OSError:
+                    continue
+        return newest / 1e9
+
+    async def wait(self, timeout: float) -> float:
+        """
+        Waits until the tree has been idle for the window and returns the idle time observed.
+        Raises asyncio.TimeoutError when it is still busy after `timeout` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        watcher = _Inotify.open(self.root, self._excluded) if self.use_inotify else None
+        self.backend = "inotify" if watcher else "mtime"
+        readable = asyncio.Event()
+        if watcher is not None:
+            loop.add_reader(watcher.fd, readable.set)
+        try:
+            # Seed from disk, so a tree that has long been quiet resolves at once.
+            newest = await asyncio.to_thread(self.last_write)
+            last = self._to_monotonic(newest)
+            deadline = time.monotonic() + timeout
+            while True:
+                # Also catches writes that landed while the seed scan was walking the tree.
+                if watcher is not None and watcher.drain():
+                    last = time.monotonic()
+                now = time.monotonic()
+                if now - last >= self.window:
+                    return now - last
+                if now >= deadline:
+                    raise asyncio.TimeoutError(f"{self.root} was still being written to after {timeout:.1f}s.")
+                wake = min(last + self.window, deadline)
+                if watcher is not None:
+                    try:
+                        await asyncio.wait_for(readable.wait(), wake - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    readable.clear()
+                else:
+                    await asyncio.sleep(min(self.poll_interval, wake - now))
+                    newest = await asyncio.to_thread(self.last_write)
+                    last = max(last, self._to_monotonic(newest))
+        finally:
+            if watcher is not None:
+                loop.remove_reader(watcher.fd)
+                watcher.close()
+
+    @staticmethod
+    def _to_monotonic(wall: float) -> float:
+        now = time.monotonic()
+        # Future mtimes (clock skew, coarse filesystems) count as a write right now.
+        return now - max(0.0, time.time() - wall)
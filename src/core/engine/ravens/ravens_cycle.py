@@ -20,9 +20,17 @@ def main() -> None:
         default=str(PROJECT_ROOT),
         help="Repository root to sweep with the canonical one-cycle ravens runtime.",
     )
+    parser.add_argument(
+        "--missions",
+        type=int,
+        default=1,
+        help="Claim up to this many non-conflicting missions and validate them concurrently.",
+    )
     args = parser.parse_args()
 
-    result = asyncio.run(execute_ravens_cycle_contract(Path(args.project_root).resolve()))
+    result = asyncio.run(
+        execute_ravens_cycle_contract(Path(args.project_root).resolve(), max_missions=args.missions)
+    )
     print(json.dumps(result.to_dict(), indent=2))
 
 
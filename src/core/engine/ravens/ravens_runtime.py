@@ -12,11 +12,17 @@ async def execute_ravens_cycle_contract(
     project_root: Path | str,
     *,
     uplink: Any | None = None,
+    max_missions: int = 1,
 ) -> RavensCycleResult:
     root = Path(project_root).resolve()
     runtime_uplink = uplink or AntigravityUplink()
     heart = MuninnHeart(root, runtime_uplink)
-    return await heart.execute_cycle_contract()
+    try:
+        if max_missions > 1:
+            return await heart.execute_batch_cycle_contract(max_missions)
+        return await heart.execute_cycle_contract()
+    finally:
+        heart.close()
 
 
 async def execute_ravens_cycle(
@@ -0,0 +1,189 @@
+"""
+[SPOKE] Validation Workspace
+Lore: "Each blade is tempered in its own forge."
+Purpose: Disposable mirrors of the live tree in which Crucible candidates are applied and tested in isolation.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+
+class ValidationWorkspace:
+    """
+    A throwaway mirror of the repository for validating one candidate.
+    Unchanged files are hardlinked from the live tree (copied when linking is impossible or `link=False`),
+    so a mirror costs one directory entry per file instead of the file contents. Shared inodes mean the
+    workspace must never write through a mirrored file: `write_text` replaces the link with a fresh file.
+    Files under `.agents/` are always copied, since runtime state there is mutated in place.
+    """
+
+    BASE_DIR = Path(".agents") / "crucible" / "workspaces"
+    OWNER_FILE = ".crucible-owner"
+    # A workspace without an owner yet may still be starting up in another process.
+    UNOWNED_GRACE_SECONDS = 300
+    COPY_PREFIXES = (".agents/",)
+    SKIP_DIRS = frozenset({
+        ".git", "node_modules", "__pycache__", ".venv", "venv",
+        ".pytest_cache", ".mypy_cache", ".ruff_cache", ".tox", ".nox",
+    })
+
+    def __init__(self, root: Path, label: str = "candidate", *, link: bool = True):
+        self.root = Path(root)
+        self.label = re.sub(r"[^A-Za-z0-9_.-]+", "-", label).strip("-") or "candidate"
+        self.link = link
+        self.path: Path | None = None
+
+    def __enter__(self) -> ValidationWorkspace:
+        self.create()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cleanup()
+
+    @classmethod
+    def base_dir(cls, root: Path) -> Path:
+        return Path(root) / cls.BASE_DIR
+
+    def create(self) -> Path:
+        """Materializes the mirror and returns its root."""
+        base = self.base_dir(self.root)
+        base.mkdir(parents=True, exist_ok=True)
+        ignore = base / ".gitignore"
+        if not ignore.exists():
+            # Keeps workspaces out of `git status`, which the Heart reads as repository activity.
+            ignore.write_text("*\n", encoding="utf-8")
+        self.sweep_stale(self.root)
+
+        self.path = Path(tempfile.mkdtemp(prefix=f"{self.label}-", dir=base))
+        try:
+            (self.path / self.OWNER_FILE).write_text(str(os.getpid()), encoding="utf-8")
+            self._mirror()
+        except BaseException:
+            self.cleanup()
+            raise
+        return self.path
+
+    def cleanup(self) -> None:
+        if self.path is not None:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.path = None
+
+    def resolve(self, live_path: Path) -> Path:
+        """The workspace counterpart of a live-tree path; paths outside the tree are returned unchanged."""
+        if self.path is None:
+            raise RuntimeError("Validation workspace has not been created.")
+        live_path = Path(live_path)
+        if not live_path.is_absolute():
+            return self.path / live_path
+        try:
+            return self.path / live_path.relative_to(self.root)
+        except ValueError:
+            return live_path
+
+    def write_text(self, live_path: Path, content: str) -> Path:
+        """Writes `content` to the workspace copy of `live_path` without touching the live inode."""
+        target = self.resolve(live_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.unlink(missing_ok=True)
+        target.write_text(content, encoding="utf-8")
+        return target
+
+    @classmethod
+    def sweep_stale(cls, root: Path) -> int:
+        """Removes workspaces left behind by processes that no longer exist. Returns the number removed."""
+        base = cls.base_dir(root)
+        if not base.is_dir():
+            return 0
+        removed = 0
+        for workspace in base.iterdir():
+            if not workspace.is_dir():
+                continue
+            try:
+                pid = int((workspace / cls.OWNER_FILE).read_text(encoding="utf-8").strip())
+            except (OSError, ValueError):
+                pid = None
+            if pid is None:
+                try:
+                    if time.time() - workspace.stat().st_mtime < cls.UNOWNED_GRACE_SECONDS:
+                        continue
+                except OSError:
+                    continue
+            elif _process_alive(pid):
+                continue
+            shutil.rmtree(workspace, ignore_errors=True)
+            removed += 1
+        return removed
+
+    def _mirror(self) -> None:
+        assert self.path is not None
+        made: set[Path] = set()
+        for rel in self._live_files():
+            source = self.root / rel
+            if source.is_dir() and not source.is_symlink():
+                continue  # submodule gitlinks
+            destination = self.path / rel
+            parent = destination.parent
+            if parent not in made:
+                parent.mkdir(parents=True, exist_ok=True)
+                made.add(parent)
+            if source.is_symlink():
+                os.symlink(os.readlink(source), destination)
+            elif self.link and not rel.startswith(self.COPY_PREFIXES):
+                try:
+                    os.link(source, destination)
+                except OSError:
+                    shutil.copy2(source, destination)
+            else:
+                shutil.copy2(source, destination)
+
+    def _live_files(self) -> Iterator[str]:
+        """Tracked and untracked-but-not-ignored files, relative to the root, minus the workspaces themselves."""
+        excluded = self.BASE_DIR.as_posix() + "/"
+        for rel in self._listed_files():
+            if rel.startswith(excluded) or not os.path.lexists(self.root / rel):
+                continue
+            yield rel
+
+    def _listed_files(self) -> list[str]:
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                cwd=self.root,
+                capture_output=True,
+                check=False,
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            result = None
+        if result is not None and result.returncode == 0:
+            return sorted({entry for entry in result.stdout.decode("utf-8", "surrogateescape").split("\0") if entry})
+
+        files = []
+        base = self.base_dir(self.root)
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                name for name in dirnames if name not in self.SKIP_DIRS and Path(dirpath, name) != base
+            ]
+            rel_dir = Path(dirpath).relative_to(self.root)
+            files.extend((rel_dir / name).as_posix() for name in filenames)
+        return sorted(files)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
@@ -4,6 +4,7 @@ Lore: "The Quill of Alfred."
 Purpose: Decouple HUD rendering and neural trace recording from the engine core.
 """
 
+import asyncio
 import json
 import re
 from pathlib import Path
@@ -20,6 +21,8 @@ class SovereignReporter:
             SovereignHUD.persona_log("WARN", f"Dissonance detected: '{query}' remains elusive.")
             if engine_instance:
                 results = engine_instance.search(query)
+                if asyncio.iscoroutine(results):
+                    results = asyncio.run(results)
                 if not results:
                     SovereignHUD.persona_log("INFO", "The Well of Mimir is silent.")
                 else:
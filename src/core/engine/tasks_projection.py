@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import atexit
+import os
+import tempfile
+import threading
+import weakref
+from collections.abc import Callable
+from pathlib import Path
+
+PROJECTION_MODES = ("sync", "deferred")
+DEFAULT_PROJECTION_MODE = "sync"
+DEFAULT_PROJECTION_STALENESS_MS = 250
+
+# Writers still open at interpreter exit; held weakly so a dropped ledger's writer can be collected.
+_LIVE_WRITERS: weakref.WeakSet[DeferredProjectionWriter] = weakref.WeakSet()
+
+
+def resolve_projection_mode(mode: str | None = None) -> str:
+    resolved = (mode or os.getenv("CSTAR_TASKS_PROJECTION_MODE") or DEFAULT_PROJECTION_MODE).strip().lower()
+    if resolved not in PROJECTION_MODES:
+        raise ValueError(f"Unknown tasks projection mode '{resolved}'. Expected one of {', '.join(PROJECTION_MODES)}.")
+    return resolved
+
+
+def resolve_projection_staleness_ms(staleness_ms: int | None = None) -> int:
+    if staleness_ms is None:
+        raw = os.getenv("CSTAR_TASKS_PROJECTION_STALENESS_MS")
+        staleness_ms = int(raw) if raw else DEFAULT_PROJECTION_STALENESS_MS
+    return max(0, int(staleness_ms))
+
+
+def write_projection_atomically(path: Path, content: str) -> None:
+    """
+    Writes `content` beside `path` and swaps it in, so readers never observe a half-written projection.
+    Each call gets its own temp file, so concurrent writers never install each other's partial output.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class DeferredProjectionWriter:
+    """
+    Coalesces projection requests into one flush per staleness window.
+    The window opens on the first dirty mark and is never extended, so staleness stays bounded under bursts.
+    """
+
+    def __init__(self, flush: Callable[[], object], staleness_ms: int = DEFAULT_PROJECTION_STALENESS_MS):
+        self._flush = flush
+        self.staleness_ms = max(0, int(staleness_ms))
+        self._state_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._dirty = False
+        self._closed = False
+        self.stats = {"requests": 0, "flushes": 0}
+        _LIVE_WRITERS.add(self)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        with self._state_lock:
+            self._dirty = True
+            self.stats["requests"] += 1
+            if self._timer is None and not self._closed:
+                self._timer = threading.Timer(self.staleness_ms / 1000, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> bool:
+        """Writes the projection now if it is dirty. Returns True when a write happened."""
+        with self._flush_lock:
+            with self._state_lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return False
+                self._dirty = False
+            try:
+                self._flush()
+            except Exception:
+                with self._state_lock:
+                    self._dirty = True
+                raise
+            self.stats["flushes"] += 1
+            return True
+
+    def close(self) -> None:
+        """Flushes any pending write and stops scheduling new ones."""
+        with self._state_lock:
+            self._closed = True
+        try:
+            self.flush()
+        finally:
+            _LIVE_WRITERS.discard(self)
+
+
+@atexit.register
+def _flush_live_writers() -> None:
+    for writer in list(_LIVE_WRITERS):
+        try:
+            writer.close()
+        except Exception:
+            pass
@@ -13,13 +13,15 @@ from pathlib import Path
 from typing import Any
 
 from src.core.engine.instruction_loader import InstructionLoader
+from src.core.engine.intent_store import IntentStore
 from src.core.engine.memory_db import MemoryDB
 from src.core.sovereign_hud import SovereignHUD
 from src.core.engine.vector_config import VectorConfig
 from src.core.engine.vector_calculus import VectorCalculus
 from src.core.engine.vector_router import VectorRouter
 from src.core.engine.vector_shadow import VectorShadow
-from src.core.engine.vector_ingest import VectorIngest
+from src.core.engine.vector_snapshot import VectorState
+from src.core.engine.vector_ingest import IngestReport, VectorIngest
 
 
 class SovereignVector:
@@ -28,23 +30,46 @@ class SovereignVector:
     Delegates logic to specialized spokes while maintaining a unified interface.
     """
     SEARCH_CACHE_MAXSIZE = 512
+    # Candidates retrieved per query for hybrid re-ranking.
+    SEMANTIC_CANDIDATES = 10
+    PROJECT_ROOT: Path = Path(__file__).resolve().parents[3]
 
     def __init__(
         self,
         thesaurus_path: str | Path | None = None,
         corrections_path: str | Path | None = None,
-        stopwords_path: str | Path | None = None
+        stopwords_path: str | Path | None = None,
+        memory_db: MemoryDB | None = None,
+        instruction_loader: InstructionLoader | None = None,
+        state: VectorState | None = None,
     ) -> None:
-        self.project_root: Path = Path(__file__).resolve().parents[3]
-        self.memory_db = MemoryDB(str(self.project_root))
-        self.instruction_loader = InstructionLoader(str(self.project_root))
+        self.project_root: Path = self.PROJECT_ROOT
+        self.memory_db = memory_db if memory_db is not None else MemoryDB(str(self.project_root))
+        self.instruction_loader = (
+            instruction_loader if instruction_loader is not None else InstructionLoader(str(self.project_root))
+        )
         self._search_cache: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        self._search_cache_generation = self.memory_db.corpus_generation
+        self.warm_start = state is not None
 
         # Initialize Spokes
         self.config_spoke = VectorConfig(self.project_root)
-        self.ingest_spoke = VectorIngest(self.memory_db)
+        self.ingest_spoke = VectorIngest(
+            self.memory_db,
+            preloaded=state.skills if state else None,
+            intent_store=IntentStore.for_root(self.project_root),
+        )
         self.router_spoke = VectorRouter(self.memory_db)
 
+        if state is not None:
+            # [Ω] WARM START: assets arrive parsed, inverted and normalized from the snapshot
+            self.stopwords = state.stopwords
+            self.thesaurus = state.thesaurus
+            self.corrections = state.corrections
+            self.calculus_spoke = VectorCalculus(self.stopwords, self.thesaurus, inverted_synonyms=state.inverted_synonyms)
+            self.shadow_spoke = VectorShadow(self.memory_db, self.stopwords, self.thesaurus)
+            return
+
         # Load Assets
         t_path = Path(thesaurus_path) if thesaurus_path else self.project_root / "src" / "data" / "thesaurus.qmd"
         s_path = Path(stopwords_path) if stopwords_path else self.project_root / "src" / "data" / "stopwords.json"
@@ -64,6 +89,16 @@ class SovereignVector:
                 self.normalize(k): v for k, v in self.corrections["phrase_mappings"].items()
             }
 
+    def export_state(self) -> VectorState:
+        """[Ω] Captures the built assets and every ingested skill directory for a warm-start snapshot."""
+        return VectorState(
+            stopwords=self.stopwords,
+            thesaurus=self.thesaurus,
+            inverted_synonyms=self.calculus_spoke.inverted_synonyms,
+            corrections=self.corrections,
+            skills=dict(self.ingest_spoke.ingested),
+        )
+
     @property
     def skills(self) -> list[str]:
         """[ODIN] Compat bridge for legacy skill counting."""
@@ -88,6 +123,7 @@ class SovereignVector:
 
     async def search(self, query: str, mode: str = "neural") -> list[dict[str, Any]]:
         query_norm = self.normalize(query)
+        self._sync_search_cache()
         if query_norm in self._search_cache:
             return self._get_cached_search(query_norm)
 
@@ -105,30 +141,123 @@ class SovereignVector:
 
         # 3. Targeted Semantic Search
         top_domain = self.router_spoke.get_top_domain(query_norm, query)
-        results = self.memory_db.search_intent("system", query_norm, n_results=10, domain=top_domain)
+        results = self.memory_db.search_intent(
+            "system", query_norm, n_results=self.SEMANTIC_CANDIDATES, domain=top_domain
+        )
+        return await self._rank_semantic(query, query_norm, results, shadow_results, mode)
+
+    async def search_many(self, queries: list[str], mode: str = "neural") -> list[list[dict[str, Any]]]:
+        """
+        [Ω] Batched search: returns one result list per query, matching what `search` returns for each.
+        Queries are normalized once and de-duplicated, shadow and semantic retrieval run as single batched
+        MemoryDB calls, and the thesaurus expansion is computed once for every token in the batch.
+        """
+        query_norms = [self.normalize(query) for query in queries]
+        self._sync_search_cache()
+        resolved: dict[str, list[dict[str, Any]]] = {}
+        pending: dict[str, str] = {}
+        phrase_mappings = self.corrections.get("phrase_mappings", {})
+
+        for query, query_norm in zip(queries, query_norms, strict=True):
+            if query_norm in resolved or query_norm in pending:
+                continue
+            if query_norm in self._search_cache:
+                resolved[query_norm] = self._get_cached_search(query_norm)
+            elif query_norm in phrase_mappings:
+                # 1. Lexical Fast-Paths
+                trigger = phrase_mappings[query_norm]
+                resolved[query_norm] = [
+                    {"trigger": trigger, "score": 1.5, "note": "Correction mapped", "is_global": trigger.startswith("GLOBAL:")}
+                ]
+            else:
+                pending[query_norm] = query
+
+        # 2. Shadow Search
+        semantic: list[tuple[str, list[dict[str, Any]]]] = []
+        shadow_batches = self.shadow_spoke.search_many(list(pending)) if pending else []
+        for query_norm, shadow_results in zip(pending, shadow_batches, strict=True):
+            if shadow_results and shadow_results[0]["score"] >= 0.95:
+                cached_results = shadow_results[:5]
+                self._set_cached_search(query_norm, cached_results)
+                resolved[query_norm] = cached_results
+            else:
+                semantic.append((query_norm, shadow_results))
 
+        # 3. Targeted Semantic Search
+        if semantic:
+            requests = [
+                (query_norm, self.router_spoke.get_top_domain(query_norm, pending[query_norm]))
+                for query_norm, _ in semantic
+            ]
+            batches = self.memory_db.search_intent_many("system", requests, n_results=self.SEMANTIC_CANDIDATES)
+            tokens = set().union(*(query_norm.split() for query_norm, _ in semantic))
+            expansion = self.calculus_spoke.expand_query(tokens)
+            scoring: list[tuple[str, tuple]] = []
+            for (query_norm, shadow_results), results in zip(semantic, batches, strict=True):
+                if not results:
+                    resolved[query_norm] = shadow_results[:5] if shadow_results else []
+                    continue
+                batch = await self._prepare_scoring(pending[query_norm], query_norm, results, mode, expansion)
+                scoring.append((query_norm, batch))
+            # 5. Final Hybrid Scoring, one pass for the whole batch
+            scored = self.calculus_spoke.score_intents_many([batch for _, batch in scoring])
+            for (query_norm, _), final_results in zip(scoring, scored, strict=True):
+                resolved[query_norm] = self._finish_ranking(query_norm, final_results)
+
+        return [resolved[query_norm] for query_norm in query_norms]
+
+    async def _rank_semantic(
+        self,
+        query: str,
+        query_norm: str,
+        results: list[dict[str, Any]],
+        shadow_results: list[dict[str, Any]],
+        mode: str,
+        expansion: dict[str, set[str]] | None = None,
+    ) -> list[dict[str, Any]]:
         if not results:
             return shadow_results[:5] if shadow_results else []
 
+        batch = await self._prepare_scoring(query, query_norm, results, mode, expansion)
+
+        # 5. Final Hybrid Scoring
+        final_results = self.calculus_spoke.score_intents(*batch)
+        return self._finish_ranking(query_norm, final_results)
+
+    async def _prepare_scoring(
+        self,
+        query: str,
+        query_norm: str,
+        results: list[dict[str, Any]],
+        mode: str,
+        expansion: dict[str, set[str]] | None = None,
+    ) -> tuple[list[dict[str, Any]], dict[str, set[str]], set[str], set[str]]:
+        """Re-ranks `results` and returns the `(results, expansion, original_tokens, all_expanded)` scoring batch."""
         # 4. Neural Re-ranking (The "Mind")
         # Only re-rank if there's potential ambiguity and we are not in heuristic mode
         if len(results) > 1 and mode != "heuristic":
             results = await self._neural_rerank(query, results)
 
-        # 5. Final Hybrid Scoring
         original_tokens = set(query_norm.split())
-        expansion = self.calculus_spoke.expand_query(original_tokens)
+        if expansion is None:
+            expansion = self.calculus_spoke.expand_query(original_tokens)
+        else:
+            expansion = {token: expansion[token] for token in original_tokens}
         all_expanded = set().union(*expansion.values())
+        return results, expansion, original_tokens, all_expanded
 
-        final_results = [
-            self.calculus_spoke.score_intent(r, expansion, original_tokens, all_expanded)
-            for r in results
-        ]
-
+    def _finish_ranking(self, query_norm: str, final_results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         final_results.sort(key=lambda x: x['score'], reverse=True)
         self._set_cached_search(query_norm, final_results)
         return final_results
 
+    def _sync_search_cache(self) -> None:
+        """Drops cached results once the memory corpus has changed since they were stored."""
+        generation = self.memory_db.corpus_generation
+        if generation != self._search_cache_generation:
+            self._search_cache.clear()
+            self._search_cache_generation = generation
+
     def _get_cached_search(self, query_norm: str) -> list[dict[str, Any]]:
         results = self._search_cache.pop(query_norm)
         self._search_cache[query_norm] = results
@@ -206,8 +335,8 @@ class SovereignVector:
     def add_skill(self, trigger: str, text: str, domain: str = "GENERAL") -> None:
         self.ingest_spoke.add_skill(trigger, text, domain)
 
-    def load_skills_from_dir(self, directory: str | Path, prefix: str = "") -> None:
-        self.ingest_spoke.load_skills_from_dir(directory, prefix)
+    def load_skills_from_dir(self, directory: str | Path, prefix: str = "") -> IngestReport:
+        return self.ingest_spoke.load_skills_from_dir(directory, prefix)
 
     def build_index(self) -> None:
         self.shadow_spoke.build_index()
@@ -216,3 +345,7 @@ class SovereignVector:
         self._search_cache.clear()
         VectorCalculus._GLOBAL_NORM_CACHE.clear()
         VectorCalculus._GLOBAL_EXPANSION_CACHE.clear()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Aggregated cache counters across the memory and calculus spokes."""
+        return {"memory": self.memory_db.cache_stats(), "calculus": VectorCalculus.cache_stats()}
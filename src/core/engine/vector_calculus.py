@@ -1,24 +1,40 @@
 
-import re
 import string
 from typing import Any
 
+from src.core.engine.bounded_cache import BoundedCache
+from src.core.engine.vector_sparse import VECTORIZE_MIN_CANDIDATES, score_batches, target_tokens, vectorization_available
+
 class VectorCalculus:
-    _GLOBAL_NORM_CACHE: dict[str, str] = {}
-    _GLOBAL_EXPANSION_CACHE: dict[str, set[str]] = {}
+    NORM_CACHE_MAXSIZE = 8192
+    EXPANSION_CACHE_MAXSIZE = 8192
+    _GLOBAL_NORM_CACHE = BoundedCache(NORM_CACHE_MAXSIZE, name="vector_norm")
+    _GLOBAL_EXPANSION_CACHE = BoundedCache(EXPANSION_CACHE_MAXSIZE, name="vector_expansion")
     _TRANS_TABLE = str.maketrans('', '', string.punctuation)
 
-    def __init__(self, stopwords: set[str], thesaurus: dict[str, set[str]]):
+    def __init__(
+        self,
+        stopwords: set[str],
+        thesaurus: dict[str, set[str]],
+        inverted_synonyms: dict[str, set[str]] | None = None,
+    ):
         self.stopwords = stopwords
         self.thesaurus = thesaurus
-        self._inverted_syns: dict[str, set[str]] = {}
-        for key, values in self.thesaurus.items():
-            for v in values:
-                self._inverted_syns.setdefault(v, set()).add(key)
+        if inverted_synonyms is None:
+            inverted_synonyms = {}
+            for key, values in self.thesaurus.items():
+                for v in values:
+                    inverted_synonyms.setdefault(v, set()).add(key)
+        self._inverted_syns = inverted_synonyms
+
+    @property
+    def inverted_synonyms(self) -> dict[str, set[str]]:
+        return self._inverted_syns
 
     def normalize(self, text: str) -> str:
         if not text: return ""
-        if text in self._GLOBAL_NORM_CACHE: return self._GLOBAL_NORM_CACHE[text]
+        cached = self._GLOBAL_NORM_CACHE.get(text)
+        if cached is not None: return cached
         clean = text.translate(self._TRANS_TABLE).lower()
         tokens = [w for w in clean.split() if w not in self.stopwords]
         result = " ".join(tokens)
@@ -28,8 +44,9 @@ class VectorCalculus:
     def expand_query(self, tokens: set[str]) -> dict[str, set[str]]:
         expansion = {}
         for t in tokens:
-            if t in self._GLOBAL_EXPANSION_CACHE:
-                expansion[t] = self._GLOBAL_EXPANSION_CACHE[t]
+            cached = self._GLOBAL_EXPANSION_CACHE.get(t)
+            if cached is not None:
+                expansion[t] = cached
                 continue
             syns = {t}
             if t in self.thesaurus: syns.update(self.thesaurus[t])
@@ -38,32 +55,58 @@ class VectorCalculus:
             expansion[t] = syns
         return expansion
 
+    @classmethod
+    def cache_stats(cls) -> dict[str, dict[str, Any]]:
+        """Hit/miss/eviction counters for the process-wide normalization and expansion caches."""
+        return {
+            "norm": cls._GLOBAL_NORM_CACHE.describe(),
+            "expansion": cls._GLOBAL_EXPANSION_CACHE.describe(),
+        }
+
     def score_intent(self, result: dict, expansion: dict, original_tokens: set, all_expanded: set) -> dict:
         if result.get("_neural_boost"):
             result["score"] = 1.0
             return result
 
         # Use pre-calculated target tokens if available
-        if "_target_tokens" not in result:
-            target_text = result.get('intent', '').lower()
-            result["_target_tokens"] = set(re.findall(r'\w+', target_text))
-        
-        target_tokens = result["_target_tokens"]
-        if not target_tokens:
+        tokens = target_tokens(result)
+        if not tokens:
             result["score"] = 0.0
             return result
 
         # [Ω] FAST INTERSECT: Python's set operations are highly optimized
-        lex_count = len(original_tokens & target_tokens)
+        lex_count = len(original_tokens & tokens)
         lex_score = lex_count / len(original_tokens) if original_tokens else 0
 
-        sem_count = len(all_expanded & target_tokens)
+        sem_count = len(all_expanded & tokens)
         sem_score = sem_count / len(original_tokens) if original_tokens else 0
 
         alignment_bonus = 0.0
         for syns in expansion.values():
-            if syns & target_tokens:
+            if syns & tokens:
                 alignment_bonus += 0.1
 
         result["score"] = round((lex_score * 0.6) + (sem_score * 0.3) + alignment_bonus, 2)
         return result
+
+    def score_intents(self, results: list[dict], expansion: dict, original_tokens: set, all_expanded: set) -> list[dict]:
+        """[Ω] Scores a candidate batch; large batches go through the sparse matrix path with identical scores."""
+        return self.score_intents_many([(results, expansion, original_tokens, all_expanded)])[0]
+
+    def score_intents_many(self, batches: list[tuple[list[dict], dict, set, set]]) -> list[list[dict]]:
+        """
+        [Ω] Scores one `(results, expansion, original_tokens, all_expanded)` batch per query.
+        Batches wide enough to beat the set path share a single sparse matrix pass; the rest are scored per result.
+        """
+        wide = [
+            index for index, batch in enumerate(batches)
+            if vectorization_available() and len(batch[0]) >= VECTORIZE_MIN_CANDIDATES
+        ]
+        scored: list[list[dict] | None] = [None] * len(batches)
+        if wide:
+            for index, results in zip(wide, score_batches([batches[index] for index in wide]), strict=True):
+                scored[index] = results
+        for index, (results, expansion, original_tokens, all_expanded) in enumerate(batches):
+            if scored[index] is None:
+                scored[index] = [self.score_intent(r, expansion, original_tokens, all_expanded) for r in results]
+        return scored
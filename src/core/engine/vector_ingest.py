@@ -4,15 +4,99 @@ Lore: "The gathering of souls."
 Purpose: Handle skill loading from files and directories into MemoryDB.
 """
 
-import re
+import json
+import os
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from src.core.engine.intent_store import INTENT_RULES_VERSION, IntentStore
 from src.core.sovereign_hud import SovereignHUD
 
+SKILL_SUFFIXES = (".qmd", ".md", ".py")
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class IngestReport:
+    """Trigger counts from one load_skills_from_dir call."""
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    skipped: int = 0
+
+
+class SkillManifest:
+    """
+    What the store already holds for each skill directory:
+    {source_key: {path: {mtime_ns, size, sha256, trigger, intent, domain}}}, where sha256 covers the
+    prefix the intent is extracted from. Records written under other intent rules keep their triggers
+    but lose their stat signature, so every file is re-read and changed intents are re-upserted.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.sources: dict[str, dict[str, dict[str, Any]]] = {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == MANIFEST_VERSION:
+            self.sources = payload.get("sources", {})
+            if payload.get("intent_rules") != INTENT_RULES_VERSION:
+                for records in self.sources.values():
+                    for record in records.values():
+                        record["mtime_ns"] = record["size"] = None
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"version": MANIFEST_VERSION, "intent_rules": INTENT_RULES_VERSION, "sources": self.sources}, handle)
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _skill_map(entries: Any) -> dict[str, tuple[str, str]]:
+    """trigger -> (intent, domain); the last entry wins, as in MemoryDB.batch_upsert_skills."""
+    return {trigger: (intent, domain) for trigger, intent, domain in entries}
+
+
 class VectorIngest:
-    def __init__(self, memory_db):
+    def __init__(
+        self,
+        memory_db,
+        preloaded: dict[str, list[tuple[str, str, str]]] | None = None,
+        intent_store: IntentStore | None = None,
+    ):
         self.memory_db = memory_db
+        self.intent_store = intent_store if intent_store is not None else IntentStore()
+        # Skills from a warm-start snapshot, keyed by source_key(directory, prefix)
+        self.preloaded = preloaded or {}
+        # What each directory produced in this process, for the next snapshot
+        self.ingested: dict[str, list[tuple[str, str, str]]] = {}
+        # Only a persistent store keeps skills between processes, so only then is there anything to skip
+        self.manifest = None if memory_db.simulated else SkillManifest(memory_db.get_skill_manifest_path())
+
+    @staticmethod
+    def source_key(directory: str | Path, prefix: str = "") -> str:
+        return f"{Path(directory)}\0{prefix}"
+
+    @staticmethod
+    def skill_files(directory: str | Path) -> list[Path]:
+        """Every file under `directory` that load_skills_from_dir turns into a skill."""
+        path = Path(directory)
+        if not path.exists():
+            return []
+        return [
+            f for f in path.glob("**/*")
+            # [Ω] SKILL DISCOVERY: Ignore internal files or visualization html
+            if f.suffix in SKILL_SUFFIXES and f.is_file() and not f.name.startswith("__") and f.name != "SKILL.qmd"
+        ]
 
     def add_skill(self, trigger: str, text: str, domain: str = "GENERAL") -> None:
         """Adds a single skill to the MemoryDB."""
@@ -25,11 +109,16 @@ class VectorIngest:
             if "domain" not in s["metadata"]: s["metadata"]["domain"] = domain
         self.memory_db.batch_upsert_skills("system", skills)
 
-    def load_skills_from_dir(self, directory: str | Path, prefix: str = "") -> None:
-        """Walks a directory and loads all .qmd, .md, or .py skills."""
+    def load_skills_from_dir(self, directory: str | Path, prefix: str = "") -> IngestReport:
+        """
+        Walks a directory and loads all .qmd, .md, or .py skills.
+        With a persistent store, only files whose size, mtime and then content hash changed are re-read and
+        re-upserted, and triggers of removed files are deleted unless another directory still provides them,
+        in which case that directory's skill is restored.
+        """
         path = Path(directory)
         if not path.exists():
-            return
+            return IngestReport()
 
         # [Ω] DOMAINE DISCOVERY: Assign domain based on path
         dir_name = path.name.lower()
@@ -41,63 +130,94 @@ class VectorIngest:
         elif "vis" in str(path).lower() or "ui" in str(path).lower():
             domain = "UI"
 
-        skills_to_load = []
-        for f in path.glob("**/*"):
-            if f.is_file() and f.suffix in [".qmd", ".md", ".py"]:
-                # [Ω] SKILL DISCOVERY: Ignore internal files or visualization html
-                if f.name.startswith("__") or f.name == "SKILL.qmd" or f.suffix == ".html":
-                    continue
-                    
-                trigger = f"{prefix}{f.stem}"
-                # Add / prefix for local workflows/skills if not present
-                if prefix == "" and not trigger.startswith("/"):
-                    trigger = f"/{trigger}"
-                
-                intent = self._read_intent(f)
-                skills_to_load.append({
-                    "trigger": trigger,
-                    "description": intent,
-                    "metadata": {"domain": domain}
-                })
-        
+        key = self.source_key(path, prefix)
+        entries = self.preloaded.get(key)
+
+        if self.manifest is None:
+            if entries is None:
+                files = self.skill_files(path)
+                entries = [
+                    (self._trigger_for(f, prefix), intent, domain)
+                    for f, (_, intent) in zip(files, self.intent_store.read_many(files), strict=True)
+                ]
+            self.ingested[key] = entries
+            self._upsert(entries, domain)
+            return IngestReport(added=len(_skill_map(entries)))
+
+        known = self.manifest.sources.get(key, {})
+        before = _skill_map((e["trigger"], e["intent"], e["domain"]) for e in known.values())
+        records = known
+        if entries is None or _skill_map(entries) != before:
+            # A snapshot that disagrees with the store is ignored; the files decide.
+            records = self._scan(path, prefix, domain, known)
+            entries = [(r["trigger"], r["intent"], r["domain"]) for r in records.values()]
+
+        after = _skill_map(entries)
+        changed = [(t, i, d) for t, (i, d) in after.items() if before.get(t) != (i, d)]
+        removed = [t for t in before if t not in after]
+        # Triggers are shared across directories (workflows and local skills both yield /stem).
+        others = _skill_map(
+            (r["trigger"], r["intent"], r["domain"])
+            for other_key, other in self.manifest.sources.items() if other_key != key
+            for r in other.values()
+        )
+        restored = [(t, *others[t]) for t in removed if t in others]
+        self._upsert(changed + restored, domain)
+        self.memory_db.delete_skills("system", [t for t in removed if t not in others])
+        # Record the scan only once the store holds it, so a failed upsert is retried next load.
+        if records != known:
+            self.manifest.sources[key] = records
+            self.manifest.save()
+        self.ingested[key] = entries
+        added = sum(1 for t, _, _ in changed if t not in before)
+        return IngestReport(added=added, updated=len(changed) - added, removed=len(removed), skipped=len(after) - len(changed))
+
+    def _scan(self, path: Path, prefix: str, domain: str, known: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Manifest records for every skill file, reading only files whose size or mtime moved."""
+        records, stale = {}, []
+        for f in self.skill_files(path):
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            record = known.get(str(f))
+            if record and (record["mtime_ns"], record["size"]) == (st.st_mtime_ns, st.st_size):
+                records[str(f)] = {**record, "trigger": self._trigger_for(f, prefix), "domain": domain}
+            else:
+                records[str(f)] = None
+                stale.append((f, st))
+
+        for (f, st), (digest, intent) in zip(stale, self.intent_store.read_many(f for f, _ in stale), strict=True):
+            if not digest:
+                # Unreadable for now: keep what the store already holds, and retry on the next load.
+                record = known.get(str(f))
+                if record:
+                    records[str(f)] = {**record, "trigger": self._trigger_for(f, prefix), "domain": domain}
+                else:
+                    del records[str(f)]
+                continue
+            records[str(f)] = {
+                "mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest,
+                "trigger": self._trigger_for(f, prefix), "intent": intent, "domain": domain,
+            }
+        return records
+
+    def _upsert(self, entries: list[tuple[str, str, str]], domain: str) -> None:
+        skills_to_load = [
+            {"trigger": trigger, "description": intent, "metadata": {"domain": skill_domain}}
+            for trigger, intent, skill_domain in entries
+        ]
         if skills_to_load:
             self.batch_add_skills(skills_to_load, domain=domain)
 
+    @staticmethod
+    def _trigger_for(file_path: Path, prefix: str) -> str:
+        trigger = f"{prefix}{file_path.stem}"
+        # Add / prefix for local workflows/skills if not present
+        if prefix == "" and not trigger.startswith("/"):
+            trigger = f"/{trigger}"
+        return trigger
+
     def _read_intent(self, file_path: Path) -> str:
         """Extracts a high-quality intent from the first few lines of a file."""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            
-            # [Ω] PRIMARY SIGNAL: Explicit Intent marker
-            # Matches: # Intent: My intent text
-            # Matches: # Intent: 
-            #          My multi-line intent
-            match = re.search(r'^# Intent:\s*(.*)', content, re.MULTILINE | re.IGNORECASE)
-            if match:
-                intent = match.group(1).strip()
-                if not intent: # Look on next line
-                    lines = content.split('\n')
-                    for i, line in enumerate(lines):
-                        if "# Intent:" in line and i + 1 < len(lines):
-                            return lines[i+1].strip().lstrip('#').strip()
-                return intent
-
-            # [Ω] SECONDARY SIGNAL: YAML description
-            match = re.search(r'^description:\s*(.*)', content, re.MULTILINE)
-            if match:
-                return match.group(1).strip()
-            
-            # [Ω] TERTIARY SIGNAL: JSDoc/Docstring Intent
-            match = re.search(r'(?:#|""").*?Intent:\s*(.*?)(?:\n|""")', content, re.IGNORECASE | re.DOTALL)
-            if match:
-                return match.group(1).strip()
-            
-            # Fallback to first # Header in QMD or MD
-            if file_path.suffix in [".qmd", ".md"]:
-                match = re.search(r'^#\s*(.*)', content, re.MULTILINE)
-                if match:
-                    return match.group(1).strip()
-            
-            return f"Intent for {file_path.name}"
-        except Exception:
-            return f"Intent for {file_path.name}"
+        return self.intent_store.read(file_path)[1]
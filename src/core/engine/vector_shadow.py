@@ -18,6 +18,10 @@ class VectorShadow:
         results = self.memory_db.search_intent("system", query_norm, n_results=5)
         return results
 
+    def search_many(self, query_norms: list[str]) -> list[list[dict[str, Any]]]:
+        """Batched lexical search; one result list per query."""
+        return self.memory_db.search_intent_many("system", [(q, None) for q in query_norms], n_results=5)
+
     def build_index(self) -> None:
         """Mock method for index building (managed by MemoryDB/Chroma)."""
         pass
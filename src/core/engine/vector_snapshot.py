@@ -0,0 +1,103 @@
+"""
+[SPOKE] Vector Snapshot
+Lore: "The Bifröst remembers its own shape."
+Purpose: Versioned, mmap-loaded warm-start snapshot of the fully built SovereignVector state.
+"""
+
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.core.engine import intent_store
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_MAGIC = b"CSVS"
+# magic, snapshot format version, marshal format version, sha256 of the input fingerprint
+_HEADER = struct.Struct("<4sHH32s")
+
+
+@dataclass
+class VectorState:
+    """Everything SovereignVector derives from its source files at startup."""
+
+    stopwords: set[str] = field(default_factory=set)
+    thesaurus: dict[str, set[str]] = field(default_factory=dict)
+    inverted_synonyms: dict[str, set[str]] = field(default_factory=dict)
+    corrections: dict[str, Any] = field(default_factory=dict)
+    # VectorIngest.source_key(directory, prefix) -> [(trigger, intent, domain), ...]
+    skills: dict[str, list[tuple[str, str, str]]] = field(default_factory=dict)
+
+
+class VectorSnapshot:
+    """
+    Binary snapshot of a VectorState, valid only for the exact inputs it was built from.
+    The key covers the (mtime_ns, size) of every source file and every skill file, so any edit,
+    addition or removal rebuilds it, and the intent-extraction rule version, so new rules re-read every skill.
+    Disable with CSTAR_VECTOR_SNAPSHOT=0.
+    """
+
+    FILENAME = "vector_snapshot.bin"
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.getenv("CSTAR_VECTOR_SNAPSHOT", "1").lower() not in ("0", "false", "off")
+
+    @staticmethod
+    def fingerprint(sources: list[Path], skill_files: list[Path]) -> bytes:
+        """Digest of the stat signature of every input; missing files are part of the signature."""
+        entries: list[Any] = [SNAPSHOT_VERSION, intent_store.INTENT_RULES_VERSION, list(sys.version_info[:2])]
+        for path in [*sources, *skill_files]:
+            try:
+                stat = os.stat(path)
+                entries.append([str(path), stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                entries.append([str(path), None, None])
+        return hashlib.sha256(json.dumps(entries).encode("utf-8")).digest()
+
+    def load(self, key: bytes) -> VectorState | None:
+        """Maps the snapshot and returns its state, or None when it is missing, stale or unreadable."""
+        try:
+            with self.path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if len(mapped) < _HEADER.size:
+                    return None
+                magic, version, marshal_version, stored_key = _HEADER.unpack_from(mapped)
+                if (magic, version, marshal_version, stored_key) != (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, marshal.version, key):
+                    return None
+                with memoryview(mapped)[_HEADER.size:] as view:
+                    payload = marshal.loads(view)
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+        try:
+            return VectorState(**payload)
+        except TypeError:
+            return None
+
+    def save(self, key: bytes, state: VectorState) -> Path:
+        """Atomically writes the snapshot for `key`. Raises ValueError if the state holds non-builtin types."""
+        payload = {
+            "stopwords": state.stopwords,
+            "thesaurus": state.thesaurus,
+            "inverted_synonyms": state.inverted_synonyms,
+            "corrections": state.corrections,
+            "skills": state.skills,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f"{self.path.suffix}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("wb") as handle:
+                handle.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, marshal.version, key))
+                handle.write(marshal.dumps(payload))
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return self.path
@@ -0,0 +1,231 @@
+"""
+[SPOKE] Vector Sparse
+Lore: "The loom that weighs every thread at once."
+Purpose: Batch hybrid scoring over a sparse binary intent/token matrix.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import re
+import threading
+
+# Below this many candidates per query the per-result set path is faster than building arrays
+# (measured with tests/benchmarks/vector_scoring.py, matrix build included).
+VECTORIZE_MIN_CANDIDATES = 128
+
+# Alignment bonuses accumulate as repeated `+= 0.1`; index k holds that exact float sum, not k * 0.1.
+_BONUS_STEPS: list[float] = [0.0]
+# Synonym groups are packed into int64 bitmasks, this many at a time.
+_GROUP_BITS = 62
+# Process-wide token ids, append-only, so a candidate's id row is derived once and reused by every matrix.
+_VOCAB: dict[str, int] = {}
+_VOCAB_LOCK = threading.Lock()
+# Per-query token tables are dense arrays up to this many cells, sorted keys beyond.
+_DENSE_LOOKUP_CELLS = 1 << 18
+
+
+def _bonus_table(size: int) -> list[float]:
+    while len(_BONUS_STEPS) <= size:
+        _BONUS_STEPS.append(_BONUS_STEPS[-1] + 0.1)
+    return _BONUS_STEPS
+
+
+def _popcount(values):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    counts = np.zeros(values.shape, dtype=np.int64)
+    for bit in range(_GROUP_BITS):
+        counts += (values >> bit) & 1
+    return counts
+
+
+def target_tokens(result: dict) -> set[str]:
+    """Returns the result's cached `_target_tokens`, deriving them from its intent on first sight."""
+    if "_target_tokens" not in result:
+        target_text = result.get('intent', '').lower()
+        result["_target_tokens"] = set(re.findall(r'\w+', target_text))
+    return result["_target_tokens"]
+
+
+def _intern(tokens: set[str]) -> list[int]:
+    ids = []
+    for token in tokens:
+        token_id = _VOCAB.get(token)
+        if token_id is None:
+            with _VOCAB_LOCK:
+                token_id = _VOCAB.setdefault(token, len(_VOCAB))
+        ids.append(token_id)
+    return ids
+
+
+def token_ids(result: dict):
+    """Returns the result's cached `_token_ids` row, interning its target tokens on first sight."""
+    if "_token_ids" not in result:
+        result["_token_ids"] = np.asarray(_intern(target_tokens(result)), dtype=np.int64)
+    return result["_token_ids"]
+
+
+class IntentMatrix:
+    """
+    Candidate intents as a CSR-style sparse binary matrix: row i holds the token ids of candidate i.
+    Build it once per candidate set and reuse it across queries, or stack the candidates of several queries
+    into one matrix and score every row against its own query in a single pass with `score_rows`.
+    """
+
+    def __init__(self, token_sets: list[set[str]]):
+        if np is None:
+            raise RuntimeError("IntentMatrix requires numpy.")
+        self._set_rows([np.asarray(_intern(tokens), dtype=np.int64) for tokens in token_sets])
+
+    @classmethod
+    def from_results(cls, results: list[dict]) -> "IntentMatrix":
+        if np is None:
+            raise RuntimeError("IntentMatrix requires numpy.")
+        matrix = cls.__new__(cls)
+        matrix._set_rows([token_ids(result) for result in results])
+        return matrix
+
+    def _set_rows(self, rows: list) -> None:
+        # Ids interned after this point cannot occur in any row; `width` keeps query keys inside this matrix.
+        self.width = len(_VOCAB)
+        self.row_sizes = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(self.row_sizes, out=self.indptr[1:])
+        self.indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        self._nonempty_rows = np.flatnonzero(self.row_sizes)
+        self._nonempty_starts = self.indptr[:-1][self._nonempty_rows]
+
+    def __len__(self) -> int:
+        return len(self.row_sizes)
+
+    def _token_ids(self, tokens: set[str]) -> list[int]:
+        ids = (_VOCAB.get(token) for token in tokens)
+        return [token_id for token_id in ids if token_id is not None and token_id < self.width]
+
+    def _lookup(self, assignments: list[tuple[int, list[int], int]], entries, dense: bool):
+        """
+        Per stored token, the bits its own query assigns to that token (0 when none): `assignments` lists
+        (query, token_ids, bits) entries, OR-ed together where a token repeats within a query.
+        A dense (queries x vocab) table is fastest while it stays small; past that, sorted keys are searched.
+        """
+        entry_queries, entry_tokens = entries
+        if dense:
+            rows = max(int(entry_queries.max(initial=0)), max((query for query, _, _ in assignments), default=0)) + 1
+            table = np.zeros((rows, self.width), dtype=np.int64)
+            for query, token_ids, bits in assignments:
+                table[query, token_ids] |= bits
+            if len(table) == 1:
+                return table[0][entry_tokens]
+            return table[entry_queries, entry_tokens]
+        keys = np.asarray(
+            [query * self.width + token_id for query, token_ids, _ in assignments for token_id in token_ids],
+            dtype=np.int64,
+        )
+        if len(keys) == 0:
+            return np.zeros(len(entry_tokens), dtype=np.int64)
+        values = np.asarray([bits for _, token_ids, bits in assignments for _ in token_ids], dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        unique_keys = sorted_keys[starts]
+        merged = np.bitwise_or.reduceat(values[order], starts)
+        entry_keys = entry_queries * self.width + entry_tokens
+        positions = np.minimum(np.searchsorted(unique_keys, entry_keys), len(unique_keys) - 1)
+        return np.where(unique_keys[positions] == entry_keys, merged[positions], 0)
+
+    def _row_counts(self, token_sets: list[set[str]], entries, dense: bool):
+        """How many of its own query's tokens each row contains."""
+        assignments = [(query, self._token_ids(tokens), 1) for query, tokens in enumerate(token_sets)]
+        return self._reduce_rows(np.add, self._lookup(assignments, entries, dense))
+
+    def _row_aligned_groups(self, group_lists: list[list[set[str]]], entries, dense: bool):
+        """How many of its query's synonym groups intersect each row, via per-token group bitmasks popcounted per row."""
+        aligned = np.zeros(len(self), dtype=np.int64)
+        widest = max((len(groups) for groups in group_lists), default=0)
+        for offset in range(0, widest, _GROUP_BITS):
+            assignments = [
+                (query, self._token_ids(syns), 1 << bit)
+                for query, groups in enumerate(group_lists)
+                for bit, syns in enumerate(groups[offset:offset + _GROUP_BITS])
+            ]
+            entry_bits = self._lookup(assignments, entries, dense)
+            aligned += _popcount(self._reduce_rows(np.bitwise_or, entry_bits))
+        return aligned
+
+    def _reduce_rows(self, ufunc, values):
+        out = np.zeros(len(self), dtype=values.dtype)
+        if len(self._nonempty_rows):
+            out[self._nonempty_rows] = ufunc.reduceat(values, self._nonempty_starts)
+        return out
+
+    def score(self, expansion: dict[str, set[str]], original_tokens: set, all_expanded: set) -> list[float]:
+        """Hybrid score per row against one query, bit-identical to `VectorCalculus.score_intent`."""
+        return self.score_rows([(expansion, original_tokens, all_expanded)], [0] * len(self))
+
+    def score_rows(self, queries: list[tuple[dict[str, set[str]], set, set]], row_queries: list[int]) -> list[float]:
+        """
+        Hybrid score per row against `queries[row_queries[row]]`, bit-identical to `VectorCalculus.score_intent`.
+        A score depends only on (query, lexical hits, semantic hits, aligned groups), so each distinct tuple
+        is scored once with the scalar formula and broadcast back to its rows.
+        """
+        if len(self) == 0:
+            return []
+        row_query_ids = np.asarray(row_queries, dtype=np.int64)
+        entries = (np.repeat(row_query_ids, self.row_sizes), self.indices)
+        dense = len(queries) * self.width <= _DENSE_LOOKUP_CELLS
+        group_lists = [list(expansion.values()) for expansion, _, _ in queries]
+        lex_counts = self._row_counts([original for _, original, _ in queries], entries, dense)
+        sem_counts = self._row_counts([expanded for _, _, expanded in queries], entries, dense)
+        aligned = self._row_aligned_groups(group_lists, entries, dense)
+
+        lex_span = int(lex_counts.max()) + 1
+        sem_span = int(sem_counts.max()) + 1
+        group_span = max(len(groups) for groups in group_lists) + 1
+        keys = ((row_query_ids * lex_span + lex_counts) * sem_span + sem_counts) * group_span + aligned
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+
+        bonuses = _bonus_table(group_span - 1)
+        table = []
+        for key in unique_keys.tolist():
+            key, aligned_count = divmod(key, group_span)
+            key, sem_count = divmod(key, sem_span)
+            query, lex_count = divmod(key, lex_span)
+            original_count = len(queries[query][1])
+            lex_score = lex_count / original_count if original_count else 0
+            sem_score = sem_count / original_count if original_count else 0
+            # Empty rows land on (0, 0, 0) -> 0.0, matching the scalar early return.
+            table.append(round((lex_score * 0.6) + (sem_score * 0.3) + bonuses[aligned_count], 2))
+        return np.asarray(table, dtype=np.float64)[inverse.reshape(-1)].tolist()
+
+
+def score_batch(results: list[dict], expansion: dict[str, set[str]], original_tokens: set, all_expanded: set) -> list[dict]:
+    """Scores `results` in place with one matrix pass, honouring `_neural_boost` like the scalar path."""
+    return score_batches([(results, expansion, original_tokens, all_expanded)])[0]
+
+
+def score_batches(batches: list[tuple[list[dict], dict[str, set[str]], set, set]]) -> list[list[dict]]:
+    """
+    Scores every `(results, expansion, original_tokens, all_expanded)` batch in place with one matrix pass
+    over all of their candidates, so a batch of short per-query candidate lists still amortizes the arrays.
+    """
+    rows: list[dict] = []
+    row_queries: list[int] = []
+    for query, (results, _, _, _) in enumerate(batches):
+        for result in results:
+            if result.get("_neural_boost"):
+                result["score"] = 1.0
+            else:
+                rows.append(result)
+                row_queries.append(query)
+    matrix = IntentMatrix.from_results(rows)
+    queries = [(expansion, original_tokens, all_expanded) for _, expansion, original_tokens, all_expanded in batches]
+    for result, score in zip(rows, matrix.score_rows(queries, row_queries), strict=True):
+        result["score"] = score
+    return [list(results) for results, _, _, _ in batches]
+
+
+def vectorization_available() -> bool:
+    return np is not None
@@ -9,6 +9,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from src.core.engine.wardens.snapshot import IGNORED_DIRS, RepositorySnapshot
 from src.core.sovereign_hud import SovereignHUD
 from src.tools.brave_search import BraveSearch
 
@@ -19,17 +20,32 @@ class BaseWarden(ABC):
     Provides centralized config loading, path filtering, and research capabilities.
     """
 
-    def __init__(self, root: Path) -> None:
+    # Suffixes of files this warden audits one at a time; setting it lets a sweep shard them across workers.
+    SHARD_SUFFIXES: tuple[str, ...] | None = None
+
+    def __init__(self, root: Path, snapshot: RepositorySnapshot | None = None) -> None:
         """
         Initializes the warden with the project root.
 
         Args:
             root: Path to the project root directory.
+            snapshot: Shared repository snapshot for the current sweep; built lazily when omitted.
         """
         self.root = root
+        self._snapshot = snapshot
         self.config: dict[str, Any] = self._load_config()
         self.brave: BraveSearch = BraveSearch()
 
+    @property
+    def snapshot(self) -> RepositorySnapshot:
+        """
+        The pruned file walk and source/AST cache this warden scans from.
+        Pass one snapshot to every warden in a sweep so the tree is walked and read only once.
+        """
+        if self._snapshot is None:
+            self._snapshot = RepositorySnapshot(self.root)
+        return self._snapshot
+
     def _load_config(self) -> dict[str, Any]:
         """
         Loads configuration from .agents/config.json.
@@ -49,16 +65,9 @@ class BaseWarden(ABC):
         """
         Centralized logic for ignoring directories.
         """
-        # Hard-kill list for expensive recursive walks
-        ignored_dirs = {
-            ".git", ".venv", "node_modules", "__pycache__", 
-            ".agents", ".pytest_cache", "dist", "build", 
-            ".quarto", ".stats"
-        }
-
         # Check if any part of the path is in the ignored list
         parts = set(path.parts)
-        if parts.intersection(ignored_dirs):
+        if parts.intersection(IGNORED_DIRS):
             return True
             
         return False
@@ -90,6 +99,19 @@ class BaseWarden(ABC):
         """
         pass
 
+    def scan_files(self, paths: list[Path]) -> list[dict[str, Any]]:
+        """
+        Scans only the given files. Wardens that set SHARD_SUFFIXES implement this so that
+        concatenating the results of contiguous shards reproduces scan().
+
+        Args:
+            paths: Files from the snapshot, in walk order.
+
+        Returns:
+            A list of breach dictionaries.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support sharded scans.")
+
     async def scan_async(self) -> list[dict[str, Any]]:
         """
         Asynchronous wrapper for scan().
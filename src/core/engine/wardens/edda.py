@@ -13,13 +13,11 @@ from src.core.engine.wardens.base import BaseWarden
 class EddaWarden(BaseWarden):
     def scan(self) -> list[dict[str, Any]]:
         targets = []
+        snapshot = self.snapshot
 
         # 1. Legacy Markdown Detection (.md -> .qmd)
         # We ignore README.md as it's standard.
-        for md_file in self.root.rglob("*.md"):
-            if self._should_ignore(md_file):
-                continue
-
+        for md_file in snapshot.files(".md"):
             if md_file.name.upper() == "README.MD":
                 continue
 
@@ -34,13 +32,9 @@ class EddaWarden(BaseWarden):
             })
 
         # 2. Docstring & Signature Matching
-        for py_file in self.root.rglob("*.py"):
-            if self._should_ignore(py_file):
-                continue
-
+        for py_file in snapshot.files(".py"):
             try:
-                content = py_file.read_text(encoding='utf-8')
-                tree = ast.parse(content)
+                tree = snapshot.parse(py_file)
 
                 for node in ast.walk(tree):
                     if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
@@ -38,12 +38,10 @@ class FreyaWarden(BaseWarden):
             except (json.JSONDecodeError, OSError):
                 pass
 
-        for tsx_file in self.root.rglob("*.tsx"):
-            if self._should_ignore(tsx_file):
-                continue
-
+        snapshot = self.snapshot
+        for tsx_file in snapshot.files(".tsx"):
             try:
-                content = tsx_file.read_text(encoding='utf-8')
+                content = snapshot.read_text(tsx_file)
 
                 # --- [GUNGNIR CALCULUS: BIRKHOFF MEASURE] ---
                 elements = re.findall(r'<[a-zA-Z0-9]+', content)
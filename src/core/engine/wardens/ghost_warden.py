@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from src.core.engine.wardens.base import BaseWarden
+from src.core.engine.wardens.snapshot import RepositorySnapshot
 from src.core.sovereign_hud import SovereignHUD
 
 class GhostWarden(BaseWarden):
@@ -17,8 +18,8 @@ class GhostWarden(BaseWarden):
     Mandate: Pre-disk fail-safe for agentic tool calls.
     """
 
-    def __init__(self, root: Path) -> None:
-        super().__init__(root)
+    def __init__(self, root: Path, snapshot: RepositorySnapshot | None = None) -> None:
+        super().__init__(root, snapshot)
         self.persona = "GHOST"
 
     def scan(self) -> list[dict[str, Any]]:
@@ -0,0 +1,68 @@
+"""
+[Gungnir: AESTHETIC CALCULUS]
+Lore: "The spear that never misses its mark."
+Purpose: Run the Universal Gungnir audit over every logic file in the repository.
+"""
+
+import contextlib
+from pathlib import Path
+from typing import Any
+
+from src.core.engine.analysis_cache import AnalysisCache
+from src.core.engine.gungnir.universal import UniversalGungnir
+from src.core.engine.wardens.base import BaseWarden
+from src.core.engine.wardens.snapshot import RepositorySnapshot
+
+
+class GungnirWarden(BaseWarden):
+    """
+    Warden adapter for UniversalGungnir.audit_logic.
+    Each file is audited independently, so sweeps may shard the work across processes.
+    """
+
+    SHARD_SUFFIXES = (".py", ".ts", ".tsx", ".js", ".jsx")
+
+    def __init__(self, root: Path, snapshot: RepositorySnapshot | None = None) -> None:
+        super().__init__(root, snapshot)
+        self.gungnir = UniversalGungnir(cache=AnalysisCache.for_root(root))
+
+    def scan(self) -> list[dict[str, Any]]:
+        """
+        Audits every logic file in the snapshot.
+
+        Returns:
+            A list of Gungnir breaches.
+        """
+        return self.scan_files(self.snapshot.files(self.SHARD_SUFFIXES))
+
+    def scan_files(self, paths: list[Path]) -> list[dict[str, Any]]:
+        """
+        Audits the given logic files.
+
+        Args:
+            paths: Files from the snapshot, in walk order.
+
+        Returns:
+            A list of Gungnir breaches, typed by the breach prefix of each action.
+        """
+        targets: list[dict[str, Any]] = []
+        snapshot = self.snapshot
+        cache = self.gungnir.cache
+        with cache.batch() if cache is not None else contextlib.nullcontext():
+            for path in paths:
+                try:
+                    code = snapshot.read_text(path)
+                except (OSError, UnicodeDecodeError):
+                    continue
+
+                rel_path = str(path.relative_to(self.root))
+                for breach in self.gungnir.audit_logic(code, path.suffix):
+                    action = breach["action"]
+                    targets.append({
+                        "type": action.split(":", 1)[0],
+                        "file": rel_path,
+                        "action": action,
+                        "severity": breach["severity"],
+                        "line": 1
+                    })
+        return targets
@@ -13,11 +13,12 @@ from typing import Any
 
 from src.cstar.core.uplink import AntigravityUplink
 from src.core.engine.wardens.base import BaseWarden
+from src.core.engine.wardens.snapshot import RepositorySnapshot
 
 
 class HuginnWarden(BaseWarden):
-    def __init__(self, root: Path) -> None:
-        super().__init__(root)
+    def __init__(self, root: Path, snapshot: RepositorySnapshot | None = None) -> None:
+        super().__init__(root, snapshot)
         self.trace_dir = root / ".agents" / "traces"
         self.api_key = os.getenv("MUNINN_API_KEY") or os.getenv("GOOGLE_API_KEY")
         # [Ω] Decoupled: Using Uplink for neural audits
@@ -4,110 +4,142 @@ Lore: "The Wise Counselor sees through tangled threads."
 Purpose: Identify cyclomatic complexity and maintainability issues.
 """
 
+import ast
 import contextlib
 import time
+from pathlib import Path
 from typing import Any
 
-from radon.complexity import cc_visit
-from radon.metrics import mi_visit
-
+from src.core.engine.analysis_cache import AnalysisCache
 from src.core.engine.wardens.base import BaseWarden
 
 
 class MimirWarden(BaseWarden):
+    SHARD_SUFFIXES = (".py",)
+    CACHE_NAMESPACE = "mimir"
+    # Bump whenever a rule below changes so cached verdicts from older rules stop matching.
+    RULES_VERSION = "mimir-1"
+
     def scan(self) -> list[dict[str, Any]]:
+        return self.scan_files(self.snapshot.files(self.SHARD_SUFFIXES))
+
+    def scan_files(self, paths: list[Path]) -> list[dict[str, Any]]:
         targets = []
         cc_threshold = self.config.get("MIMIR_CC_THRESHOLD", 10)
         mi_threshold = self.config.get("MIMIR_MI_THRESHOLD", 40) # < 40 is usually bad
 
-        for py_file in self.root.rglob("*.py"):
-            if self._should_ignore(py_file):
-                continue
+        snapshot = self.snapshot
+        cache = AnalysisCache.for_root(self.root)
+        with cache.batch() if cache is not None else contextlib.nullcontext():
+            for py_file in paths:
+                file_targets: list[dict[str, Any]] = []
+                mi_score = None
+                with contextlib.suppress(Exception):
+                    content = snapshot.read_text(py_file)
+                    rel_path = str(py_file.relative_to(self.root))
+
+                    # Unchanged content under the same rules and thresholds reuses the stored verdict.
+                    key = AnalysisCache.key(snapshot.content_hash(py_file), cc_threshold, mi_threshold)
+                    cached = cache.get(self.CACHE_NAMESPACE, self.RULES_VERSION, key) if cache is not None else None
+                    if cached is not None:
+                        file_targets = [{**breach, "file": rel_path} for breach in cached["breaches"]]
+                        mi_score = cached["maintainability"]
+                    else:
+                        mi_score = self._audit_file(py_file, content, rel_path, file_targets, cc_threshold, mi_threshold)
+                        if cache is not None:
+                            cache.put(
+                                self.CACHE_NAMESPACE, self.RULES_VERSION, key,
+                                {"breaches": file_targets, "maintainability": mi_score}
+                            )
+                targets.extend(file_targets)
+
+                # --- [Ω] PROACTIVE ARCHITECTURAL FEEDBACK (Phase 89) ---
+                if mi_score is not None and mi_score < 60: # Suggestion threshold (higher than breach)
+                    with contextlib.suppress(Exception):
+                        from src.core.telemetry import SubspaceTelemetry
+                        SubspaceTelemetry.log_trace(
+                            mission_id=f"MIMIR-{int(time.time())}",
+                            file_path=rel_path,
+                            target_metric="SUGGESTION",
+                            initial_score=mi_score,
+                            justification=f"Refactoring of '{py_file.name}' suggested to improve maintainability (MI: {mi_score:.2f}).",
+                            status="ADVICE"
+                        )
 
-            with contextlib.suppress(Exception):
-                content = py_file.read_text(encoding='utf-8')
-                rel_path = str(py_file.relative_to(self.root))
+        return targets
 
-                # --- [GUNGNIR CALCULUS: STRUCTURAL BEAUTY] ---
-                # 1. Whitespace Rhythm Enforcement
-                lines = content.split('\n')
+    def _audit_file(
+        self, py_file: Path, content: str, rel_path: str, file_targets: list[dict[str, Any]],
+        cc_threshold: int, mi_threshold: int
+    ) -> float:
+        """Runs every Mimir rule on one file, appending breaches as it goes. Returns the maintainability index."""
+        # --- [GUNGNIR CALCULUS: STRUCTURAL BEAUTY] ---
+        # 1. Whitespace Rhythm Enforcement
+        lines = content.split('\n')
+        consecutive_logic = 0
+        for line_idx, line in enumerate(lines):
+            stripped = line.strip()
+            if stripped and not stripped.startswith('#'):
+                consecutive_logic += 1
+                if consecutive_logic > 12: # Claustrophobia threshold
+                    file_targets.append({
+                        "type": "MIMIR_AESTHETIC_BREACH",
+                        "file": rel_path,
+                        "action": "Claustrophobic code block detected (>12 consecutive lines). Inject vertical whitespace for cognitive rhythm.",
+                        "line": line_idx + 1,
+                        "severity": "MEDIUM"
+                    })
+                    break
+            else:
                 consecutive_logic = 0
-                for line_idx, line in enumerate(lines):
-                    stripped = line.strip()
-                    if stripped and not stripped.startswith('#'):
-                        consecutive_logic += 1
-                        if consecutive_logic > 12: # Claustrophobia threshold
-                            targets.append({
-                                "type": "MIMIR_AESTHETIC_BREACH",
+
+        # 2. Golden Ratio Setup-to-Execution Limit
+        try:
+            tree = self.snapshot.parse(py_file)
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef):
+                    setup_nodes = 0
+                    exec_nodes = 0
+                    for child in node.body:
+                        if isinstance(child, (ast.Assign, ast.AnnAssign, ast.Assert)):
+                            setup_nodes += 1
+                        elif isinstance(child, (ast.For, ast.While, ast.Return, ast.Expr, ast.If)):
+                            exec_nodes += 1
+
+                    if exec_nodes > 0:
+                        ratio = setup_nodes / exec_nodes
+                        if ratio > 1.7: # Exceeds ~1.618 limit
+                            file_targets.append({
+                                "type": "MIMIR_STRUCTURAL_BREACH",
                                 "file": rel_path,
-                                "action": "Claustrophobic code block detected (>12 consecutive lines). Inject vertical whitespace for cognitive rhythm.",
-                                "line": line_idx + 1,
+                                "action": f"Function '{node.name}' is top-heavy (Ratio: {ratio:.2f}). Extract setup/validation logic into helper functions.",
+                                "line": node.lineno,
                                 "severity": "MEDIUM"
                             })
-                            break
-                    else:
-                        consecutive_logic = 0
-
-                # 2. Golden Ratio Setup-to-Execution Limit
-                import ast
-                try:
-                    tree = ast.parse(content)
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.FunctionDef):
-                            setup_nodes = 0
-                            exec_nodes = 0
-                            for child in node.body:
-                                if isinstance(child, (ast.Assign, ast.AnnAssign, ast.Assert)):
-                                    setup_nodes += 1
-                                elif isinstance(child, (ast.For, ast.While, ast.Return, ast.Expr, ast.If)):
-                                    exec_nodes += 1
-
-                            if exec_nodes > 0:
-                                ratio = setup_nodes / exec_nodes
-                                if ratio > 1.7: # Exceeds ~1.618 limit
-                                    targets.append({
-                                        "type": "MIMIR_STRUCTURAL_BREACH",
-                                        "file": rel_path,
-                                        "action": f"Function '{node.name}' is top-heavy (Ratio: {ratio:.2f}). Extract setup/validation logic into helper functions.",
-                                        "line": node.lineno,
-                                        "severity": "MEDIUM"
-                                    })
-                except SyntaxError: pass
-
-                # --- Original Mimir Checks ---
-                # 1. Cyclomatic Complexity
-                blocks = cc_visit(content)
-                for block in blocks:
-                    if block.complexity > cc_threshold:
-                        targets.append({
-                            "type": "MIMIR_COMPLEXITY",
-                            "file": rel_path,
-                            "action": f"Untangle Threads: Simplify {block.name} (CC: {block.complexity})",
-                            "severity": "MEDIUM",
-                            "line": block.lineno
-                        })
-
-                # 2. Maintainability Index
-                mi_score = mi_visit(content, multi=False)
-                if mi_score < mi_threshold:
-                     targets.append({
-                            "type": "MIMIR_MAINTAINABILITY",
-                            "file": rel_path,
-                            "action": f"Restructure Saga: File Maintainability Index too low ({mi_score:.2f} < {mi_threshold})",
-                            "severity": "MEDIUM",
-                            "line": 1
-                        })
+        except SyntaxError: pass
 
-                # --- [Ω] PROACTIVE ARCHITECTURAL FEEDBACK (Phase 89) ---
-                if mi_score < 60: # Suggestion threshold (higher than breach)
-                    from src.core.telemetry import SubspaceTelemetry
-                    SubspaceTelemetry.log_trace(
-                        mission_id=f"MIMIR-{int(time.time())}",
-                        file_path=rel_path,
-                        target_metric="SUGGESTION",
-                        initial_score=mi_score,
-                        justification=f"Refactoring of '{py_file.name}' suggested to improve maintainability (MI: {mi_score:.2f}).",
-                        status="ADVICE"
-                    )
+        # --- Original Mimir Checks ---
+        # 1. Cyclomatic Complexity
+        blocks = self.snapshot.cc_blocks(py_file)
+        for block in blocks:
+            if block.complexity > cc_threshold:
+                file_targets.append({
+                    "type": "MIMIR_COMPLEXITY",
+                    "file": rel_path,
+                    "action": f"Untangle Threads: Simplify {block.name} (CC: {block.complexity})",
+                    "severity": "MEDIUM",
+                    "line": block.lineno
+                })
 
-        return targets
+        # 2. Maintainability Index
+        mi_score = self.snapshot.maintainability(py_file)
+        if mi_score < mi_threshold:
+             file_targets.append({
+                    "type": "MIMIR_MAINTAINABILITY",
+                    "file": rel_path,
+                    "action": f"Restructure Saga: File Maintainability Index too low ({mi_score:.2f} < {mi_threshold})",
+                    "severity": "MEDIUM",
+                    "line": 1
+                })
+
+        return mi_score
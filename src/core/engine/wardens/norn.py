@@ -9,12 +9,13 @@ from typing import Any
 
 from src.core.norn_coordinator import NornCoordinator
 from src.core.engine.wardens.base import BaseWarden
+from src.core.engine.wardens.snapshot import RepositorySnapshot
 
 
 class NornWarden(BaseWarden):
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, snapshot: RepositorySnapshot | None = None) -> None:
         # Initialize BaseWarden with project root
-        super().__init__(root)
+        super().__init__(root, snapshot)
         self.plan_path = root / "tasks.qmd"
         self.coordinator = NornCoordinator(root)
 
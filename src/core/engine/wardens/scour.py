@@ -4,9 +4,7 @@ Lore: "The broom of the high halls."
 Purpose: Identifies and purges legacy references, orphaned mocks, and architectural clutter.
 """
 
-import os
 import re
-from pathlib import Path
 from typing import Any
 
 from src.core.engine.wardens.base import BaseWarden
@@ -38,35 +36,28 @@ class ScourWarden(BaseWarden):
         breaches = []
         pattern = re.compile(r'\bc\* (start|ravens|status|mcp|lets-go|plan|wrap-it-up|investigate)\b')
 
-        # [Ω] SAFE WALK: Manual traversal to respect _should_ignore
-        for root, dirs, files in os.walk(self.root, followlinks=False):
+        # [Ω] SAFE WALK: The shared snapshot is already pruned of ignored directories
+        snapshot = self.snapshot
+        for entry in snapshot.entries():
             # Depth guard: Don't go deeper than 10 levels for scour
-            rel_root = Path(root).relative_to(self.root)
-            if len(rel_root.parts) > 10:
-                dirs[:] = [] # Stop recursion
+            if entry.depth > 10 or not entry.path.name.endswith((".qmd", ".md")):
                 continue
 
-            # Prune ignored directories in-place for efficiency
-            dirs[:] = [d for d in dirs if not self._should_ignore(Path(root) / d)]
-            
-            for file in files:
-                if not file.endswith((".qmd", ".md")): continue
-                
-                path = Path(root) / file
-                try:
-                    content = path.read_text(encoding='utf-8')
-                    matches = list(pattern.finditer(content))
-                    for m in matches:
-                        line_no = content.count('\n', 0, m.start()) + 1
-                        breaches.append({
-                            "type": "LEGACY_COMMAND",
-                            "file": str(path.relative_to(self.root)),
-                            "action": f"REPLACE: '{m.group(0)}' with 'cstar {m.group(1)}'",
-                            "severity": "LOW",
-                            "line": line_no
-                        })
-                except Exception:
-                    continue
+            path = entry.path
+            try:
+                content = snapshot.read_text(path)
+                matches = list(pattern.finditer(content))
+                for m in matches:
+                    line_no = content.count('\n', 0, m.start()) + 1
+                    breaches.append({
+                        "type": "LEGACY_COMMAND",
+                        "file": str(path.relative_to(self.root)),
+                        "action": f"REPLACE: '{m.group(0)}' with 'cstar {m.group(1)}'",
+                        "severity": "LOW",
+                        "line": line_no
+                    })
+            except Exception:
+                continue
 
         return breaches
 
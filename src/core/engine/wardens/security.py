@@ -4,9 +4,7 @@ Lore: "The lock on the Archive door."
 Purpose: Identifies exposed secrets, unencrypted environment files, and outdated API keys.
 """
 
-import os
 import re
-from pathlib import Path
 from typing import Any
 
 from src.core.engine.wardens.base import BaseWarden
@@ -35,19 +33,14 @@ class SecurityWarden(BaseWarden):
         breaches = []
         env_files = [".env", ".env.local", ".env.test"]
         
-        for root, dirs, files in os.walk(self.root):
-            # Prune ignored
-            dirs[:] = [d for d in dirs if not self._should_ignore(Path(root) / d)]
-            
-            for f in files:
-                if f in env_files:
-                    path = Path(root) / f
-                    breaches.append({
-                        "type": "EXPOSED_ENV",
-                        "file": str(path.relative_to(self.root)),
-                        "action": "VAULT: Encrypt this file using 'src/tools/vault.py' and purge the raw version.",
-                        "severity": "HIGH"
-                    })
+        for path in self.snapshot.files():
+            if path.name in env_files:
+                breaches.append({
+                    "type": "EXPOSED_ENV",
+                    "file": str(path.relative_to(self.root)),
+                    "action": "VAULT: Encrypt this file using 'src/tools/vault.py' and purge the raw version.",
+                    "severity": "HIGH"
+                })
         return breaches
 
     def _scour_hardcoded_keys(self) -> list[dict[str, Any]]:
@@ -59,23 +52,20 @@ class SecurityWarden(BaseWarden):
             "GENERIC_KEY": re.compile(r'key\s*=\s*["\'][0-9a-zA-Z]{32,45}["\']', re.I)
         }
 
-        for root, dirs, files in os.walk(self.root / "src"):
-            dirs[:] = [d for d in dirs if not self._should_ignore(Path(root) / d)]
-            for f in files:
-                if not f.endswith((".py", ".ts", ".tsx", ".js")): continue
-                path = Path(root) / f
-                try:
-                    content = path.read_text(encoding='utf-8')
-                    for name, p in patterns.items():
-                        matches = list(p.finditer(content))
-                        for m in matches:
-                            line_no = content.count('\n', 0, m.start()) + 1
-                            breaches.append({
-                                "type": "HARDCODED_SECRET",
-                                "file": str(path.relative_to(self.root)),
-                                "action": f"REDACT: Remove hardcoded {name} and move to Vault.",
-                                "severity": "CRITICAL",
-                                "line": line_no
-                            })
-                except Exception: continue
+        snapshot = self.snapshot
+        for path in snapshot.files((".py", ".ts", ".tsx", ".js"), under="src"):
+            try:
+                content = snapshot.read_text(path)
+                for name, p in patterns.items():
+                    matches = list(p.finditer(content))
+                    for m in matches:
+                        line_no = content.count('\n', 0, m.start()) + 1
+                        breaches.append({
+                            "type": "HARDCODED_SECRET",
+                            "file": str(path.relative_to(self.root)),
+                            "action": f"REDACT: Remove hardcoded {name} and move to Vault.",
+                            "severity": "CRITICAL",
+                            "line": line_no
+                        })
+            except Exception: continue
         return breaches
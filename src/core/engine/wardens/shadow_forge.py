@@ -18,13 +18,14 @@ from typing import Any
 
 from src.core.sovereign_hud import SovereignHUD
 from src.core.engine.wardens.base import BaseWarden
+from src.core.engine.wardens.snapshot import RepositorySnapshot
 
 
 class ShadowForgeWarden(BaseWarden):
     """Orchestrates the Host-side Shadow Forge lifecycle."""
 
-    def __init__(self, project_root: Path | str):
-        super().__init__(project_root)
+    def __init__(self, project_root: Path | str, snapshot: RepositorySnapshot | None = None):
+        super().__init__(project_root, snapshot)
         self.mock_mode = os.getenv("MOCK_MODE") == "true"
         self.docker_exe = shutil.which("docker")
 
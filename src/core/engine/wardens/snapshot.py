@@ -0,0 +1,221 @@
+"""
+[WARDEN] Repository Snapshot
+Lore: "One flight over the realm; every Warden reads the same map."
+Purpose: A single pruned walk of the repository with lazily cached source, AST and radon results.
+"""
+
+import ast
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.core.engine.analysis_cache import content_hash
+
+# Hard-kill list for expensive recursive walks
+IGNORED_DIRS = frozenset({
+    ".git", ".venv", "node_modules", "__pycache__",
+    ".agents", ".pytest_cache", "dist", "build",
+    ".quarto", ".stats"
+})
+
+Fingerprint = tuple[int, int] | None
+
+
+@dataclass(slots=True)
+class SnapshotFile:
+    """One file seen by the walk. `rel` uses the walk's own relative path, never a patched `relative_to`."""
+
+    path: Path
+    rel: str
+    depth: int
+    fingerprint: Fingerprint = None
+    stat_done: bool = False
+
+
+@dataclass(slots=True)
+class _Analysis:
+    fingerprint: Fingerprint
+    source: str | None = None
+    tree: Any = None
+    tree_error: BaseException | None = None
+    cc_blocks: Any = None
+    maintainability: float | None = None
+    digest: str | None = None
+
+
+class RepositorySnapshot:
+    """
+    One pruned directory walk shared by every Warden in a sweep.
+    Each file is read at most once; source, AST and radon results are cached per (path, mtime, size),
+    and `refresh()` carries unchanged entries into the next sweep's snapshot.
+    """
+
+    def __init__(self, root: Path, *, ignored_dirs: Iterable[str] = IGNORED_DIRS) -> None:
+        self.root = Path(root)
+        self.ignored_dirs = frozenset(ignored_dirs)
+        self._files: list[SnapshotFile] | None = None
+        self._by_path: dict[Path, SnapshotFile] = {}
+        self._analyses: dict[str, _Analysis] = {}
+        self._lock = threading.RLock()
+        self._trackers: list[set[str]] = []
+        self.stats = {"walks": 0, "files_seen": 0, "files_read": 0, "bytes_read": 0, "parses": 0, "radon_runs": 0}
+
+    # --- Walk -----------------------------------------------------------------
+
+    def files(self, suffixes: str | tuple[str, ...] | None = None, *, under: str | None = None) -> list[Path]:
+        """Returns walked files, optionally filtered by suffix and a top-level subdirectory, in walk order."""
+        prefix = f"{under.strip('/')}/" if under else None
+        return [
+            entry.path for entry in self._entries()
+            if (suffixes is None or entry.path.name.endswith(suffixes))
+            and (prefix is None or entry.rel.startswith(prefix))
+        ]
+
+    def entries(self) -> list[SnapshotFile]:
+        return list(self._entries())
+
+    def _entries(self) -> list[SnapshotFile]:
+        with self._lock:
+            if self._files is None:
+                self._files = self._walk()
+            return self._files
+
+    def _walk(self) -> list[SnapshotFile]:
+        self.stats["walks"] += 1
+        found: list[SnapshotFile] = []
+        root = str(self.root)
+        for current, dirs, names in os.walk(root, followlinks=False):
+            # Prune ignored directories in-place so the walk never descends into them.
+            dirs[:] = sorted(d for d in dirs if d not in self.ignored_dirs)
+            rel_dir = os.path.relpath(current, root)
+            rel_parts = () if rel_dir == "." else Path(rel_dir).parts
+            if self.ignored_dirs.intersection(rel_parts):
+                continue
+            for name in sorted(names):
+                rel = "/".join((*rel_parts, name))
+                entry = SnapshotFile(path=Path(current) / name, rel=rel, depth=len(rel_parts))
+                found.append(entry)
+                self._by_path[entry.path] = entry
+        self.stats["files_seen"] = len(found)
+        return found
+
+    # --- Cached analysis ------------------------------------------------------
+
+    def read_text(self, path: Path) -> str:
+        """Returns the file's UTF-8 source, reading it from disk only once per fingerprint."""
+        analysis = self._analysis(path)
+        if analysis.source is None:
+            source = Path(path).read_text(encoding='utf-8')
+            with self._lock:
+                if analysis.source is None:
+                    analysis.source = source
+                    self.stats["files_read"] += 1
+                    self.stats["bytes_read"] += len(source.encode('utf-8'))
+        return analysis.source
+
+    def parse(self, path: Path) -> ast.Module:
+        """Returns the cached AST; a SyntaxError is cached too and re-raised on every call."""
+        analysis = self._analysis(path)
+        if analysis.tree is None and analysis.tree_error is None:
+            source = self.read_text(path)
+            with self._lock:
+                if analysis.tree is None and analysis.tree_error is None:
+                    self.stats["parses"] += 1
+                    try:
+                        analysis.tree = ast.parse(source)
+                    except (SyntaxError, ValueError) as exc:
+                        analysis.tree_error = exc
+        if analysis.tree_error is not None:
+            raise analysis.tree_error
+        return analysis.tree
+
+    def content_hash(self, path: Path) -> str:
+        """SHA-256 of the file's source, computed once per fingerprint."""
+        analysis = self._analysis(path)
+        if analysis.digest is None:
+            digest = content_hash(self.read_text(path))
+            with self._lock:
+                analysis.digest = digest
+        return analysis.digest
+
+    def cc_blocks(self, path: Path) -> list[Any]:
+        """radon cyclomatic-complexity blocks for a Python file."""
+        analysis = self._analysis(path)
+        if analysis.cc_blocks is None:
+            from radon.complexity import cc_visit
+
+            blocks = cc_visit(self.read_text(path))
+            with self._lock:
+                self.stats["radon_runs"] += 1
+                analysis.cc_blocks = blocks
+        return analysis.cc_blocks
+
+    def maintainability(self, path: Path) -> float:
+        """radon maintainability index (single-line comments not counted as multi)."""
+        analysis = self._analysis(path)
+        if analysis.maintainability is None:
+            from radon.metrics import mi_visit
+
+            score = mi_visit(self.read_text(path), multi=False)
+            with self._lock:
+                self.stats["radon_runs"] += 1
+                analysis.maintainability = score
+        return analysis.maintainability
+
+    def _analysis(self, path: Path) -> _Analysis:
+        path = Path(path)
+        with self._lock:
+            entry = self._by_path.get(path)
+            if entry is None:
+                # Files outside the walk (or read before it) still get cached analyses.
+                rel = os.path.relpath(path, self.root)
+                entry = SnapshotFile(path=path, rel=rel.replace(os.sep, "/"), depth=len(Path(rel).parts) - 1)
+                self._by_path[path] = entry
+            if not entry.stat_done:
+                entry.fingerprint = _fingerprint(path)
+                entry.stat_done = True
+            for touched in self._trackers:
+                touched.add(entry.rel)
+            analysis = self._analyses.get(entry.rel)
+            if analysis is None or analysis.fingerprint != entry.fingerprint:
+                analysis = _Analysis(fingerprint=entry.fingerprint)
+                self._analyses[entry.rel] = analysis
+            return analysis
+
+    @contextmanager
+    def tracking(self) -> Iterator[set[str]]:
+        """Collects the relative paths of every file whose contents are analysed inside the block."""
+        touched: set[str] = set()
+        with self._lock:
+            self._trackers.append(touched)
+        try:
+            yield touched
+        finally:
+            with self._lock:
+                self._trackers.remove(touched)
+
+    # --- Lifecycle ------------------------------------------------------------
+
+    def refresh(self) -> "RepositorySnapshot":
+        """Returns a fresh snapshot of the same tree that reuses analyses for files whose fingerprint is unchanged."""
+        successor = RepositorySnapshot(self.root, ignored_dirs=self.ignored_dirs)
+        with self._lock:
+            successor._analyses = {
+                rel: analysis for rel, analysis in self._analyses.items() if analysis.fingerprint is not None
+            }
+        return successor
+
+    def describe(self) -> dict[str, Any]:
+        return {"root": str(self.root), "cached_files": len(self._analyses), **self.stats}
+
+
+def _fingerprint(path: Path) -> Fingerprint:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,326 @@
+"""
+[WARDEN] Sweep Orchestrator
+Lore: "Every watchtower lights its beacon at once."
+Purpose: Fan Wardens, and file shards of the heavy ones, out across a process pool with budgets and timing.
+"""
+
+import os
+import signal
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.core.engine.wardens.base import BaseWarden
+from src.core.engine.wardens.edda import EddaWarden
+from src.core.engine.wardens.freya import FreyaWarden
+from src.core.engine.wardens.gungnir_warden import GungnirWarden
+from src.core.engine.wardens.mimir import MimirWarden
+from src.core.engine.wardens.scour import ScourWarden
+from src.core.engine.wardens.security import SecurityWarden
+from src.core.engine.wardens.snapshot import RepositorySnapshot
+from src.core.engine.wardens.taste import TasteWarden
+from src.core.engine.wardens.valkyrie import ValkyrieWarden
+from src.core.sovereign_hud import SovereignHUD
+
+# Repository-analysis wardens; Huginn, Norn, Ghost and the Shadow Forge are driven by their own loops.
+DEFAULT_SWEEP_WARDENS: tuple[type[BaseWarden], ...] = (
+    MimirWarden, GungnirWarden, ValkyrieWarden, EddaWarden,
+    FreyaWarden, TasteWarden, ScourWarden, SecurityWarden,
+)
+
+# Sharded wardens get at least this many files per shard; smaller shards cost more in IPC than they save.
+SHARD_MIN_FILES = 32
+
+
+class WardenTimeout(BaseException):
+    """
+    Raised inside a warden that overruns its budget.
+    Derives from BaseException because wardens deliberately swallow `Exception` per file.
+    """
+
+
+@dataclass(slots=True)
+class _SweepTask:
+    order: int
+    shard: int
+    warden_cls: type[BaseWarden]
+    root: str
+    sweep_id: str
+    paths: list[str] | None
+    budget: float | None
+
+
+@dataclass(slots=True)
+class _TaskOutcome:
+    order: int
+    shard: int
+    breaches: list[dict[str, Any]]
+    started: float = 0.0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    files_processed: int = 0
+    timed_out: bool = False
+    error: str | None = None
+
+
+@dataclass
+class WardenReport:
+    """Merged outcome of one warden: its breaches plus wall/CPU time and files processed across all shards."""
+
+    warden: str
+    breaches: list[dict[str, Any]] = field(default_factory=list)
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    files_processed: int = 0
+    shards: int = 0
+    budget: float | None = None
+    timed_out: bool = False
+    errors: list[str] = field(default_factory=list)
+
+    def as_row(self) -> dict[str, Any]:
+        return {
+            "warden": self.warden,
+            "breaches": len(self.breaches),
+            "wall_ms": round(self.wall_time * 1000, 1),
+            "cpu_ms": round(self.cpu_time * 1000, 1),
+            "files": self.files_processed,
+            "shards": self.shards,
+            "budget_s": self.budget,
+            "timed_out": self.timed_out,
+            "errors": list(self.errors),
+        }
+
+
+@dataclass
+class SweepResult:
+    reports: list[WardenReport]
+    wall_time: float
+    workers: int
+
+    @property
+    def breaches(self) -> list[dict[str, Any]]:
+        """All breaches in warden order, then shard order; identical to running the wardens serially."""
+        return [breach for report in self.reports for breach in report.breaches]
+
+
+class WardenSweep:
+    """
+    Runs a full Warden sweep across a process pool.
+    Wardens that declare SHARD_SUFFIXES are split into contiguous file shards; every other warden runs as one task.
+    The pool outlives a single run(), so each worker keeps its own RepositorySnapshot and refreshes it between sweeps;
+    call close(), or use the sweep as a context manager, to stop the workers.
+    Budgets apply per task: every shard of a sharded warden gets the warden's full budget.
+    A task that overruns its budget is interrupted where the platform allows it, and its warden contributes no breaches.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        wardens: list[type[BaseWarden]] | tuple[type[BaseWarden], ...] | None = None,
+        *,
+        max_workers: int | None = None,
+        budgets: dict[str, float] | None = None,
+        default_budget: float | None = None,
+        snapshot: RepositorySnapshot | None = None,
+    ) -> None:
+        """
+        Args:
+            root: Path to the project root directory.
+            wardens: Warden classes to run, in report order. Defaults to DEFAULT_SWEEP_WARDENS.
+            max_workers: Process count; 1 runs every warden inline on a shared snapshot. Defaults to the CPU count.
+            budgets: Wall-clock seconds per warden class name, enforced on each of the warden's shards.
+            default_budget: Budget for wardens missing from `budgets`; None means unbounded.
+            snapshot: Snapshot used for shard planning and inline runs; built and refreshed per sweep when omitted.
+        """
+        self.root = Path(root)
+        self.wardens = tuple(wardens or DEFAULT_SWEEP_WARDENS)
+        self.max_workers = max(1, max_workers if max_workers is not None else (os.cpu_count() or 1))
+        self.budgets = dict(budgets or {})
+        self.default_budget = default_budget
+        self._snapshot = snapshot
+        self._snapshot_used = False
+        self._pool: ProcessPoolExecutor | None = None
+
+    def budget_for(self, warden_cls: type[BaseWarden]) -> float | None:
+        return self.budgets.get(warden_cls.__name__, self.default_budget)
+
+    def run(self) -> SweepResult:
+        """
+        Executes one sweep.
+
+        Returns:
+            The merged SweepResult with one WardenReport per warden.
+        """
+        start = time.perf_counter()
+        snapshot = self._next_snapshot()
+        tasks = self._plan(snapshot)
+        if self.max_workers == 1:
+            outcomes = [_execute(task, snapshot) for task in tasks]
+        else:
+            outcomes = self._run_pool(tasks)
+
+        result = SweepResult(self._merge(outcomes), time.perf_counter() - start, self.max_workers)
+        for report in result.reports:
+            status = "TIMEOUT" if report.timed_out else ("ERROR" if report.errors else "OK")
+            SovereignHUD.log(
+                "INFO",
+                f"Sweep: {report.warden} {status} — {len(report.breaches)} breaches, {report.files_processed} files, "
+                f"wall {report.wall_time * 1000:.0f}ms, cpu {report.cpu_time * 1000:.0f}ms",
+            )
+        return result
+
+    async def run_async(self) -> SweepResult:
+        """Asynchronous wrapper for run(); the pool does the work, the thread only waits on it."""
+        import asyncio
+        return await asyncio.to_thread(self.run)
+
+    def close(self) -> None:
+        """Shuts down the worker pool, if one was started; the next run() starts a fresh one."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> "WardenSweep":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _next_snapshot(self) -> RepositorySnapshot:
+        if self._snapshot is None:
+            self._snapshot = RepositorySnapshot(self.root)
+        elif self._snapshot_used:
+            self._snapshot = self._snapshot.refresh()
+        self._snapshot_used = True
+        return self._snapshot
+
+    def _plan(self, snapshot: RepositorySnapshot) -> list[_SweepTask]:
+        sweep_id = uuid.uuid4().hex
+        root = str(self.root)
+        tasks = []
+        for order, warden_cls in enumerate(self.wardens):
+            budget = self.budget_for(warden_cls)
+            if warden_cls.SHARD_SUFFIXES and self.max_workers > 1:
+                paths = [str(path) for path in snapshot.files(warden_cls.SHARD_SUFFIXES)]
+                shard_count = max(1, min(self.max_workers, len(paths) // SHARD_MIN_FILES))
+                for shard, chunk in enumerate(_chunks(paths, shard_count)):
+                    tasks.append(_SweepTask(order, shard, warden_cls, root, sweep_id, chunk, budget))
+            else:
+                tasks.append(_SweepTask(order, 0, warden_cls, root, sweep_id, None, budget))
+        return tasks
+
+    def _run_pool(self, tasks: list[_SweepTask]) -> list[_TaskOutcome]:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        outcomes, broken = [], False
+        futures = {self._pool.submit(_run_task, task): task for task in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                outcomes.append(future.result())
+            except Exception as exc:
+                # A crashed worker or an unpicklable result loses only this task.
+                broken = broken or isinstance(exc, BrokenProcessPool)
+                outcomes.append(_TaskOutcome(task.order, task.shard, [], error=f"{type(exc).__name__}: {exc}"))
+        if broken:
+            self.close()
+        return outcomes
+
+    def _merge(self, outcomes: list[_TaskOutcome]) -> list[WardenReport]:
+        reports = [WardenReport(warden_cls.__name__, budget=self.budget_for(warden_cls)) for warden_cls in self.wardens]
+        spans: dict[int, tuple[float, float]] = {}
+        for outcome in sorted(outcomes, key=lambda item: (item.order, item.shard)):
+            report = reports[outcome.order]
+            report.breaches.extend(outcome.breaches)
+            report.cpu_time += outcome.cpu_time
+            report.files_processed += outcome.files_processed
+            report.shards += 1
+            report.timed_out = report.timed_out or outcome.timed_out
+            if outcome.error:
+                report.errors.append(outcome.error)
+            if outcome.started:
+                first, last = spans.get(outcome.order, (outcome.started, outcome.started))
+                spans[outcome.order] = (min(first, outcome.started), max(last, outcome.started + outcome.wall_time))
+        for order, (first, last) in spans.items():
+            reports[order].wall_time = last - first
+        for report in reports:
+            if report.timed_out:
+                report.breaches = []
+        return reports
+
+
+def _chunks(items: list[str], count: int) -> list[list[str]]:
+    """Splits `items` into `count` contiguous, near-equal chunks, preserving order."""
+    size, extra = divmod(len(items), count)
+    chunks, start = [], 0
+    for index in range(count):
+        end = start + size + (1 if index < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+@contextmanager
+def _budget(seconds: float | None) -> Iterator[None]:
+    """Raises WardenTimeout in the current thread after `seconds`, via SIGALRM where the platform has it."""
+    if not seconds or not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def _expire(signum: int, frame: Any) -> None:
+        raise WardenTimeout(f"Budget of {seconds}s exceeded.")
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+# Per-worker snapshots keyed by root: (sweep_id, snapshot). Workers outlive a sweep, so the next one refreshes rather than rebuilds.
+_WORKER_SNAPSHOTS: dict[str, tuple[str, RepositorySnapshot]] = {}
+
+
+def _worker_snapshot(root: str, sweep_id: str) -> RepositorySnapshot:
+    current = _WORKER_SNAPSHOTS.get(root)
+    if current is not None and current[0] == sweep_id:
+        return current[1]
+    snapshot = current[1].refresh() if current is not None else RepositorySnapshot(Path(root))
+    _WORKER_SNAPSHOTS[root] = (sweep_id, snapshot)
+    return snapshot
+
+
+def _run_task(task: _SweepTask) -> _TaskOutcome:
+    """Pool entry point."""
+    return _execute(task, _worker_snapshot(task.root, task.sweep_id))
+
+
+def _execute(task: _SweepTask, snapshot: RepositorySnapshot) -> _TaskOutcome:
+    outcome = _TaskOutcome(task.order, task.shard, [], started=time.time())
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    with snapshot.tracking() as touched:
+        try:
+            with _budget(task.budget):
+                warden = task.warden_cls(Path(task.root), snapshot)
+                if task.paths is None:
+                    outcome.breaches = warden.scan()
+                else:
+                    outcome.breaches = warden.scan_files([Path(path) for path in task.paths])
+        except WardenTimeout:
+            outcome.timed_out = True
+            outcome.breaches = []
+        except Exception as exc:
+            outcome.error = f"{type(exc).__name__}: {exc}"
+    outcome.wall_time = time.perf_counter() - wall_start
+    outcome.cpu_time = time.process_time() - cpu_start
+    outcome.files_processed = len(touched)
+    return outcome
@@ -28,12 +28,10 @@ class TasteWarden(BaseWarden):
         """
         targets: list[dict[str, Any]] = []
 
-        for tsx_file in self.root.rglob("*.tsx"):
-            if self._should_ignore(tsx_file):
-                continue
-
+        snapshot = self.snapshot
+        for tsx_file in snapshot.files(".tsx"):
             try:
-                content = tsx_file.read_text(encoding='utf-8')
+                content = snapshot.read_text(tsx_file)
                 lines = content.splitlines()
 
                 for i, line in enumerate(lines):
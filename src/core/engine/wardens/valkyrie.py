@@ -4,28 +4,35 @@ Lore: "Choosers of the Slain."
 Purpose: Identify unused imports and unreachable code using Vulture.
 """
 
+import contextlib
+import pkgutil
 from pathlib import Path
 from typing import Any
 
 import vulture
+import vulture.core
 
+from src.core.engine.analysis_cache import AnalysisCache
 from src.core.engine.wardens.base import BaseWarden
 
 
+# Vulture.Vulture attributes holding defined (or unreachable) code items, in get_unused_code() order.
+VULTURE_COLLECTIONS = (
+    "defined_attrs", "defined_classes", "defined_funcs", "defined_imports",
+    "defined_methods", "defined_props", "defined_vars", "unreachable_code",
+)
+
+
 class ValkyrieWarden(BaseWarden):
+    CACHE_NAMESPACE = "valkyrie"
+    # Module tables depend on vulture's own visitor, so its version is part of the rule set.
+    RULES_VERSION = f"valkyrie-1:vulture-{vulture.__version__}"
+
     def scan(self) -> list[dict[str, Any]]:
         targets = []
         try:
             v = vulture.Vulture(verbose=False)
-            py_files = []
-
-            # Scavenge all python files not in ignored dirs
-            for p in self.root.rglob("*.py"):
-                if self._should_ignore(p):
-                    continue
-                py_files.append(str(p))
-
-            v.scavenge(py_files)
+            self._scavenge(v)
 
             # Get threshold from config or default to 60 (standard confidence)
             # The previous code used 20, but user requested it be configurable.
@@ -35,7 +42,7 @@ class ValkyrieWarden(BaseWarden):
 
             for item in raw_items:
                 # Ignore structural files
-                if "__init__.py" in item.filename:
+                if "__init__.py" in str(item.filename):
                     continue
 
                 if item.confidence < min_confidence:
@@ -58,3 +65,69 @@ class ValkyrieWarden(BaseWarden):
         except Exception:
             pass
         return targets
+
+    def _scavenge(self, v: "vulture.Vulture") -> None:
+        """
+        Equivalent of `Vulture.scavenge` over the snapshot's Python files, fed from its source cache.
+        Vulture's per-module state is independent, so each module's definition/usage table is persisted
+        by content hash and only new or changed modules are re-scanned; the unused-code set is then
+        recomputed from the merged tables. Set VALKYRIE_INCREMENTAL to false to always scan in full.
+        """
+        snapshot = self.snapshot
+        cache = AnalysisCache.for_root(self.root) if self.config.get("VALKYRIE_INCREMENTAL", True) else None
+        self.last_scavenge = {"modules": 0, "rescanned": 0}
+        with cache.batch() if cache is not None else contextlib.nullcontext():
+            for py_file in snapshot.files(".py"):
+                try:
+                    source = snapshot.read_text(py_file)
+                except (OSError, UnicodeDecodeError):
+                    continue
+
+                self.last_scavenge["modules"] += 1
+                if cache is None:
+                    self.last_scavenge["rescanned"] += 1
+                    v.scan(source, filename=py_file)
+                    continue
+
+                # Test-file and __init__ ignore rules depend on the path, so it is part of the key.
+                key = AnalysisCache.key(snapshot.content_hash(py_file), py_file.relative_to(self.root).as_posix())
+                table = cache.get(self.CACHE_NAMESPACE, self.RULES_VERSION, key)
+                if table is None:
+                    self.last_scavenge["rescanned"] += 1
+                    table = _module_table(source, py_file)
+                    cache.put(self.CACHE_NAMESPACE, self.RULES_VERSION, key, table)
+                _merge_table(v, table, py_file)
+
+        # Mirror scavenge(): load vulture's bundled whitelists for every module it saw imported.
+        for import_name in sorted({item.name for item in v.defined_imports}):
+            whitelist = Path("whitelists") / f"{import_name}_whitelist.py"
+            try:
+                data = pkgutil.get_data("vulture", str(whitelist))
+            except OSError:
+                # Most imported modules don't have a whitelist.
+                continue
+            if data is not None:
+                v.scan(data.decode("utf-8"), filename=whitelist)
+
+
+def _module_table(source: str, filename: Path) -> dict[str, Any]:
+    """Scans one module with a throwaway Vulture and returns its definitions and used names as JSON data."""
+    v = vulture.Vulture(verbose=False)
+    v.scan(source, filename=filename)
+    return {
+        "defined": [
+            [collection, item.name, item.typ, item.first_lineno, item.last_lineno, item.message, item.confidence]
+            for collection in VULTURE_COLLECTIONS
+            for item in getattr(v, collection)
+        ],
+        "used": sorted(v.used_names),
+    }
+
+
+def _merge_table(v: "vulture.Vulture", table: dict[str, Any], filename: Path) -> None:
+    """Replays a module table into `v` exactly as scanning the module would have."""
+    for collection, name, typ, first_lineno, last_lineno, message, confidence in table["defined"]:
+        getattr(v, collection).append(
+            vulture.core.Item(name, typ, Path(filename), first_lineno, last_lineno, message, confidence)
+        )
+    v.used_names.update(table["used"])
@@ -2,18 +2,20 @@ import sqlite3
 import time
 from pathlib import Path
 
+from src.core.engine.hall_connections import get_hall_connections
+
 class LeaseManager:
     """
     [🔒] THE FLOCK OF MUNINN: Task Leases
     Synchronizes concurrent Raven executions via a central FTS5 SQLite lock.
     """
     def __init__(self, project_root: Path):
-        self.db_path = project_root / ".stats" / "pennyone.db"
+        self.connections = get_hall_connections(project_root)
+        self.db_path = self.connections.db_path
         
     def _get_conn(self):
-        # Ensure directory exists just in case
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        return sqlite3.connect(self.db_path, timeout=10.0)
+        # Shared, serialized Hall writer; the manager creates `.stats/` on first open.
+        return self.connections.writer()
 
     def acquire_lease(self, target_path: str, agent_id: str = "ONE_MIND", duration_ms: int = 300000) -> bool:
         """
@@ -45,7 +47,6 @@ class LeaseManager:
                     "INSERT INTO task_leases (target_path, agent_id, lease_expiry) VALUES (?, ?, ?)",
                     (normalized_path, agent_id, expiry)
                 )
-                conn.commit()
                 return True
             except sqlite3.IntegrityError:
                 # Primary key constraint failed, meaning it's locked.
@@ -55,7 +56,6 @@ class LeaseManager:
                 if row and row[0] == agent_id:
                     # Renew the lease
                     cursor.execute("UPDATE task_leases SET lease_expiry = ? WHERE target_path = ?", (expiry, normalized_path))
-                    conn.commit()
                     return True
                 return False
 
@@ -68,4 +68,3 @@ class LeaseManager:
                 "DELETE FROM task_leases WHERE target_path = ? AND agent_id = ?",
                 (normalized_path, agent_id)
             )
-            conn.commit()
@@ -11,10 +11,12 @@ import os
 import sqlite3
 import subprocess
 import sys
+import time
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
+from src.core.engine.hall_connections import get_hall_connections
 from src.core.host_session import (
     HostProvider,
     expand_host_bridge_args,
@@ -31,7 +33,7 @@ from src.core.intelligence_contract import (
     normalize_intelligence_request,
 )
 from src.core.one_mind_bridge import resolve_one_mind_decision
-from src.core.synapse_db import ensure_healthy_synapse_db
+from src.core.synapse_db import SynapseStore
 
 OracleRunner = Callable[[int], Awaitable[None] | None]
 HostSessionRunner = Callable[[str, HostProvider], Awaitable[str] | str]
@@ -46,6 +48,10 @@ def _default_cli_bridge_args(provider: HostProvider, prompt: str) -> list[str]:
 class MimirClient:
     """Canonical Python bridge for Corvus Star intelligence requests."""
 
+    # Waiting on a Synapse row: the first look comes this soon after the oracle returns, and the gap
+    # doubles while the database stays untouched, up to `poll_interval`.
+    WAIT_BACKOFF_INITIAL_SECONDS = 0.005
+
     def __init__(
         self,
         project_root: Path | None = None,
@@ -67,6 +73,9 @@ class MimirClient:
         self.oracle_runner = oracle_runner
         self.poll_interval = poll_interval
         self.poll_attempts = poll_attempts
+        # The old fixed-interval poll gave up after `poll_attempts * poll_interval`; the wait keeps that budget.
+        self.response_timeout = poll_interval * poll_attempts
+        self._synapse: SynapseStore | None = None
 
     async def request(self, payload: IntelligenceRequest | dict[str, Any]) -> IntelligenceResponse:
         request = normalize_intelligence_request(payload, default_source="python:mimir")
@@ -131,7 +140,8 @@ class MimirClient:
         )
 
     async def close(self) -> None:
-        return None
+        if self._synapse is not None:
+            self._synapse.close()
 
     def _resolve_transport_mode(self, request: IntelligenceRequest) -> str:
         broker_active = self._read_hall_broker_active()
@@ -277,11 +287,10 @@ class MimirClient:
                 "synapse_db",
             )
 
-        for _ in range(self.poll_attempts):
-            row = self._read_synapse_row(synapse_id)
-            if row and row["status"] == "COMPLETED" and row["response"]:
-                return build_intelligence_success(request, row["response"], "synapse_db")
-            await asyncio.sleep(self.poll_interval)
+        row = await self._wait_for_synapse_row(synapse_id)
+        if row is not None:
+            self.synapse.store_response(effective_prompt, row["response"], synapse_id)
+            return build_intelligence_success(request, row["response"], "synapse_db")
 
         return build_intelligence_error(
             request,
@@ -324,8 +333,36 @@ class MimirClient:
             stderr = completed.stderr.strip() or completed.stdout.strip() or "Unknown oracle failure."
             raise RuntimeError(stderr)
 
+    @property
+    def synapse(self) -> SynapseStore:
+        if self._synapse is None:
+            self._synapse = SynapseStore.for_path(self.db_path)
+        return self._synapse
+
+    async def _wait_for_synapse_row(self, synapse_id: int) -> dict[str, Any] | None:
+        """
+        Waits for the oracle to complete `synapse_id`, re-reading the row only after another connection has
+        committed to the database. Returns None once `response_timeout` has passed.
+        """
+        deadline = time.monotonic() + self.response_timeout
+        delay = self.WAIT_BACKOFF_INITIAL_SECONDS
+        version = None
+        while True:
+            current = self.synapse.data_version()
+            if current != version:
+                version = current
+                delay = self.WAIT_BACKOFF_INITIAL_SECONDS
+                row = self._read_synapse_row(synapse_id)
+                if row and row["status"] == "COMPLETED" and row["response"]:
+                    return row
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max(self.poll_interval, self.WAIT_BACKOFF_INITIAL_SECONDS))
+
     def _ensure_db(self) -> None:
-        recovered, backup_path = ensure_healthy_synapse_db(self.db_path)
+        recovered, backup_path = self.synapse.open()
         if recovered:
             print(f"[MIMIR] Synapse DB was corrupt and has been rebuilt. Backup: {backup_path}")
 
@@ -336,7 +373,7 @@ class MimirClient:
 
         repo_id = f"repo:{str(self.project_root).replace(chr(92), '/').rstrip('/')}"
         try:
-            with sqlite3.connect(str(hall_db_path)) as conn:
+            with get_hall_connections(self.project_root).reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -356,36 +393,13 @@ class MimirClient:
             return False
 
     def _read_cached_response(self, prompt: str) -> str | None:
-        with sqlite3.connect(str(self.db_path)) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT response FROM synapse WHERE prompt = ? AND status = 'COMPLETED' ORDER BY id DESC",
-                (prompt,),
-            )
-            row = cursor.fetchone()
-            return row[0] if row and row[0] else None
+        return self.synapse.cached_response(prompt)
 
     def _create_pending_prompt(self, prompt: str) -> int:
-        with sqlite3.connect(str(self.db_path)) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO synapse (prompt, status) VALUES (?, ?)",
-                (prompt, "PENDING"),
-            )
-            conn.commit()
-            return int(cursor.lastrowid)
+        return self.synapse.create_pending(prompt)
 
     def _read_synapse_row(self, synapse_id: int) -> dict[str, Any] | None:
-        with sqlite3.connect(str(self.db_path)) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT response, status FROM synapse WHERE id = ?",
-                (synapse_id,),
-            )
-            row = cursor.fetchone()
-            if not row:
-                return None
-            return {"response": row[0], "status": row[1]}
+        return self.synapse.read_row(synapse_id)
 
 
 mimir = MimirClient()
@@ -32,6 +32,21 @@ class NornCoordinator:
         self.sync_tasks()
         return self.ledger.claim_next_bead(agent_id)
 
+    def peek_claimable_beads(self, limit: int) -> list[dict[str, Any]]:
+        """Lists the next claimable beads without claiming them."""
+        self.sync_tasks()
+        return self.ledger.peek_claimable_beads(limit)
+
+    def claim_bead(self, bead_id: int | str, agent_id: str) -> dict[str, Any] | None:
+        """Claims one specific bead; None when it is no longer claimable."""
+        bead = self.ledger.claim_bead(bead_id, agent_id)
+        return bead.to_public_dict() if bead else None
+
+    def release_bead(self, bead_id: int | str, agent_id: str, status: str = "OPEN") -> dict[str, Any] | None:
+        """Returns a bead claimed by `agent_id` to the queue when its work never started."""
+        bead = self.ledger.release_bead(bead_id, agent_id, status=status)
+        return bead.to_public_dict() if bead else None
+
     def complete_bead_work(self, bead_id: int | str, resolution_note: str | None = None) -> None:
         """Moves a claimed bead into review once implementation work is complete."""
         bead = self.ledger.get_bead(bead_id)
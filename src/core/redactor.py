@@ -3,16 +3,161 @@
 │ THE SHIELD OF PRIVACY: Automatically masks sensitive runes in logs and displays.                      │
 └──────────────────────────────────────────────────────────────────────────────────────────────────────┘
 """
+import os
 import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
 
 from src.tools.vault import SovereignVault
 
+STREAM_CHUNK_CHARS = 64 * 1024
+
+
+def _trie_pattern(values: list[str]) -> str:
+    """
+    Regex source for a trie of literal values. Every branch point starts with a distinct character and a
+    value ending at a node is only an optional (greedy) stop, so the longest value at a position always wins
+    and matching costs the secret length, not the secret count.
+    Emitted from an explicit stack, since a single vault secret (a PEM key, say) can run to thousands of characters.
+    """
+    trie: dict = {}
+    for value in values:
+        node = trie
+        for char in value:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    out: list[str] = []
+    stack: list[dict | str] = [trie]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            out.append(item)
+            continue
+        branches = sorted((char, child) for char, child in item.items() if char)
+        if not branches:
+            continue
+        grouped = "" in item or len(branches) > 1
+        parts: list[dict | str] = ["(?:"] if grouped else []
+        for index, (char, child) in enumerate(branches):
+            if index:
+                parts.append("|")
+            parts += [re.escape(char), child]
+        if grouped:
+            parts.append(")?" if "" in item else ")")
+        stack.extend(reversed(parts))
+    return "".join(out)
+
+
+def _compile(values: list[str]) -> re.Pattern[str]:
+    """The trie regex, or a longest-first alternation when its nesting is too deep for the regex compiler."""
+    try:
+        return re.compile(_trie_pattern(values))
+    except (RecursionError, re.error):
+        return re.compile("|".join(re.escape(value) for value in sorted(values, key=len, reverse=True)))
+
+
+class SecretMatcher:
+    """
+    Compiled matcher over literal secrets with leftmost-longest semantics.
+    Short texts (log lines, traces) go through one combined trie regex. Long texts from a small vault are
+    scanned per secret with `str.find` instead, whose C search outruns the regex until the vault is large.
+    """
+
+    SCAN_MIN_CHARS = 4096
+    SCAN_MAX_SECRETS = 256
+
+    def __init__(self, secrets: dict[str, str]) -> None:
+        # The first key holding a value names it, as the old per-secret loop did.
+        self._placeholders: dict[str, str] = {}
+        for key, val in secrets.items():
+            if val:
+                self._placeholders.setdefault(val, f"[REDACTED_{key}]")
+        self.max_len = max(map(len, self._placeholders), default=0)
+        self._pattern = _compile(list(self._placeholders)) if self._placeholders else None
+
+    def __len__(self) -> int:
+        return len(self._placeholders)
+
+    def subn(self, text: str) -> tuple[str, int]:
+        if self._pattern is None or not text:
+            return text, 0
+        if len(text) < self.SCAN_MIN_CHARS or len(self) > self.SCAN_MAX_SECRETS:
+            return self._pattern.subn(self._replace, text)
+        out, pos, count = [], 0, 0
+        for start, end in self._matches(text):
+            out.append(text[pos:start])
+            out.append(self._placeholders[text[start:end]])
+            pos = end
+            count += 1
+        out.append(text[pos:])
+        return "".join(out), count
+
+    def sub(self, text: str) -> str:
+        return self.subn(text)[0]
+
+    def redact_stream(self, source: TextIO, sink: TextIO, chunk_chars: int = STREAM_CHUNK_CHARS) -> int:
+        """
+        Redacts `source` into `sink` chunk by chunk and returns the number of secrets masked.
+        Only the last `max_len - 1` characters are held back, in case a secret straddles two chunks.
+        """
+        if self._pattern is None:
+            for chunk in iter(lambda: source.read(chunk_chars), ""):
+                sink.write(chunk)
+            return 0
+
+        count = 0
+        pending = ""
+        for chunk in iter(lambda: source.read(chunk_chars), ""):
+            buffer = pending + chunk
+            # A match starting before `settled` cannot grow with more input; later text waits for the next chunk.
+            settled = len(buffer) - (self.max_len - 1)
+            out, pos = [], 0
+            for start, end in self._matches(buffer):
+                if start >= settled:
+                    break
+                out.append(buffer[pos:start])
+                out.append(self._placeholders[buffer[start:end]])
+                pos = end
+                count += 1
+            cut = max(pos, settled)
+            out.append(buffer[pos:cut])
+            sink.write("".join(out))
+            pending = buffer[cut:]
+
+        tail, tail_count = self.subn(pending)
+        sink.write(tail)
+        return count + tail_count
+
+    def _matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Leftmost-longest, non-overlapping (start, end) spans in order."""
+        if len(self) > self.SCAN_MAX_SECRETS:
+            for match in self._pattern.finditer(text):
+                yield match.span()
+            return
+        hits = []
+        for val in self._placeholders:
+            start = text.find(val)
+            while start != -1:
+                hits.append((start, -len(val)))
+                start = text.find(val, start + 1)
+        hits.sort()
+        pos = 0
+        for start, neg_len in hits:
+            if start >= pos:
+                pos = start - neg_len
+                yield start, pos
+
+    def _replace(self, match: re.Match) -> str:
+        return self._placeholders[match.group(0)]
+
 
 class Redactor:
     """[ALFRED] A diligent filter to ensure no secrets are accidentally exposed."""
 
     _instance = None
-    _patterns = []
+    _matcher = SecretMatcher({})
 
     def __new__(cls):
         if cls._instance is None:
@@ -21,35 +166,35 @@ class Redactor:
         return cls._instance
 
     def _initialize(self) -> None:
-        """Loads secrets from the Vault and prepares regex patterns."""
+        """Loads secrets from the Vault and compiles them into one matcher."""
         try:
             vault = SovereignVault()
-            secrets = vault.get_secrets_map()
-
-            # Create a list of (key_name, sensitive_value)
-            # Sort by length descending to prevent partial matches
-            sorted_secrets = sorted(secrets.items(), key=lambda x: len(x[1]), reverse=True)
-
-            self._patterns = []
-            for key, val in sorted_secrets:
-                # Escape for regex and create a pattern
-                pattern = re.compile(re.escape(val))
-                self._patterns.append((key, pattern))
+            self._matcher = SecretMatcher(vault.get_secrets_map())
         except Exception:
-            self._patterns = []
+            self._matcher = SecretMatcher({})
 
     def redact(self, text: str) -> str:
-        """Applies all redaction patterns to the provided text."""
-        if not text:
-            return text
+        """Masks every secret in the provided text in a single pass."""
+        return self._matcher.sub(text)
 
-        redacted_text = text
-        for key, pattern in self._patterns:
-            # Replace with a themed placeholder
-            placeholder = f"[REDACTED_{key}]"
-            redacted_text = pattern.sub(placeholder, redacted_text)
+    def redact_stream(self, source: TextIO, sink: TextIO, chunk_chars: int = STREAM_CHUNK_CHARS) -> int:
+        """Redacts a text stream chunk by chunk without loading it whole. Returns the number of secrets masked."""
+        return self._matcher.redact_stream(source, sink, chunk_chars)
 
-        return redacted_text
+    def redact_file(self, source: str | Path, destination: str | Path | None = None) -> int:
+        """Redacts a (log) file into `destination`, or in place when omitted. Returns the number of secrets masked."""
+        source = Path(source)
+        target = Path(destination) if destination else source
+        tmp_path = target.with_name(f"{target.name}.redacting")
+        try:
+            # surrogateescape round-trips bytes that are not valid UTF-8 untouched
+            with open(source, encoding="utf-8", errors="surrogateescape", newline="") as src, \
+                 open(tmp_path, "w", encoding="utf-8", errors="surrogateescape", newline="") as dst:
+                count = self.redact_stream(src, dst)
+            os.replace(tmp_path, target)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return count
 
     @staticmethod
     def redact_shorthand(text: str) -> str:
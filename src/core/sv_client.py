@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+[O.D.I.N.] Sovereign Engine Client (sv_client.py)
+Thin client for a resident `sv_engine.py --serve`; same flags and output as sv_engine.py.
+Falls back to running sv_engine.py in-process when no resident engine is listening.
+"""
+
+# Intent: Resolve intents through the warm resident engine without paying interpreter, bootstrap and engine build per query.
+
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+SOCKET_NAME = "sv_engine.sock"
+
+
+def default_socket_path(project_root: Path | str | None = None) -> Path:
+    """CSTAR_ENGINE_SOCKET, or `.agents/sv_engine.sock` under the project root."""
+    override = os.getenv("CSTAR_ENGINE_SOCKET")
+    if override:
+        return Path(override)
+    return Path(project_root or os.getcwd()) / ".agents" / SOCKET_NAME
+
+
+class QueryServerUnavailable(ConnectionError):
+    """No resident engine is listening on the socket."""
+
+
+class QueryClient:
+    """Blocking JSON-lines client for a SovereignQueryServer; one connection, many requests."""
+
+    def __init__(self, socket_path: Path | str, timeout: float = 30.0) -> None:
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader: Any = None
+
+    def __enter__(self) -> "QueryClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if self._sock is None:
+            self._connect()
+        self._sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        line = self._reader.readline()
+        if not line:
+            self.close()
+            raise QueryServerUnavailable(f"Resident engine closed the connection on {self.socket_path}")
+        return json.loads(line)
+
+    def query(
+        self,
+        query: str,
+        *,
+        json_mode: bool = False,
+        record: bool = False,
+        cortex: bool = False,
+        benchmark: bool = False,
+    ) -> dict[str, Any]:
+        return self.request({"query": query, "json": json_mode, "record": record, "cortex": cortex, "benchmark": benchmark})
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = self._reader = None
+
+    def _connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError as e:
+            sock.close()
+            raise QueryServerUnavailable(f"No resident engine on {self.socket_path}: {e}") from e
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point for sv_client.py."""
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description="Corvus Star Sovereign Engine (resident client)")
+    parser.add_argument("query", nargs="*", help="Query phrase or intent")
+    parser.add_argument("--json", action="store_true", help="Output in JSON format")
+    parser.add_argument("--record", action="store_true", help="Record neural trace")
+    parser.add_argument("--benchmark", action="store_true", help="Display diagnostic info")
+    parser.add_argument("--cortex", action="store_true", help="Query the Knowledge Graph")
+    parser.add_argument("--socket", help="Resident engine socket (default: CSTAR_ENGINE_SOCKET or .agents/sv_engine.sock)")
+    parser.add_argument("--shutdown", action="store_true", help="Stop the resident engine")
+    args = parser.parse_args(argv)
+
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    try:
+        with QueryClient(socket_path) as client:
+            if args.shutdown:
+                response = client.request({"op": "shutdown"})
+            else:
+                response = client.query(
+                    " ".join(args.query),
+                    json_mode=args.json,
+                    record=args.record,
+                    cortex=args.cortex,
+                    benchmark=args.benchmark,
+                )
+    except QueryServerUnavailable:
+        if args.shutdown:
+            return 0
+        # No resident engine: behave exactly like sv_engine.py.
+        engine_path = Path(__file__).resolve().with_name("sv_engine.py")
+        engine_args = [a for a in argv if a != "--socket" and a != args.socket]
+        os.execv(sys.executable, [sys.executable, str(engine_path), *engine_args])
+        return 0  # execv only returns when stubbed out
+
+    if not response.get("ok"):
+        print(f"Resident engine error: {response.get('error')}", file=sys.stderr)
+        return 1
+    sys.stdout.write(response.get("output", ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,7 @@ Architecture: Spoke Decomposition (Context, Injector, Executor, Reporter, Builde
 # Intent: Core compute engine for natural language intent resolution and environment orchestration.
 
 import argparse
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -26,11 +27,13 @@ except (ImportError, ValueError, IndexError) as e:
 
 from src.core import utils
 from src.core.sovereign_hud import SovereignHUD
+from src.core.sv_client import default_socket_path
 from src.core.engine.builder import SovereignBuilder
 from src.core.engine.context import SovereignContext
 from src.core.engine.executor import SovereignExecutor
 from src.core.engine.injector import SovereignInjector
 from src.core.engine.orchestrator import SovereignOrchestrator
+from src.core.engine.query_server import SovereignQueryServer
 from src.core.engine.reporter import SovereignReporter
 
 
@@ -82,6 +85,26 @@ class SovereignEngine:
             json_mode=json_mode
         )
 
+    def render_diagnostic(self) -> None:
+        """Renders the --benchmark diagnostic box."""
+        ve = self.engine
+        SovereignHUD.box_top("DIAGNOSTIC")
+        SovereignHUD.box_row("ENGINE", "SovereignVector 2.5 (Iron)", SovereignHUD.CYAN)
+        SovereignHUD.box_row("PERSONA", SovereignHUD.PERSONA, SovereignHUD.MAGENTA)
+        SovereignHUD.box_separator()
+        SovereignHUD.box_row("SKILLS", f"{len(ve.skills)}", SovereignHUD.GREEN)
+        SovereignHUD.box_row("TOKENS", f"{len(ve.vocab)}", SovereignHUD.YELLOW)
+        SovereignHUD.box_row("VECTORS", f"{len(ve.vectors)}", SovereignHUD.CYAN)
+        SovereignHUD.box_bottom()
+
+    def input_fingerprint(self) -> bytes:
+        """Digest of the skill and lexicon files the vector engine was built from."""
+        return self.builder.input_fingerprint()
+
+    def reload(self) -> None:
+        """Rebuilds the vector engine from the current skill and lexicon files (resident mode)."""
+        self.engine = self.builder.build_vector_engine(self.injector.skills_db_path)
+
     def teardown(self) -> None:
         """Delegates teardown to the context spoke."""
         self.ctx.teardown(self.engine)
@@ -95,20 +118,20 @@ def main() -> None:
     parser.add_argument("--record", action="store_true", help="Record neural trace")
     parser.add_argument("--benchmark", action="store_true", help="Display diagnostic info")
     parser.add_argument("--cortex", action="store_true", help="Query the Knowledge Graph")
+    parser.add_argument("--serve", action="store_true", help="Run as a resident query server (see sv_client.py)")
+    parser.add_argument("--socket", help="Unix socket for --serve (default: CSTAR_ENGINE_SOCKET or .agents/sv_engine.sock)")
     args = parser.parse_args()
 
     engine = SovereignEngine()
 
+    if args.serve:
+        socket_path = args.socket or default_socket_path(engine.project_root)
+        SovereignHUD.persona_log("INFO", f"SovereignEngine: Resident mode listening on {socket_path}")
+        asyncio.run(SovereignQueryServer(engine, socket_path).serve_forever())
+        return
+
     if args.benchmark:
-        ve = engine.engine
-        SovereignHUD.box_top("DIAGNOSTIC")
-        SovereignHUD.box_row("ENGINE", "SovereignVector 2.5 (Iron)", SovereignHUD.CYAN)
-        SovereignHUD.box_row("PERSONA", SovereignHUD.PERSONA, SovereignHUD.MAGENTA)
-        SovereignHUD.box_separator()
-        SovereignHUD.box_row("SKILLS", f"{len(ve.skills)}", SovereignHUD.GREEN)
-        SovereignHUD.box_row("TOKENS", f"{len(ve.vocab)}", SovereignHUD.YELLOW)
-        SovereignHUD.box_row("VECTORS", f"{len(ve.vectors)}", SovereignHUD.CYAN)
-        SovereignHUD.box_bottom()
+        engine.render_diagnostic()
         sys.exit(0)
 
     query = utils.sanitize_query(" ".join(args.query))
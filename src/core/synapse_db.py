@@ -1,14 +1,25 @@
 """
 [Ω] Synapse DB repair helpers for Python runtimes.
-Purpose: Recover from malformed local Synapse stores without collapsing the caller.
+Purpose: Recover from malformed local Synapse stores without collapsing the caller, and serve the
+Python side of the Synapse transport from one long-lived, health-checked connection per database.
 """
 
 from __future__ import annotations
 
+import hashlib
 import os
 import sqlite3
+import threading
+import time
 from datetime import datetime, UTC
 from pathlib import Path
+from typing import Any
+
+BUSY_TIMEOUT_MS = 5000
+# Cached responses older than this are neither served nor kept; terminal queue rows share the horizon.
+DEFAULT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_CACHE_MAX_ENTRIES = 2048
+TERMINAL_STATUSES = ("COMPLETED", "FAILED")
 
 
 def _is_recoverable_sqlite_error(error: BaseException) -> bool:
@@ -34,10 +45,36 @@ def _initialize_synapse_schema(db_path: Path) -> None:
                 prompt TEXT,
                 response TEXT,
                 status TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                prompt_hash TEXT
             )
             """
         )
+        # Queues created by the Node runtime (or older clients) predate the prompt_hash column.
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(synapse)")}
+        if "prompt_hash" not in columns:
+            conn.execute("ALTER TABLE synapse ADD COLUMN prompt_hash TEXT")
+        # Response cache keyed by the SHA-256 of the effective prompt, so lookups never compare prompt text.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS synapse_cache (
+                prompt_hash TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                synapse_id INTEGER,
+                created_at REAL NOT NULL,
+                last_hit_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_synapse_cache_last_hit ON synapse_cache(last_hit_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_synapse_created_at ON synapse(created_at)")
+        conn.execute("DROP INDEX IF EXISTS idx_synapse_prompt")
+        # Serves cache misses for rows another runtime completed after this process last backfilled.
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_synapse_prompt_hash ON synapse(prompt_hash, id)")
+        # Finds rows written without a hash (the Node writer does not compute one) so a miss can key them first.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_synapse_unhashed ON synapse(id) WHERE prompt_hash IS NULL AND prompt IS NOT NULL"
+        )
 
 
 def _validate_synapse_db(db_path: Path) -> None:
@@ -67,3 +104,274 @@ def ensure_healthy_synapse_db(db_path: Path) -> tuple[bool, Path | None]:
         _initialize_synapse_schema(db_path)
         _validate_synapse_db(db_path)
         return True, backup_path
+
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+class SynapseStore:
+    """
+    Per-process handle on one Synapse database.
+    The health check and schema migration run once, when the connection is opened; the connection is then
+    reused until the file is deleted or replaced underneath it, or SQLite reports it malformed.
+    """
+
+    _registry: dict[tuple[int, str], SynapseStore] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        cache_ttl_seconds: float | None = None,
+        cache_max_entries: int | None = None,
+    ):
+        self.db_path = Path(db_path)
+        self.cache_ttl_seconds = (
+            cache_ttl_seconds
+            if cache_ttl_seconds is not None
+            else _env_number("CSTAR_SYNAPSE_CACHE_TTL", DEFAULT_CACHE_TTL_SECONDS)
+        )
+        self.cache_max_entries = int(
+            cache_max_entries
+            if cache_max_entries is not None
+            else _env_number("CSTAR_SYNAPSE_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES)
+        )
+        self.stats = {"opens": 0, "recoveries": 0, "evicted": 0}
+        self._conn: sqlite3.Connection | None = None
+        self._identity: tuple[int, int] | None = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_path(cls, db_path: Path | str) -> SynapseStore:
+        """Returns the shared store for `db_path` in this process, creating it on first use."""
+        key = (os.getpid(), os.path.abspath(db_path))
+        with cls._registry_lock:
+            store = cls._registry.get(key)
+            if store is None:
+                store = cls(db_path)
+                cls._registry[key] = store
+            return store
+
+    def open(self) -> tuple[bool, Path | None]:
+        """
+        Connects if needed and returns `ensure_healthy_synapse_db`'s (recovered, backup_path) for that
+        connect; (False, None) when the existing connection is still valid.
+        """
+        with self._lock:
+            if self._conn is not None and self._file_identity() == self._identity:
+                return False, None
+            self.close()
+            recovered, backup_path = ensure_healthy_synapse_db(self.db_path)
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=BUSY_TIMEOUT_MS / 1000,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+            self._conn = conn
+            self._identity = self._file_identity()
+            self.stats["opens"] += 1
+            self.stats["recoveries"] += int(recovered)
+            self._backfill_cache(conn)
+            self._evict(conn)
+            return recovered, backup_path
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._identity = None
+
+    def data_version(self) -> int:
+        """Changes whenever another connection commits to the database; reading it touches no pages."""
+        return int(self._run(lambda conn: conn.execute("PRAGMA data_version").fetchone()[0]))
+
+    def cached_response(self, prompt: str) -> str | None:
+        digest = prompt_hash(prompt)
+
+        def lookup(conn: sqlite3.Connection) -> str | None:
+            now = time.time()
+            row = conn.execute(
+                "SELECT response FROM synapse_cache WHERE prompt_hash = ? AND created_at >= ?",
+                (digest, now - self.cache_ttl_seconds),
+            ).fetchone()
+            if not row:
+                return self._completed_response(conn, digest, now)
+            conn.execute("UPDATE synapse_cache SET last_hit_at = ? WHERE prompt_hash = ?", (now, digest))
+            return row[0]
+
+        return self._run(lookup)
+
+    def store_response(self, prompt: str, response: str, synapse_id: int | None = None) -> None:
+        digest = prompt_hash(prompt)
+
+        def store(conn: sqlite3.Connection) -> None:
+            now = time.time()
+            conn.execute(
+                """
+                INSERT INTO synapse_cache (prompt_hash, response, synapse_id, created_at, last_hit_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(prompt_hash) DO UPDATE SET
+                    response = excluded.response,
+                    synapse_id = excluded.synapse_id,
+                    created_at = excluded.created_at,
+                    last_hit_at = excluded.last_hit_at
+                """,
+                (digest, response, synapse_id, now, now),
+            )
+            self._evict(conn)
+
+        self._run(store)
+
+    def create_pending(self, prompt: str) -> int:
+        return int(
+            self._run(
+                lambda conn: conn.execute(
+                    "INSERT INTO synapse (prompt, status, prompt_hash) VALUES (?, ?, ?)",
+                    (prompt, "PENDING", prompt_hash(prompt)),
+                ).lastrowid
+            )
+        )
+
+    def read_row(self, synapse_id: int) -> dict[str, Any] | None:
+        row = self._run(
+            lambda conn: conn.execute(
+                "SELECT response, status FROM synapse WHERE id = ?",
+                (synapse_id,),
+            ).fetchone()
+        )
+        if not row:
+            return None
+        return {"response": row[0], "status": row[1]}
+
+    def _run(self, operation):
+        with self._lock:
+            self.open()
+            assert self._conn is not None
+            try:
+                return operation(self._conn)
+            except sqlite3.DatabaseError as exc:
+                # The next call re-runs the health check, which rebuilds a malformed store.
+                if _is_recoverable_sqlite_error(exc):
+                    self.close()
+                raise
+
+    def _completed_response(self, conn: sqlite3.Connection, digest: str, now: float) -> str | None:
+        """
+        Falls back to the queue for a prompt the cache does not hold; the open-time backfill misses rows
+        completed after it ran or behind its id watermark. A hit is cached for the next lookup, but eviction
+        stays on the store path so a miss never pays for it.
+        """
+        self._hash_unkeyed_rows(conn)
+        row = conn.execute(
+            """
+            SELECT id, response, CAST(strftime('%s', created_at) AS REAL)
+            FROM synapse
+            WHERE prompt_hash = ? AND status = 'COMPLETED' AND response IS NOT NULL AND response != ''
+              AND created_at >= datetime(?, 'unixepoch')
+            ORDER BY id DESC
+            LIMIT 1
+            """,
+            (digest, now - self.cache_ttl_seconds),
+        ).fetchone()
+        if not row:
+            return None
+        synapse_id, response, created_at = row
+        conn.execute(
+            """
+            INSERT INTO synapse_cache (prompt_hash, response, synapse_id, created_at, last_hit_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(prompt_hash) DO UPDATE SET
+                response = excluded.response,
+                synapse_id = excluded.synapse_id,
+                created_at = excluded.created_at,
+                last_hit_at = excluded.last_hit_at
+            """,
+            (digest, response, synapse_id, created_at or now, now),
+        )
+        return response
+
+    def _hash_unkeyed_rows(self, conn: sqlite3.Connection) -> None:
+        """Fills prompt_hash on rows inserted by writers that leave it NULL."""
+        rows = conn.execute(
+            "SELECT id, prompt FROM synapse WHERE prompt_hash IS NULL AND prompt IS NOT NULL"
+        ).fetchall()
+        if rows:
+            conn.executemany(
+                "UPDATE synapse SET prompt_hash = ? WHERE id = ?",
+                [(prompt_hash(prompt), synapse_id) for synapse_id, prompt in rows],
+            )
+
+    def _backfill_cache(self, conn: sqlite3.Connection) -> None:
+        """Indexes completed rows written by other runtimes (or older clients) since the newest cached one."""
+        watermark = conn.execute("SELECT COALESCE(MAX(synapse_id), 0) FROM synapse_cache").fetchone()[0]
+        rows = conn.execute(
+            """
+            SELECT id, prompt, response, CAST(strftime('%s', created_at) AS REAL)
+            FROM synapse
+            WHERE id > ? AND status = 'COMPLETED' AND prompt IS NOT NULL AND response IS NOT NULL AND response != ''
+            ORDER BY id
+            """,
+            (watermark,),
+        ).fetchall()
+        if not rows:
+            return
+        now = time.time()
+        conn.executemany(
+            """
+            INSERT INTO synapse_cache (prompt_hash, response, synapse_id, created_at, last_hit_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(prompt_hash) DO UPDATE SET
+                response = excluded.response,
+                synapse_id = excluded.synapse_id,
+                created_at = excluded.created_at
+            """,
+            [
+                (prompt_hash(prompt), response, synapse_id, created_at or now, created_at or now)
+                for synapse_id, prompt, response, created_at in rows
+            ],
+        )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drops expired cache entries and terminal queue rows, then the least recently hit entries over the cap."""
+        horizon = time.time() - self.cache_ttl_seconds
+        evicted = conn.execute("DELETE FROM synapse_cache WHERE created_at < ?", (horizon,)).rowcount
+        evicted += conn.execute(
+            """
+            DELETE FROM synapse_cache WHERE prompt_hash IN (
+                SELECT prompt_hash FROM synapse_cache ORDER BY last_hit_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (max(0, self.cache_max_entries),),
+        ).rowcount
+        conn.execute(
+            f"""
+            DELETE FROM synapse
+            WHERE status IN ({", ".join("?" for _ in TERMINAL_STATUSES)})
+              AND created_at < datetime(?, 'unixepoch')
+            """,
+            (*TERMINAL_STATUSES, horizon),
+        )
+        self.stats["evicted"] += evicted
+
+    def _file_identity(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (stat.st_dev, stat.st_ino)
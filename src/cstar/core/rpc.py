@@ -6,11 +6,11 @@ Phase 1 Note: Transitional projection surface only. Runtime and Hall are authori
 """
 
 import json
-import sqlite3
 from pathlib import Path
 from typing import Any
 
 from src.core.engine.bead_ledger import BeadLedger
+from src.core.engine.hall_connections import get_hall_connections
 
 class SovereignRPC:
     def __init__(self, root_path: Path):
@@ -25,8 +25,7 @@ class SovereignRPC:
             return []
         
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+            conn = get_hall_connections(self.root).reader()
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -38,7 +37,6 @@ class SovereignRPC:
                 (limit,)
             )
             rows = cursor.fetchall()
-            conn.close()
             traces: list[dict[str, Any]] = []
             for row in rows:
                 payload = dict(row)
@@ -10,6 +10,7 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+from src.core.engine.hall_connections import get_hall_connections
 from src.games.odin_protocol.engine.models import UniverseState
 from src.games.odin_protocol.engine.persistence import OdinPersistence
 
@@ -89,8 +90,7 @@ class CampaignUpdater:
             return []
 
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
+            conn = get_hall_connections(self.project_root).reader()
             cursor = conn.cursor()
             
             cursor.execute(
@@ -103,7 +103,6 @@ class CampaignUpdater:
                 (last_id,)
             )
             rows = cursor.fetchall()
-            conn.close()
 
             traces: list[dict[str, Any]] = []
             for row in rows:
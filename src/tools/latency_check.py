@@ -5,10 +5,13 @@ Measures Sovereign Engine search and startup performance metrics.
 Encapsulated for the Linscott Standard.
 """
 
+import argparse
 import contextlib
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 import time
 
 
@@ -23,7 +26,9 @@ class LatencyProfiler:
         self.scripts_dir = os.path.dirname(os.path.abspath(__file__))
         self.agent_dir = os.path.dirname(self.scripts_dir)
         self.project_root = os.path.dirname(self.agent_dir)
-        self.engine_path = os.path.join(self.scripts_dir, "sv_engine.py")
+        self.core_dir = os.path.join(self.project_root, "src", "core")
+        self.engine_path = os.path.join(self.core_dir, "sv_engine.py")
+        self.client_path = os.path.join(self.core_dir, "sv_client.py")
 
     def measure_startup(self) -> float:
         """
@@ -83,15 +88,86 @@ class LatencyProfiler:
 
         return sum(latencies) / len(latencies) if latencies else 5000.0
 
+    def measure_resident(self, query: str = "check logs", ready_timeout: float = 60.0) -> dict[str, float]:
+        """
+        Compares a query per sv_engine.py process against a resident `sv_engine.py --serve`.
+
+        Returns:
+            Average latency in milliseconds for `subprocess` (sv_engine.py per query),
+            `client` (sv_client.py per query) and `socket` (one warm QueryClient connection).
+        """
+        from src.core.sv_client import QueryClient, QueryServerUnavailable
+
+        socket_path = os.path.join(tempfile.mkdtemp(prefix="cstar-latency-"), "sv_engine.sock")
+        server = subprocess.Popen(
+            [sys.executable, self.engine_path, "--serve", "--socket", socket_path],
+            cwd=self.project_root,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + ready_timeout
+            while True:
+                try:
+                    with QueryClient(socket_path) as client:
+                        client.request({"op": "ping"})
+                    break
+                except QueryServerUnavailable:
+                    if server.poll() is not None or time.monotonic() > deadline:
+                        raise RuntimeError("Resident engine failed to start") from None
+                    time.sleep(0.05)
+
+            results = {"subprocess": self.measure_search(query)}
+            results["client"] = self._average_run(
+                [sys.executable, self.client_path, "--socket", socket_path, "--json", query]
+            )
+            latencies: list[float] = []
+            with QueryClient(socket_path) as client:
+                for _ in range(self.iterations):
+                    start = time.perf_counter()
+                    client.query(query, json_mode=True)
+                    latencies.append((time.perf_counter() - start) * 1000)
+            results["socket"] = sum(latencies) / len(latencies)
+            return results
+        finally:
+            with contextlib.suppress(QueryServerUnavailable), QueryClient(socket_path) as client:
+                client.request({"op": "shutdown"})
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+            shutil.rmtree(os.path.dirname(socket_path), ignore_errors=True)
+
+    def _average_run(self, cmd: list[str], timeout: float = 5) -> float:
+        latencies: list[float] = []
+        for _ in range(self.iterations):
+            try:
+                start = time.perf_counter()
+                subprocess.run(cmd, capture_output=True, cwd=self.project_root, timeout=timeout, check=False)
+                latencies.append((time.perf_counter() - start) * 1000)
+            except (subprocess.SubprocessError, subprocess.TimeoutExpired):
+                latencies.append(timeout * 1000)
+        return sum(latencies) / len(latencies) if latencies else timeout * 1000
+
 
 def main() -> None:
     """Entry point for command line profiling."""
+    parser = argparse.ArgumentParser(description="Sovereign Engine latency profiler")
+    parser.add_argument("iterations", nargs="?", default="5", help="Runs per measurement")
+    parser.add_argument("--resident", action="store_true", help="Compare per-query processes with a resident engine")
+    args = parser.parse_args()
+
     iterations = 5
-    if len(sys.argv) > 1:
-        with contextlib.suppress(ValueError):
-            iterations = int(sys.argv[1])
+    with contextlib.suppress(ValueError):
+        iterations = int(args.iterations)
 
     profiler = LatencyProfiler(iterations=iterations)
+    if args.resident:
+        # CSV: Subprocess,Client,Socket
+        resident = profiler.measure_resident()
+        print(",".join(f"{resident[k]:.2f}" for k in ("subprocess", "client", "socket")))
+        return
+
     avg_startup = profiler.measure_startup()
     avg_search = profiler.measure_search()
 
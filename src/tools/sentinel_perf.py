@@ -6,6 +6,7 @@ Sentinel Perf: Engine Latency Profiler
 Profiles engine search vs. direct regex matching to identify bottlenecks.
 """
 
+import asyncio
 import os
 import sys
 import time
@@ -52,6 +53,15 @@ class SentinelPerf:
         end = time.perf_counter()
         return (end - start) / iterations * 1000
 
+    def profile_search_batch(self, queries: list[str]) -> float:
+        """Measure per-query latency when the whole workload goes through one `search_many` call."""
+        if not queries:
+            return 0.0
+        start = time.perf_counter()
+        asyncio.run(self.engine.search_many(queries))
+        end = time.perf_counter()
+        return (end - start) / len(queries) * 1000
+
     def profile_tokenization(self, text: str, iterations: int = 1000) -> float:
         """Measure tokenization latency."""
         start = time.perf_counter()
@@ -0,0 +1,107 @@
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.core.engine.bead_ledger import BeadLedger  # noqa: E402
+
+LEDGER_SIZES = (1_000, 10_000, 100_000)
+CLAIMS_PER_RUN = 50
+
+
+def seed_ledger(root: Path, bead_count: int) -> BeadLedger:
+    (root / ".agents").mkdir(parents=True, exist_ok=True)
+    (root / ".agents" / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+    ledger = BeadLedger(root)
+    repo_id = ledger.repository.repo_id
+    now = int(time.time() * 1000)
+    rows = []
+    for index in range(bead_count):
+        status = ("SET", "OPEN", "OPEN", "RESOLVED", "BLOCKED")[index % 5]
+        rows.append(
+            (
+                f"bead:bench:{index:06d}",
+                repo_id,
+                "FILE",
+                f"src/bench/module_{index % 500}.py",
+                f"src/bench/module_{index % 500}.py",
+                f"Benchmark bead {index}",
+                json.dumps([f"file:src/bench/module_{index % 500}.py"]),
+                json.dumps({"overall": round((index * 7919) % 1000 / 100, 2)}),
+                "Raise the module score above 5.0.",
+                status,
+                "SYSTEM",
+                "Benchmark blocker." if status == "BLOCKED" else None,
+                now + index,
+                now + index,
+            )
+        )
+    with ledger.connect() as conn:
+        conn.executemany(
+            """
+            INSERT INTO hall_beads (
+                bead_id, repo_id, target_kind, target_ref, target_path, rationale, contract_refs_json,
+                baseline_scores_json, acceptance_criteria, status, source_kind, triage_reason, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+    return ledger
+
+
+def legacy_claim(ledger: BeadLedger, agent_id: str):
+    """The pre-index claim path: load every SET/OPEN row, filter and sort in Python, then CAS-update."""
+    with ledger.connect() as conn:
+        rows = conn.execute(
+            "SELECT * FROM hall_beads WHERE repo_id = ? AND status IN ('SET', 'OPEN')",
+            (ledger.repository.repo_id,),
+        ).fetchall()
+        beads = sorted(
+            (ledger._row_to_bead(row) for row in rows if ledger._is_claimable(ledger._row_to_bead(row))),
+            key=ledger._claim_sort_key,
+        )
+        if not beads:
+            return None
+        return ledger._claim_bead_in_transaction(conn, beads[0], agent_id)
+
+
+def measure(claim, ledger: BeadLedger) -> float:
+    start = time.perf_counter()
+    for index in range(CLAIMS_PER_RUN):
+        claim(ledger, f"RAVEN-{index}")
+    elapsed = time.perf_counter() - start
+    return CLAIMS_PER_RUN / elapsed if elapsed else float("inf")
+
+
+def run_benchmark():
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🔱 BEAD CLAIM THROUGHPUT BENCHMARK                                           │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+    print("| Beads | Legacy (claims/s) | Indexed (claims/s) | Speedup |")
+    print("| :--- | :--- | :--- | :--- |")
+
+    for bead_count in LEDGER_SIZES:
+        legacy_root = Path(tempfile.mkdtemp(prefix="bead-claim-legacy-"))
+        indexed_root = Path(tempfile.mkdtemp(prefix="bead-claim-indexed-"))
+        try:
+            legacy_rate = measure(legacy_claim, seed_ledger(legacy_root, bead_count))
+            indexed_rate = measure(
+                lambda ledger, agent_id: ledger._claim_next_indexed_bead(agent_id),
+                seed_ledger(indexed_root, bead_count),
+            )
+        finally:
+            shutil.rmtree(legacy_root, ignore_errors=True)
+            shutil.rmtree(indexed_root, ignore_errors=True)
+        print(f"| {bead_count:,} | {legacy_rate:,.1f} | {indexed_rate:,.1f} | {indexed_rate / legacy_rate:,.1f}x |")
+
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+
+if __name__ == "__main__":
+    run_benchmark()
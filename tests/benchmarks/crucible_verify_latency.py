@@ -0,0 +1,84 @@
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.core.engine.ravens.muninn_crucible import MuninnCrucible  # noqa: E402
+from src.core.engine.ravens.pytest_pool import PytestWorkerPool  # noqa: E402
+
+CANDIDATES = 12
+WORKLOADS = {
+    "plain": "",
+    "numpy": "import numpy\n",
+}
+
+
+def build_project(root: Path, header: str) -> list[Path]:
+    (root / "app").mkdir()
+    (root / "app" / "__init__.py").write_text("", encoding="utf-8")
+    (root / "tests").mkdir()
+    tests = []
+    for i in range(CANDIDATES):
+        (root / "app" / f"target_{i}.py").write_text(f"VALUE = {i}\n", encoding="utf-8")
+        test = root / "tests" / f"test_target_{i}.py"
+        test.write_text(
+            f"{header}from app.target_{i} import VALUE\n\n\ndef test_value():\n    assert VALUE == {i}\n",
+            encoding="utf-8",
+        )
+        tests.append(test)
+    return tests
+
+
+def per_candidate_ms(crucible: MuninnCrucible, root: Path, tests: list[Path]) -> list[float]:
+    timings = []
+    for test in tests:
+        start = time.perf_counter()
+        result = crucible.verify_fix_result(test, cwd=root)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert result.verdict == "ACCEPTED", result.summary
+    return timings
+
+
+def run_benchmark():
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  ⚒️ CRUCIBLE VERIFICATION LATENCY (cold subprocess vs warm worker pool)       │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+    if not PytestWorkerPool.supported():
+        print("SKIP: warm workers need os.fork.")
+        return
+
+    print("| Workload | Cold mean (ms) | Warm first (ms) | Warm mean after first (ms) | Warm p95 (ms) | Speedup |")
+    print("| :--- | :--- | :--- | :--- | :--- | :--- |")
+    for name, header in WORKLOADS.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            tests = build_project(root, header)
+
+            cold = per_candidate_ms(MuninnCrucible(root, MagicMock()), root, tests)
+
+            crucible = MuninnCrucible(root, MagicMock(), max_concurrency=1)
+            preload = PytestWorkerPool.PRELOAD_MODULES + ((name,) if header else ())
+            crucible.worker_pool = PytestWorkerPool(root, preload=preload)
+            try:
+                warm = per_candidate_ms(crucible, root, tests)
+            finally:
+                crucible.close()
+
+        steady = warm[1:]
+        p95 = statistics.quantiles(steady, n=20)[-1]
+        print(
+            f"| {name} | {statistics.mean(cold):,.0f} | {warm[0]:,.0f} | {statistics.mean(steady):,.0f} "
+            f"| {p95:,.0f} | {statistics.mean(cold) / statistics.mean(steady):,.1f}x |"
+        )
+
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,111 @@
+import ast
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import radon.complexity as cc
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.core.engine.gungnir.logic_metrics import measure_logic  # noqa: E402
+from src.core.engine.gungnir.universal import UniversalGungnir  # noqa: E402
+from src.core.engine.wardens.snapshot import RepositorySnapshot  # noqa: E402
+
+ROUNDS = 3
+
+
+def legacy_audit(code: str) -> list[dict[str, Any]]:
+    """The multi-pass Python logic rules (two parses, two walks, two line scans) the fused visitor replaced."""
+    breaches = []
+    try:
+        tree = ast.parse(code)
+        results = cc.cc_visit(code)
+        avg_cc = sum(r.complexity for r in results) / len(results) if results else 1
+        if avg_cc > 15:
+            breaches.append({"severity": "HIGH", "action": f"GUNGNIR_LOGIC_BREACH: High Complexity ({avg_cc:.1f}). Refactor God Methods."})
+        imports = [node for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))]
+        if len(imports) > 10:
+            breaches.append({"severity": "MEDIUM", "action": f"GUNGNIR_COUPLING_BREACH: Over-entangled ({len(imports)} imports). Isolate dependencies."})
+        lines = code.split('\n')
+        total_lines = len(lines)
+        doc_lines = sum(1 for line in lines if line.strip().startswith(('#', '"""', "'''")))
+        if total_lines > 20 and (doc_lines / total_lines) < 0.15:
+            breaches.append({"severity": "MEDIUM", "action": f"GUNGNIR_INTEL_BREACH: Low documentation ratio ({doc_lines/total_lines:.2f}). Add intents/docstrings."})
+        for node in [n for n in ast.walk(tree) if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))]:
+            setup_steps = sum(isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign)) for stmt in node.body)
+            execution_steps = sum(isinstance(stmt, (ast.Return, ast.Expr, ast.Raise, ast.Yield, ast.YieldFrom)) for stmt in node.body)
+            if execution_steps and setup_steps / execution_steps > 1.7:
+                breaches.append({
+                    "severity": "MEDIUM",
+                    "action": f"GUNGNIR_LOGIC_BREACH: top-heavy setup detected ({setup_steps/execution_steps:.1f}). Reduce preamble before execution."
+                })
+                break
+        consecutive = 0
+        for line in lines:
+            if line.strip() and not line.strip().startswith('#'):
+                consecutive += 1
+                if consecutive > 12:
+                    breaches.append({"severity": "LOW", "action": "GUNGNIR_STYLE_BREACH: Claustrophobic code block (>12 lines)."})
+                    break
+            else:
+                consecutive = 0
+    except Exception as e:
+        breaches.append({"severity": "CRITICAL", "action": f"GUNGNIR_PARSE_ERROR: {e}"})
+    return breaches
+
+
+def timed(audit, sources: list[str]) -> tuple[float, list[list[dict[str, Any]]]]:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        reports = [audit(code) for code in sources]
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, reports
+
+
+def run_benchmark(root: Path | None = None):
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🔱 GUNGNIR LOGIC AUDIT (multi-pass rules vs fused single-walk visitor)       │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+    root = root or PROJECT_ROOT
+    snapshot = RepositorySnapshot(root)
+    sources = []
+    for path in snapshot.files(".py", under="src"):
+        try:
+            sources.append(snapshot.read_text(path))
+        except (OSError, UnicodeDecodeError):
+            continue
+
+    gungnir = UniversalGungnir()
+    legacy_ms, legacy_reports = timed(legacy_audit, sources)
+    fused_ms, fused_reports = timed(lambda code: gungnir.audit_logic(code, ".py"), sources)
+
+    mismatched_cc = 0
+    for code in sources:
+        try:
+            blocks = cc.cc_visit(code)
+        except SyntaxError:
+            continue
+        if sorted(b.complexity for b in blocks) != sorted(measure_logic(code).block_complexities):
+            mismatched_cc += 1
+
+    breaches = sum(len(report) for report in fused_reports)
+    print(f"Tree: {root / 'src'} | Files: {len(sources)} | Lines: {sum(code.count(chr(10)) + 1 for code in sources):,}")
+    print("| Audit | Best of 3 (ms) | Per file (ms) | Speedup | Breaches |")
+    print("| :--- | :--- | :--- | :--- | :--- |")
+    for label, elapsed_ms in (("Multi-pass (before)", legacy_ms), ("Fused visitor (after)", fused_ms)):
+        print(f"| {label} | {elapsed_ms:.1f} | {elapsed_ms / len(sources):.3f} | {legacy_ms / elapsed_ms:.2f}x | {breaches} |")
+    print(f"Files whose block complexities differ from radon: {mismatched_cc}")
+
+    if fused_reports != legacy_reports or mismatched_cc:
+        print("FAIL: Fused visitor diverged from the multi-pass rules.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else None
+    run_benchmark(target)
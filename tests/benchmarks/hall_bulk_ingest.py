@@ -0,0 +1,82 @@
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.core.engine.hall_schema import HallFileRecord, HallOfRecords, HallScanRecord  # noqa: E402
+
+SCAN_SIZES = (5_000, 50_000)
+# Per-record writes are sampled and extrapolated; a full 50k single-record run takes minutes.
+PER_RECORD_SAMPLE = 2_000
+
+
+def seed_hall(root: Path) -> tuple[HallOfRecords, str]:
+    (root / ".agents").mkdir(parents=True, exist_ok=True)
+    (root / ".agents" / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+    hall = HallOfRecords(root)
+    repo = hall.bootstrap_repository()
+    hall.record_scan(
+        HallScanRecord(
+            scan_id="scan:bench",
+            repo_id=repo.repo_id,
+            scan_kind="P1_SCAN",
+            status="COMPLETED",
+            started_at=1700000000000,
+        )
+    )
+    return hall, repo.repo_id
+
+
+def file_records(repo_id: str, count: int):
+    for index in range(count):
+        yield HallFileRecord(
+            repo_id=repo_id,
+            scan_id="scan:bench",
+            path=f"src/bench/pkg_{index % 200}/module_{index}.py",
+            content_hash=f"{index:040x}",
+            language="python",
+            gungnir_score=round((index * 7919) % 1000 / 100, 2),
+            imports=[{"source": "./dep", "local": "helper", "imported": "helper"}],
+            exports=["run"],
+            created_at=1700000000000 + index,
+        )
+
+
+def run_benchmark():
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🔱 HALL BULK INGEST BENCHMARK                                                │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+    print("| Files | record_file (s, extrapolated) | record_files_bulk (s) | Speedup |")
+    print("| :--- | :--- | :--- | :--- |")
+
+    for file_count in SCAN_SIZES:
+        single_root = Path(tempfile.mkdtemp(prefix="hall-ingest-single-"))
+        bulk_root = Path(tempfile.mkdtemp(prefix="hall-ingest-bulk-"))
+        try:
+            hall, repo_id = seed_hall(single_root)
+            sample = min(file_count, PER_RECORD_SAMPLE)
+            start = time.perf_counter()
+            for record in file_records(repo_id, sample):
+                hall.record_file(record)
+            single_seconds = (time.perf_counter() - start) * file_count / sample
+
+            hall, repo_id = seed_hall(bulk_root)
+            start = time.perf_counter()
+            hall.record_files_bulk("scan:bench", file_records(repo_id, file_count))
+            bulk_seconds = time.perf_counter() - start
+        finally:
+            shutil.rmtree(single_root, ignore_errors=True)
+            shutil.rmtree(bulk_root, ignore_errors=True)
+        print(f"| {file_count:,} | {single_seconds:,.2f} | {bulk_seconds:,.2f} | {single_seconds / bulk_seconds:,.1f}x |")
+
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+
+if __name__ == "__main__":
+    run_benchmark()
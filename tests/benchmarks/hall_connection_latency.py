@@ -0,0 +1,129 @@
+import json
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.core.engine.bead_ledger import BeadLedger  # noqa: E402
+from src.core.engine.hall_schema import HallBeadRecord, HallOfRecords  # noqa: E402
+from src.core.lease_manager import LeaseManager  # noqa: E402
+
+OPERATIONS_PER_RUN = 500
+
+
+class LegacyHall(HallOfRecords):
+    """The pre-pool Hall: a fresh connection with PRAGMA setup per operation and a schema pass per call."""
+
+    def connect(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT_MS / 1000)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA busy_timeout={self.BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def read(self):
+        return self.connect()
+
+    def ensure_schema(self) -> None:
+        self.connections.schema_ready = False
+        super().ensure_schema()
+
+
+class LegacyLeaseManager(LeaseManager):
+    def _get_conn(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        return sqlite3.connect(self.db_path, timeout=10.0)
+
+
+def seed_workspace(root: Path) -> tuple[str, str]:
+    (root / ".agents").mkdir(parents=True, exist_ok=True)
+    (root / ".agents" / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+    ledger = BeadLedger(root)
+    bead = ledger.upsert_bead(
+        target_path="src/bench/module.py",
+        rationale="Benchmark bead",
+        contract_refs=["contract:bench"],
+        acceptance_criteria="Raise the module score above 5.0.",
+    )
+    return ledger.repository.repo_id, bead.scan_id
+
+
+def operations(hall: HallOfRecords, leases: LeaseManager, seed: tuple[str, str]) -> dict:
+    repo_id, scan_id = seed
+
+    def read_repository(index: int) -> None:
+        hall.get_repository_record()
+
+    def read_bead(index: int) -> None:
+        with hall.read() as conn:
+            conn.execute("SELECT * FROM hall_beads WHERE repo_id = ? LIMIT 1", (repo_id,)).fetchone()
+
+    def write_bead(index: int) -> None:
+        hall.upsert_bead(
+            HallBeadRecord(
+                bead_id=f"bead:bench:{index:05d}",
+                repo_id=repo_id,
+                scan_id=scan_id,
+                target_path="src/bench/module.py",
+                rationale=f"Benchmark write {index}",
+                status="OPEN",
+                created_at=1700000000000 + index,
+                updated_at=1700000000000 + index,
+            )
+        )
+
+    def lease_cycle(index: int) -> None:
+        leases.acquire_lease(f"src/bench/lease_{index}.py", "RAVEN-BENCH")
+        leases.release_lease(f"src/bench/lease_{index}.py", "RAVEN-BENCH")
+
+    return {
+        "get_repository_record": read_repository,
+        "bead read": read_bead,
+        "upsert_bead": write_bead,
+        "lease acquire+release": lease_cycle,
+    }
+
+
+def measure(operation) -> float:
+    start = time.perf_counter()
+    for index in range(OPERATIONS_PER_RUN):
+        operation(index)
+    return (time.perf_counter() - start) / OPERATIONS_PER_RUN * 1_000_000
+
+
+def run_benchmark():
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🔱 HALL CONNECTION LATENCY BENCHMARK                                         │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+    print("| Operation | Per-call connections (µs/op) | Pooled (µs/op) | Speedup |")
+    print("| :--- | :--- | :--- | :--- |")
+
+    legacy_root = Path(tempfile.mkdtemp(prefix="hall-conn-legacy-"))
+    pooled_root = Path(tempfile.mkdtemp(prefix="hall-conn-pooled-"))
+    try:
+        legacy_ops = operations(
+            LegacyHall(legacy_root), LegacyLeaseManager(legacy_root), seed_workspace(legacy_root)
+        )
+        pooled_ops = operations(HallOfRecords(pooled_root), LeaseManager(pooled_root), seed_workspace(pooled_root))
+        for name, legacy_op in legacy_ops.items():
+            legacy_us = measure(legacy_op)
+            pooled_us = measure(pooled_ops[name])
+            print(f"| {name} | {legacy_us:,.1f} | {pooled_us:,.1f} | {legacy_us / pooled_us:,.1f}x |")
+    finally:
+        shutil.rmtree(legacy_root, ignore_errors=True)
+        shutil.rmtree(pooled_root, ignore_errors=True)
+
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,98 @@
+import io
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.core.redactor import SecretMatcher  # noqa: E402
+
+SECRET_COUNTS = (10, 100, 1_000)
+LOG_LINES = 20_000
+SECRET_LINE_RATE = 0.05
+ROUNDS = 3
+
+
+def build_workload(count: int, rng: random.Random):
+    alphabet = string.ascii_letters + string.digits + "-_"
+    secrets = {f"SECRET_{i}": "".join(rng.choice(alphabet) for _ in range(rng.randint(16, 40))) for i in range(count)}
+    values = list(secrets.values())
+    words = ["engine", "query", "resolved", "trace", "latency", "warden", "skill", "intent", "vault", "status=ok"]
+    lines = []
+    for i in range(LOG_LINES):
+        line = f"2026-01-01T00:00:{i % 60:02d} INFO " + " ".join(rng.choice(words) for _ in range(10))
+        if rng.random() < SECRET_LINE_RATE:
+            line += f" token={rng.choice(values)}"
+        lines.append(line)
+    return secrets, "\n".join(lines) + "\n"
+
+
+def legacy_redact(text: str, patterns: list[tuple[str, re.Pattern]]) -> str:
+    """The previous Redactor.redact: one compiled pattern per secret, applied longest first."""
+    for key, pattern in patterns:
+        text = pattern.sub(f"[REDACTED_{key}]", text)
+    return text
+
+
+def best_ms(fn) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def run_benchmark():
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🛡️ REDACTOR BENCHMARK (per-secret loop vs SecretMatcher)                    │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+    print(
+        "| Secrets | Compile (ms) | Per line: legacy (ms) | Per line: matcher (ms) | Speedup "
+        "| Whole log: legacy (ms) | Whole log: matcher (ms) | Stream (ms) | Speedup | Identical |"
+    )
+    print("| :--- | :--- | :--- | :--- | :--- | :--- | :--- | :--- | :--- | :--- |")
+
+    rng = random.Random(42)
+    for count in SECRET_COUNTS:
+        secrets, text = build_workload(count, rng)
+        patterns = [
+            (key, re.compile(re.escape(val)))
+            for key, val in sorted(secrets.items(), key=lambda item: len(item[1]), reverse=True)
+        ]
+
+        start = time.perf_counter()
+        matcher = SecretMatcher(secrets)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        lines = text.splitlines(keepends=True)
+        line_legacy_ms = best_ms(lambda lines=lines, patterns=patterns: [legacy_redact(line, patterns) for line in lines])
+        line_ms = best_ms(lambda lines=lines, matcher=matcher: [matcher.sub(line) for line in lines])
+        legacy_ms = best_ms(lambda text=text, patterns=patterns: legacy_redact(text, patterns))
+        single_ms = best_ms(lambda text=text, matcher=matcher: matcher.sub(text))
+        stream_ms = best_ms(lambda text=text, matcher=matcher: matcher.redact_stream(io.StringIO(text), io.StringIO()))
+
+        sink = io.StringIO()
+        matcher.redact_stream(io.StringIO(text), sink)
+        expected = legacy_redact(text, patterns)
+        identical = (
+            matcher.sub(text) == expected
+            and sink.getvalue() == expected
+            and "".join(matcher.sub(line) for line in lines) == expected
+        )
+        print(
+            f"| {count:,} | {compile_ms:,.1f} | {line_legacy_ms:,.1f} | {line_ms:,.1f} | {line_legacy_ms / line_ms:,.1f}x "
+            f"| {legacy_ms:,.1f} | {single_ms:,.1f} | {stream_ms:,.1f} | {legacy_ms / single_ms:,.1f}x "
+            f"| {'yes' if identical else 'NO'} |"
+        )
+
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.core.engine.vector_calculus import VectorCalculus  # noqa: E402
+from src.core.engine.vector_sparse import IntentMatrix  # noqa: E402
+
+CANDIDATE_COUNTS = (10, 1_000, 100_000)
+QUERIES_PER_RUN = 20
+
+
+def build_workload(candidates: int, rng: random.Random):
+    vocab = [f"token{i}" for i in range(5_000)]
+    thesaurus = {word: set(rng.sample(vocab, 4)) for word in vocab[:1_000]}
+    calc = VectorCalculus(set(), thesaurus)
+    intents = [" ".join(rng.sample(vocab, rng.randint(3, 12))) for _ in range(candidates)]
+    queries = []
+    for _ in range(QUERIES_PER_RUN):
+        original_tokens = set(rng.sample(vocab[:1_500], 5))
+        expansion = calc.expand_query(original_tokens)
+        queries.append((expansion, original_tokens, set().union(*expansion.values())))
+    return calc, intents, queries
+
+
+def run_benchmark():
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🔱 HYBRID SCORING BENCHMARK (score_intent vs sparse matrix)                  │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+    print("| Candidates | Set path (ms/query) | Matrix build (ms) | Matrix (ms/query) | Speedup | Identical |")
+    print("| :--- | :--- | :--- | :--- | :--- | :--- |")
+
+    rng = random.Random(42)
+    for count in CANDIDATE_COUNTS:
+        calc, intents, queries = build_workload(count, rng)
+        results = [{"intent": intent} for intent in intents]
+        for result in results:
+            calc.score_intent(result, {}, set(), set())  # Warm `_target_tokens`, as re-ranking does.
+
+        start = time.perf_counter()
+        scalar_scores = []
+        for expansion, original_tokens, all_expanded in queries:
+            scalar_scores.append(
+                [calc.score_intent(r, expansion, original_tokens, all_expanded)["score"] for r in results]
+            )
+        scalar_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        start = time.perf_counter()
+        matrix = IntentMatrix.from_results(results)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        matrix_scores = [matrix.score(*query) for query in queries]
+        matrix_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+        identical = matrix_scores == scalar_scores
+        print(
+            f"| {count:,} | {scalar_ms:,.3f} | {build_ms:,.3f} | {matrix_ms:,.3f} | "
+            f"{scalar_ms / matrix_ms:,.1f}x | {'yes' if identical else 'NO'} |"
+        )
+
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+
+if __name__ == "__main__":
+    run_benchmark()
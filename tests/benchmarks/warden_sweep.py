@@ -0,0 +1,186 @@
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(PROJECT_ROOT))
+
+from src.core.engine.analysis_cache import AnalysisCache  # noqa: E402
+from src.core.engine.wardens.edda import EddaWarden  # noqa: E402
+from src.core.engine.wardens.freya import FreyaWarden  # noqa: E402
+from src.core.engine.wardens.gungnir_warden import GungnirWarden  # noqa: E402
+from src.core.engine.wardens.mimir import MimirWarden  # noqa: E402
+from src.core.engine.wardens.scour import ScourWarden  # noqa: E402
+from src.core.engine.wardens.security import SecurityWarden  # noqa: E402
+from src.core.engine.wardens.snapshot import RepositorySnapshot  # noqa: E402
+from src.core.engine.wardens.sweep import DEFAULT_SWEEP_WARDENS, WardenSweep  # noqa: E402
+from src.core.engine.wardens.taste import TasteWarden  # noqa: E402
+from src.core.engine.wardens.valkyrie import ValkyrieWarden  # noqa: E402
+
+WARDENS = (MimirWarden, ValkyrieWarden, EddaWarden, FreyaWarden, TasteWarden, ScourWarden, SecurityWarden)
+PY_FILES = 400
+TSX_FILES = 80
+MD_FILES = 40
+
+
+def build_tree(root: Path, rng: random.Random) -> None:
+    for i in range(PY_FILES):
+        package = root / "src" / f"pkg{i % 12}"
+        package.mkdir(parents=True, exist_ok=True)
+        functions = []
+        for j in range(rng.randint(3, 10)):
+            branches = "\n".join(f"    if x == {k}:\n        return {k}" for k in range(rng.randint(1, 14)))
+            functions.append(f"def func_{j}(x):\n{branches}\n    return None\n")
+        (package / f"module_{i}.py").write_text("import os\n\n" + "\n\n".join(functions), encoding="utf-8")
+    for i in range(TSX_FILES):
+        ui = root / "src" / "ui"
+        ui.mkdir(parents=True, exist_ok=True)
+        body = "\n".join(f'<div className="flex p-[{k}px] grid-cols-3">50%</div>' for k in range(rng.randint(5, 40)))
+        (ui / f"View{i}.tsx").write_text(f"export const View{i} = () => (\n{body}\n);\n", encoding="utf-8")
+    for i in range(MD_FILES):
+        docs = root / "docs"
+        docs.mkdir(parents=True, exist_ok=True)
+        (docs / f"note_{i}.md").write_text(f"# Note {i}\nRun c* start then c* ravens.\n", encoding="utf-8")
+    # Ignored trees the walk must never enter.
+    for ignored in ("node_modules/lib", ".venv/site", "build/out"):
+        target = root / ignored
+        target.mkdir(parents=True, exist_ok=True)
+        for i in range(50):
+            (target / f"vendored_{i}.py").write_text("x = 1\n" * 200, encoding="utf-8")
+
+
+def sweep(root: Path, snapshots: list[RepositorySnapshot]) -> int:
+    """Runs every warden; one snapshot means a shared sweep, one per warden mirrors the old independent walks."""
+    breaches = 0
+    for index, warden_cls in enumerate(WARDENS):
+        warden = warden_cls(root, snapshots[index % len(snapshots)])
+        breaches += len(warden.scan())
+    return breaches
+
+
+def measure(label: str, root: Path, snapshots: list[RepositorySnapshot]) -> tuple[str, float, int, int, int, int]:
+    start = time.perf_counter()
+    breaches = sweep(root, snapshots)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    walks = sum(s.stats["walks"] for s in snapshots)
+    files_read = sum(s.stats["files_read"] for s in snapshots)
+    bytes_read = sum(s.stats["bytes_read"] for s in snapshots)
+    return label, elapsed_ms, walks, files_read, bytes_read, breaches
+
+
+def run_benchmark(root: Path | None = None):
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🔱 WARDEN SWEEP BENCHMARK (independent walks vs shared snapshot)             │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+    with tempfile.TemporaryDirectory() as tmp, \
+         patch.dict(os.environ, {"CSTAR_ANALYSIS_CACHE": "0"}), \
+         patch("src.core.engine.wardens.base.BraveSearch"), \
+         patch("src.core.telemetry.SubspaceTelemetry.log_trace"):
+        if root is None:
+            root = Path(tmp)
+            build_tree(root, random.Random(42))
+
+        before = measure("Independent (before)", root, [RepositorySnapshot(root) for _ in WARDENS])
+        shared = RepositorySnapshot(root)
+        after = measure("Shared snapshot (after)", root, [shared])
+        warm = measure("Refreshed snapshot (next sweep)", root, [shared.refresh()])
+
+    print(f"Tree: {root}")
+    print("| Sweep | Time (ms) | Walks | Files read | Bytes read | Breaches |")
+    print("| :--- | :--- | :--- | :--- | :--- | :--- |")
+    for label, elapsed_ms, walks, files_read, bytes_read, breaches in (before, after, warm):
+        print(f"| {label} | {elapsed_ms:.1f} | {walks} | {files_read} | {bytes_read:,} | {breaches} |")
+
+    if not before[5] == after[5] == warm[5]:
+        print("FAIL: Breach counts diverged between sweep modes.")
+        sys.exit(1)
+
+
+def run_parallel_benchmark(root: Path | None = None):
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🔱 PARALLEL WARDEN SWEEP (process pool, sharded Mimir/Gungnir)               │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    with tempfile.TemporaryDirectory() as tmp, \
+         patch.dict(os.environ, {"CSTAR_ANALYSIS_CACHE": "0"}), \
+         patch("src.core.engine.wardens.base.BraveSearch"), \
+         patch("src.core.engine.wardens.sweep.SovereignHUD"), \
+         patch("src.core.telemetry.SubspaceTelemetry.log_trace"):
+        if root is None:
+            root = Path(tmp)
+            build_tree(root, random.Random(42))
+
+        results = {}
+        for workers in worker_counts:
+            with WardenSweep(root, DEFAULT_SWEEP_WARDENS, max_workers=workers) as sweep:
+                results[workers] = sweep.run()
+
+    print(f"Tree: {root} | CPUs: {os.cpu_count()}")
+    print("| Workers | Sweep wall (ms) | Speedup | Breaches | Identical |")
+    print("| :--- | :--- | :--- | :--- | :--- |")
+    baseline = results[1]
+    for workers, result in results.items():
+        print(
+            f"| {workers} | {result.wall_time * 1000:.1f} | {baseline.wall_time / result.wall_time:.2f}x "
+            f"| {len(result.breaches)} | {result.breaches == baseline.breaches} |"
+        )
+
+    widest = results[worker_counts[-1]]
+    print(f"\nPer-warden report ({worker_counts[-1]} workers):")
+    print("| Warden | Shards | Files | Wall (ms) | CPU (ms) | Breaches |")
+    print("| :--- | :--- | :--- | :--- | :--- | :--- |")
+    for row in (report.as_row() for report in widest.reports):
+        print(f"| {row['warden']} | {row['shards']} | {row['files']} | {row['wall_ms']} | {row['cpu_ms']} | {row['breaches']} |")
+
+    if any(result.breaches != baseline.breaches for result in results.values()):
+        print("FAIL: Parallel sweep diverged from the inline sweep.")
+        sys.exit(1)
+
+
+def run_cache_benchmark():
+    print("┌──────────────────────────────────────────────────────────────────────────────┐")
+    print("│  🔱 PERSISTENT ANALYSIS CACHE (Mimir, Gungnir, Valkyrie; fresh process state) │")
+    print("└──────────────────────────────────────────────────────────────────────────────┘")
+
+    with tempfile.TemporaryDirectory() as tmp, \
+         patch("src.core.engine.wardens.base.BraveSearch"), \
+         patch("src.core.telemetry.SubspaceTelemetry.log_trace"):
+        root = Path(tmp)
+        build_tree(root, random.Random(42))
+
+        rows = []
+        for label in ("Cold cache", "Warm cache"):
+            # New snapshot and cache handle each run, as a fresh `cstar` process would have.
+            AnalysisCache._instances.clear()
+            snapshot = RepositorySnapshot(root)
+            start = time.perf_counter()
+            breaches = sum(len(cls(root, snapshot).scan()) for cls in (MimirWarden, GungnirWarden, ValkyrieWarden))
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            cache = AnalysisCache.for_root(root)
+            hits = sum(counts["hits"] for counts in cache.stats.values())
+            misses = sum(counts["misses"] for counts in cache.stats.values())
+            rows.append((label, elapsed_ms, hits / (hits + misses), snapshot.stats["radon_runs"], breaches))
+            cache.close()
+
+    print("| Run | Time (ms) | Hit rate | Radon runs | Breaches |")
+    print("| :--- | :--- | :--- | :--- | :--- |")
+    for label, elapsed_ms, hit_rate, radon_runs, breaches in rows:
+        print(f"| {label} | {elapsed_ms:.1f} | {hit_rate:.0%} | {radon_runs} | {breaches} |")
+
+    if rows[0][4] != rows[1][4]:
+        print("FAIL: Cached sweep diverged from the cold sweep.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]).resolve() if len(sys.argv) > 1 else None
+    run_benchmark(target)
+    run_parallel_benchmark(target)
+    run_cache_benchmark()
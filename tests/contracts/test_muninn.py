@@ -158,6 +158,25 @@ class TestMuninnCrucible:
         assert "tests/gauntlet" in path.as_posix()
         mock_uplink.send_payload.assert_called()
 
+    @patch("src.core.engine.ravens.muninn_crucible.BifrostGate")
+    def test_gauntlets_forged_in_the_same_second_do_not_collide(self, mock_gate_cls, tmp_path):
+        mock_gate_cls.return_value.sanitize_test.return_value = "def test_fix(): assert True"
+        mock_uplink = MagicMock()
+        mock_uplink.send_payload = AsyncMock(return_value={"status": "success", "data": {"code": ""}})
+        crucible = MuninnCrucible(tmp_path, mock_uplink)
+
+        async def forge_pair():
+            return await asyncio.gather(
+                crucible.generate_gauntlet({"file": "src/a.py"}, ""),
+                crucible.generate_gauntlet({"file": "src/b.py"}, ""),
+            )
+
+        with patch("src.core.engine.ravens.muninn_crucible.time.time", return_value=1700000000.0):
+            first, second = asyncio.run(forge_pair())
+
+        assert first != second
+        assert first.exists() and second.exists()
+
 class TestMuninnHeartEndurance:
     """Verifies 6-hour limit enforcement."""
 
@@ -37,6 +37,9 @@ class TestValkyrieWarden:
 
         mock_v.get_unused_code.return_value = [mock_item]
 
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "dead.py").write_text("def dead():\n    pass\n", encoding="utf-8")
+
         # Init Warden
         valkyrie = ValkyrieWarden(tmp_path)
 
@@ -49,8 +52,8 @@ class TestValkyrieWarden:
         assert "dead.py" in targets[0]["file"]
         assert "unused function 'dead'" in targets[0]["action"]
 
-        # Verify Vulture was called correctly
-        mock_v.scavenge.assert_called()
+        # Verify Vulture scanned the module
+        mock_v.scan.assert_called()
 
     @patch('src.core.engine.wardens.valkyrie.vulture')
     def test_filters_low_confidence(self, mock_vulture_module, tmp_path):
@@ -1,8 +1,17 @@
+import os
 import unittest.mock as mock
 
 from src.tools.latency_check import LatencyProfiler
 
 
+def test_latency_profiler_resolves_engine_and_client_from_project_root():
+    profiler = LatencyProfiler()
+
+    assert os.path.isfile(profiler.engine_path)
+    assert os.path.isfile(profiler.client_path)
+    assert os.path.dirname(profiler.engine_path) == os.path.join(profiler.project_root, "src", "core")
+
+
 def test_latency_profiler_startup():
     with mock.patch("subprocess.run") as mock_run:
         mock_run.return_value.returncode = 0
@@ -35,3 +44,20 @@ def test_latency_profiler_failure():
 
         # Should return penalty value
         assert avg == 10000.0
+
+def test_latency_profiler_resident():
+    with mock.patch("subprocess.run") as mock_run, \
+         mock.patch("subprocess.Popen") as mock_popen, \
+         mock.patch("src.core.sv_client.QueryClient") as mock_client:
+        mock_run.return_value.returncode = 0
+        client = mock_client.return_value.__enter__.return_value
+        client.query.return_value = {"ok": True, "output": "{}"}
+
+        profiler = LatencyProfiler(iterations=2)
+        result = profiler.measure_resident("test query")
+
+        assert set(result) == {"subprocess", "client", "socket"}
+        assert mock_run.call_count == 4
+        assert client.query.call_count == 2
+        client.request.assert_any_call({"op": "shutdown"})
+        assert mock_popen.call_args.args[0][2:4] == ["--serve", "--socket"]
@@ -66,7 +66,7 @@ class TestMimirEmpire:
         # Let's trust radon works and checks if we get *any* result for a really bad file
         # (simulated by mocking radon)
 
-        with patch("src.core.engine.wardens.mimir.mi_visit") as mock_mi:
+        with patch("src.core.engine.wardens.snapshot.RepositorySnapshot.maintainability") as mock_mi:
             mock_mi.return_value = 20.0 # Very low MI
             results = warden.scan()
 
@@ -24,12 +24,14 @@ class TestValkyrieEmpire:
         """Test clean scan with no dead code."""
         mock_vulture = mock_vulture_cls.return_value
         mock_vulture.get_unused_code.return_value = []
+        (mock_root / "module.py").write_text("def used():\n    return 1\n", encoding="utf-8")
 
         warden = ValkyrieWarden(mock_root)
         results = warden.scan()
 
         assert results == []
-        mock_vulture.scavenge.assert_called()
+        mock_vulture.scan.assert_called()
+        assert warden.last_scavenge == {"modules": 1, "rescanned": 1}
 
     @patch("src.core.engine.wardens.valkyrie.vulture.Vulture")
     def test_scan_detects_dead_code(self, mock_vulture_cls, mock_root):
@@ -5,6 +5,7 @@ Statistical intent resolution validator comparing results against ground truth.
 Refined for the Linscott Standard.
 """
 
+import asyncio
 import json
 import math
 import os
@@ -118,8 +119,10 @@ class FishtestRunner:
         engine.build_index()
         return engine, persona
 
-    def run_case(self, case: dict[str, Any]) -> tuple[bool, dict[str, Any]]:
-        """Executes a single test case query and validates the result."""
+    def run_case(
+        self, case: dict[str, Any], results: list[dict[str, Any]] | None = None
+    ) -> tuple[bool, dict[str, Any]]:
+        """Validates a test case, using prefetched `results` when the suite already searched for it."""
         # Defensive validation
         is_malformed = not isinstance(case, dict) or not case.get('query')
         if not is_malformed:
@@ -130,7 +133,8 @@ class FishtestRunner:
             return False, {"actual": None, "score": 0, "reasons": ["Malformed Case"]}
 
         try:
-            results = self.engine.search(case['query'])
+            if results is None:
+                results = asyncio.run(self.engine.search(case['query']))
             top = results[0] if results else {}
             actual = top.get('trigger')
             score = top.get('score', 0)
@@ -188,15 +192,22 @@ class FishtestRunner:
         SovereignHUD.box_row("POPULATION", f"{len(cases)} Cases", SovereignHUD.BOLD)
         SovereignHUD.box_separator()
 
-        passed, skipped, start = 0, 0, time.time()
-        for case in cases:
-            query = str(case.get('query', ''))
-            # [ALFRED] English Only Filter: Skip non-ASCII queries (CJK/Cyrillic/etc.)
-            if not all(ord(c) < 128 for c in query):
-                skipped += 1
-                continue
+        passed, start = 0, time.time()
+        # [ALFRED] English Only Filter: Skip non-ASCII queries (CJK/Cyrillic/etc.)
+        active = [
+            case for case in cases
+            if all(ord(c) < 128 for c in str(case.get('query', '')))
+        ]
+        skipped = len(cases) - len(active)
+        searchable = [case for case in active if isinstance(case, dict) and case.get('query')]
+        try:
+            batched = asyncio.run(self.engine.search_many([str(case['query']) for case in searchable]))
+            prefetched = {id(case): results for case, results in zip(searchable, batched)}
+        except Exception:
+            prefetched = {}
 
-            ok, info = self.run_case(case)
+        for case in active:
+            ok, info = self.run_case(case, prefetched.get(id(case)))
             if ok:
                 passed += 1
             else:
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.engine.ravens.quiescence import QuiescenceDetector, _Inotify
+
+
+def _backends():
+    probe = _Inotify.open(Path(__file__).parent, lambda path: False)
+    if probe is None:
+        return ["mtime"]
+    probe.close()
+    return ["inotify", "mtime"]
+
+
+@pytest.fixture(params=_backends())
+def backend(request):
+    return request.param
+
+
+def seed(root: Path) -> None:
+    (root / "src").mkdir()
+    (root / "src" / "module.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (root / "node_modules").mkdir()
+    (root / ".agents").mkdir()
+    # Pretend everything was last written a minute ago.
+    past = time.time() - 60
+    for path in (root / "src" / "module.py", root / "src", root / "node_modules", root / ".agents", root):
+        os.utime(path, (past, past))
+
+
+async def _write_every(path: Path, interval: float, until: float) -> None:
+    count = 0
+    while time.monotonic() < until:
+        count += 1
+        path.write_text(f"write {count}\n", encoding="utf-8")
+        await asyncio.sleep(interval)
+
+
+def test_quiet_tree_resolves_without_waiting_a_window(tmp_path, backend):
+    seed(tmp_path)
+    detector = QuiescenceDetector(tmp_path, 5.0, use_inotify=backend == "inotify")
+
+    started = time.monotonic()
+    idle = asyncio.run(detector.wait(timeout=10.0))
+
+    assert idle >= 5.0
+    assert time.monotonic() - started < 2.0
+    assert detector.backend == backend
+
+
+def test_resolves_once_writes_stop(tmp_path, backend):
+    seed(tmp_path)
+    detector = QuiescenceDetector(tmp_path, 0.3, use_inotify=backend == "inotify")
+
+    async def scenario():
+        writer = asyncio.create_task(_write_every(tmp_path / "src" / "new.py", 0.05, time.monotonic() + 0.6))
+        await asyncio.sleep(0.1)
+        started = time.monotonic()
+        await detector.wait(timeout=5.0)
+        await writer
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(scenario())
+    # Writes continued for ~0.5s after the wait began; silence then takes one more 0.3s window.
+    assert 0.6 <= elapsed < 2.0
+
+
+def test_keeps_waiting_while_the_tree_is_busy(tmp_path, backend):
+    seed(tmp_path)
+    detector = QuiescenceDetector(tmp_path, 0.3, use_inotify=backend == "inotify")
+
+    async def scenario():
+        writer = asyncio.create_task(_write_every(tmp_path / "src" / "module.py", 0.05, time.monotonic() + 1.5))
+        await asyncio.sleep(0.1)
+        try:
+            await detector.wait(timeout=0.8)
+        finally:
+            await writer
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scenario())
+
+
+def test_writes_in_excluded_directories_are_not_activity(tmp_path, backend):
+    seed(tmp_path)
+    detector = QuiescenceDetector(tmp_path, 0.3, use_inotify=backend == "inotify")
+
+    async def scenario():
+        until = time.monotonic() + 1.0
+        writers = [
+            asyncio.create_task(_write_every(tmp_path / "node_modules" / "dep.js", 0.05, until)),
+            asyncio.create_task(_write_every(tmp_path / ".agents" / "state.json", 0.05, until)),
+        ]
+        await asyncio.sleep(0.1)
+        started = time.monotonic()
+        await detector.wait(timeout=0.8)
+        elapsed = time.monotonic() - started
+        await asyncio.gather(*writers)
+        return elapsed
+
+    assert asyncio.run(scenario()) < 0.5
@@ -23,6 +23,21 @@ async def test_execute_ravens_cycle_contract():
         assert result == mock_result
         MockHeart.assert_called_once()
         mock_heart_instance.execute_cycle_contract.assert_called_once()
+        mock_heart_instance.close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_execute_ravens_cycle_contract_closes_the_heart_when_the_cycle_raises():
+    with patch("src.core.engine.ravens.ravens_runtime.AntigravityUplink"), \
+         patch("src.core.engine.ravens.ravens_runtime.MuninnHeart") as MockHeart:
+        mock_heart_instance = MockHeart.return_value
+        async def mock_cycle(_max_missions):
+            raise RuntimeError("crucible exploded")
+        mock_heart_instance.execute_batch_cycle_contract.side_effect = mock_cycle
+
+        with pytest.raises(RuntimeError):
+            await execute_ravens_cycle_contract("/tmp/test_project", max_missions=2)
+
+        mock_heart_instance.close.assert_called_once()
 
 @pytest.mark.asyncio
 async def test_execute_ravens_cycle():
@@ -0,0 +1,119 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.core.engine.analysis_cache import AnalysisCache, analysis_cache_path, main
+from src.core.engine.gungnir.universal import UniversalGungnir
+from src.core.engine.wardens.mimir import MimirWarden
+from src.core.engine.wardens.snapshot import RepositorySnapshot
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AnalysisCache(tmp_path / "cache.db")
+    yield cache
+    cache.close()
+
+
+def test_round_trip_and_hit_rate(cache):
+    assert cache.get("mimir", "v1", "abc") is None
+    cache.put("mimir", "v1", "abc", {"breaches": [{"line": 1}]})
+
+    first = cache.get("mimir", "v1", "abc")
+    first["breaches"].clear()
+
+    assert cache.get("mimir", "v1", "abc") == {"breaches": [{"line": 1}]}
+    assert cache.get("mimir", "v2", "abc") is None
+    session = cache.describe()["session"]["mimir"]
+    assert (session["hits"], session["misses"], session["writes"]) == (2, 2, 1)
+    assert cache.describe()["lifetime"]["mimir"]["hit_rate"] == 0.5
+
+
+def test_batch_commits_once_on_exit(cache, tmp_path):
+    other = AnalysisCache(tmp_path / "cache.db")
+    with cache.batch():
+        cache.put("mimir", "v1", "abc", [1])
+        assert cache.get("mimir", "v1", "abc") == [1]
+        assert other.get("mimir", "v1", "abc") is None
+
+    assert other.get("mimir", "v1", "abc") == [1]
+    other.close()
+
+
+def test_reads_do_not_write_until_flushed(cache, tmp_path):
+    cache.put("mimir", "v1", "abc", [1])
+    with patch.object(cache, "flush", wraps=cache.flush) as flush:
+        for _ in range(3):
+            cache.get("mimir", "v1", "abc")
+        cache.get("mimir", "v1", "missing")
+    flush.assert_not_called()
+
+    other = AnalysisCache(tmp_path / "cache.db")
+    assert "mimir" not in other.describe()["lifetime"]
+    cache.flush()
+    assert other.describe()["lifetime"]["mimir"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+    other.close()
+
+
+def test_invalidate_and_prune_by_rule_version(cache):
+    for version in ("v1", "v2"):
+        cache.put("mimir", version, "abc", [])
+        cache.put("gungnir.audit", version, "abc", [])
+
+    assert cache.invalidate("mimir", "v1") == 1
+    assert cache.get("mimir", "v2", "abc") == []
+    assert cache.prune_stale({"mimir": "v2", "gungnir.audit": "v2"}) == 1
+    assert [(e["namespace"], e["rule_version"]) for e in cache.describe()["entries"]] == [
+        ("gungnir.audit", "v2"), ("mimir", "v2")
+    ]
+
+
+def test_cli_invalidates_by_rule_version(tmp_path, capsys):
+    cache = AnalysisCache(analysis_cache_path(tmp_path))
+    cache.put("mimir", "mimir-0", "abc", [])
+    cache.put("mimir", MimirWarden.RULES_VERSION, "abc", [])
+    cache.close()
+
+    with pytest.raises(SystemExit):
+        main(["--root", str(tmp_path), "--invalidate"])
+    capsys.readouterr()
+
+    main(["--root", str(tmp_path), "--invalidate", "--rule-version", "mimir-0"])
+    assert json.loads(capsys.readouterr().out) == {"removed": 1}
+
+    main(["--root", str(tmp_path), "--stats"])
+    assert json.loads(capsys.readouterr().out)["entries"] == [
+        {"namespace": "mimir", "rule_version": MimirWarden.RULES_VERSION, "count": 1}
+    ]
+
+
+def test_mimir_reuses_cached_verdicts_for_unchanged_files(tmp_path):
+    body = "\n".join(f"    value_{j} = x + {j}" for j in range(15))
+    (tmp_path / "alpha.py").write_text(f"def alpha(x):\n{body}\n    return x\n", encoding="utf-8")
+    (tmp_path / "beta.py").write_text(f"def alpha(x):\n{body}\n    return x\n", encoding="utf-8")
+
+    with patch("src.core.engine.wardens.base.BraveSearch"), patch("src.core.telemetry.SubspaceTelemetry.log_trace"):
+        cold = MimirWarden(tmp_path, RepositorySnapshot(tmp_path))
+        first = cold.scan()
+        warm_snapshot = RepositorySnapshot(tmp_path)
+        second = MimirWarden(tmp_path, warm_snapshot).scan()
+
+    assert second == first
+    assert {b["file"] for b in second} == {"alpha.py", "beta.py"}
+    assert warm_snapshot.stats["radon_runs"] == 0 and warm_snapshot.stats["parses"] == 0
+    stats = AnalysisCache.for_root(tmp_path).stats["mimir"]
+    # beta.py has the same content as alpha.py, so it already hits on the cold scan.
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+
+
+def test_gungnir_matrix_and_audit_are_cached(cache):
+    gungnir = UniversalGungnir(cache=cache)
+    code = "def alpha():\n    return 1\n"
+    first = gungnir.score_matrix(code, ".py")
+
+    with patch.object(UniversalGungnir, "_audit", side_effect=AssertionError("recomputed")):
+        assert UniversalGungnir(cache=cache).score_matrix(code, ".py") == first
+        assert UniversalGungnir(cache=cache).audit_logic(code, ".PY") == []
+
+    assert first == UniversalGungnir().score_matrix(code, ".py")
@@ -0,0 +1,40 @@
+import unittest
+
+from src.core.engine.bounded_cache import BoundedCache
+
+
+class TestBoundedCache(unittest.TestCase):
+    def test_evicts_least_recently_used_entry(self):
+        cache = BoundedCache(2)
+        cache["alpha"] = 1
+        cache["beta"] = 2
+        self.assertEqual(cache.get("alpha"), 1)
+        cache["gamma"] = 3
+
+        self.assertNotIn("beta", cache)
+        self.assertEqual(list(cache), ["alpha", "gamma"])
+        self.assertEqual(cache.stats["evictions"], 1)
+
+    def test_byte_bound_evicts_oldest_entries(self):
+        cache = BoundedCache(100, max_bytes=250, sizeof=lambda key, value: 100)
+        for key in ("a", "b", "c"):
+            cache[key] = key
+
+        self.assertEqual(list(cache), ["b", "c"])
+        self.assertEqual(cache.describe()["bytes"], 200)
+
+    def test_invalidate_drops_entries_written_before_the_bump(self):
+        cache = BoundedCache(10)
+        cache["stale"] = [1]
+        cache.invalidate()
+        cache["fresh"] = [2]
+
+        self.assertIsNone(cache.get("stale"))
+        self.assertEqual(cache.get("fresh"), [2])
+        self.assertEqual(cache.stats["invalidations"], 1)
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import os
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
@@ -13,10 +14,11 @@ def builder(tmp_path):
     return SovereignBuilder(project_root, base_path, thresholds)
 
 class TestSovereignBuilder:
+    @patch("src.core.engine.builder.VectorSnapshot")
     @patch("src.core.engine.builder.SovereignVector")
     @patch("src.core.engine.builder.InstructionLoader")
     @patch("src.core.engine.builder.MemoryDB")
-    def test_build_vector_engine(self, mock_memory_db_class, mock_loader_class, mock_vector_class, builder):
+    def test_build_vector_engine(self, mock_memory_db_class, mock_loader_class, mock_vector_class, mock_snapshot_class, builder):
         mock_memory_db = mock_memory_db_class.return_value
         mock_loader = mock_loader_class.return_value
         mock_vector = mock_vector_class.return_value
@@ -28,7 +30,7 @@ class TestSovereignBuilder:
         vector = builder.build_vector_engine(skills_db_path)
         
         # Check initialization
-        mock_memory_db_class.assert_called_with(str(builder.base_path))
+        mock_memory_db_class.assert_called_with(str(builder.project_root))
         mock_loader_class.assert_called_with(str(builder.project_root))
         
         # Check source added
@@ -38,7 +40,11 @@ class TestSovereignBuilder:
         thesaurus = str(builder.project_root / "src" / "data" / "thesaurus.qmd")
         corrections = str(builder.base_path / "corrections.json")
         stopwords = str(builder.project_root / "src" / "data" / "stopwords.json")
-        mock_vector_class.assert_called_with(thesaurus, corrections, stopwords)
+        mock_vector_class.assert_called_with(
+            thesaurus, corrections, stopwords,
+            memory_db=mock_memory_db, instruction_loader=mock_loader,
+            state=mock_snapshot_class.return_value.load.return_value,
+        )
         
         # Check skill loading and index building
         mock_vector.load_core_skills.assert_called_once()
@@ -47,10 +53,11 @@ class TestSovereignBuilder:
         
         assert vector == mock_vector
 
+    @patch("src.core.engine.builder.VectorSnapshot")
     @patch("src.core.engine.builder.SovereignVector")
     @patch("src.core.engine.builder.InstructionLoader")
     @patch("src.core.engine.builder.MemoryDB")
-    def test_build_vector_engine_no_skills_db(self, mock_memory_db_class, mock_loader_class, mock_vector_class, builder):
+    def test_build_vector_engine_no_skills_db(self, mock_memory_db_class, mock_loader_class, mock_vector_class, mock_snapshot_class, builder):
         mock_loader = mock_loader_class.return_value
         
         skills_db_path = builder.project_root / "missing.db" # Does not exist
@@ -59,3 +66,83 @@ class TestSovereignBuilder:
         
         # add_source should NOT be called
         mock_loader.add_source.assert_not_called()
+
+
+@pytest.fixture
+def engine_tree(tmp_path, monkeypatch):
+    from src.core.engine import memory_db as memory_db_module
+    from src.core.engine.vector import SovereignVector
+
+    monkeypatch.setattr(memory_db_module, "chromadb", None)
+    monkeypatch.setattr(memory_db_module, "HallOfRecords", MagicMock())
+    monkeypatch.setattr(SovereignVector, "PROJECT_ROOT", tmp_path / "project")
+    monkeypatch.delenv("CSTAR_VECTOR_SNAPSHOT", raising=False)
+
+    project_root, base_path = tmp_path / "project", tmp_path / "base"
+    (project_root / "src" / "data").mkdir(parents=True)
+    (project_root / ".agents" / "workflows").mkdir(parents=True)
+    (project_root / "src" / "skills" / "local").mkdir(parents=True)
+    base_path.mkdir()
+    (project_root / "src" / "data" / "thesaurus.qmd").write_text("- **deploy**: ship, release\n", encoding="utf-8")
+    (project_root / "src" / "data" / "stopwords.json").write_text('["the", "a"]', encoding="utf-8")
+    (base_path / "corrections.json").write_text('{"phrase_mappings": {"Ship The Build!": "/deploy"}}', encoding="utf-8")
+    (project_root / ".agents" / "workflows" / "deploy.md").write_text("# Intent: Ship the build\n", encoding="utf-8")
+    (project_root / "src" / "skills" / "local" / "audit.py").write_text("# Intent: Audit the code\n", encoding="utf-8")
+    return SovereignBuilder(project_root, base_path, {})
+
+
+def _records(vector):
+    return sorted((r["id"], r["doc"], r["metadata"].get("domain")) for r in vector.memory_db._mock_records)
+
+
+class TestVectorWarmStart:
+    def test_warm_start_reproduces_cold_build(self, engine_tree):
+        skills_db = engine_tree.project_root / "missing.db"
+        cold = engine_tree.build_vector_engine(skills_db)
+        assert not cold.warm_start
+        assert (engine_tree.base_path / "vector_snapshot.bin").exists()
+
+        with patch("src.core.engine.vector_ingest.VectorIngest._read_intent", side_effect=AssertionError("re-read")), \
+             patch("src.core.engine.vector_config.VectorConfig.load_thesaurus", side_effect=AssertionError("re-parsed")):
+            warm = engine_tree.build_vector_engine(skills_db)
+
+        assert warm.warm_start
+        assert (warm.stopwords, warm.thesaurus, warm.corrections) == (cold.stopwords, cold.thesaurus, cold.corrections)
+        assert warm.corrections["phrase_mappings"] == {"ship build": "/deploy"}
+        assert warm.calculus_spoke.expand_query({"ship"}) == cold.calculus_spoke.expand_query({"ship"})
+        assert _records(warm) == _records(cold)
+        assert ("system::/audit", "Audit the code", "DEV") in _records(warm)
+
+    def test_changed_or_added_skill_rebuilds_snapshot(self, engine_tree):
+        skills_db = engine_tree.project_root / "missing.db"
+        engine_tree.build_vector_engine(skills_db)
+
+        skill = engine_tree.project_root / "src" / "skills" / "local" / "audit.py"
+        skill.write_text("# Intent: Audit every module\n", encoding="utf-8")
+        stat = skill.stat()
+        os.utime(skill, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (engine_tree.project_root / ".agents" / "workflows" / "review.md").write_text("# Review code\n", encoding="utf-8")
+
+        rebuilt = engine_tree.build_vector_engine(skills_db)
+        assert not rebuilt.warm_start
+        assert ("system::/audit", "Audit every module", "DEV") in _records(rebuilt)
+        assert ("system::/review", "Review code", "CORE") in _records(rebuilt)
+        assert engine_tree.build_vector_engine(skills_db).warm_start
+
+    def test_new_intent_rules_rebuild_snapshot(self, engine_tree, monkeypatch):
+        skills_db = engine_tree.project_root / "missing.db"
+        engine_tree.build_vector_engine(skills_db)
+
+        monkeypatch.setattr("src.core.engine.intent_store.INTENT_RULES_VERSION", "next")
+
+        assert not engine_tree.build_vector_engine(skills_db).warm_start
+        assert engine_tree.build_vector_engine(skills_db).warm_start
+
+    def test_snapshot_can_be_disabled(self, engine_tree, monkeypatch):
+        monkeypatch.setenv("CSTAR_VECTOR_SNAPSHOT", "0")
+        skills_db = engine_tree.project_root / "missing.db"
+
+        engine_tree.build_vector_engine(skills_db)
+
+        assert not engine_tree.build_vector_engine(skills_db).warm_start
+        assert not (engine_tree.base_path / "vector_snapshot.bin").exists()
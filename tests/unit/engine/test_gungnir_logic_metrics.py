@@ -0,0 +1,130 @@
+import sys
+
+import pytest
+import radon.complexity as cc
+
+from src.core.engine.gungnir.logic_metrics import measure_logic
+from src.core.engine.gungnir.universal import UniversalGungnir
+
+TRICKY = '''
+import os
+from typing import Any
+
+if os.name == "nt":
+    def platform_helper(x):
+        return x or None
+
+@decorate(lambda v: v if v else 0)
+def closures(items, flag=True and False):
+    def inner(y):
+        return [z for z in y if z if z > 1]
+    class Local:
+        def method(self):
+            return 1 if self else 2
+    assert items and flag or not items
+    for item in items:
+        while item:
+            item -= 1
+        else:
+            pass
+    try:
+        pass
+    except ValueError:
+        pass
+    else:
+        pass
+    return inner(items)
+
+def matcher(value):
+    match value:
+        case 1 | 2:
+            return "low"
+        case [x, *_] if x:
+            return "seq"
+        case _:
+            return None
+
+class Outer:
+    flag = 1 if os else 0
+
+    class Inner:
+        def hidden(self):
+            return all(a and b for a, b in self)
+
+    if flag:
+        def conditional(self):
+            return self.flag or 1
+    else:
+        def conditional(self):
+            return 0
+
+    async def fetch(self):
+        async for chunk in self:
+            yield chunk
+
+class Empty:
+    pass
+
+class Single:
+    def only(self):
+        return 1 if self else 0
+'''
+
+# `except*` only parses on Python 3.11+.
+EXCEPTION_GROUPS = '''
+def grouped(items):
+    try:
+        pass
+    except* TypeError:
+        pass
+    except* (ValueError, KeyError):
+        return items or None
+'''
+
+
+def test_block_complexities_match_radon():
+    metrics = measure_logic(TRICKY)
+
+    assert sorted(metrics.block_complexities) == sorted(block.complexity for block in cc.cc_visit(TRICKY))
+    assert metrics.import_count == 2
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="except* needs Python 3.11")
+def test_exception_group_handlers_match_radon():
+    metrics = measure_logic(EXCEPTION_GROUPS)
+
+    assert sorted(metrics.block_complexities) == sorted(block.complexity for block in cc.cc_visit(EXCEPTION_GROUPS))
+
+
+def test_function_balance_follows_ast_walk_order():
+    code = (
+        "def outer():\n"
+        "    def nested():\n"
+        "        a = 1\n        b = 2\n        return a + b\n"
+        "    return nested()\n\n"
+        "def sibling():\n"
+        "    a = 1\n    b = 2\n    c = 3\n    return a\n"
+    )
+
+    # Breadth-first: both top-level functions come before the nested one.
+    assert measure_logic(code).function_balance == [(0, 1), (3, 1), (2, 1)]
+
+
+def test_audit_reports_every_rule_in_order():
+    setup = "\n".join(f"    value_{i} = {i}" for i in range(14))
+    code = "".join(f"import mod_{i}\n" for i in range(11)) + f"\ndef heavy():\n{setup}\n    return value_0\n"
+
+    actions = [breach["action"] for breach in UniversalGungnir().audit_logic(code, ".py")]
+
+    assert actions == [
+        "GUNGNIR_COUPLING_BREACH: Over-entangled (11 imports). Isolate dependencies.",
+        "GUNGNIR_INTEL_BREACH: Low documentation ratio (0.00). Add intents/docstrings.",
+        "GUNGNIR_LOGIC_BREACH: top-heavy setup detected (14.0). Reduce preamble before execution.",
+        "GUNGNIR_STYLE_BREACH: Claustrophobic code block (>12 lines).",
+    ]
+
+
+def test_parse_error_is_the_only_breach():
+    assert UniversalGungnir().audit_logic("def broken(:\n", ".py") == [
+        {"severity": "CRITICAL", "action": "GUNGNIR_PARSE_ERROR: invalid syntax (<unknown>, line 1)"}
+    ]
@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.core.engine.analysis_cache import AnalysisCache
+from src.core.engine.intent_store import INTENT_NAMESPACE, PREFIX_BYTES, IntentStore, read_prefix
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AnalysisCache(tmp_path / "cache.db")
+    yield cache
+    cache.close()
+
+
+def test_extraction_reads_only_a_bounded_prefix(tmp_path):
+    skill = tmp_path / "huge.md"
+    filler = "lorem ipsum dolor\n" * (PREFIX_BYTES // 10)
+    skill.write_text(f"{filler}# Intent: Buried too deep\n", encoding="utf-8")
+
+    prefix = read_prefix(skill)
+    assert len(prefix) <= PREFIX_BYTES and prefix.endswith(b"\n")
+    assert IntentStore().read(skill)[1] == "Intent for huge.md"
+
+
+def test_identical_content_is_extracted_once(tmp_path):
+    for name in ("one.py", "two.py"):
+        (tmp_path / name).write_text("# Intent: Shared intent\n", encoding="utf-8")
+    store = IntentStore()
+
+    with patch("src.core.engine.intent_store.extract_intent", return_value="Shared intent") as extract:
+        first = store.read(tmp_path / "one.py")
+        second = store.read(tmp_path / "two.py")
+
+    assert first == second
+    extract.assert_called_once()
+
+
+def test_persistent_cache_serves_a_fresh_store(tmp_path, cache):
+    skill = tmp_path / "skill.qmd"
+    skill.write_text("# Deploy to production\n", encoding="utf-8")
+    assert IntentStore(cache).read(skill)[1] == "Deploy to production"
+
+    with patch("src.core.engine.intent_store.extract_intent") as extract:
+        assert IntentStore(cache).read(skill)[1] == "Deploy to production"
+    extract.assert_not_called()
+    assert cache.describe()["session"][INTENT_NAMESPACE]["hits"] == 1
+
+
+def test_read_many_keeps_order_across_the_pool(tmp_path):
+    paths = []
+    for i in range(IntentStore.PARALLEL_THRESHOLD * 2):
+        path = tmp_path / f"skill_{i}.py"
+        path.write_text(f"# Intent: Skill number {i}\n", encoding="utf-8")
+        paths.append(path)
+    paths.append(tmp_path / "missing.py")
+
+    results = IntentStore().read_many(paths)
+
+    assert [intent for _, intent in results[:-1]] == [f"Skill number {i}" for i in range(len(paths) - 1)]
+    assert results[-1] == ("", "Intent for missing.py")
+
+
+def test_for_root_shares_one_store_per_project(tmp_path):
+    with patch.dict("os.environ", {"CSTAR_ANALYSIS_CACHE": "0"}):
+        store = IntentStore.for_root(tmp_path)
+        assert IntentStore.for_root(str(tmp_path)) is store
+        assert store.cache is None
@@ -1,8 +1,43 @@
+import random
+import re
+import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
 from src.core.engine.memory_db import MemoryDB
 
+
+def _linear_scores(records, app_id, query, domain=None):
+    """Reference implementation of the original linear-scan scorer."""
+    query = query.lower()
+    processed = []
+    for r in records:
+        if r["metadata"].get("app_id") != app_id:
+            continue
+        if domain and r["metadata"].get("domain") != domain:
+            continue
+        intent_id = r["id"].replace(f"{app_id}::", "", 1)
+        q_words = set(query.split())
+        d_words = set(r["doc"].lower().split())
+        trigger_name = intent_id.lower().lstrip("/")
+        if query == trigger_name or query == intent_id.lower():
+            score = 1.0
+        elif query in trigger_name or trigger_name in query:
+            score = 0.95
+        elif q_words & set(re.findall(r'\w+', trigger_name)):
+            score = 0.8
+        elif q_words & d_words:
+            weighted_total = sum(len(w) for w in q_words)
+            score = max(sum(len(w) for w in q_words & d_words) / weighted_total, 0.4)
+        else:
+            score = 0.0
+        if score > 0:
+            processed.append((intent_id, score))
+    processed.sort(key=lambda x: x[1], reverse=True)
+    return processed
+
+
 class TestMemoryDB(unittest.TestCase):
     def setUp(self):
         self.project_root = "/mock/root"
@@ -97,5 +132,112 @@ class TestMemoryDB(unittest.TestCase):
         self.db.clear_active_ram()
         self.assertEqual(len(self.db._sim_cache), 0)
 
+    @patch("src.core.engine.memory_db.chromadb", None)
+    @patch("src.core.engine.memory_db.HallOfRecords")
+    def test_simulated_index_matches_linear_scan(self, mock_hall):
+        db = MemoryDB(self.project_root)
+        rng = random.Random(7)
+        vocab = ["deploy", "build", "test", "lint", "scan", "repair", "status", "forge", "oracle", "raven"]
+        for index in range(300):
+            app_id = rng.choice(["system", "other"])
+            trigger = "/" + "_".join(rng.sample(vocab, rng.randint(1, 2))) + f"{index % 40}"
+            description = " ".join(rng.choice(vocab + ["the", "a", "system"]) for _ in range(6))
+            db.upsert_skill(app_id, trigger, description, {"domain": rng.choice(["GENERAL", "OPS"])})
+
+        queries = ["deploy", "build test", "/lint3", "status of the system", "repair_scan", "", "zzz", "forge12"]
+        for query in queries:
+            for domain in (None, "OPS"):
+                db.clear_active_ram()
+                expected = _linear_scores(db._mock_records, "system", query, domain)[:10]
+                actual = db._sim_index.search("system", query, domain=domain, limit=10)
+                self.assertEqual([(r["trigger"], r["score"]) for r in actual], expected, (query, domain))
+
+    @patch("src.core.engine.memory_db.chromadb", None)
+    @patch("src.core.engine.memory_db.HallOfRecords")
+    def test_simulated_upsert_moves_record_to_end(self, mock_hall):
+        db = MemoryDB(self.project_root)
+        db.upsert_skill("system", "/alpha", "shared words here")
+        db.upsert_skill("system", "/beta", "shared words here")
+        db.upsert_skill("system", "/alpha", "shared words here again")
+
+        self.assertEqual([r["id"] for r in db._mock_records][-2:], ["system::/beta", "system::/alpha"])
+        results = db.search_intent("system", "shared", n_results=2)
+        self.assertEqual([r["trigger"] for r in results], ["/beta", "/alpha"])
+        self.assertEqual(db.get_total_skills(), 3)
+
+    @patch("src.core.engine.memory_db.chromadb", None)
+    @patch("src.core.engine.memory_db.HallOfRecords")
+    def test_simulated_index_persists_for_warm_start(self, mock_hall):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = MemoryDB(tmp)
+            db.batch_upsert_skills("system", [
+                {"trigger": "/forge", "description": "Forge a new feature", "metadata": {"domain": "DEV"}},
+                {"trigger": "/scan", "description": "Scan the repository"},
+            ])
+            path = db.save_simulated_index()
+            self.assertTrue(path.exists())
+
+            warm = MemoryDB(tmp)
+            self.assertTrue(warm.load_simulated_index())
+            self.assertEqual(warm._mock_records, db._mock_records)
+            self.assertEqual(warm.search_intent("system", "feature"), db.search_intent("system", "feature"))
+            self.assertFalse(warm.load_simulated_index(Path(tmp) / "missing.json"))
+
+    @patch("src.core.engine.memory_db.chromadb", None)
+    @patch("src.core.engine.memory_db.HallOfRecords")
+    def test_concurrent_index_saves_do_not_collide(self, mock_hall):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = MemoryDB(tmp)
+            db.batch_upsert_skills("system", [{"trigger": "/forge", "description": "Forge a new feature"}])
+            path = Path(tmp) / "index.json"
+            errors = []
+
+            def saver():
+                try:
+                    for _ in range(50):
+                        db._sim_index.save(path)
+                except OSError as exc:
+                    errors.append(exc)
+
+            threads = [threading.Thread(target=saver) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(errors, [])
+            self.assertTrue(MemoryDB(tmp)._sim_index.load(path))
+            self.assertEqual(list(Path(tmp).glob("*.tmp")), [])
+
+    @patch("src.core.engine.memory_db.chromadb", None)
+    @patch("src.core.engine.memory_db.HallOfRecords")
+    def test_upsert_invalidates_cached_search(self, mock_hall):
+        db = MemoryDB(self.project_root)
+        self.assertEqual(db.search_intent("system", "telemetry"), [])
+        self.assertEqual(db.search_intent("system", "telemetry"), [])
+        self.assertEqual(db.cache_stats()["search"]["hits"], 1)
+
+        db.upsert_skill("system", "/telemetry", "Collect runtime telemetry")
+
+        results = db.search_intent("system", "telemetry")
+        self.assertEqual(results[0]["trigger"], "/telemetry")
+        self.assertEqual(db.cache_stats()["search"]["invalidations"], 1)
+
+    @patch("src.core.engine.memory_db.chromadb", None)
+    @patch("src.core.engine.memory_db.HallOfRecords")
+    def test_delete_skills_removes_from_search(self, mock_hall):
+        db = MemoryDB(self.project_root)
+        db.upsert_skill("system", "/telemetry", "Collect runtime telemetry")
+        db.upsert_skill("system", "/metrics", "Collect runtime metrics")
+        self.assertEqual(len(db.search_intent("system", "runtime", n_results=5)), 2)
+
+        db.delete_skills("system", ["/telemetry", "/missing"])
+
+        self.assertEqual([r["trigger"] for r in db.search_intent("system", "runtime", n_results=5)], ["/metrics"])
+
+    def test_delete_skills_real(self):
+        self.db.delete_skills("system", ["/gone"])
+        self.mock_collection.delete.assert_called_once_with(ids=["system::/gone"])
+
 if __name__ == "__main__":
     unittest.main()
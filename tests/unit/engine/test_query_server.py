@@ -0,0 +1,185 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core import sv_client
+from src.core.engine.query_server import SovereignQueryServer
+from src.core.sv_client import QueryClient, QueryServerUnavailable
+
+
+class FakeEngine:
+    def __init__(self) -> None:
+        self.fingerprint = b"v1"
+        self.calls: list[dict] = []
+        self.active = 0
+        self.max_active = 0
+        self.reloads = 0
+        self.torn_down = False
+        self._guard = threading.Lock()
+
+    def run(self, query: str, json_mode: bool = False, record: bool = False, use_cortex: bool = False) -> None:
+        with self._guard:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        self.calls.append({"query": query, "json": json_mode, "record": record, "cortex": use_cortex})
+        print(json.dumps({"query": query, "generation": self.reloads}) if json_mode else f"match for {query}")
+        with self._guard:
+            self.active -= 1
+
+    def render_diagnostic(self) -> None:
+        print("DIAGNOSTIC")
+
+    def input_fingerprint(self) -> bytes:
+        return self.fingerprint
+
+    def reload(self) -> None:
+        self.reloads += 1
+
+    def teardown(self) -> None:
+        self.torn_down = True
+
+
+def _serve(engine, sock_path, scenario, reload_interval=60.0):
+    async def main():
+        server = SovereignQueryServer(engine, sock_path, reload_interval=reload_interval)
+        task = asyncio.create_task(server.serve_forever())
+        while True:
+            try:
+                _, writer = await asyncio.open_unix_connection(str(sock_path))
+            except OSError:
+                await asyncio.sleep(0.01)
+                continue
+            writer.close()
+            break
+        try:
+            return await scenario(server)
+        finally:
+            server.stop()
+            await task
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def sock_path(tmp_path):
+    return tmp_path / "sv.sock"
+
+
+def test_queries_round_trip_with_cli_output(sock_path):
+    engine = FakeEngine()
+
+    async def scenario(server):
+        def client_session():
+            with QueryClient(sock_path) as client:
+                return [
+                    client.query("deploy `rm` the build", json_mode=True),
+                    client.query("", benchmark=True),
+                    client.request({"op": "ping", "id": 7}),
+                    client.request({"op": "nope"}),
+                ]
+        return await asyncio.to_thread(client_session)
+
+    answer, diagnostic, ping, unknown = _serve(engine, sock_path, scenario)
+
+    assert answer["ok"] and json.loads(answer["output"]) == {"query": "deploy rm the build", "generation": 0}
+    assert diagnostic["output"] == "DIAGNOSTIC\n"
+    assert ping == {"ok": True, "op": "ping", "id": 7}
+    assert unknown == {"ok": False, "error": "Unknown op: nope"}
+    assert engine.torn_down and not sock_path.exists()
+
+
+def test_concurrent_clients_are_served_and_engine_runs_are_serialized(sock_path):
+    engine = FakeEngine()
+
+    async def scenario(server):
+        def one(i):
+            with QueryClient(sock_path) as client:
+                return client.query(f"query {i}")["output"]
+        outputs = await asyncio.gather(*(asyncio.to_thread(one, i) for i in range(8)))
+        return outputs, server.stats["requests"]
+
+    outputs, requests = _serve(engine, sock_path, scenario)
+
+    assert sorted(outputs) == sorted(f"match for query {i}\n" for i in range(8))
+    assert requests == 8
+    assert engine.max_active == 1
+
+
+def test_malformed_lines_get_an_error_and_the_connection_survives(sock_path):
+    engine = FakeEngine()
+
+    async def scenario(server):
+        reader, writer = await asyncio.open_unix_connection(str(sock_path))
+        writer.write(b"not json\n[1, 2]\n" + json.dumps({"op": "ping"}).encode() + b"\n")
+        await writer.drain()
+        lines = [json.loads(await reader.readline()) for _ in range(3)]
+        writer.close()
+        await writer.wait_closed()
+        return lines
+
+    bad, not_object, ping = _serve(engine, sock_path, scenario)
+
+    assert not bad["ok"] and bad["error"].startswith("Malformed request")
+    assert not not_object["ok"]
+    assert ping == {"ok": True, "op": "ping"}
+
+
+def test_changed_inputs_hot_reload_the_engine(sock_path):
+    engine = FakeEngine()
+
+    async def scenario(server):
+        assert await server.reload_if_changed() is False
+        engine.fingerprint = b"v2"
+        await asyncio.sleep(0.2)
+        with QueryClient(sock_path) as client:
+            answer = await asyncio.to_thread(client.query, "deploy", json_mode=True)
+        return answer, server.stats["reloads"]
+
+    answer, reloads = _serve(engine, sock_path, scenario, reload_interval=0.05)
+
+    assert (engine.reloads, reloads) == (1, 1)
+    assert json.loads(answer["output"])["generation"] == 1
+
+
+def test_stale_socket_is_replaced_but_a_live_one_is_refused(sock_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(sock_path))
+    stale.close()
+
+    async def scenario(server):
+        second = SovereignQueryServer(FakeEngine(), sock_path)
+        with pytest.raises(RuntimeError, match="already listening"):
+            await second.serve_forever()
+        return True
+
+    assert _serve(FakeEngine(), sock_path, scenario)
+
+
+def test_client_cli_prints_output_and_shuts_down_server(sock_path, capsys):
+    engine = FakeEngine()
+
+    async def scenario(server):
+        code = await asyncio.to_thread(sv_client.main, ["--socket", str(sock_path), "--json", "ship", "it"])
+        stop = await asyncio.to_thread(sv_client.main, ["--socket", str(sock_path), "--shutdown"])
+        return code, stop
+
+    assert _serve(engine, sock_path, scenario) == (0, 0)
+    assert json.loads(capsys.readouterr().out) == {"query": "ship it", "generation": 0}
+    assert engine.calls == [{"query": "ship it", "json": True, "record": False, "cortex": False}]
+
+
+def test_client_cli_falls_back_to_sv_engine_without_a_server(sock_path):
+    with patch("src.core.sv_client.os.execv") as execv:
+        sv_client.main(["--socket", str(sock_path), "--record", "find", "logs"])
+
+    args = execv.call_args.args[1]
+    assert args[1].endswith("sv_engine.py")
+    assert args[2:] == ["--record", "find", "logs"]
+    with pytest.raises(QueryServerUnavailable):
+        QueryClient(sock_path).request({"op": "ping"})
@@ -9,6 +9,8 @@ def test_sovereign_vector_search_cache_evicts_oldest_entry(monkeypatch) -> None:
     vector = SovereignVector.__new__(SovereignVector)
     vector.SEARCH_CACHE_MAXSIZE = 2
     vector._search_cache = OrderedDict()
+    vector.memory_db = MagicMock(corpus_generation=0)
+    vector._search_cache_generation = 0
     vector.normalize = lambda text: text.lower()
     vector.corrections = {"phrase_mappings": {}}
     vector.shadow_spoke = MagicMock()
@@ -26,6 +28,8 @@ def test_sovereign_vector_search_cache_refreshes_recency_on_hit(monkeypatch) ->
     vector = SovereignVector.__new__(SovereignVector)
     vector.SEARCH_CACHE_MAXSIZE = 2
     vector._search_cache = OrderedDict()
+    vector.memory_db = MagicMock(corpus_generation=0)
+    vector._search_cache_generation = 0
     vector.normalize = lambda text: text.lower()
     vector.corrections = {"phrase_mappings": {}}
     vector.shadow_spoke = MagicMock()
@@ -38,3 +42,110 @@ def test_sovereign_vector_search_cache_refreshes_recency_on_hit(monkeypatch) ->
 
     assert "beta" not in vector._search_cache
     assert list(vector._search_cache.keys()) == ["alpha", "gamma"]
+
+
+def _simulated_vector(monkeypatch) -> SovereignVector:
+    from src.core.engine import memory_db as memory_db_module
+    from src.core.engine.vector_calculus import VectorCalculus
+    from src.core.engine.vector_router import VectorRouter
+    from src.core.engine.vector_shadow import VectorShadow
+
+    monkeypatch.setattr(memory_db_module, "chromadb", None)
+    monkeypatch.setattr(memory_db_module, "HallOfRecords", MagicMock())
+    vector = SovereignVector.__new__(SovereignVector)
+    vector._search_cache = OrderedDict()
+    vector.memory_db = memory_db_module.MemoryDB("/mock/root")
+    vector._search_cache_generation = vector.memory_db.corpus_generation
+    vector.corrections = {"phrase_mappings": {"ship it": "/lets-go"}}
+    thesaurus = {"deploy": {"ship", "release"}, "test": {"verify"}}
+    vector.calculus_spoke = VectorCalculus({"the", "a"}, thesaurus)
+    vector.shadow_spoke = VectorShadow(vector.memory_db, {"the", "a"}, thesaurus)
+    vector.router_spoke = VectorRouter(vector.memory_db)
+    for trigger, description, domain in [
+        ("/deploy-prod", "Release the build to production servers", "SYSTEM"),
+        ("/run-tests", "Verify the suite and debug failures", "DEV"),
+        ("/graph-view", "Render the matrix graph in the hud", "UI"),
+        ("/plan-session", "Plan the next session and update the ledger", "CORE"),
+    ]:
+        vector.memory_db.upsert_skill("system", trigger, description, {"domain": domain})
+    return vector
+
+
+def test_search_many_matches_serial_search(monkeypatch) -> None:
+    queries = ["ship it", "verify the build", "render graph", "plan session ledger", "verify the build", "zzz"]
+
+    serial_vector = _simulated_vector(monkeypatch)
+    serial = [asyncio.run(serial_vector.search(query, mode="heuristic")) for query in queries]
+
+    batch_vector = _simulated_vector(monkeypatch)
+    batched = asyncio.run(batch_vector.search_many(queries, mode="heuristic"))
+
+    assert len(batched) == len(queries)
+    assert [[(r["trigger"], r["score"]) for r in results] for results in batched] == [
+        [(r["trigger"], r["score"]) for r in results] for results in serial
+    ]
+    assert batched[1] is batched[4]
+
+
+def test_memory_search_intent_many_batches_chroma_queries_per_domain() -> None:
+    from src.core.engine.memory_db import MemoryDB
+
+    db = MemoryDB.__new__(MemoryDB)
+    db.simulated = False
+    db.collection = MagicMock()
+    db._sim_cache = {}
+
+    def fake_query(query_texts, n_results, where):
+        return {
+            "ids": [[f"system::/{text}"] for text in query_texts],
+            "distances": [[0.25] for _ in query_texts],
+            "metadatas": [[{"domain": where.get("domain", "GENERAL")}] for _ in query_texts],
+            "documents": [[text] for text in query_texts],
+        }
+
+    db.collection.query.side_effect = fake_query
+    results = db.search_intent_many("system", [("alpha", "DEV"), ("beta", None), ("gamma", "DEV")], n_results=1)
+
+    assert db.collection.query.call_count == 2
+    assert [r[0]["trigger"] for r in results] == ["/alpha", "/beta", "/gamma"]
+    assert results[0][0]["score"] == 0.75
+
+
+def test_search_cache_drops_results_from_before_an_ingest(monkeypatch) -> None:
+    vector = _simulated_vector(monkeypatch)
+    before = asyncio.run(vector.search("release build servers", mode="heuristic"))
+    assert "release build servers" in vector._search_cache
+
+    vector.memory_db.upsert_skill("system", "/release-build", "Release build servers", {"domain": "SYSTEM"})
+    after = asyncio.run(vector.search("release build servers", mode="heuristic"))
+
+    assert "/release-build" not in [result["trigger"] for result in before]
+    assert "/release-build" in [result["trigger"] for result in after]
+
+
+def test_search_many_scores_wide_candidate_pools_in_one_matrix_pass(monkeypatch) -> None:
+    from src.core.engine import vector_calculus
+
+    queries = ["deploy build servers", "release build step", "servers deploy build"]
+
+    def ranked(matrix_enabled: bool):
+        vector = _simulated_vector(monkeypatch)
+        vector.SEMANTIC_CANDIDATES = 300
+        for index in range(200):
+            vector.memory_db.upsert_skill(
+                "system", f"/build-{index}", f"Build step {index} for servers suite graph", {"domain": "SYSTEM"}
+            )
+        monkeypatch.setattr(vector_calculus, "vectorization_available", lambda: matrix_enabled)
+        return asyncio.run(vector.search_many(queries, mode="heuristic"))
+
+    passes = MagicMock(side_effect=vector_calculus.score_batches)
+    monkeypatch.setattr(vector_calculus, "score_batches", passes)
+    batched = ranked(matrix_enabled=True)
+    scalar = ranked(matrix_enabled=False)
+
+    assert passes.call_count == 1
+    assert len(passes.call_args.args[0]) == len(queries)
+    assert all(len(results) >= vector_calculus.VECTORIZE_MIN_CANDIDATES for results in batched)
+    assert [[(r["trigger"], r["score"]) for r in results] for results in batched] == [
+        [(r["trigger"], r["score"]) for r in results] for results in scalar
+    ]
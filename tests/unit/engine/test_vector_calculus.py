@@ -1,3 +1,4 @@
+import random
 import unittest
 from src.core.engine.vector_calculus import VectorCalculus
 
@@ -59,5 +60,49 @@ class TestVectorCalculus(unittest.TestCase):
         scored = self.calc.score_intent(result, expansion, original_tokens, all_expanded)
         self.assertEqual(scored["score"], 0.0)
 
+    def test_score_intents_matrix_path_is_bit_identical(self):
+        rng = random.Random(11)
+        vocab = [f"w{i}" for i in range(40)]
+        thesaurus = {word: set(rng.sample(vocab, 3)) for word in vocab[:20]}
+        calc = VectorCalculus(set(), thesaurus)
+        intents = [" ".join(rng.sample(vocab, rng.randint(0, 8))) for _ in range(500)]
+        intents.append("")
+
+        for _ in range(20):
+            original_tokens = set(rng.sample(vocab, rng.randint(0, 9)))
+            expansion = calc.expand_query(original_tokens)
+            all_expanded = set().union(*expansion.values())
+            scalar = [
+                calc.score_intent({"intent": intent}, expansion, original_tokens, all_expanded)["score"]
+                for intent in intents
+            ]
+            batch = [{"intent": intent} for intent in intents]
+            batch[3]["_neural_boost"] = True
+            scored = calc.score_intents(batch, expansion, original_tokens, all_expanded)
+
+            expected = list(scalar)
+            expected[3] = 1.0
+            self.assertEqual([r["score"] for r in scored], expected)
+            self.assertIsNot(scored, batch)
+
+    def test_score_intents_many_shares_one_pass_across_wide_batches(self):
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(60)]
+        thesaurus = {word: set(rng.sample(vocab, 3)) for word in vocab[:30]}
+        calc = VectorCalculus(set(), thesaurus)
+        batches = []
+        for width in (300, 5, 200, 0):
+            original_tokens = set(rng.sample(vocab, rng.randint(1, 6)))
+            expansion = calc.expand_query(original_tokens)
+            intents = [" ".join(rng.sample(vocab, rng.randint(0, 8))) for _ in range(width)]
+            batches.append((intents, expansion, original_tokens, set().union(*expansion.values())))
+
+        scored = calc.score_intents_many([([{"intent": i} for i in intents], *query) for intents, *query in batches])
+
+        expected = [
+            [calc.score_intent({"intent": i}, *query)["score"] for i in intents] for intents, *query in batches
+        ]
+        self.assertEqual([[r["score"] for r in results] for results in scored], expected)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,12 @@
+import json
+import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
-from src.core.engine.vector_ingest import VectorIngest
+from src.core.engine.intent_store import IntentStore
+from src.core.engine.vector_ingest import IngestReport, SkillManifest, VectorIngest
 
 class TestVectorIngest(unittest.TestCase):
     def setUp(self):
@@ -43,24 +48,160 @@ class TestVectorIngest(unittest.TestCase):
         self.assertEqual(args[1][0]["trigger"], "/test_skill")
         self.assertEqual(args[1][0]["metadata"]["domain"], "CORE")
 
+    def _intent_of(self, name, content):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / name
+            path.write_text(content, encoding="utf-8")
+            return self.ingest._read_intent(path)
+
     def test_read_intent_explicit(self):
-        mock_file = MagicMock(spec=Path)
-        mock_file.read_text.return_value = "# Intent: My explicit intent\nSome content"
-        intent = self.ingest._read_intent(mock_file)
+        intent = self._intent_of("skill.py", "# Intent: My explicit intent\nSome content")
         self.assertEqual(intent, "My explicit intent")
 
     def test_read_intent_description(self):
-        mock_file = MagicMock(spec=Path)
-        mock_file.read_text.return_value = "description: My description intent\nSome content"
-        intent = self.ingest._read_intent(mock_file)
+        intent = self._intent_of("skill.py", "description: My description intent\nSome content")
         self.assertEqual(intent, "My description intent")
 
     def test_read_intent_header(self):
-        mock_file = MagicMock(spec=Path)
-        mock_file.suffix = ".qmd"
-        mock_file.read_text.return_value = "# My Header Intent\nSome content"
-        intent = self.ingest._read_intent(mock_file)
+        intent = self._intent_of("skill.qmd", "# My Header Intent\nSome content")
         self.assertEqual(intent, "My Header Intent")
 
+
+class TestIncrementalIngest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.skills = self.root / "skills"
+        self.skills.mkdir()
+        (self.skills / "alpha.md").write_text("# Intent: First skill\n", encoding="utf-8")
+        (self.skills / "beta.py").write_text("# Intent: Second skill\n", encoding="utf-8")
+        self.memory_db = MagicMock()
+        self.memory_db.simulated = False
+        self.memory_db.get_skill_manifest_path.return_value = self.root / "store" / "skill_manifest.json"
+        self.store = IntentStore()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _load(self):
+        self.memory_db.reset_mock()
+        return VectorIngest(self.memory_db, intent_store=self.store).load_skills_from_dir(self.skills)
+
+    def _upserted(self):
+        if not self.memory_db.batch_upsert_skills.called:
+            return []
+        return sorted(s["trigger"] for s in self.memory_db.batch_upsert_skills.call_args.args[1])
+
+    def test_unchanged_files_are_neither_read_nor_upserted(self):
+        self.assertEqual(self._load(), IngestReport(added=2))
+        self.assertEqual(self._upserted(), ["/alpha", "/beta"])
+
+        with patch.object(Path, "read_bytes") as read_bytes:
+            self.assertEqual(self._load(), IngestReport(skipped=2))
+        read_bytes.assert_not_called()
+        self.assertEqual(self._upserted(), [])
+
+    def test_changes_and_removals_are_applied(self):
+        self._load()
+        (self.skills / "alpha.md").write_text("# Intent: Reworded skill\n", encoding="utf-8")
+        (self.skills / "beta.py").unlink()
+        (self.skills / "gamma.qmd").write_text("# Intent: Third skill\n", encoding="utf-8")
+
+        self.assertEqual(self._load(), IngestReport(added=1, updated=1, removed=1))
+        self.assertEqual(self._upserted(), ["/alpha", "/gamma"])
+        self.memory_db.delete_skills.assert_called_once_with("system", ["/beta"])
+
+    def test_trigger_still_provided_by_another_directory_is_restored_not_deleted(self):
+        other = self.root / "workflows"
+        other.mkdir()
+        (other / "beta.md").write_text("# Intent: Workflow beta\n", encoding="utf-8")
+        VectorIngest(self.memory_db, intent_store=self.store).load_skills_from_dir(other)
+        self._load()
+
+        (self.skills / "beta.py").unlink()
+        self.assertEqual(self._load(), IngestReport(removed=1, skipped=1))
+        self.memory_db.delete_skills.assert_called_once_with("system", [])
+        restored = self.memory_db.batch_upsert_skills.call_args.args[1]
+        self.assertEqual([(s["trigger"], s["description"]) for s in restored], [("/beta", "Workflow beta")])
+
+    def test_unreadable_file_keeps_its_skill_until_it_can_be_read(self):
+        self._load()
+        (self.skills / "alpha.md").write_text("# Intent: Reworded skill\n", encoding="utf-8")
+
+        with patch("src.core.engine.intent_store.read_prefix", side_effect=PermissionError("locked")):
+            self.assertEqual(self._load(), IngestReport(skipped=2))
+        self.memory_db.delete_skills.assert_called_once_with("system", [])
+
+        self.assertEqual(self._load(), IngestReport(updated=1, skipped=1))
+        self.assertEqual(self._upserted(), ["/alpha"])
+
+    def test_new_intent_rules_reread_every_file(self):
+        self._load()
+        manifest = self.root / "store" / "skill_manifest.json"
+        payload = json.loads(manifest.read_text(encoding="utf-8"))
+        payload["intent_rules"] = "older"
+        manifest.write_text(json.dumps(payload), encoding="utf-8")
+        self.store = IntentStore()
+
+        with patch("src.core.engine.intent_store.extract_intent", return_value="Re-extracted") as parse:
+            self.assertEqual(self._load(), IngestReport(updated=2))
+        self.assertEqual(parse.call_count, 2)
+        self.memory_db.delete_skills.assert_called_once_with("system", [])
+
+    def test_failed_upsert_is_retried_on_the_next_load(self):
+        self.memory_db.batch_upsert_skills.side_effect = RuntimeError("store offline")
+        with self.assertRaises(RuntimeError):
+            self._load()
+
+        self.memory_db.batch_upsert_skills.side_effect = None
+        self.assertEqual(self._load(), IngestReport(added=2))
+        self.assertEqual(self._upserted(), ["/alpha", "/beta"])
+
+    def test_touched_file_with_same_content_is_skipped(self):
+        self._load()
+        alpha = self.skills / "alpha.md"
+        os.utime(alpha, ns=(alpha.stat().st_atime_ns, alpha.stat().st_mtime_ns + 10**9))
+
+        with patch("src.core.engine.intent_store.extract_intent") as parse:
+            self.assertEqual(self._load(), IngestReport(skipped=2))
+        parse.assert_not_called()
+
+    def test_snapshot_entries_matching_the_manifest_skip_the_scan(self):
+        first = VectorIngest(self.memory_db)
+        first.load_skills_from_dir(self.skills)
+        self.memory_db.reset_mock()
+
+        warm = VectorIngest(self.memory_db, preloaded=first.ingested)
+        with patch.object(VectorIngest, "skill_files") as skill_files:
+            self.assertEqual(warm.load_skills_from_dir(self.skills), IngestReport(skipped=2))
+        skill_files.assert_not_called()
+        self.assertEqual(warm.ingested, first.ingested)
+
+
+class TestSkillManifest(unittest.TestCase):
+    def test_concurrent_saves_do_not_collide(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = SkillManifest(Path(tmp) / "skill_manifest.json")
+            manifest.sources = {"skills": {"a.md": {"trigger": "/a"}}}
+            errors = []
+
+            def saver():
+                try:
+                    for _ in range(50):
+                        manifest.save()
+                except OSError as exc:
+                    errors.append(exc)
+
+            threads = [threading.Thread(target=saver) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEqual(errors, [])
+            self.assertEqual(SkillManifest(manifest.path).sources, manifest.sources)
+            self.assertEqual(list(Path(tmp).glob("*.tmp")), [])
+
+
 if __name__ == "__main__":
     unittest.main()
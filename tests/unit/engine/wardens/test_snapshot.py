@@ -0,0 +1,87 @@
+import ast
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.engine.wardens.edda import EddaWarden
+from src.core.engine.wardens.mimir import MimirWarden
+from src.core.engine.wardens.snapshot import RepositorySnapshot
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("def run(x):\n    return x\n", encoding="utf-8")
+    (tmp_path / "src" / "broken.py").write_text("def broken(:\n", encoding="utf-8")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n", encoding="utf-8")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "hooks.py").write_text("x = 1\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_walk_prunes_ignored_dirs_and_filters(tree):
+    snapshot = RepositorySnapshot(tree)
+
+    assert [p.relative_to(tree).as_posix() for p in snapshot.files(".py")] == ["src/app.py", "src/broken.py"]
+    assert [p.name for p in snapshot.files(".md")] == ["guide.md"]
+    assert [p.name for p in snapshot.files(under="docs")] == ["guide.md"]
+    assert snapshot.stats["walks"] == 1
+
+
+def test_source_and_ast_are_shared_across_wardens(tree):
+    snapshot = RepositorySnapshot(tree)
+    with patch("src.core.engine.wardens.base.BraveSearch"):
+        wardens = [EddaWarden(tree, snapshot), MimirWarden(tree, snapshot)]
+
+    with patch("src.core.telemetry.SubspaceTelemetry"):
+        for warden in wardens:
+            warden.scan()
+
+    assert snapshot.stats["walks"] == 1
+    assert snapshot.stats["files_read"] == 2
+    assert snapshot.stats["parses"] == 2
+    assert snapshot.stats["bytes_read"] == sum(len(p.read_bytes()) for p in snapshot.files(".py"))
+
+
+def test_syntax_error_is_cached(tree):
+    snapshot = RepositorySnapshot(tree)
+    broken = tree / "src" / "broken.py"
+
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            snapshot.parse(broken)
+
+    assert snapshot.stats["parses"] == 1
+    assert isinstance(snapshot.parse(tree / "src" / "app.py"), ast.Module)
+
+
+def test_refresh_reuses_unchanged_files(tree):
+    first = RepositorySnapshot(tree)
+    app, broken = tree / "src" / "app.py", tree / "src" / "broken.py"
+    first.parse(app)
+    first.read_text(broken)
+
+    broken.write_text("def fixed():\n    pass\n", encoding="utf-8")
+    stat = os.stat(broken)
+    os.utime(broken, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = first.refresh()
+    second.files()
+    assert isinstance(second.parse(app), ast.Module)
+    assert "fixed" in second.read_text(broken)
+    assert second.stats["files_read"] == 1
+    assert second.stats["parses"] == 0
+
+
+def test_warden_builds_snapshot_lazily():
+    with patch("src.core.engine.wardens.base.BraveSearch"):
+        warden = EddaWarden(Path("/tmp/root"))
+
+    assert warden._snapshot is None
+    assert warden.snapshot is warden.snapshot
+    assert warden.snapshot.root == Path("/tmp/root")
@@ -0,0 +1,109 @@
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.engine.wardens import sweep as sweep_module
+from src.core.engine.wardens.base import BaseWarden
+from src.core.engine.wardens.edda import EddaWarden
+from src.core.engine.wardens.gungnir_warden import GungnirWarden
+from src.core.engine.wardens.mimir import MimirWarden
+from src.core.engine.wardens.sweep import WardenSweep, _TaskOutcome
+
+
+class SlowWarden(BaseWarden):
+    def scan(self):
+        while True:
+            time.sleep(0.01)
+
+
+class BrokenWarden(BaseWarden):
+    def scan(self):
+        raise RuntimeError("shattered")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for i in range(6):
+        lines = "\n".join(f"    value_{j} = x + {j}" for j in range(15))
+        (tmp_path / f"module_{i}.py").write_text(f"def func_{i}(x):\n{lines}\n    return x\n", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("# Notes\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    with patch("src.core.engine.wardens.base.BraveSearch"), \
+         patch("src.core.engine.wardens.sweep.SovereignHUD"), \
+         patch("src.core.telemetry.SubspaceTelemetry.log_trace"):
+        yield
+
+
+def test_pool_sweep_matches_inline_sweep(tree, monkeypatch):
+    monkeypatch.setattr(sweep_module, "SHARD_MIN_FILES", 1)
+    wardens = [MimirWarden, GungnirWarden, EddaWarden]
+
+    inline = WardenSweep(tree, wardens, max_workers=1).run()
+    with WardenSweep(tree, wardens, max_workers=3) as sweep:
+        pooled = sweep.run()
+
+    assert pooled.breaches == inline.breaches
+    assert [r.warden for r in pooled.reports] == ["MimirWarden", "GungnirWarden", "EddaWarden"]
+    assert [r.shards for r in pooled.reports] == [3, 3, 1]
+    assert pooled.reports[0].files_processed == 6
+    assert all(r.cpu_time > 0 for r in pooled.reports[:2])
+
+
+def test_budget_interrupts_overrunning_warden(tree):
+    result = WardenSweep(tree, [SlowWarden, EddaWarden], max_workers=1, budgets={"SlowWarden": 0.05}).run()
+
+    slow, edda = result.reports
+    assert slow.timed_out and slow.breaches == []
+    assert 0.05 <= slow.wall_time < 1.0
+    assert not edda.timed_out and edda.breaches
+
+
+def test_warden_error_is_reported_without_failing_sweep(tree):
+    result = WardenSweep(tree, [BrokenWarden, EddaWarden], max_workers=1).run()
+
+    assert result.reports[0].errors == ["RuntimeError: shattered"]
+    assert result.breaches == result.reports[1].breaches
+
+
+def test_merge_is_independent_of_completion_order(tree):
+    sweep = WardenSweep(tree, [MimirWarden, EddaWarden], max_workers=2)
+    outcomes = [
+        _TaskOutcome(1, 0, [{"file": "c"}], started=5.0, wall_time=1.0),
+        _TaskOutcome(0, 1, [{"file": "b"}], started=2.0, wall_time=3.0),
+        _TaskOutcome(0, 0, [{"file": "a"}], started=1.0, wall_time=1.0),
+    ]
+
+    reports = sweep._merge(outcomes)
+
+    assert [b["file"] for r in reports for b in r.breaches] == ["a", "b", "c"]
+    assert reports[0].wall_time == 4.0
+    assert reports[0].shards == 2
+
+
+def test_consecutive_sweeps_refresh_the_snapshot(tree):
+    sweep = WardenSweep(tree, [MimirWarden], max_workers=1)
+    sweep.run()
+    first = sweep._snapshot
+    sweep.run()
+
+    assert sweep._snapshot is not first
+    assert sweep._snapshot.stats["files_read"] == 0
+    assert sweep._snapshot.root == Path(tree)
+
+
+def test_pool_is_reused_across_sweeps_until_closed(tree):
+    with WardenSweep(tree, [MimirWarden, EddaWarden], max_workers=2) as sweep:
+        first = sweep.run()
+        pool = sweep._pool
+        second = sweep.run()
+
+        assert pool is not None and sweep._pool is pool
+        assert second.breaches == first.breaches
+
+    assert sweep._pool is None
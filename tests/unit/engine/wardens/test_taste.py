@@ -11,7 +11,7 @@ def warden():
 
 def test_scan_slop_name(warden):
     mock_content = "const userName = 'John Doe';"
-    with patch.object(Path, "rglob", return_value=[Path("/tmp/root/test.tsx")]), \
+    with patch("os.walk", return_value=[("/tmp/root", [], ["test.tsx"])]), \
          patch.object(Path, "read_text", return_value=mock_content), \
          patch.object(Path, "relative_to", return_value=Path("test.tsx")), \
          patch.object(warden, "_should_ignore", return_value=False):
@@ -23,7 +23,7 @@ def test_scan_slop_name(warden):
 
 def test_scan_pure_black(warden):
     mock_content = "color: #000000; background: bg-black;"
-    with patch.object(Path, "rglob", return_value=[Path("/tmp/root/test.tsx")]), \
+    with patch("os.walk", return_value=[("/tmp/root", [], ["test.tsx"])]), \
          patch.object(Path, "read_text", return_value=mock_content), \
          patch.object(Path, "relative_to", return_value=Path("test.tsx")), \
          patch.object(warden, "_should_ignore", return_value=False):
@@ -34,7 +34,7 @@ def test_scan_pure_black(warden):
 
 def test_scan_boring_layout(warden):
     mock_content = "<div className='grid grid-cols-3'></div>"
-    with patch.object(Path, "rglob", return_value=[Path("/tmp/root/test.tsx")]), \
+    with patch("os.walk", return_value=[("/tmp/root", [], ["test.tsx"])]), \
          patch.object(Path, "read_text", return_value=mock_content), \
          patch.object(Path, "relative_to", return_value=Path("test.tsx")), \
          patch.object(warden, "_should_ignore", return_value=False):
@@ -45,7 +45,7 @@ def test_scan_boring_layout(warden):
 
 def test_scan_organic_data(warden):
     mock_content = "const progress = '50%';"
-    with patch.object(Path, "rglob", return_value=[Path("/tmp/root/test.tsx")]), \
+    with patch("os.walk", return_value=[("/tmp/root", [], ["test.tsx"])]), \
          patch.object(Path, "read_text", return_value=mock_content), \
          patch.object(Path, "relative_to", return_value=Path("test.tsx")), \
          patch.object(warden, "_should_ignore", return_value=False):
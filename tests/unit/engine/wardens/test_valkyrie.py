@@ -0,0 +1,101 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import vulture
+
+from src.core.engine.wardens.snapshot import RepositorySnapshot
+from src.core.engine.wardens.valkyrie import ValkyrieWarden
+
+MODULES = {
+    "src/app.py": (
+        "import os\n"
+        "import json as js\n"
+        "from src.helpers import used_helper\n\n"
+        "def main():\n"
+        "    return used_helper()\n"
+        "    print('never')\n\n"
+        "class Orphan:\n"
+        "    attr = 1\n"
+        "    def method(self):\n"
+        "        self.dead_attr = 2\n"
+    ),
+    "src/helpers.py": "def used_helper():\n    return 1\n\ndef unused_helper():\n    return 2\n",
+    "src/__init__.py": "import sys\n",
+    "tests/test_app.py": "class TestApp:\n    def test_main(self):\n        pass\n",
+    "src/broken.py": "def broken(:\n",
+}
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel, source in MODULES.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    with patch("src.core.engine.wardens.base.BraveSearch"):
+        yield
+
+
+def _full(root: Path) -> tuple[list[str], list[dict]]:
+    with patch.dict(os.environ, {"CSTAR_ANALYSIS_CACHE": "0"}):
+        warden = ValkyrieWarden(root, RepositorySnapshot(root))
+        v = vulture.Vulture(verbose=False)
+        warden._scavenge(v)
+        return [item.get_report() for item in v.get_unused_code()], ValkyrieWarden(root).scan()
+
+
+def _incremental(root: Path, snapshot: RepositorySnapshot) -> tuple[list[str], list[dict], dict]:
+    warden = ValkyrieWarden(root, snapshot)
+    v = vulture.Vulture(verbose=False)
+    warden._scavenge(v)
+    reports = [item.get_report() for item in v.get_unused_code()]
+    return reports, ValkyrieWarden(root, snapshot).scan(), warden.last_scavenge
+
+
+def test_full_scavenge_matches_vulture(tree):
+    reports, breaches = _full(tree)
+
+    v = vulture.Vulture(verbose=False)
+    v.scavenge([str(tree)])
+    assert reports == [item.get_report() for item in v.get_unused_code()]
+    assert any("unused_helper" in b["action"] for b in breaches)
+    assert not any(b["file"].endswith("__init__.py") for b in breaches)
+
+
+def test_incremental_matches_full_run_across_edits(tree, capsys):
+    snapshot = RepositorySnapshot(tree)
+    cold_reports, cold_breaches, cold_stats = _incremental(tree, snapshot)
+    assert (cold_reports, cold_breaches) == _full(tree)
+    assert cold_stats == {"modules": 5, "rescanned": 5}
+
+    # A new process: fresh snapshot, only the persisted tables survive.
+    warm_reports, warm_breaches, warm_stats = _incremental(tree, RepositorySnapshot(tree))
+    assert (warm_reports, warm_breaches) == (cold_reports, cold_breaches)
+    assert warm_stats == {"modules": 5, "rescanned": 0}
+
+    helpers = tree / "src" / "helpers.py"
+    helpers.write_text("def used_helper():\n    return unused_helper()\n\ndef unused_helper():\n    return 2\n", encoding="utf-8")
+    stat = os.stat(helpers)
+    os.utime(helpers, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    (tree / "src" / "extra.py").write_text("from src.app import Orphan\n", encoding="utf-8")
+
+    edited_reports, edited_breaches, edited_stats = _incremental(tree, snapshot.refresh())
+    assert (edited_reports, edited_breaches) == _full(tree)
+    assert edited_stats == {"modules": 6, "rescanned": 2}
+    assert not any("unused_helper" in report for report in edited_reports)
+
+
+def test_incremental_can_be_disabled(tree):
+    warden = ValkyrieWarden(tree, RepositorySnapshot(tree))
+    warden.config["VALKYRIE_INCREMENTAL"] = False
+    warden.scan()
+    warden.scan()
+
+    assert warden.last_scavenge == {"modules": 5, "rescanned": 5}
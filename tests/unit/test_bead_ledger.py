@@ -1,6 +1,9 @@
+import gc
 import json
 import threading
+import weakref
 
+from src.core.engine import tasks_projection
 from src.core.engine.bead_ledger import BeadLedger
 from src.core.engine.hall_schema import HallBeadRecord, HallFileRecord, HallOfRecords, HallScanRecord, HallValidationRun
 
@@ -416,3 +419,276 @@ def test_bead_ledger_archives_system_execution_telemetry(tmp_path):
     assert bead.status == "ARCHIVED"
     assert bead.triage_reason is None
     assert "telemetry retained" in (bead.resolution_note or "").lower()
+
+
+def test_indexed_claim_order_matches_claim_sort_key(tmp_path):
+    seed_hall(tmp_path)
+    hall = HallOfRecords(tmp_path)
+    repo = hall.bootstrap_repository()
+    for index, (status, overall, contracts) in enumerate(
+        [
+            ("OPEN", 1.5, ["contract:open-low"]),
+            ("SET", 4.0, ["contract:set-high"]),
+            ("SET", 2.0, ["contract:set-low"]),
+            ("OPEN", 0.5, ["lore:not-executable"]),
+            ("BLOCKED", 0.1, ["contract:blocked"]),
+        ]
+    ):
+        hall.upsert_bead(
+            HallBeadRecord(
+                bead_id=f"bead-order-{index}",
+                repo_id=repo.repo_id,
+                scan_id="scan-1",
+                target_path="src/core/sample.py",
+                rationale=f"Ordered bead {index}",
+                contract_refs=contracts,
+                baseline_scores={"overall": overall},
+                acceptance_criteria="Raise the baseline above 5.0.",
+                status=status,
+                triage_reason="Blocked upstream." if status == "BLOCKED" else None,
+                created_at=1700000001000 + index,
+                updated_at=1700000001000 + index,
+            )
+        )
+
+    ledger = BeadLedger(tmp_path)
+    expected = [
+        bead.id
+        for bead in sorted(
+            (bead for bead in ledger.list_beads() if ledger._is_claimable(bead)),
+            key=ledger._claim_sort_key,
+        )
+    ]
+    claimed = []
+    while (bead := ledger.claim_next_bead("RAVEN-ORDER")) is not None:
+        claimed.append(bead["id"])
+
+    assert expected == ["bead-order-2", "bead-order-1", "bead-order-0"]
+    assert claimed == expected
+
+
+def test_claim_index_tracks_writes_that_bypass_the_ledger(tmp_path):
+    seed_hall(tmp_path)
+    ledger = BeadLedger(tmp_path)
+    bead = ledger.upsert_bead(
+        target_path="src/core/sample.py",
+        rationale="Repair the sample path",
+        contract_refs=["contracts:sample-repair"],
+        acceptance_criteria="Raise the baseline above 5.0.",
+    )
+
+    with ledger.connect() as conn:
+        conn.execute("UPDATE hall_beads SET contract_refs_json = ? WHERE bead_id = ?", (json.dumps(["lore:only"]), bead.id))
+        row = conn.execute("SELECT claimable FROM hall_beads WHERE bead_id = ?", (bead.id,)).fetchone()
+    assert row["claimable"] == 0
+
+    with ledger.connect() as conn:
+        conn.execute(
+            "UPDATE hall_beads SET contract_refs_json = ?, baseline_scores_json = ? WHERE bead_id = ?",
+            (json.dumps(["contracts:sample-repair"]), json.dumps({"scan_baseline": "3.25"}), bead.id),
+        )
+        row = conn.execute("SELECT claimable, claim_priority FROM hall_beads WHERE bead_id = ?", (bead.id,)).fetchone()
+    assert row["claimable"] == 1
+    assert row["claim_priority"] == 3.25
+
+
+def test_claim_next_p1_scan_bead_only_claims_p1_scan_work(tmp_path):
+    seed_hall(tmp_path)
+    hall = HallOfRecords(tmp_path)
+    repo = hall.bootstrap_repository()
+    hall.record_scan(
+        HallScanRecord(
+            scan_id="scan-p1",
+            repo_id=repo.repo_id,
+            scan_kind="P1_SCAN",
+            status="COMPLETED",
+            started_at=1700000000300,
+            completed_at=1700000000400,
+        )
+    )
+    ledger = BeadLedger(tmp_path)
+    ledger.upsert_bead(
+        scan_id="scan-1",
+        target_path="src/core/sample.py",
+        rationale="Baseline scan work",
+        contract_refs=["contract:baseline"],
+        acceptance_criteria="Raise the baseline above 5.0.",
+        status="SET",
+    )
+    p1_bead = ledger.upsert_bead(
+        scan_id="scan-p1",
+        target_path="src/core/sample.py",
+        rationale="P1 scan work",
+        contract_refs=["contract:p1"],
+        acceptance_criteria="Raise the baseline above 5.0.",
+    )
+
+    claimed = ledger.claim_next_p1_scan_bead("RAVEN-P1")
+
+    assert claimed is not None
+    assert claimed["id"] == p1_bead.id
+    assert claimed["status"] == "IN_PROGRESS"
+    assert ledger.claim_next_p1_scan_bead("RAVEN-P1") is None
+
+
+def test_lazy_normalization_only_rewrites_touched_beads(tmp_path):
+    seed_hall(tmp_path)
+    ledger = BeadLedger(tmp_path)
+    for index in range(3):
+        ledger.upsert_bead(
+            target_path="src/core/sample.py",
+            rationale=f"Repair sample concern {index}",
+            contract_refs=[f"contract:sample-{index}"],
+            acceptance_criteria="Raise the baseline above 5.0.",
+        )
+
+    assert ledger.normalize_pending_beads() == 0
+    examined = ledger.normalization_stats["rows_examined"]
+    ledger.list_beads()
+    assert ledger.normalization_stats["rows_examined"] == examined
+
+    hall = HallOfRecords(tmp_path)
+    hall.upsert_bead(
+        HallBeadRecord(
+            bead_id="bead:external-writer",
+            repo_id=ledger.repository.repo_id,
+            scan_id="scan-1",
+            target_path="src/core/sample.py",
+            rationale="Externally written bead without acceptance criteria",
+            contract_refs=["contract:external"],
+            status="OPEN",
+            created_at=1700000000900,
+            updated_at=1700000000900,
+        )
+    )
+
+    assert ledger.normalize_pending_beads() == 1
+    assert ledger.normalization_stats["last_rows_rewritten"] == 1
+    assert ledger.normalization_stats["rows_examined"] == examined + 1
+    bead = ledger.get_bead("bead:external-writer")
+    assert bead is not None
+    assert bead.status == "NEEDS_TRIAGE"
+    assert bead.triage_reason == "Missing acceptance criteria."
+
+    assert ledger.normalize_pending_beads() == 0
+    assert ledger.normalization_stats["rows_examined"] == examined + 1
+
+
+def test_normalization_version_bump_renormalizes_stamped_beads(tmp_path, monkeypatch):
+    seed_hall(tmp_path)
+    ledger = BeadLedger(tmp_path)
+    ledger.upsert_bead(
+        target_path="src/core/sample.py",
+        rationale="Repair the sample path",
+        contract_refs=["contracts:sample-repair"],
+        acceptance_criteria="Raise the baseline above 5.0.",
+    )
+    ledger.normalize_pending_beads()
+    examined = ledger.normalization_stats["rows_examined"]
+
+    monkeypatch.setattr(BeadLedger, "NORMALIZATION_VERSION", BeadLedger.NORMALIZATION_VERSION + 1)
+    assert ledger.normalize_pending_beads() == 0
+    assert ledger.normalization_stats["rows_examined"] == examined + 1
+    assert ledger.normalize_pending_beads() == 0
+    assert ledger.normalization_stats["rows_examined"] == examined + 1
+
+
+def test_incremental_projection_only_rerenders_changed_sections(tmp_path):
+    seed_hall(tmp_path)
+    ledger = BeadLedger(tmp_path)
+    beads = [
+        ledger.upsert_bead(
+            target_path="src/core/sample.py",
+            rationale=f"Repair sample concern {index}",
+            contract_refs=[f"contract:sample-{index}"],
+            acceptance_criteria="Raise the baseline above 5.0.",
+        )
+        for index in range(3)
+    ]
+    rendered = ledger.projection_stats["sections_rendered"]
+
+    ledger.claim_bead(beads[0].id, "AGENT-1")
+
+    # Only the OPEN and IN_PROGRESS sections moved.
+    assert ledger.projection_stats["sections_rendered"] == rendered + 2
+    assert (tmp_path / "tasks.qmd").read_text(encoding="utf-8") == BeadLedger(tmp_path).render_tasks_projection()
+    assert ledger.projection_matches() is True
+
+
+def test_deferred_projection_coalesces_bursts_into_one_atomic_write(tmp_path):
+    seed_hall(tmp_path)
+    ledger = BeadLedger(tmp_path, projection_mode="deferred", projection_staleness_ms=60_000)
+    for index in range(5):
+        ledger.upsert_bead(
+            target_path="src/core/sample.py",
+            rationale=f"Repair sample concern {index}",
+            contract_refs=[f"contract:sample-{index}"],
+            acceptance_criteria="Raise the baseline above 5.0.",
+        )
+
+    assert not (tmp_path / "tasks.qmd").exists()
+    assert ledger.flush_tasks_projection() is True
+    assert ledger.flush_tasks_projection() is False
+    assert ledger._projection_writer.stats == {"requests": 5, "flushes": 1}
+    assert ledger.projection_matches() is True
+    assert list(tmp_path.glob("tasks.qmd.*.tmp")) == []
+    ledger.close()
+
+
+def test_concurrent_projection_writes_never_swap_in_another_writers_temp_file(tmp_path):
+    path = tmp_path / "tasks.qmd"
+    errors: list[BaseException] = []
+
+    def writer(index: int) -> None:
+        try:
+            for _ in range(100):
+                tasks_projection.write_projection_atomically(path, f"writer {index}\n" * 50)
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert path.read_text(encoding="utf-8") in {f"writer {index}\n" * 50 for index in range(4)}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_deferred_projection_flushes_within_staleness_window(tmp_path, monkeypatch):
+    seed_hall(tmp_path)
+    monkeypatch.setenv("CSTAR_TASKS_PROJECTION_MODE", "deferred")
+    monkeypatch.setenv("CSTAR_TASKS_PROJECTION_STALENESS_MS", "10")
+    ledger = BeadLedger(tmp_path)
+    flushed = threading.Event()
+    write = ledger._projection_writer._flush
+
+    def record_flush():
+        write()
+        flushed.set()
+
+    ledger._projection_writer._flush = record_flush
+    bead = ledger.upsert_bead(
+        target_path="src/core/sample.py",
+        rationale="Repair the sample path",
+        contract_refs=["contracts:sample-repair"],
+        acceptance_criteria="Raise the baseline above 5.0.",
+    )
+
+    assert flushed.wait(5)
+    assert f"[{bead.id}]" in (tmp_path / "tasks.qmd").read_text(encoding="utf-8")
+    ledger.close()
+
+
+def test_deferred_writers_are_not_pinned_until_exit(tmp_path):
+    seed_hall(tmp_path)
+    ledger = BeadLedger(tmp_path, projection_mode="deferred", projection_staleness_ms=60_000)
+    writer = weakref.ref(ledger._projection_writer)
+    assert writer() in tasks_projection._LIVE_WRITERS
+
+    del ledger
+    gc.collect()
+
+    assert writer() is None
@@ -9,6 +9,7 @@ from src.core.engine.hall_schema import (
     HallFileRecord,
     HallOfRecords,
     HallRepositoryRecord,
+    HallSkillObservation,
     HallSkillProposalRecord,
     HallScanRecord,
     HallValidationRun,
@@ -348,3 +349,184 @@ def test_hall_schema_persists_file_imports_and_episodic_memory(tmp_path):
     assert memory.metadata["source"] == "unit-test"
     assert len(memories) == 1
     assert memories[0].memory_id == "memory-1"
+
+
+def test_hall_connections_are_shared_per_process_and_readers_are_read_only(tmp_path):
+    agents_dir = tmp_path / ".agents"
+    agents_dir.mkdir()
+    (agents_dir / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+
+    first = HallOfRecords(tmp_path)
+    first.bootstrap_repository()
+    second = HallOfRecords(tmp_path)
+    second.bootstrap_repository()
+    second.get_repository_summary()
+
+    assert second.connections is first.connections
+    assert first.connections.stats["writer_opens"] == 1
+    assert first.connections.stats["reader_opens"] == 1
+    assert first.read() is second.read()
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        first.read().execute("DELETE FROM hall_repositories")
+
+
+def test_hall_connections_reset_when_database_file_is_replaced(tmp_path):
+    agents_dir = tmp_path / ".agents"
+    agents_dir.mkdir()
+    (agents_dir / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+
+    hall = HallOfRecords(tmp_path)
+    hall.bootstrap_repository()
+    for suffix in ("", "-wal", "-shm"):
+        (tmp_path / ".stats" / f"pennyone.db{suffix}").unlink(missing_ok=True)
+
+    repo = hall.bootstrap_repository()
+
+    assert hall.connections.stats["resets"] == 1
+    assert hall.get_repository_record().repo_id == repo.repo_id
+    with sqlite3.connect(tmp_path / ".stats" / "pennyone.db") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM hall_repositories").fetchone()[0] == 1
+
+
+def test_hall_schema_bulk_writers_stream_records_in_one_transaction(tmp_path):
+    agents_dir = tmp_path / ".agents"
+    agents_dir.mkdir()
+    (agents_dir / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+
+    hall = HallOfRecords(tmp_path)
+    repo = hall.bootstrap_repository()
+    hall.record_scan(
+        HallScanRecord(
+            scan_id="scan-1",
+            repo_id=repo.repo_id,
+            scan_kind="baseline",
+            status="COMPLETED",
+            started_at=1700000000000,
+        )
+    )
+
+    written = hall.record_files_bulk(
+        "scan-1",
+        (
+            HallFileRecord(
+                repo_id=repo.repo_id,
+                scan_id="scan-1",
+                path=f"src/module_{index}.py",
+                gungnir_score=float(index),
+                created_at=1700000000100,
+            )
+            for index in range(25)
+        ),
+        chunk_size=10,
+    )
+    assert written == 25
+    assert len(hall.list_files("scan-1")) == 25
+
+    with pytest.raises(ValueError, match="scan-2"):
+        hall.record_files_bulk(
+            "scan-1",
+            [
+                HallFileRecord(repo_id=repo.repo_id, scan_id="scan-1", path="src/rolled_back.py", created_at=1700000000200),
+                HallFileRecord(repo_id=repo.repo_id, scan_id="scan-2", path="src/other_scan.py", created_at=1700000000200),
+            ],
+            chunk_size=1,
+        )
+    assert hall.get_file("src/rolled_back.py", scan_id="scan-1") is None
+
+    assert hall.save_validation_runs_bulk(
+        HallValidationRun(
+            validation_id=f"validation-{index}",
+            repo_id=repo.repo_id,
+            scan_id="scan-1",
+            verdict="ACCEPTED",
+            created_at=1700000000300 + index,
+        )
+        for index in range(3)
+    ) == 3
+    assert hall.get_validation_run("validation-2") is not None
+
+    assert hall.save_skill_observations_bulk(
+        [
+            HallSkillObservation(
+                observation_id="observation-1",
+                repo_id=repo.repo_id,
+                skill_id="skill-1",
+                outcome="SUCCESS",
+                observation="Bulk observation",
+                created_at=1700000000400,
+            )
+        ]
+    ) == 1
+    with hall.connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM hall_skill_observations").fetchone()[0] == 1
+
+
+def test_hall_schema_streams_list_apis_with_keyset_pagination(tmp_path):
+    agents_dir = tmp_path / ".agents"
+    agents_dir.mkdir()
+    (agents_dir / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+
+    hall = HallOfRecords(tmp_path)
+    repo = hall.bootstrap_repository()
+    for scan_id in ("scan-1", "scan-2"):
+        hall.record_scan(
+            HallScanRecord(
+                scan_id=scan_id,
+                repo_id=repo.repo_id,
+                scan_kind="baseline",
+                status="COMPLETED",
+                started_at=1,
+            )
+        )
+        hall.record_files_bulk(
+            scan_id,
+            (
+                HallFileRecord(
+                    repo_id=repo.repo_id,
+                    scan_id=scan_id,
+                    path=f"src/module_{index:02d}.py",
+                    created_at=2,
+                )
+                for index in range(7)
+            ),
+        )
+    for index in range(5):
+        hall.save_skill_proposal(
+            HallSkillProposalRecord(
+                proposal_id=f"proposal-{index}",
+                repo_id=repo.repo_id,
+                skill_id="skill-a" if index % 2 else "skill-b",
+                status="PROPOSED",
+                created_at=1700000000000 + index // 2,
+                updated_at=1700000000000,
+            )
+        )
+
+    streamed = list(hall.iter_files(page_size=3))
+    assert [(record.path, record.scan_id) for record in streamed] == sorted(
+        (f"src/module_{index:02d}.py", scan_id) for index in range(7) for scan_id in ("scan-1", "scan-2")
+    )
+    assert [record.path for record in hall.list_files("scan-2")] == [
+        f"src/module_{index:02d}.py" for index in range(7)
+    ]
+
+    page = list(hall.iter_files("scan-1", after=("src/module_02.py", "scan-1"), limit=2, page_size=1))
+    assert [record.path for record in page] == ["src/module_03.py", "src/module_04.py"]
+    resumed = next(iter(hall.iter_files("scan-1", after=page[-1])))
+    assert resumed.path == "src/module_05.py"
+
+    projected = list(hall.iter_files("scan-1", columns=("path",), limit=1))
+    assert projected == [{"path": "src/module_00.py"}]
+    with pytest.raises(ValueError, match="Unknown hall_files columns"):
+        list(hall.iter_files(columns=("path; DROP TABLE hall_files",)))
+
+    proposals = [proposal.proposal_id for proposal in hall.iter_skill_proposals(page_size=2)]
+    assert proposals == ["proposal-4", "proposal-3", "proposal-2", "proposal-1", "proposal-0"]
+    assert [proposal.proposal_id for proposal in hall.list_skill_proposals(skill_id="skill-a")] == [
+        "proposal-3",
+        "proposal-1",
+    ]
+    assert [
+        row["proposal_id"]
+        for row in hall.iter_skill_proposals(after=(1700000000001, "proposal-2"), columns=("proposal_id",))
+    ] == ["proposal-1", "proposal-0"]
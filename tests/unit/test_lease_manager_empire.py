@@ -59,3 +59,12 @@ def test_lease_expiration(temp_lease_manager):
     
     # RAVEN-2 should now be able to acquire it
     assert temp_lease_manager.acquire_lease(target, "RAVEN-2") is True
+
+def test_lease_inside_an_outer_writer_session_follows_its_transaction(temp_lease_manager):
+    """[Ω] Ensures a lease taken inside a caller's writer session does not commit that session early."""
+    with pytest.raises(RuntimeError):
+        with temp_lease_manager._get_conn():
+            assert temp_lease_manager.acquire_lease("src/nested.py", "RAVEN-1") is True
+            raise RuntimeError("caller failed after leasing")
+
+    assert temp_lease_manager.acquire_lease("src/nested.py", "RAVEN-2") is True
@@ -1,6 +1,7 @@
 import pytest
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 from src.core.engine.hall_schema import HallFileRecord, HallOfRecords, HallScanRecord
 from src.core.norn_coordinator import NornCoordinator
@@ -131,3 +132,91 @@ def test_select_mission_prefers_hall_beads_over_legacy_projection(tmp_path):
     assert mission["file"] == "src/core/bead_target.py"
     assert mission["bead_id"].startswith("bead:")
     assert mission["compatibility_source"] == "hall_beads"
+
+
+def _seed_batch_beads(tmp_path, targets):
+    agents_dir = tmp_path / ".agents"
+    agents_dir.mkdir()
+    (agents_dir / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+    hall = HallOfRecords(tmp_path)
+    repo = hall.bootstrap_repository()
+    hall.record_scan(
+        HallScanRecord(
+            scan_id="scan-batch-1",
+            repo_id=repo.repo_id,
+            scan_kind="hunt",
+            status="COMPLETED",
+            baseline_gungnir_score=4.2,
+            started_at=1700000000000,
+            completed_at=1700000000100,
+            metadata={},
+        )
+    )
+    ledger = NornCoordinator(tmp_path).ledger
+    for index, target in enumerate(targets):
+        ledger.upsert_bead(
+            scan_id="scan-batch-1",
+            target_path=target,
+            rationale=f"Batch bead {index}.",
+            contract_refs=[f"contracts:batch-{index}"],
+            acceptance_criteria="Raise the baseline above 5.0.",
+        )
+
+    return ledger
+
+
+def test_select_missions_claims_distinct_unleased_targets(tmp_path):
+    ledger = _seed_batch_beads(tmp_path, ["src/core/a.py", "src/core/a.py", "src/core/leased.py", "src/core/b.py"])
+
+    coordinator = MissionCoordinator(tmp_path)
+    assert coordinator.leases.acquire_lease("src/core/leased.py", "OTHER_RAVEN")
+
+    missions = coordinator.select_missions(3, claim_agent="MUNINN", lease_agent="MUNINN:1")
+
+    assert sorted(mission["file"] for mission in missions) == ["src/core/a.py", "src/core/b.py"]
+    statuses = sorted((bead.target_path, bead.status) for bead in ledger.list_beads())
+    assert statuses == [
+        ("src/core/a.py", "IN_PROGRESS"),
+        ("src/core/a.py", "OPEN"),
+        ("src/core/b.py", "IN_PROGRESS"),
+        ("src/core/leased.py", "OPEN"),
+    ]
+    assert not coordinator.leases.acquire_lease("src/core/b.py", "OTHER_RAVEN")
+
+    coordinator.release_missions(missions)
+    assert coordinator.leases.acquire_lease("src/core/b.py", "OTHER_RAVEN")
+
+
+def test_select_missions_releases_its_leases_when_a_claim_fails(tmp_path):
+    (tmp_path / ".agents").mkdir()
+    coordinator = MissionCoordinator(tmp_path)
+    beads = [{"id": f"bead:{name}", "target_path": f"src/core/{name}.py"} for name in ("a", "b")]
+
+    with patch.object(coordinator.norn, "peek_claimable_beads", return_value=beads), \
+         patch.object(coordinator.norn, "claim_bead", side_effect=[{**beads[0], "rationale": "r"}, RuntimeError("ledger locked")]):
+        with pytest.raises(RuntimeError):
+            coordinator.select_missions(2, claim_agent="MUNINN", lease_agent="MUNINN:1")
+
+    assert coordinator.leases.acquire_lease("src/core/a.py", "OTHER_RAVEN")
+    assert coordinator.leases.acquire_lease("src/core/b.py", "OTHER_RAVEN")
+
+
+def test_select_missions_reopens_claimed_beads_when_the_batch_fails(tmp_path):
+    ledger = _seed_batch_beads(tmp_path, ["src/core/a.py", "src/core/b.py", "src/core/c.py"])
+    coordinator = MissionCoordinator(tmp_path)
+    claim_bead = coordinator.norn.claim_bead
+    claimed = []
+
+    def flaky_claim(bead_id, agent_id):
+        if len(claimed) == 2:
+            raise RuntimeError("ledger locked")
+        claimed.append(bead_id)
+        return claim_bead(bead_id, agent_id)
+
+    with patch.object(coordinator.norn, "claim_bead", side_effect=flaky_claim):
+        with pytest.raises(RuntimeError):
+            coordinator.select_missions(3, claim_agent="MUNINN", lease_agent="MUNINN:1")
+
+    assert len(claimed) == 2
+    assert [(bead.status, bead.assigned_agent) for bead in ledger.list_beads()] == [("OPEN", None)] * 3
+    assert len(coordinator.select_missions(3, claim_agent="MUNINN", lease_agent="MUNINN:1")) == 3
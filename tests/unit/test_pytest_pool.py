@@ -0,0 +1,68 @@
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.engine.ravens.muninn_crucible import MuninnCrucible
+from src.core.engine.ravens.pytest_pool import PytestWorkerPool
+
+pytestmark = pytest.mark.skipif(not PytestWorkerPool.supported(), reason="warm workers need os.fork")
+
+
+def write_project(root: Path, tests: dict[str, str]) -> None:
+    (root / "app").mkdir(parents=True, exist_ok=True)
+    (root / "app" / "__init__.py").write_text("", encoding="utf-8")
+    (root / "app" / "value.py").write_text("VALUE = 2\n", encoding="utf-8")
+    (root / "tests").mkdir(exist_ok=True)
+    for name, body in tests.items():
+        (root / "tests" / name).write_text(body, encoding="utf-8")
+
+
+def test_warm_runs_report_outcomes_and_reimport_the_project(tmp_path: Path) -> None:
+    write_project(tmp_path, {
+        "test_value.py": "from app.value import VALUE\n\n\ndef test_two():\n    assert VALUE == 2\n\n\n"
+                         "def test_three():\n    assert VALUE == 3\n",
+    })
+
+    with PytestWorkerPool(tmp_path) as pool:
+        first = pool.run(tmp_path / "tests" / "test_value.py")
+        (tmp_path / "app" / "value.py").write_text("VALUE = 3\n", encoding="utf-8")
+        second = pool.run(tmp_path / "tests" / "test_value.py")
+
+    assert (first.exit_code, first.passed, first.failed) == (1, 1, 1)
+    assert (second.exit_code, second.passed, second.failed) == (1, 1, 1)
+    assert "test_three PASSED" in second.output
+
+
+def test_timeout_kills_the_worker_and_the_next_run_respawns_it(tmp_path: Path) -> None:
+    write_project(tmp_path, {
+        "test_slow.py": "import time\n\n\ndef test_slow():\n    time.sleep(30)\n",
+        "test_fast.py": "def test_fast():\n    pass\n",
+    })
+
+    with PytestWorkerPool(tmp_path) as pool:
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.run(tmp_path / "tests" / "test_slow.py", timeout=1.0)
+        run = pool.run(tmp_path / "tests" / "test_fast.py")
+
+    assert (run.exit_code, run.passed) == (0, 1)
+
+
+def test_crucible_falls_back_to_a_cold_run_when_the_worker_crashes(tmp_path: Path) -> None:
+    write_project(tmp_path, {
+        "test_crash.py": "import os\n\n\ndef test_crash():\n    os._exit(1)\n",
+        "test_ok.py": "def test_ok():\n    pass\n",
+    })
+    crucible = MuninnCrucible(tmp_path, MagicMock(), max_concurrency=1, warm_workers=True)
+    try:
+        crashed = crucible.verify_fix_result(tmp_path / "tests" / "test_crash.py", cwd=tmp_path)
+        accepted = crucible.verify_fix_result(tmp_path / "tests" / "test_ok.py", cwd=tmp_path)
+    finally:
+        crucible.close()
+
+    assert crashed.verdict == "REJECTED"
+    assert crashed.benchmark.metadata["runner"] == "cold"
+    assert accepted.verdict == "ACCEPTED"
+    assert accepted.benchmark.metadata["runner"] == "warm"
+    assert accepted.benchmark.metadata["passed"] == 1
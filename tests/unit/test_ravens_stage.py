@@ -47,7 +47,7 @@ def test_muninn_heart_emits_structured_cycle_result(tmp_path: Path) -> None:
 
     heart = MuninnHeart(tmp_path, MagicMock())
     heart._run_behavioral_pulse = AsyncMock()
-    heart._wait_for_silence = MagicMock()
+    heart._wait_for_silence = AsyncMock()
     heart.coordinator.select_mission = MagicMock(
         return_value={
             "mission_id": "mission:test",
@@ -81,17 +81,75 @@ def test_muninn_heart_emits_structured_cycle_result(tmp_path: Path) -> None:
     assert result.stages[3].status == "SUCCESS"
 
 
-def test_muninn_heart_wait_for_silence_requires_stable_repository_snapshot(tmp_path: Path, monkeypatch) -> None:
+def test_muninn_heart_batch_cycle_validates_concurrently_and_promotes_in_order(tmp_path: Path) -> None:
+    agents_dir = tmp_path / ".agents"
+    agents_dir.mkdir()
+    (agents_dir / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+
+    missions = []
+    for name in ("first", "second", "third"):
+        target_file = tmp_path / "src" / f"{name}.py"
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        target_file.write_text("print('original')\n", encoding="utf-8")
+        test_file = tmp_path / "tests" / "gauntlet" / f"test_{name}.py"
+        test_file.parent.mkdir(parents=True, exist_ok=True)
+        test_file.write_text("def test_target():\n    assert True\n", encoding="utf-8")
+        missions.append({
+            "mission_id": f"mission:{name}",
+            "file": f"src/{name}.py",
+            "action": f"Repair {name}",
+            "metrics": {"overall": 1.0},
+            "generated_tests": [{"path": f"tests/gauntlet/test_{name}.py"}],
+        })
+
     heart = MuninnHeart(tmp_path, MagicMock())
-    monkeypatch.setenv("MUNINN_SILENCE_INTERVAL", "0")
+    heart._wait_for_silence = AsyncMock()
+    heart.coordinator.select_missions = MagicMock(return_value=missions)
+    heart.coordinator.release_missions = MagicMock()
+
+    async def steel(target, code, test_path):
+        if target["file"] == "src/second.py":
+            raise RuntimeError("forge exploded")
+        await asyncio.sleep(0.05)
+        return f"print('fixed {target['file']}')\n"
+
+    heart.crucible.generate_steel = AsyncMock(side_effect=steel)
+    heart.crucible.verify_fix_result = MagicMock(
+        return_value=create_validation_result(before={"overall": 1.0}, after={"overall": 2.0}, summary="Accepted.")
+    )
+    heart.promotion.watcher.record_edit = MagicMock(return_value=True)
+    heart.promotion.watcher.record_failure = MagicMock(return_value=1)
+    heart.memory.record_trace = MagicMock()
+
+    result = asyncio.run(heart.execute_batch_cycle_contract(max_missions=3, max_concurrency=2))
+
+    heart.coordinator.select_missions.assert_called_once()
+    assert heart.coordinator.select_missions.call_args.args == (3,)
+    assert [stage.stage for stage in result.stages] == [
+        "memory", "hunt", "validate", "promote", "validate", "promote", "validate", "promote",
+    ]
+    assert [stage.target.target_path for stage in result.stages[2::2]] == ["src/first.py", "src/second.py", "src/third.py"]
+    assert [stage.status for stage in result.stages[3::2]] == ["SUCCESS", "FAILURE", "SUCCESS"]
+    assert result.status == "FAILURE"
+    assert result.metadata["missions_promoted"] == 2
+    assert len(result.metadata["stage_latency_ms"]["validate"]) == 3
+    assert result.metadata["missions_per_minute"] > 0
+    assert (tmp_path / "src" / "third.py").read_text(encoding="utf-8") == "print('fixed src/third.py')\n"
+    assert (tmp_path / "src" / "second.py").read_text(encoding="utf-8") == "print('original')\n"
+    heart.coordinator.release_missions.assert_called_once_with(missions)
+
+
+def test_muninn_heart_wait_for_silence_waits_for_one_quiet_window(tmp_path: Path, monkeypatch) -> None:
+    heart = MuninnHeart(tmp_path, MagicMock())
+    monkeypatch.setenv("MUNINN_SILENCE_INTERVAL", "0.5")
     monkeypatch.setenv("MUNINN_SILENCE_ATTEMPTS", "2")
 
-    with patch.object(heart, "_repository_activity_snapshot", side_effect=[" M file.py\n", " M file.py\n"]) as snapshot, \
-         patch("src.core.engine.ravens.muninn_heart.time.sleep") as sleep:
-        heart._wait_for_silence()
+    with patch("src.core.engine.ravens.muninn_heart.QuiescenceDetector") as detector:
+        detector.return_value.wait = AsyncMock(return_value=0.5)
+        asyncio.run(heart._wait_for_silence())
 
-    assert snapshot.call_count == 2
-    sleep.assert_called_once_with(0.0)
+    detector.assert_called_once_with(tmp_path, 0.5)
+    detector.return_value.wait.assert_awaited_once_with(timeout=1.5)
 
 
 def test_muninn_heart_wait_for_silence_fails_when_repository_keeps_changing(tmp_path: Path, monkeypatch) -> None:
@@ -99,10 +157,10 @@ def test_muninn_heart_wait_for_silence_fails_when_repository_keeps_changing(tmp_
     monkeypatch.setenv("MUNINN_SILENCE_INTERVAL", "0")
     monkeypatch.setenv("MUNINN_SILENCE_ATTEMPTS", "2")
 
-    with patch.object(heart, "_repository_activity_snapshot", side_effect=["1", "2", "3"]), \
-         patch("src.core.engine.ravens.muninn_heart.time.sleep"):
+    with patch("src.core.engine.ravens.muninn_heart.QuiescenceDetector") as detector:
+        detector.return_value.wait = AsyncMock(side_effect=asyncio.TimeoutError("busy"))
         try:
-            heart._wait_for_silence()
+            asyncio.run(heart._wait_for_silence())
         except RuntimeError as exc:
             assert "did not settle" in str(exc)
         else:
@@ -0,0 +1,115 @@
+import io
+import random
+from unittest.mock import patch
+
+import pytest
+
+from src.core.redactor import Redactor, SecretMatcher
+
+
+def _reference(text: str, secrets: dict[str, str]) -> str:
+    """Leftmost-longest replacement, one position at a time."""
+    names = {}
+    for key, val in secrets.items():
+        names.setdefault(val, key)
+    out, i = [], 0
+    while i < len(text):
+        hit = max((val for val in names if text.startswith(val, i)), key=len, default=None)
+        if hit is None:
+            out.append(text[i])
+            i += 1
+        else:
+            out.append(f"[REDACTED_{names[hit]}]")
+            i += len(hit)
+    return "".join(out)
+
+
+def _workload(seed: int):
+    rng = random.Random(seed)
+    alphabet = "abc-_"
+    secrets = {f"KEY_{i}": "".join(rng.choice(alphabet) for _ in range(rng.randint(5, 12))) for i in range(30)}
+    values = list(secrets.values())
+    parts = []
+    for _ in range(200):
+        parts.append(rng.choice(values) if rng.random() < 0.3 else "".join(rng.choice(alphabet + " \n") for _ in range(rng.randint(1, 8))))
+    return secrets, "".join(parts)
+
+
+@pytest.fixture
+def redactor():
+    Redactor._instance = None
+    with patch("src.core.redactor.SovereignVault") as vault:
+        vault.return_value.get_secrets_map.return_value = {
+            "GEMINI_API_KEY": "AIzaSyD-fake-key",
+            "SHORT_KEY": "AIzaSyD",
+            "BRAVE_KEY": "12345-brave",
+        }
+        yield Redactor()
+    Redactor._instance = None
+
+
+def test_redact_prefers_the_longest_secret(redactor):
+    text = "gemini=AIzaSyD-fake-key brave=12345-brave prefix=AIzaSyD-other"
+    assert redactor.redact(text) == (
+        "gemini=[REDACTED_GEMINI_API_KEY] brave=[REDACTED_BRAVE_KEY] prefix=[REDACTED_SHORT_KEY]-other"
+    )
+    assert redactor.redact("") == ""
+    assert Redactor.redact_shorthand("nothing secret") == "nothing secret"
+
+
+@pytest.fixture(params=["trie", "scan"])
+def strategy(request):
+    # Force every text through the trie regex, or every text through the per-secret scan.
+    limits = {"SCAN_MIN_CHARS": 0, "SCAN_MAX_SECRETS": 0} if request.param == "trie" else {"SCAN_MIN_CHARS": 0}
+    with patch.multiple(SecretMatcher, **limits):
+        yield request.param
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_single_pass_matches_reference(seed, strategy):
+    secrets, text = _workload(seed)
+    assert SecretMatcher(secrets).sub(text) == _reference(text, secrets)
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 3, 7, 64, 4096])
+def test_stream_matches_whole_text_redaction(chunk_chars, strategy):
+    secrets, text = _workload(11)
+    matcher = SecretMatcher(secrets)
+    sink = io.StringIO()
+
+    count = matcher.redact_stream(io.StringIO(text), sink, chunk_chars=chunk_chars)
+
+    assert (sink.getvalue(), count) == matcher.subn(text)
+
+
+def test_long_secret_is_redacted(strategy):
+    pem = "".join(random.Random(3).choice("ABCDEFabcdef0123456789+/") for _ in range(5000))
+    secrets = {"SERVICE_ACCOUNT": pem, "SHORT_KEY": pem[:12]}
+    text = f"key={pem}\nprefix={pem[:12]}!"
+
+    assert SecretMatcher(secrets).sub(text) == "key=[REDACTED_SERVICE_ACCOUNT]\nprefix=[REDACTED_SHORT_KEY]!"
+
+
+def test_deeply_nested_prefixes_still_compile(strategy):
+    secrets = {f"KEY_{i}": "a" * i for i in range(1, 1500)}
+    text = "b" + "a" * 1600 + "b"
+
+    assert SecretMatcher(secrets).sub(text) == _reference(text, secrets)
+
+
+def test_redact_file_in_place_keeps_undecodable_bytes(redactor, tmp_path):
+    log = tmp_path / "trace.log"
+    log.write_bytes(b"key=AIzaSyD-fake-key\r\n\xff raw 12345-brave\n")
+
+    assert redactor.redact_file(log) == 2
+    assert log.read_bytes() == b"key=[REDACTED_GEMINI_API_KEY]\r\n\xff raw [REDACTED_BRAVE_KEY]\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["trace.log"]
+
+
+def test_vault_failure_redacts_nothing():
+    Redactor._instance = None
+    try:
+        with patch("src.core.redactor.SovereignVault", side_effect=RuntimeError("no vault")):
+            assert Redactor().redact("AIzaSyD-fake-key") == "AIzaSyD-fake-key"
+    finally:
+        Redactor._instance = None
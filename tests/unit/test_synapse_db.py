@@ -0,0 +1,168 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core import synapse_db
+from src.core.mimir_client import MimirClient
+from src.core.synapse_db import SynapseStore, prompt_hash
+
+
+def complete(db_path: Path, synapse_id: int, response: str) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE synapse SET response = ?, status = 'COMPLETED' WHERE id = ?", (response, synapse_id))
+
+
+def test_health_check_runs_once_until_the_file_is_replaced(tmp_path: Path) -> None:
+    db_path = tmp_path / ".stats" / "synapse.db"
+    store = SynapseStore(db_path)
+
+    with patch.object(synapse_db, "ensure_healthy_synapse_db", wraps=synapse_db.ensure_healthy_synapse_db) as check:
+        synapse_id = store.create_pending("first")
+        store.read_row(synapse_id)
+        store.cached_response("first")
+        assert check.call_count == 1
+
+        store.close()
+        db_path.unlink()
+        store.create_pending("second")
+        assert check.call_count == 2
+
+    assert store.stats["opens"] == 2
+
+
+def test_completed_rows_from_other_writers_are_indexed_by_prompt_hash(tmp_path: Path) -> None:
+    db_path = tmp_path / ".stats" / "synapse.db"
+    synapse_db.ensure_healthy_synapse_db(db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO synapse (prompt, response, status) VALUES (?, ?, ?)",
+            [("Legacy", "old answer", "COMPLETED"), ("Legacy", "new answer", "COMPLETED"), ("Open", None, "PENDING")],
+        )
+
+    store = SynapseStore(db_path)
+
+    assert store.cached_response("Legacy") == "new answer"
+    assert store.cached_response("Open") is None
+    with sqlite3.connect(db_path) as conn:
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT response FROM synapse_cache WHERE prompt_hash = ?", (prompt_hash("Legacy"),)
+        ))
+    assert "USING INDEX" in plan or "PRIMARY KEY" in plan
+
+
+def test_rows_completed_after_open_and_out_of_order_are_served(tmp_path: Path) -> None:
+    db_path = tmp_path / ".stats" / "synapse.db"
+    synapse_db.ensure_healthy_synapse_db(db_path)
+    with sqlite3.connect(db_path) as conn:
+        node_id = conn.execute("INSERT INTO synapse (prompt, status) VALUES ('node-q', 'PENDING')").lastrowid
+
+    store = SynapseStore(db_path)
+    python_id = store.create_pending("python-q")
+    store.store_response("python-q", "python-a", python_id)
+    complete(db_path, node_id, "node-a")
+
+    assert store.cached_response("node-q") == "node-a"
+    store.close()
+    assert SynapseStore(db_path).cached_response("node-q") == "node-a"
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute(
+            "SELECT synapse_id FROM synapse_cache WHERE prompt_hash = ?", (prompt_hash("node-q"),)
+        ).fetchone() == (node_id,)
+        assert conn.execute("SELECT prompt_hash FROM synapse WHERE id = ?", (node_id,)).fetchone() == (prompt_hash("node-q"),)
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(synapse)")}
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT response FROM synapse WHERE prompt_hash = ? AND status = 'COMPLETED'",
+            (prompt_hash("node-q"),),
+        ))
+    assert "idx_synapse_prompt" not in indexes
+    assert "idx_synapse_prompt_hash" in plan
+
+
+def test_cache_miss_does_not_evict(tmp_path: Path) -> None:
+    store = SynapseStore(tmp_path / ".stats" / "synapse.db")
+    store.cached_response("warm-up")
+
+    with patch.object(SynapseStore, "_evict") as evict:
+        assert store.cached_response("never asked") is None
+        store_id = store.create_pending("asked")
+        complete(store.db_path, store_id, "answered")
+        assert store.cached_response("asked") == "answered"
+    evict.assert_not_called()
+
+
+def test_eviction_bounds_the_cache_by_age_and_size(tmp_path: Path) -> None:
+    db_path = tmp_path / ".stats" / "synapse.db"
+    store = SynapseStore(db_path, cache_ttl_seconds=60, cache_max_entries=2)
+
+    store.store_response("a", "A")
+    store.store_response("b", "B")
+    assert store.cached_response("a") == "A"  # now the most recently hit
+    store.store_response("c", "C")
+
+    assert [store.cached_response(prompt) for prompt in ("a", "b", "c")] == ["A", None, "C"]
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE synapse_cache SET created_at = created_at - 120 WHERE prompt_hash = ?", (prompt_hash("a"),))
+        conn.execute(
+            "INSERT INTO synapse (prompt, response, status, created_at) VALUES ('old', 'x', 'COMPLETED', datetime('now', '-1 hour'))"
+        )
+        conn.execute("INSERT INTO synapse (prompt, status, created_at) VALUES ('waiting', 'PENDING', datetime('now', '-1 hour'))")
+    assert store.cached_response("a") is None
+    store.store_response("d", "D")
+
+    with sqlite3.connect(db_path) as conn:
+        assert [row[0] for row in conn.execute("SELECT prompt FROM synapse")] == ["waiting"]
+        assert conn.execute("SELECT COUNT(*) FROM synapse_cache").fetchone()[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_rereads_the_row_only_after_another_connection_commits(tmp_path: Path) -> None:
+    db_path = tmp_path / ".stats" / "synapse.db"
+
+    def oracle_runner(synapse_id: int) -> None:
+        threading.Timer(0.3, complete, args=(db_path, synapse_id, "late answer")).start()
+
+    client = MimirClient(project_root=tmp_path, env={}, host_session_active=False, oracle_runner=oracle_runner)
+    reads = 0
+    read_row = client.synapse.read_row
+
+    def counting_read(synapse_id: int):
+        nonlocal reads
+        reads += 1
+        return read_row(synapse_id)
+
+    client.synapse.read_row = counting_read
+    try:
+        started = time.monotonic()
+        first = await client.request({"prompt": "Slow question"})
+        elapsed = time.monotonic() - started
+        second = await client.request({"prompt": "Slow question"})
+    finally:
+        await client.close()
+
+    assert first.status == "success" and first.raw_text == "late answer"
+    assert 0.3 <= elapsed < 1.0
+    assert reads == 2
+    assert second.trace.cached is True and second.raw_text == "late answer"
+
+
+def test_wait_gives_up_after_the_response_budget(tmp_path: Path) -> None:
+    client = MimirClient(
+        project_root=tmp_path,
+        env={},
+        host_session_active=False,
+        oracle_runner=lambda _synapse_id: None,
+        poll_interval=0.05,
+        poll_attempts=4,
+    )
+
+    response = asyncio.run(client.request({"prompt": "Nobody answers"}))
+    asyncio.run(client.close())
+
+    assert response.status == "error"
+    assert "Timed out" in (response.error or "")
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.engine.hall_schema import HallOfRecords
+from src.core.engine.ravens.muninn_crucible import MuninnCrucible
+from src.core.engine.ravens.muninn_memory import MuninnMemory
+from src.core.engine.ravens.validation_workspace import ValidationWorkspace
+from src.core.engine.validation_result import create_validation_result
+
+
+def seed_repository(root: Path) -> None:
+    agents_dir = root / ".agents"
+    agents_dir.mkdir(parents=True, exist_ok=True)
+    (agents_dir / "sovereign_state.json").write_text(json.dumps({}), encoding="utf-8")
+    HallOfRecords(root).bootstrap_repository()
+
+    package = root / "app"
+    package.mkdir(parents=True, exist_ok=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    for name in ("alpha", "beta"):
+        (package / f"{name}.py").write_text("VALUE = 1\n", encoding="utf-8")
+        test_file = root / "tests" / "gauntlet" / f"test_{name}.py"
+        test_file.parent.mkdir(parents=True, exist_ok=True)
+        test_file.write_text(f"from app.{name} import VALUE\n\n\ndef test_value():\n    assert VALUE == 2\n", encoding="utf-8")
+
+
+def candidate(name: str, bead: str) -> dict:
+    return {
+        "mission_id": f"mission:{bead}",
+        "file": f"app/{name}.py",
+        "action": f"Raise {name}",
+        "metrics": {"overall": 1.0},
+        "generated_tests": [{"path": f"tests/gauntlet/test_{name}.py"}],
+    }
+
+
+def test_workspace_mirrors_without_writing_through_to_the_live_tree(tmp_path: Path) -> None:
+    seed_repository(tmp_path)
+    live = tmp_path / "app" / "alpha.py"
+
+    with ValidationWorkspace(tmp_path, label="bead:alpha") as workspace:
+        mirrored = workspace.resolve(live)
+        assert os.path.samefile(mirrored, live)
+        assert not os.path.samefile(workspace.resolve(tmp_path / ".agents" / "sovereign_state.json"),
+                                    tmp_path / ".agents" / "sovereign_state.json")
+
+        workspace.write_text(live, "VALUE = 2\n")
+        assert mirrored.read_text(encoding="utf-8") == "VALUE = 2\n"
+        assert live.read_text(encoding="utf-8") == "VALUE = 1\n"
+        root = workspace.path
+
+    assert not root.exists()
+
+
+def test_sweep_removes_workspaces_of_dead_processes(tmp_path: Path) -> None:
+    base = ValidationWorkspace.base_dir(tmp_path)
+    for name, owner in (("dead", "999999999"), ("alive", str(os.getpid()))):
+        (base / name).mkdir(parents=True)
+        (base / name / ValidationWorkspace.OWNER_FILE).write_text(owner, encoding="utf-8")
+
+    assert ValidationWorkspace.sweep_stale(tmp_path) == 1
+    assert sorted(path.name for path in base.iterdir()) == ["alive"]
+
+
+def test_candidates_are_tested_in_parallel_workspaces(tmp_path: Path) -> None:
+    seed_repository(tmp_path)
+    memory = MuninnMemory(tmp_path)
+    crucible = MuninnCrucible(tmp_path, MagicMock(), max_concurrency=2)
+    crucible.generate_steel = AsyncMock(side_effect=["VALUE = 2\n", "VALUE = 3\n"])
+
+    stages = asyncio.run(
+        crucible.validate_candidates(
+            memory.repo_id(),
+            [candidate("alpha", "alpha"), candidate("beta", "beta")],
+            memory.record_stage_observation,
+        )
+    )
+
+    assert [stage.status for stage in stages] == ["SUCCESS", "FAILURE"]
+    assert [stage.metadata["applied_to_tree"] for stage in stages] == [True, False]
+    assert (tmp_path / "app" / "alpha.py").read_text(encoding="utf-8") == "VALUE = 2\n"
+    assert (tmp_path / "app" / "alpha.py.bak").exists()
+    assert (tmp_path / "app" / "beta.py").read_text(encoding="utf-8") == "VALUE = 1\n"
+    assert not (tmp_path / "app" / "beta.py.bak").exists()
+    assert list(ValidationWorkspace.base_dir(tmp_path).iterdir()) == [ValidationWorkspace.base_dir(tmp_path) / ".gitignore"]
+
+
+def test_concurrency_limit_and_same_file_conflicts(tmp_path: Path) -> None:
+    seed_repository(tmp_path)
+    memory = MuninnMemory(tmp_path)
+    crucible = MuninnCrucible(tmp_path, MagicMock(), max_concurrency=2)
+    crucible.generate_steel = AsyncMock(side_effect=[f"VALUE = {n}\n" for n in range(2, 6)])
+
+    active, peak, lock = 0, 0, threading.Lock()
+
+    def verify(test_path, **kwargs):
+        nonlocal active, peak
+        assert Path(kwargs["cwd"]) in test_path.parents
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.1)
+        with lock:
+            active -= 1
+        return create_validation_result(before={"overall": 1.0}, after={"overall": 2.0}, metadata=kwargs["metadata"])
+
+    crucible.verify_fix_result = MagicMock(side_effect=verify)
+    stages = asyncio.run(
+        crucible.validate_candidates(
+            memory.repo_id(),
+            [candidate("alpha", f"alpha-{n}") for n in range(4)],
+            memory.record_stage_observation,
+        )
+    )
+
+    # Two waves of two; within each wave the file is promoted once and the sibling sees it change.
+    assert peak == 2
+    assert sum(stage.metadata["applied_to_tree"] for stage in stages) == 2
+    rejected = [stage for stage in stages if stage.status == "FAILURE"]
+    assert len(rejected) == 2
+    assert all(stage.metadata["checks"][-1]["name"] == "live_tree" for stage in rejected)